@@ -0,0 +1,163 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include <benchmark/benchmark.h>
+
+#include "higra/hierarchy/binary_partition_tree.hpp"
+#include "higra/image/graph_image.hpp"
+#include "xtensor/xrandom.hpp"
+#include "xtensor/xmanipulation.hpp"
+
+using namespace xt;
+using namespace hg;
+
+std::size_t min_image_size = 6;
+std::size_t max_image_size = 9;
+
+std::size_t min_knn_size = 10;
+std::size_t max_knn_size = 16;
+
+// random graph where each vertex is linked to 10 random vertices and to its successor (ensures connectivity)
+static ugraph random_knn_graph(index_t num_vertices) {
+    array_2d<index_t> targets = xt::random::randint<index_t>({(size_t) num_vertices, (size_t) 11}, 0, num_vertices);
+    array_2d<index_t> sources = xt::empty<index_t>(targets.shape());
+    for (index_t i = 0; i < num_vertices; i++) {
+        xt::view(sources, i, xt::all()) = i;
+        targets(i, 0) = (i + 1) % num_vertices;
+        for (index_t j = 1; j < 11; j++) {
+            if (targets(i, j) == i) {
+                targets(i, j) = targets(i, 0);
+            }
+        }
+    }
+    // removes multiple edges
+    auto res = arcs_2_undirected_graph(num_vertices, xt::flatten(sources), xt::flatten(targets),
+                                       array_1d<double>{});
+    return std::move(res.first);
+}
+
+template<bpt_algorithm algorithm>
+static void BM_bpt_average_linkage_4_adjacency(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        size_t size = state.range(0);
+        auto graph = get_4_adjacency_graph({size, size});
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+        array_1d<double> edge_weight_weights = xt::ones_like(edge_weights);
+        state.ResumeTiming();
+        auto res = binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights, algorithm);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_4_adjacency, bpt_algorithm::heap)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_4_adjacency, bpt_algorithm::nn_chain)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+
+template<bpt_algorithm algorithm>
+static void BM_bpt_complete_linkage_4_adjacency(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        size_t size = state.range(0);
+        auto graph = get_4_adjacency_graph({size, size});
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+        state.ResumeTiming();
+        auto res = binary_partition_tree_complete_linkage(graph, edge_weights, algorithm);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_complete_linkage_4_adjacency, bpt_algorithm::heap)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+BENCHMARK_TEMPLATE(BM_bpt_complete_linkage_4_adjacency, bpt_algorithm::nn_chain)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+
+template<bpt_algorithm algorithm>
+static void BM_bpt_average_linkage_knn(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        auto graph = random_knn_graph(state.range(0));
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+        array_1d<double> edge_weight_weights = xt::ones_like(edge_weights);
+        state.ResumeTiming();
+        auto res = binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights, algorithm);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_knn, bpt_algorithm::heap)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_knn, bpt_algorithm::nn_chain)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+
+template<bpt_algorithm algorithm>
+static void BM_bpt_ward_linkage_knn(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        size_t num_vertices = state.range(0);
+        auto graph = random_knn_graph(num_vertices);
+        array_2d<double> vertex_centroids = xt::random::rand<double>({num_vertices, (size_t) 3});
+        array_1d<double> vertex_sizes = xt::ones<double>({num_vertices});
+        state.ResumeTiming();
+        auto res = binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, "max", algorithm);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_ward_linkage_knn, bpt_algorithm::heap)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+BENCHMARK_TEMPLATE(BM_bpt_ward_linkage_knn, bpt_algorithm::nn_chain)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+
+template<bpt_heap heap>
+static void BM_bpt_average_linkage_heap_4_adjacency(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        size_t size = state.range(0);
+        auto graph = get_4_adjacency_graph({size, size});
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+        array_1d<double> edge_weight_weights = xt::ones_like(edge_weights);
+        binary_partition_tree_internal::binary_partition_tree_average_linkage_weighting_functor<array_1d<double>>
+                weighting_functor(edge_weights, edge_weight_weights);
+        state.ResumeTiming();
+        auto res = binary_partition_tree(graph, edge_weights, weighting_functor, heap);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_4_adjacency, bpt_heap::fibonacci)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_4_adjacency, bpt_heap::pairing)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_4_adjacency, bpt_heap::dary)
+        ->RangeMultiplier(2)->Range(1 << min_image_size, 1 << max_image_size);
+
+template<bpt_heap heap>
+static void BM_bpt_average_linkage_heap_knn(benchmark::State &state) {
+    for (auto _ : state) {
+        state.PauseTiming();
+        auto graph = random_knn_graph(state.range(0));
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+        array_1d<double> edge_weight_weights = xt::ones_like(edge_weights);
+        binary_partition_tree_internal::binary_partition_tree_average_linkage_weighting_functor<array_1d<double>>
+                weighting_functor(edge_weights, edge_weight_weights);
+        state.ResumeTiming();
+        auto res = binary_partition_tree(graph, edge_weights, weighting_functor, heap);
+        benchmark::DoNotOptimize(res);
+    }
+}
+
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_knn, bpt_heap::fibonacci)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_knn, bpt_heap::pairing)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
+BENCHMARK_TEMPLATE(BM_bpt_average_linkage_heap_knn, bpt_heap::dary)
+        ->RangeMultiplier(4)->Range(1 << min_knn_size, 1 << max_knn_size);
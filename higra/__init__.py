@@ -26,18 +26,132 @@ from .hg_utils import *
 
 data_cache._data_cache__init()
 
-# normal modules
-from .accumulator import *
-from .algo import *
-from .assessment import *
-from .attribute import *
-from .hierarchy import *
-from .image import *
-from .interop import *
-from .io_utils import *
-from .plot import *
+# modules that extend classes of the extension module
 from .structure import *
 
+# other modules are loaded on the first access to one of their public names (PEP 562), this is checked by
+# test/python/test_import.py
+_lazy_submodules = {
+    "accumulator": (
+        "accumulate_and_add_sequential", "accumulate_and_max_sequential", "accumulate_and_min_sequential",
+        "accumulate_and_multiply_sequential", "accumulate_at", "accumulate_graph_edges", "accumulate_graph_vertices",
+        "accumulate_on_contours", "accumulate_parallel", "accumulate_sequential", "propagate_parallel",
+        "propagate_sequential", "propagate_sequential_and_accumulate"),
+    "algo": (
+        "adjacency_matrix_2_undirected_graph", "align_hierarchies", "arcs_2_undirected_graph",
+        "attribute_piecewise_constant_Mumford_Shah_energy", "binary_labelisation_from_markers",
+        "binary_partition_tree_MumfordShah_energy", "csr_2_undirected_graph", "filter_non_relevant_node_from_tree",
+        "filter_small_nodes_from_tree", "filter_weak_frontier_nodes_from_tree", "graph_cut_2_labelisation",
+        "hierarchy_to_optimal_MumfordShah_energy_cut_hierarchy", "hierarchy_to_optimal_energy_cut_hierarchy",
+        "labelisation_2_graph_cut", "labelisation_hierarchy_supervertices",
+        "labelisation_horizontal_cut_from_num_regions", "labelisation_horizontal_cut_from_threshold",
+        "labelisation_optimal_cut_from_energy", "labelisation_seeded_watershed", "labelisation_watershed",
+        "make_graph_from_points", "make_region_adjacency_graph_from_graph_cut",
+        "make_region_adjacency_graph_from_labelisation", "minimum_spanning_tree",
+        "project_fine_to_coarse_labelisation", "project_fine_to_coarse_rag", "rag_accumulate_on_edges",
+        "rag_accumulate_on_vertices", "rag_back_project_edge_weights", "rag_back_project_vertex_weights",
+        "reconstruct_leaf_data", "sort_hierarchy_with_altitudes", "test_altitudes_increasingness",
+        "tree_fusion_depth_map", "tree_monotonic_regression", "ultrametric_open",
+        "undirected_graph_2_adjacency_matrix", "weight_graph"),
+    "assessment": (
+        "assess_fragmentation_horizontal_cut", "assess_fragmentation_optimal_cut", "dasgupta_cost",
+        "dendrogram_purity", "make_assesser_fragmentation_optimal_cut", "tree_sampling_divergence"),
+    "attribute": (
+        "attribute_area", "attribute_child_number", "attribute_children_pair_sum_product", "attribute_compactness",
+        "attribute_contour_length", "attribute_contour_strength", "attribute_depth", "attribute_dynamics",
+        "attribute_edge_length", "attribute_extinction_value", "attribute_extrema", "attribute_frontier_length",
+        "attribute_frontier_strength", "attribute_gaussian_region_weights_model", "attribute_height",
+        "attribute_lca_map", "attribute_mean_vertex_weights", "attribute_moment_of_inertia",
+        "attribute_regular_altitudes", "attribute_sibling", "attribute_topological_height",
+        "attribute_tree_sampling_probability", "attribute_vertex_area", "attribute_vertex_coordinates",
+        "attribute_vertex_list", "attribute_vertex_perimeter", "attribute_volume", "compute_attributes"),
+    "hierarchy": (
+        "batch", "binary_partition_tree", "binary_partition_tree_average_linkage",
+        "binary_partition_tree_complete_linkage", "binary_partition_tree_exponential_linkage",
+        "binary_partition_tree_single_linkage", "binary_partition_tree_ward_linkage", "bpt_canonical",
+        "canonize_hierarchy", "component_tree_max_tree", "component_tree_min_tree",
+        "constrained_connectivity_hierarchy_alpha_omega", "constrained_connectivity_hierarchy_strong_connection",
+        "quasi_flat_zone_hierarchy", "random_binary_partition_tree", "saliency", "simplify_tree", "tree_2_binary_tree",
+        "watershed_hierarchy_by_area", "watershed_hierarchy_by_attribute", "watershed_hierarchy_by_dynamics",
+        "watershed_hierarchy_by_minima_ordering", "watershed_hierarchy_by_number_of_parents",
+        "watershed_hierarchy_by_volume"),
+    "image": (
+        "bpt_canonical_tiled", "component_tree_multivariate_tree_of_shapes_image2d",
+        "component_tree_tree_of_shapes_image2d", "component_tree_tree_of_shapes_image3d", "get_4_adjacency_graph",
+        "get_4_adjacency_implicit_graph", "get_8_adjacency_graph", "get_8_adjacency_implicit_graph",
+        "get_nd_regular_graph", "get_nd_regular_implicit_graph", "gradient_orientation",
+        "graph_4_adjacency_2_khalimsky", "khalimsky_2_graph_4_adjacency", "mask_2_neighbours", "mean_pb_hierarchy",
+        "multiscale_mean_pb_hierarchy", "oriented_watershed", "rag_2d_vertex_perimeter_and_edge_length",
+        "triangular_filter"),
+    "interop": (
+        "binary_hierarchy_to_scipy_linkage_matrix", "scipy_linkage_matrix_to_binary_hierarchy"),
+    "io_utils": (
+        "print_partition_tree", "read_graph_pink", "read_tree", "save_graph_pink"),
+    "plot": (
+        "COLORS", "MARKERS", "lighten_color", "plot_graph", "plot_partition_tree"),
+}
+
+# classes of the extension module extended by a lazy module: the module is loaded before the class is returned
+_lazy_extended_classes = {
+    "HorizontalCutExplorer": "algo",
+    "HorizontalCutNodes": "algo",
+}
+
+_lazy_names = {name: submodule for submodule, names in _lazy_submodules.items() for name in names}
+_lazy_names.update(_lazy_extended_classes)
+
+# python functions of lazy modules replace the extension module functions with the same name
+for _name in _lazy_names:
+    globals().pop(_name, None)
+
+
+def _load_submodule(submodule):
+    """
+    Imports the given lazy module and exports its public names (as ``from .submodule import *`` would do)
+
+    :param submodule: name of a lazy module
+    :return: the module
+    """
+    import importlib
+    module = importlib.import_module("." + submodule, __name__)
+    g = globals()
+    for name in _lazy_submodules[submodule]:
+        g[name] = getattr(module, name)
+    for name, s in _lazy_extended_classes.items():
+        if s == submodule:
+            g[name] = getattr(cpp, name)
+    return module
+
+
+def __getattr__(name):
+    if name in _lazy_extended_classes:
+        import sys
+        submodule = _lazy_extended_classes[name]
+        # the module may be accessing the class during its own import
+        if __name__ + "." + submodule not in sys.modules:
+            _load_submodule(submodule)
+        return getattr(cpp, name)
+    if name in _lazy_names:
+        _load_submodule(_lazy_names[name])
+        return globals()[name]
+    if name in _lazy_submodules:
+        return _load_submodule(name)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | set(_lazy_submodules))
+
 
 def __logger_printer(m):
     print(m)
+
+
+__all__ = [_name for _name in globals() if not _name.startswith("_")] + sorted(_lazy_names)
+
+import sys as _sys
+
+if _sys.version_info < (3, 7):
+    # module __getattr__ is not supported: load everything
+    for _name in _lazy_submodules:
+        _load_submodule(_name)
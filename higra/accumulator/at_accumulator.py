@@ -27,5 +27,5 @@ def accumulate_at(indices, weights, accumulator):
     :param accumulator: see :class:`~higra.Accumulators`
     :return: a nd-array of size :math:`(M, s_2, \ldots, s_n)`
     """
-    indices = hg.cast_to_dtype(indices, np.int64)
+    indices = hg.cast_to_dtype(indices, hg.index_dtype())
     return hg.cpp._accumulate_at(indices, weights, accumulator)
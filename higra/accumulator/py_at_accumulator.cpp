@@ -40,7 +40,8 @@ struct def_at_accumulate {
               doc,
               py::arg("indices"),
               py::arg("weights"),
-              py::arg("accumulator")
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -42,7 +42,8 @@ struct def_accumulate_graph_edges {
               doc,
               py::arg("graph"),
               py::arg("input"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -63,7 +64,8 @@ struct def_accumulate_graph_vertices {
               doc,
               py::arg("graph"),
               py::arg("input"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -42,7 +42,8 @@ struct def_accumulate_parallel {
               doc,
               py::arg("tree"),
               py::arg("input"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -62,7 +63,8 @@ struct def_accumulate_sequential {
               doc,
               py::arg("tree"),
               py::arg("leaf_data"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -114,7 +116,8 @@ struct def_accumulate_and_combine_sequential {
               py::arg("tree"),
               py::arg("input"),
               py::arg("leaf_data"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -132,7 +135,8 @@ struct def_propagate_sequential {
               doc,
               py::arg("tree"),
               py::arg("input"),
-              py::arg("condition"));
+              py::arg("condition"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -153,7 +157,8 @@ struct def_propagate_parallel {
               doc,
               py::arg("tree"),
               py::arg("input"),
-              py::arg("condition") = pyarray<bool>{});
+              py::arg("condition") = pyarray<bool>{},
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -174,7 +179,8 @@ struct def_propagate_sequential_and_accumulate {
               doc,
               py::arg("tree"),
               py::arg("vertex_data"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -220,4 +226,21 @@ void py_init_tree_accumulator(pybind11::module &m) {
 
     add_type_overloads<def_propagate_sequential_and_accumulate<graph_t>, HG_TEMPLATE_NUMERIC_TYPES>
             (m, "");
+
+    m.def("set_tree_accumulator_parallel_threshold",
+          [](hg::index_t threshold) { hg::set_tree_accumulator_parallel_threshold(threshold); },
+          "Set the minimal number of nodes of a tree for the tree accumulators and propagators "
+          "(:func:`~higra.accumulate_sequential`, :func:`~higra.propagate_sequential`...) to process the tree "
+          "in parallel. A negative threshold (default) disables parallel processing.\n\n"
+          "In parallel mode, nodes are grouped by level (topological height for the accumulations, depth for the "
+          "propagations) and the nodes of a same level are processed concurrently. Each node still reads its "
+          "children (or its parent) in the same order: the results are identical to the sequential ones.\n\n"
+          "Parallel mode is only used if more than one thread is available (see :func:`~higra.set_num_threads`). "
+          "Grouping the nodes by level has a cost comparable to a sequential accumulation: parallel mode is only "
+          "beneficial with several cores and large trees.",
+          py::arg("threshold"));
+
+    m.def("get_tree_accumulator_parallel_threshold", []() { return hg::get_tree_accumulator_parallel_threshold(); },
+          "Get the minimal number of nodes of a tree for the tree accumulators and propagators to process the tree "
+          "in parallel (a negative value means that parallel processing is disabled).");
 }
\ No newline at end of file
@@ -43,7 +43,8 @@ struct def_accumulate_on_contours {
               py::arg("tree"),
               py::arg("vertex_data"),
               py::arg("depth"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -68,7 +68,6 @@ def undirected_graph_2_adjacency_matrix(graph, edge_weights=None, non_edge_value
         edge_weights = np.ones((graph.num_edges(),), np.float64)
 
     num_v = graph.num_vertices()
-    sources, targets = graph.edge_list()
 
     if sparse:
         try:
@@ -80,10 +79,13 @@ def undirected_graph_2_adjacency_matrix(graph, edge_weights=None, non_edge_value
             raise ValueError("'non_edge_value' must be equal to 0 is 'sparse' is True: Scipy sparse matrix dor not "
                              "support custom default value.")
 
-        A = csr_matrix((edge_weights, (sources, targets)), shape=(num_v, num_v), dtype=edge_weights.dtype)
-        A += A.T
+        indptr, indices, data = hg.cpp._undirected_graph_2_csr(graph, edge_weights)
+        A = csr_matrix((data, indices, indptr), shape=(num_v, num_v))
+        # parallel edges lead to duplicate entries
+        A.sum_duplicates()
 
     else:
+        sources, targets = graph.edge_list()
         A = np.empty((num_v, num_v), dtype=edge_weights.dtype)
         A.fill(non_edge_value)
         A[sources, targets] = edge_weights
@@ -98,6 +100,10 @@ def adjacency_matrix_2_undirected_graph(adjacency_matrix, non_edge_value=0):
 
     Adjacency matrix entries which are equal to :attr:`non_edge_value` are not considered to be part of the graph.
 
+    If the adjacency matrix is a Scipy sparse matrix, the graph is built in a single pass with
+    :func:`~higra.csr_2_undirected_graph` (if the matrix is not symmetric, an edge :math:`\{i,j\}` exists if any
+    of the entries :math:`(i,j)` and :math:`(j,i)` is non zero and its weight is the maximum of the two entries).
+
     :param adjacency_matrix: Input adjacency matrix (A 2d symmetric square matrix)
     :param non_edge_value: Value used to represent non existing edges in the adjacency matrix
     :return: a pair (UndirectedGraph, ndarray) representing the graph and its edge_weights (Concept :class:`~higra.CptEdgeWeightedGraph`)
@@ -114,8 +120,13 @@ def adjacency_matrix_2_undirected_graph(adjacency_matrix, non_edge_value=0):
     if scipy_available and sp.issparse(adjacency_matrix):
         if non_edge_value != 0:
             raise ValueError("'non_edge_value' must be equal to 0 is 'adjacency_matrix' is a Scipy sparse matrix.")
-        adjacency_matrix = sp.triu(adjacency_matrix)
-        sources, targets, edge_weights = sp.find(adjacency_matrix)
+        adjacency_matrix = adjacency_matrix.tocsr()
+        # explicit zeros are not edges
+        if not adjacency_matrix.has_canonical_format or np.any(adjacency_matrix.data == 0):
+            adjacency_matrix = adjacency_matrix.copy()
+            adjacency_matrix.sum_duplicates()
+            adjacency_matrix.eliminate_zeros()
+        return csr_2_undirected_graph(adjacency_matrix.indptr, adjacency_matrix.indices, adjacency_matrix.data)
     else:
         adjacency_matrix = adjacency_matrix.copy()
         adjacency_matrix[np.tri(*adjacency_matrix.shape, k=-1, dtype=np.bool)] = non_edge_value
@@ -132,6 +143,76 @@ def adjacency_matrix_2_undirected_graph(adjacency_matrix, non_edge_value=0):
     return graph, edge_weights
 
 
+def arcs_2_undirected_graph(num_vertices, sources, targets, arc_weights=None, symmetrization="max"):
+    """
+    Undirected edge-weighted graph corresponding to a list of weighted arcs (directed edges) :math:`(sources[i], targets[i])`.
+
+    Arcs between the same pair of vertices, in any direction, are merged into a single edge according to the
+    argument :attr:`symmetrization`:
+
+        - ``"max"``: an edge :math:`\{x,y\}` is created if any arc :math:`(x,y)` or :math:`(y,x)` exists.
+          Its weight is the maximum weight of those arcs.
+        - ``"min"``: an edge :math:`\{x,y\}` is created if both arcs :math:`(x,y)` and :math:`(y,x)` exist.
+          Its weight is the minimum weight of those arcs.
+
+    Repeated arcs are thus removed. Edges of the resulting graph are sorted in lexicographic order of their
+    extremities :math:`(min(x,y), max(x,y))`.
+
+    The graph is built in a single pass in time linear in the number of vertices plus the number of arcs.
+
+    :param num_vertices: number of vertices of the graph
+    :param sources: a 1d array of source vertices
+    :param targets: a 1d array of target vertices
+    :param arc_weights: a 1d array of arc weights (optional)
+    :param symmetrization: ``"max"`` (default) or ``"min"``
+    :return: a pair (UndirectedGraph, ndarray) representing the graph and its edge_weights
+             (Concept :class:`~higra.CptEdgeWeightedGraph`), edge_weights is ``None`` if :attr:`arc_weights` is ``None``
+    """
+    sources = hg.cast_to_dtype(np.asarray(sources), hg.index_dtype())
+    targets = hg.cast_to_dtype(np.asarray(targets), hg.index_dtype())
+    weighted = arc_weights is not None
+    if not weighted:
+        arc_weights = np.zeros((0,), dtype=np.float64)
+
+    graph, edge_weights = hg.cpp._arcs_2_undirected_graph(num_vertices, sources, targets, arc_weights, symmetrization)
+
+    return graph, edge_weights if weighted else None
+
+
+def csr_2_undirected_graph(indptr, indices, data=None, symmetrization="max"):
+    """
+    Undirected edge-weighted graph corresponding to a square sparse matrix in compressed sparse row (CSR) format.
+
+    The non zero entries of the row :math:`i` of the matrix are located in the columns
+    :math:`indices[indptr[i]:indptr[i+1]]` and their values are :math:`data[indptr[i]:indptr[i+1]]`
+    (see :class:`scipy.sparse.csr_matrix`).
+
+    Each entry :math:`(i, j)` is an arc from :math:`i` to :math:`j`: see :func:`~higra.arcs_2_undirected_graph`
+    for the possible values of :attr:`symmetrization`.
+
+    :Example:
+
+    >>> A = sklearn.neighbors.kneighbors_graph(X, n_neighbors=5, mode="distance")
+    >>> graph, edge_weights = hg.csr_2_undirected_graph(A.indptr, A.indices, A.data)
+
+    :param indptr: a 1d array of size :math:`n+1` where :math:`n` is the number of vertices
+    :param indices: a 1d array of column indices
+    :param data: a 1d array of matrix entries (optional)
+    :param symmetrization: ``"max"`` (default) or ``"min"``
+    :return: a pair (UndirectedGraph, ndarray) representing the graph and its edge_weights
+             (Concept :class:`~higra.CptEdgeWeightedGraph`), edge_weights is ``None`` if :attr:`data` is ``None``
+    """
+    indptr = hg.cast_to_dtype(np.asarray(indptr), hg.index_dtype())
+    indices = hg.cast_to_dtype(np.asarray(indices), hg.index_dtype())
+    weighted = data is not None
+    if not weighted:
+        data = np.zeros((0,), dtype=np.float64)
+
+    graph, edge_weights = hg.cpp._csr_2_undirected_graph(indptr, indices, data, symmetrization)
+
+    return graph, edge_weights if weighted else None
+
+
 def ultrametric_open(graph, edge_weights):
     """
     Subdominant ultrametric of the given edge weighted graph.
@@ -152,7 +233,7 @@ def ultrametric_open(graph, edge_weights):
     return hg.saliency(altitudes)
 
 
-def minimum_spanning_tree(graph, edge_weights):
+def minimum_spanning_tree(graph, edge_weights, algorithm="kruskal"):
     """
     Computes the minimum spanning tree of the given edge weighted graph with Kruskal's algorithm.
 
@@ -160,11 +241,15 @@ def minimum_spanning_tree(graph, edge_weights):
 
     Complexity: :math:`\mathcal{O}(n*log(n))` with :math:`n` the number of edges in the graph
 
+    The argument :attr:`algorithm` selects the Kruskal engine, ``"kruskal"`` (default) or ``"filter_kruskal"``
+    (see :func:`~higra.bpt_canonical`): both give exactly the same result.
+
     :param graph: Input graph
     :param edge_weights: Graph edge weights
+    :param algorithm: ``"kruskal"`` or ``"filter_kruskal"`` (default ``"kruskal"``)
     :return: a minimum spanning tree of the input edge weighted graph (Concept :class:`~higra.CptMinimumSpanningTree`)
     """
-    mst, edge_map = hg.cpp._minimum_spanning_tree(graph, edge_weights)
+    mst, edge_map = hg.cpp._minimum_spanning_tree(graph, edge_weights, algorithm)
     hg.CptMinimumSpanningTree.link(mst, mst_edge_map=edge_map, base_graph=graph)
     return mst
 
@@ -182,6 +267,7 @@ def make_graph_from_points(X, graph_type="knn+mst", symmetrization="max", **kwar
         - ``"knn+mst"`` (default): creates a :math:`k`-nearest neighbor graph and add the edges of an mst of the complete graph.
           This method ensures that the resulting graph is connected.
           The parameter :math:`k` can be controlled with the extra parameter 'n_neighbors' (default value 5).
+        - ``"mst"``: creates a minimum spanning tree of the complete graph.
         - ``"delaunay"``: creates a graph corresponding to the Delaunay triangulation of the points
           (only works in low dimensions).
 
@@ -196,74 +282,76 @@ def make_graph_from_points(X, graph_type="knn+mst", symmetrization="max", **kwar
         - ``"max"``: an edge :math:`\{x,y\}` is created if there is any of the two arcs :math:`(x,y)` and :math:`(y,x)` exists.
           Its weight is given by the weight of the existing arcs (if both arcs exists they necessarily have the same weight).
 
-    This method is not suited for large set of points.
+    Except for the ``"complete"`` graph, the pairwise distance matrix is never computed:
+    nearest neighbors are found with the tree based search of :func:`sklearn.neighbors.kneighbors_graph`
+    and the minimum spanning tree of the complete graph is computed with Boruvka's algorithm on a kd-tree
+    (the memory footprint is linear in the number of points).
+    The extra parameter 'n_jobs' (default value ``None``) is forwarded to :func:`sklearn.neighbors.kneighbors_graph`,
+    the minimum spanning tree computation uses the threads of Higra (see :func:`~higra.set_num_threads`).
 
     :param X: A 2d array of vertex coordinates
-    :param graph_type: ``"complete"``, ``"knn"``, ``"knn+mst"`` (default), or ``"delaunay"``
+    :param graph_type: ``"complete"``, ``"knn"``, ``"knn+mst"`` (default), ``"mst"``, or ``"delaunay"``
     :param symmetrization: `"min"`` or ``"max"``
     :param kwargs: extra args depends of chosen graph type
     :return: a graph and its edge weights
     """
     try:
-        from scipy.spatial.distance import pdist, squareform, euclidean
+        from scipy.spatial.distance import pdist, squareform
         from sklearn.neighbors import kneighbors_graph
-        from scipy.sparse.csgraph import minimum_spanning_tree
         from scipy.spatial import Delaunay
     except:
         raise RuntimeError("scipy and sklearn required.")
 
     n_neighbors = kwargs.get('n_neighbors', 5)
     mode = kwargs.get('mode', 'distance')
+    n_jobs = kwargs.get('n_jobs', None)
 
-    def symmetrization_fun(A):
-        if symmetrization == "min":
-            return A.minimum(A.T)
-        elif symmetrization == "max":
-            return A.maximum(A.T)
-        else:
+    X = np.asarray(X)
+    num_vertices = X.shape[0]
+
+    def knn_graph():
+        if symmetrization not in ("min", "max"):
             raise ValueError("Unknown symmetrization: " + str(symmetrization))
+        A = kneighbors_graph(X, n_neighbors=n_neighbors, mode=mode, n_jobs=n_jobs)
+        return hg.csr_2_undirected_graph(A.indptr, A.indices, A.data, symmetrization)
+
+    def euclidean_mst():
+        points = X if np.issubdtype(X.dtype, np.floating) else X.astype(np.float64)
+        return hg.cpp._euclidean_minimum_spanning_tree(points)
 
     if graph_type == "complete":
         d = pdist(X)
         A = squareform(d)
         g, edge_weights = hg.adjacency_matrix_2_undirected_graph(A)
     elif graph_type == "knn":
-        A = kneighbors_graph(X, n_neighbors=n_neighbors, mode=mode)
-        A = symmetrization_fun(A)
-        g, edge_weights = hg.adjacency_matrix_2_undirected_graph(A)
+        g, edge_weights = knn_graph()
     elif graph_type == "knn+mst":
-        A = kneighbors_graph(X, n_neighbors=n_neighbors, mode=mode)
-        A = symmetrization_fun(A)
-        D = squareform(pdist(X))
-        MST = minimum_spanning_tree(D)
-        MST = MST + MST.T
-        A = A.maximum(MST)
-        g, edge_weights = hg.adjacency_matrix_2_undirected_graph(A)
+        g, edge_weights = knn_graph()
+        mst, mst_edge_weights = euclidean_mst()
+        sources, targets = g.edge_list()
+        mst_sources, mst_targets = mst.edge_list()
+        g, edge_weights = hg.arcs_2_undirected_graph(num_vertices,
+                                                     np.concatenate((sources, mst_sources)),
+                                                     np.concatenate((targets, mst_targets)),
+                                                     np.concatenate((edge_weights, mst_edge_weights)),
+                                                     "max")
     elif graph_type == "delaunay":
-        g = hg.UndirectedGraph(X.shape[0])
-        edge_weights = []
-
         # add QJ to ensure that coplanar point are not discarded
         tmp = Delaunay(X)
-        nbp = X.shape[0]
         if tmp.coplanar.size != 0:
             print("Warning coplanar points detected!")
-        indices, indptr = tmp.vertex_neighbor_vertices
+        indptr, indices = tmp.vertex_neighbor_vertices
 
-        for k in range(nbp):
-            neighbours = indptr[indices[k]:indices[k+1]]
-            for n in neighbours:
-                if n > k:
-                    d = euclidean(X[k, :], X[n, :])
-                    g.add_edge(k, n)
-                    edge_weights.append(d)
+        sources = np.repeat(np.arange(num_vertices), np.diff(indptr))
+        keep = indices > sources
+        sources = sources[keep]
+        targets = indices[keep]
 
-        edge_weights = np.asarray(edge_weights, dtype=np.float64)
+        g = hg.UndirectedGraph(num_vertices)
+        g.add_edges(sources, targets)
+        edge_weights = np.sqrt(np.sum((X[sources, :] - X[targets, :]) ** 2, axis=1, dtype=np.float64))
     elif graph_type == "mst":
-        D = squareform(pdist(X))
-        MST = minimum_spanning_tree(D).toarray()
-        MST = MST + MST.T
-        g, edge_weights = hg.adjacency_matrix_2_undirected_graph(MST)
+        g, edge_weights = euclidean_mst()
     else:
         raise ValueError("Unknown graph_type: " + str(graph_type))
 
@@ -38,7 +38,8 @@ struct def_project_fine_to_coarse_labelisation {
               py::arg("labelisation_fine"),
               py::arg("labelisation_coarse"),
               py::arg("num_regions_fine") = 0,
-              py::arg("num_regions_coarse") = 0);
+              py::arg("num_regions_coarse") = 0,
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -52,7 +53,8 @@ struct def_from_cut {
                      },
                      doc,
                      py::arg("graph"),
-                     py::arg("edge_weights"));
+                     py::arg("edge_weights"),
+                     py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -66,7 +68,8 @@ struct def_from_labelisation {
                      },
                      doc,
                      py::arg("graph"),
-                     py::arg("vertex_labels"));
+                     py::arg("vertex_labels"),
+                     py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -82,7 +85,8 @@ struct def_from_hierarchy {
                      doc,
                      py::arg("graph"),
                      py::arg("tree"),
-                     py::arg("altitudes"));
+                     py::arg("altitudes"),
+                     py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -98,7 +102,8 @@ struct def_align_hierarchy {
               },
               doc,
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
         c.def("align_hierarchy", [](
                       const hg::hierarchy_aligner &a,
                       const hg::ugraph &graph,
@@ -107,7 +112,8 @@ struct def_align_hierarchy {
               },
               doc,
               py::arg("graph"),
-              py::arg("saliency_map"));
+              py::arg("saliency_map"),
+              py::call_guard<py::gil_scoped_release>());
         c.def("align_hierarchy", [](
                       const hg::hierarchy_aligner &a,
                       const pyarray<hg::index_t> &super_vertices,
@@ -118,7 +124,8 @@ struct def_align_hierarchy {
               doc,
               py::arg("super_vertices"),
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -30,7 +30,8 @@ struct def_graph_cut_2_labelisation {
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights"));
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -45,7 +46,78 @@ struct def_labelisation_2_graph_cut {
               },
               doc,
               py::arg("graph"),
-              py::arg("vertex_labels"));
+              py::arg("vertex_labels"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_undirected_graph_2_csr {
+    template<typename value_t>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_undirected_graph_2_csr", [](const graph_t &graph,
+                                            const pyarray<value_t> &edge_weights) {
+                  return hg::undirected_graph_2_csr(graph, edge_weights);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+struct def_arcs_2_undirected_graph {
+    template<typename value_t>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_arcs_2_undirected_graph", [](hg::size_t num_vertices,
+                                             const pyarray<hg::index_t> &sources,
+                                             const pyarray<hg::index_t> &targets,
+                                             const pyarray<value_t> &arc_weights,
+                                             const std::string &symmetrization) {
+                  return hg::arcs_2_undirected_graph(num_vertices, sources, targets, arc_weights,
+                                                     py_arc_symmetrization(symmetrization));
+              },
+              doc,
+              py::arg("num_vertices"),
+              py::arg("sources"),
+              py::arg("targets"),
+              py::arg("arc_weights"),
+              py::arg("symmetrization") = "max",
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+struct def_csr_2_undirected_graph {
+    template<typename value_t>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_csr_2_undirected_graph", [](const pyarray<hg::index_t> &indptr,
+                                            const pyarray<hg::index_t> &indices,
+                                            const pyarray<value_t> &data,
+                                            const std::string &symmetrization) {
+                  return hg::csr_2_undirected_graph(indptr, indices, data, py_arc_symmetrization(symmetrization));
+              },
+              doc,
+              py::arg("indptr"),
+              py::arg("indices"),
+              py::arg("data"),
+              py::arg("symmetrization") = "max",
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+struct def_euclidean_minimum_spanning_tree {
+    template<typename value_t>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_euclidean_minimum_spanning_tree", [](const pyarray<value_t> &points) {
+                  return hg::euclidean_minimum_spanning_tree(points);
+              },
+              doc,
+              py::arg("points"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -55,13 +127,16 @@ struct def_minimum_spanning_tree {
     static
     void def(pybind11::module &m, const char *doc) {
         m.def("_minimum_spanning_tree", [](const graph_t &graph,
-                                           const pyarray<value_t> &edge_weights) {
-                  auto res = hg::minimum_spanning_tree(graph, edge_weights);
-                  return pybind11::make_tuple(std::move(res.mst), std::move(res.mst_edge_map));
+                                           const pyarray<value_t> &edge_weights,
+                                           const std::string &algorithm) {
+                  auto res = hg::minimum_spanning_tree(graph, edge_weights, py_mst_algorithm(algorithm));
+                  return std::make_tuple(std::move(res.mst), std::move(res.mst_edge_map));
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights"));
+              py::arg("edge_weights"),
+              py::arg("algorithm") = "kruskal",
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -90,4 +165,34 @@ void py_init_algo_graph_core(pybind11::module &m) {
             (m,
              ""
             );
+
+    add_type_overloads<def_euclidean_minimum_spanning_tree,
+            HG_TEMPLATE_FLOAT_TYPES>
+            (m,
+             ""
+            );
+
+    add_type_overloads<def_undirected_graph_2_csr<hg::ugraph>,
+            HG_TEMPLATE_NUMERIC_TYPES>
+            (m,
+             ""
+            );
+
+    add_type_overloads<def_undirected_graph_2_csr<hg::tree>,
+            HG_TEMPLATE_NUMERIC_TYPES>
+            (m,
+             ""
+            );
+
+    add_type_overloads<def_arcs_2_undirected_graph,
+            HG_TEMPLATE_NUMERIC_TYPES>
+            (m,
+             ""
+            );
+
+    add_type_overloads<def_csr_2_undirected_graph,
+            HG_TEMPLATE_NUMERIC_TYPES>
+            (m,
+             ""
+            );
 }
\ No newline at end of file
@@ -11,6 +11,33 @@
 #pragma once
 
 #include "pybind11/pybind11.h"
+#include "higra/algo/kruskal.hpp"
+#include "higra/graph.hpp"
+#include <stdexcept>
+#include <string>
 
+/**
+ * Converts the name of a Kruskal engine ("kruskal" or "filter_kruskal") into the corresponding mst_algorithm value.
+ */
+inline hg::mst_algorithm py_mst_algorithm(const std::string &algorithm) {
+    if (algorithm == "kruskal") {
+        return hg::mst_algorithm::kruskal;
+    } else if (algorithm == "filter_kruskal") {
+        return hg::mst_algorithm::filter_kruskal;
+    }
+    throw std::runtime_error("Unknown algorithm '" + algorithm + "', possible values are 'kruskal' and 'filter_kruskal'.");
+}
+
+/**
+ * Converts the name of an arc symmetrization strategy ("max" or "min") into the corresponding arc_symmetrization value.
+ */
+inline hg::arc_symmetrization py_arc_symmetrization(const std::string &symmetrization) {
+    if (symmetrization == "max") {
+        return hg::arc_symmetrization::max;
+    } else if (symmetrization == "min") {
+        return hg::arc_symmetrization::min;
+    }
+    throw std::runtime_error("Unknown symmetrization '" + symmetrization + "', possible values are 'max' and 'min'.");
+}
 
 void py_init_algo_graph_core(pybind11::module &m);
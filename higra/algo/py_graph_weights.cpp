@@ -34,7 +34,8 @@ struct def_weight_graph {
               doc,
               py::arg("explicit_graph"),
               py::arg("vertex_weights"),
-              py::arg("weigh_function"));
+              py::arg("weigh_function"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
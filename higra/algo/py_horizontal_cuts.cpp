@@ -73,7 +73,8 @@ struct def_horizontal_cut_explorer_ctr {
                 },
               doc,
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
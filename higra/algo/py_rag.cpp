@@ -29,11 +29,12 @@ struct def_make_rag {
         c.def("_make_region_adjacency_graph_from_labelisation",
               [](const graph_t &graph, const pyarray<value_t> &input) {
                   auto res = hg::make_region_adjacency_graph_from_labelisation(graph, input);
-                  return py::make_tuple(std::move(res.rag), std::move(res.vertex_map), std::move(res.edge_map));
+                  return std::make_tuple(std::move(res.rag), std::move(res.vertex_map), std::move(res.edge_map));
               },
               doc,
               py::arg("graph"),
-              py::arg("vertex_labels"));
+              py::arg("vertex_labels"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -44,11 +45,12 @@ struct def_make_rag_cut {
     void def(C &c, const char *doc) {
         c.def("_make_region_adjacency_graph_from_graph_cut", [](const graph_t &graph, const pyarray<value_t> &input) {
                   auto res = hg::make_region_adjacency_graph_from_graph_cut(graph, input);
-                  return py::make_tuple(std::move(res.rag), std::move(res.vertex_map), std::move(res.edge_map));
+                  return std::make_tuple(std::move(res.rag), std::move(res.vertex_map), std::move(res.edge_map));
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights"));
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -62,7 +64,8 @@ struct def_rag_back_project_weights {
               },
               doc,
               py::arg("rag_map"),
-              py::arg("rag_weights"));
+              py::arg("rag_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -32,7 +32,8 @@ struct labelisation_horizontal_cut {
               doc,
               py::arg("tree"),
               py::arg("threshold"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -46,7 +47,8 @@ struct labelisation_hierarchy_supervertices {
               },
               doc,
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -62,7 +64,8 @@ struct binary_labelisation_from_markers {
               doc,
               py::arg("tree"),
               py::arg("object_marker"),
-              py::arg("background_marker"));
+              py::arg("background_marker"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -73,11 +76,12 @@ struct sort_hierarchy_with_altitudes {
         m.def("_sort_hierarchy_with_altitudes", [](const hg::tree &tree,
                                                       const pyarray<value_t> &altitudes) {
                   auto res = hg::sort_hierarchy_with_altitudes(tree, altitudes);
-                  return pybind11::make_tuple(std::move(res.tree), std::move(res.node_map));
+                  return std::make_tuple(std::move(res.tree), std::move(res.node_map));
               },
               doc,
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -58,7 +58,8 @@ struct def_labelisation_optimal_cut_from_energy {
               doc,
               py::arg("tree"),
               py::arg("energy_attribute"),
-              py::arg("accumulator"));
+              py::arg("accumulator"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -81,7 +82,8 @@ struct def_hierarchy_to_optimal_energy_cut_hierarchy {
               py::arg("tree"),
               py::arg("data_fidelity_attribute"),
               py::arg("regularization_attribute"),
-              py::arg("approximation_piecewise_linear_function"));
+              py::arg("approximation_piecewise_linear_function"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -113,7 +115,8 @@ void py_init_tree_energy_optimization(pybind11::module &m) {
           py::arg("vertex_area"),
           py::arg("vertex_values"),
           py::arg("squared_vertex_values"),
-          py::arg("edge_length"));
+          py::arg("edge_length"),
+          py::call_guard<py::gil_scoped_release>());
 }
 
 
@@ -25,7 +25,7 @@ void py_init_tree_fusion(pybind11::module &m) {
 
     m.def("_tree_fusion_depth_map", [](const std::vector<tree *> &trees) {
         return tree_fusion_depth_map(trees);
-    });
+    }, py::call_guard<py::gil_scoped_release>());
 
 }
 
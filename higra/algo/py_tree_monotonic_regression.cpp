@@ -35,7 +35,8 @@ struct def_tree_monotonic_regression {
               py::arg("tree"),
               py::arg("altitudes"),
               py::arg("mode"),
-              py::arg("weights") = hg::array_1d<double>());
+              py::arg("weights") = hg::array_1d<double>(),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
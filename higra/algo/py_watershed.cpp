@@ -30,7 +30,8 @@ struct def_labelisation_watershed {
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights"));
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -50,7 +51,8 @@ struct def_labelisation_seeded_watershed {
               py::arg("graph"),
               py::arg("edge_weights"),
               py::arg("vertex_seeds"),
-              py::arg("background_label"));
+              py::arg("background_label"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
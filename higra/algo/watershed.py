@@ -67,7 +67,7 @@ def labelisation_seeded_watershed(graph, edge_weights, vertex_seeds, background_
 
     vertex_seeds = hg.linearize_vertex_weights(vertex_seeds, graph)
 
-    vertex_seeds = hg.cast_to_dtype(vertex_seeds, np.int64)
+    vertex_seeds = hg.cast_to_dtype(vertex_seeds, hg.index_dtype())
 
     labels = hg.cpp._labelisation_seeded_watershed(graph, edge_weights, vertex_seeds, background_label)
 
@@ -37,7 +37,7 @@ def make_assesser_fragmentation_optimal_cut(tree,
     if vertex_map is None:
         return hg.AssesserFragmentationOptimalCut(tree, ground_truth, measure, max_regions=int(max_regions))
     else:
-        vertex_map = hg.cast_to_dtype(vertex_map, np.int64)
+        vertex_map = hg.cast_to_dtype(vertex_map, hg.index_dtype())
         return hg.AssesserFragmentationOptimalCut(tree, ground_truth, measure, max_regions=int(max_regions),
                                                   vertex_map=vertex_map)
 
@@ -91,14 +91,13 @@ def assess_fragmentation_horizontal_cut(tree,
     :return: an object of type :class:`~higra.FragmentationCurve`
     """
 
-    if ground_truth.dtype != np.int64:
-        ground_truth = ground_truth.astype(np.int64)
+    ground_truth = hg.cast_to_dtype(ground_truth, hg.index_dtype())
 
     if vertex_map is None:
         return hg.cpp._assess_fragmentation_horizontal_cut(tree, altitudes, ground_truth, measure,
                                                            max_regions=int(max_regions))
     else:
-        vertex_map = hg.cast_to_dtype(vertex_map, np.int64)
+        vertex_map = hg.cast_to_dtype(vertex_map, hg.index_dtype())
         return hg.cpp._assess_fragmentation_horizontal_cut(tree, altitudes, ground_truth, measure,
                                                            max_regions=int(max_regions),
                                                            vertex_map=vertex_map)
@@ -74,7 +74,8 @@ struct def_assesse_horizontal_cut {
               py::arg("ground_truth"),
               py::arg("optimal_cut_measure"),
               py::arg("vertex_map") = xt::pytensor<index_t, 1>{},
-              py::arg("max_regions") = 200);
+              py::arg("max_regions") = 200,
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
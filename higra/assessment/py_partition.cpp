@@ -39,7 +39,8 @@ struct def_assess_partition {
               doc,
               py::arg("candidate"),
               py::arg("ground_truth"),
-              py::arg("partition_measure"));
+              py::arg("partition_measure"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
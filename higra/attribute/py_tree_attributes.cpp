@@ -39,7 +39,8 @@ struct def_contour_length_component_tree {
               py::arg("tree"),
               py::arg("graph"),
               py::arg("vertex_perimeter"),
-              py::arg("edge_length"));
+              py::arg("edge_length"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -57,7 +58,8 @@ struct def_attribute_extrema {
               },
               doc,
               py::arg("tree"),
-              py::arg("altitudes"));
+              py::arg("altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -78,7 +80,8 @@ struct def_attribute_height {
               doc,
               py::arg("tree"),
               py::arg("altitudes"),
-              py::arg("increasing_altitudes"));
+              py::arg("increasing_altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -102,7 +105,8 @@ struct def_attribute_extinction_value {
               py::arg("tree"),
               py::arg("altitudes"),
               py::arg("attribute"),
-              py::arg("increasing_altitudes"));
+              py::arg("increasing_altitudes"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -120,33 +124,89 @@ struct def_attribute_children_pair_sum_product {
               },
               doc,
               py::arg("tree"),
-              py::arg("node_weights"));
+              py::arg("node_weights"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+struct def_attribute_fused {
+    template<typename T>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_attribute_fused",
+              [](const hg::tree &tree,
+                 const std::vector<hg::fused_attribute> &attributes,
+                 const pyarray<double> &leaf_area,
+                 const pyarray<T> &altitudes,
+                 bool increasing_altitudes,
+                 const pyarray<double> &vertex_weights,
+                 const pyarray<double> &vertex_perimeter,
+                 const pyarray<double> &frontier_length) {
+                  auto res = hg::attribute_fused(
+                          tree,
+                          attributes,
+                          leaf_area,
+                          altitudes,
+                          increasing_altitudes,
+                          vertex_weights,
+                          vertex_perimeter,
+                          frontier_length
+                  );
+                  return std::make_tuple(std::move(res.area),
+                                         std::move(res.volume),
+                                         std::move(res.height),
+                                         std::move(res.depth),
+                                         std::move(res.contour_length),
+                                         std::move(res.mean_vertex_weights));
+              },
+              doc,
+              py::arg("tree"),
+              py::arg("attributes"),
+              py::arg("leaf_area"),
+              py::arg("altitudes"),
+              py::arg("increasing_altitudes"),
+              py::arg("vertex_weights"),
+              py::arg("vertex_perimeter"),
+              py::arg("frontier_length"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
 void py_init_attributes(pybind11::module &m) {
     xt::import_numpy();
+
+    py::enum_<hg::fused_attribute>(m, "FusedAttribute",
+                                   "Attributes that can be computed by :func:`~higra.compute_attributes`.")
+            .value("area", hg::fused_attribute::area)
+            .value("volume", hg::fused_attribute::volume)
+            .value("height", hg::fused_attribute::height)
+            .value("depth", hg::fused_attribute::depth)
+            .value("contour_length", hg::fused_attribute::contour_length)
+            .value("mean_vertex_weights", hg::fused_attribute::mean_vertex_weights);
     m.def("_attribute_sibling",
           [](const hg::tree &tree, hg::index_t skip) {
               return hg::attribute_sibling(tree, skip);
           },
           "",
           pybind11::arg("tree"),
-          pybind11::arg("skip") = 1);
+          pybind11::arg("skip") = 1,
+          py::call_guard<py::gil_scoped_release>());
 
     m.def("_attribute_depth",
           [](const hg::tree &tree) {
               return hg::attribute_depth(tree);
           },
           "",
-          pybind11::arg("tree"));
+          pybind11::arg("tree"),
+          py::call_guard<py::gil_scoped_release>());
 
     m.def("_attribute_child_number",
           [](const hg::tree &tree) {
               return hg::attribute_child_number(tree);
           },
           "",
-          pybind11::arg("tree"));
+          pybind11::arg("tree"),
+          py::call_guard<py::gil_scoped_release>());
 
     add_type_overloads<def_contour_length_component_tree,
             HG_TEMPLATE_FLOAT_TYPES>(m, "");
@@ -162,4 +222,7 @@ void py_init_attributes(pybind11::module &m) {
 
     add_type_overloads<def_attribute_children_pair_sum_product,
             int32_t, uint32_t, int64_t, uint64_t, float, double>(m, "");
+
+    add_type_overloads<def_attribute_fused,
+            HG_TEMPLATE_NUMERIC_TYPES>(m, "");
 }
@@ -670,8 +670,8 @@ def attribute_topological_height(tree):
     """
 
     res = hg.accumulate_and_add_sequential(tree,
-                                           np.ones(tree.num_vertices(), dtype=np.int64),
-                                           np.zeros(tree.num_leaves(), dtype=np.int64),
+                                           np.ones(tree.num_vertices(), dtype=hg.index_dtype()),
+                                           np.zeros(tree.num_leaves(), dtype=hg.index_dtype()),
                                            hg.Accumulators.max)
 
     return res
@@ -747,3 +747,146 @@ def attribute_moment_of_inertia(tree, leaf_graph):
     I_1 = (miu_20 + miu_02) / (M_00 ** 2)
 
     return I_1
+
+
+# attributes accepted by compute_attributes and the fused attributes they rely on
+__compute_attributes_dependencies = {
+    "area": ("area",),
+    "volume": ("volume",),
+    "height": ("height",),
+    "depth": ("depth",),
+    "contour_length": ("contour_length",),
+    "compactness": ("area", "contour_length"),
+    "mean_vertex_weights": ("mean_vertex_weights",),
+}
+
+
+@hg.argument_helper(hg.CptHierarchy)
+def compute_attributes(tree, attributes, altitudes=None, vertex_weights=None, vertex_area=None,
+                       vertex_perimeter=None, edge_length=None, increasing_altitudes="auto", normalize=True,
+                       leaf_graph=None):
+    """
+    Computes several attributes of the nodes of the given tree at once.
+
+    Instead of calling one attribute function per attribute, each one doing its own traversal of the tree, the
+    dependencies of the requested attributes are resolved once and all the accumulations are performed together
+    in a single leaves to root traversal.
+
+    Possible values in :attr:`attributes` are:
+
+        - ``"area"``: see :func:`~higra.attribute_area`;
+        - ``"volume"``: see :func:`~higra.attribute_volume` (requires :attr:`altitudes`);
+        - ``"height"``: see :func:`~higra.attribute_height` (requires :attr:`altitudes`);
+        - ``"depth"``: see :func:`~higra.attribute_depth`;
+        - ``"contour_length"``: see :func:`~higra.attribute_contour_length`;
+        - ``"compactness"``: see :func:`~higra.attribute_compactness`;
+        - ``"mean_vertex_weights"``: see :func:`~higra.attribute_mean_vertex_weights` (requires :attr:`vertex_weights`).
+
+    Example:
+
+    >>> res = hg.compute_attributes(tree, ["area", "volume", "mean_vertex_weights"],
+    >>>                             altitudes=altitudes, vertex_weights=image)
+    >>> area, volume = res["area"], res["volume"]
+
+    :param tree: input tree (Concept :class:`~higra.CptHierarchy`)
+    :param attributes: list of attribute names
+    :param altitudes: node altitudes of the input tree (used by volume and height)
+    :param vertex_weights: vertex weights of the leaf graph of the input tree (used by mean_vertex_weights)
+    :param vertex_area: area of the vertices of the leaf graph of the tree (provided by :func:`~higra.attribute_vertex_area` on `leaf_graph` )
+    :param vertex_perimeter: perimeter of each vertex of the leaf graph (provided by :func:`~higra.attribute_vertex_perimeter` on `leaf_graph`)
+    :param edge_length: length of each edge of the leaf graph (provided by :func:`~higra.attribute_edge_length` on `leaf_graph`)
+    :param increasing_altitudes: possible values 'auto', True, False, 'increasing', and 'decreasing' (used by height)
+    :param normalize: if True the compactness is divided by the maximal compactness value in the tree
+    :param leaf_graph: (deduced from :class:`~higra.CptHierarchy`)
+    :return: a dictionary mapping each requested attribute name to its value
+    """
+    if isinstance(attributes, str):
+        attributes = (attributes,)
+
+    fused = []
+    for name in attributes:
+        if name not in __compute_attributes_dependencies:
+            raise ValueError("Unknown attribute '" + str(name) + "', valid attributes are: " +
+                             ", ".join(__compute_attributes_dependencies) + ".")
+        for dependency in __compute_attributes_dependencies[name]:
+            if dependency not in fused:
+                fused.append(dependency)
+
+    empty = np.zeros((0,), dtype=np.float64)
+    leaf_area = empty
+    if "area" in fused or "volume" in fused or "mean_vertex_weights" in fused:
+        if vertex_area is None:
+            if leaf_graph is not None:
+                vertex_area = hg.attribute_vertex_area(leaf_graph)
+            else:
+                vertex_area = np.ones((tree.num_leaves(),), dtype=np.float64)
+
+        if leaf_graph is not None:
+            vertex_area = hg.linearize_vertex_weights(vertex_area, leaf_graph)
+        leaf_area = np.ascontiguousarray(vertex_area, dtype=np.float64)
+
+    inc = True
+    if "volume" in fused or "height" in fused:
+        if altitudes is None:
+            raise ValueError("Parameter 'altitudes' is required to compute the volume and the height.")
+        if "height" in fused:
+            inc = __process_param_increasing_altitudes(tree, altitudes, increasing_altitudes)
+    else:
+        altitudes = empty
+
+    frontier_length = empty
+    if "contour_length" in fused:
+        if leaf_graph is None:
+            raise ValueError("Parameter 'leaf_graph' is required to compute the contour length.")
+        if vertex_perimeter is None:
+            vertex_perimeter = hg.attribute_vertex_perimeter(leaf_graph)
+        if edge_length is None:
+            edge_length = hg.attribute_edge_length(leaf_graph)
+
+        vertex_perimeter = hg.linearize_vertex_weights(vertex_perimeter, leaf_graph)
+        vertex_perimeter = np.ascontiguousarray(vertex_perimeter, dtype=np.float64)
+        frontier_length = hg.attribute_frontier_length(tree, edge_length, leaf_graph)
+        frontier_length = np.ascontiguousarray(frontier_length, dtype=np.float64)
+    else:
+        vertex_perimeter = empty
+
+    weights_shape = None
+    if "mean_vertex_weights" in fused:
+        if vertex_weights is None:
+            raise ValueError("Parameter 'vertex_weights' is required to compute the mean vertex weights.")
+        if leaf_graph is not None:
+            vertex_weights = hg.linearize_vertex_weights(vertex_weights, leaf_graph)
+        weights_shape = vertex_weights.shape[1:]
+        vertex_weights = np.ascontiguousarray(vertex_weights, dtype=np.float64).reshape((tree.num_leaves(), -1))
+    else:
+        vertex_weights = np.zeros((0, 0), dtype=np.float64)
+
+    area, volume, height, depth, contour_length, mean_vertex_weights = hg.cpp._attribute_fused(
+        tree,
+        [getattr(hg.FusedAttribute, a) for a in fused],
+        leaf_area,
+        altitudes,
+        inc,
+        vertex_weights,
+        vertex_perimeter,
+        frontier_length)
+
+    values = {"area": area,
+              "volume": volume,
+              "height": height,
+              "depth": depth,
+              "contour_length": contour_length}
+    if weights_shape is not None:
+        values["mean_vertex_weights"] = mean_vertex_weights.reshape((tree.num_vertices(),) + weights_shape)
+
+    result = {}
+    for name in attributes:
+        if name == "compactness":
+            compactness = area / (contour_length * contour_length)
+            if normalize:
+                compactness = compactness / np.nanmax(compactness)
+            result[name] = compactness
+        else:
+            result[name] = values[name]
+
+    return result
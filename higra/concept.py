@@ -13,11 +13,39 @@ import inspect
 import functools
 
 
+class _ConceptDocstring:
+    """
+    Descriptor generating the docstring of a concept class from its description when it is first accessed.
+    """
+
+    def __get__(self, instance, owner):
+        doc = owner.description()
+        owner.__doc__ = doc
+        return doc
+
+
 def auto_concept_docstring(cls):
-    cls.__doc__ = cls.description()
+    cls.__doc__ = _ConceptDocstring()
     return cls
 
 
+@functools.lru_cache(maxsize=None)
+def _concept_hierarchy(cls):
+    """
+    Data elements of the given concept and of its ancestors (the walk of the method resolution order is done once per
+    concept class).
+
+    :param cls: a concept class
+    :return: a tuple of triplets (concept class, canonical data element name, tuple of pairs (data element name,
+        attribute name)) for each concept class in the method resolution order of :attr:`cls` (excluding the abstract
+        :class:`Concept`)
+    """
+    return tuple((c,
+                  c._canonical_data_element,
+                  tuple((data_name, data_description[1]) for data_name, data_description in c._data_elements.items()))
+                 for c in inspect.getmro(cls) if issubclass(c, Concept) and c is not Concept)
+
+
 class Concept(object):
     _name = "Abstract Concept"
     _description = "A concept describes how a set of data elements can be considered as a coherent notion of higher " \
@@ -72,36 +100,46 @@ class Concept(object):
                             + "' does not satisfy this concept.")
         result = {cls._canonical_data_element: canonical_element}
 
-        classes = inspect.getmro(cls)
-        for c in classes:
-            if issubclass(c, Concept) and c is not Concept:
-                ce_name = c._canonical_data_element
-                if ce_name not in result:
-                    if strict:
-                        raise Exception("Construction of concept '"
-                                        + str(cls)
-                                        + "' failed: "
-                                          "cannot find canonical element named '" + ce_name + "'('" + str(c) + "')")
-                else:
-                    ce = result[ce_name]
-                    for data_name, data_description in c._data_elements.items():
-                        if data_description[1] is not None:
-                            if data_cache is None:
-                                elem = hg.get_attribute(ce, data_description[1])
-                            else:
-                                elem = data_cache.get_data(ce).get(data_description[1], None)
-                            if elem is None:
-                                if strict:
-                                    raise Exception("Construction of concept '"
-                                                    + str(cls)
-                                                    + "' failed: "
-                                                      "cannot find data element named '" + data_description[1] + "'('"
-                                                    + str(ce) + "')")
-                            else:
-                                result[data_name] = elem
+        for c, ce_name, data_elements in _concept_hierarchy(cls):
+            if ce_name not in result:
+                if strict:
+                    raise Exception("Construction of concept '"
+                                    + str(cls)
+                                    + "' failed: "
+                                      "cannot find canonical element named '" + ce_name + "'('" + str(c) + "')")
+            else:
+                ce = result[ce_name]
+                for data_name, attribute_name in data_elements:
+                    if attribute_name is not None:
+                        if data_cache is None:
+                            elem = hg.get_attribute(ce, attribute_name)
+                        else:
+                            elem = data_cache.get_data(ce).get(attribute_name, None)
+                        if elem is None:
+                            if strict:
+                                raise Exception("Construction of concept '"
+                                                + str(cls)
+                                                + "' failed: "
+                                                  "cannot find data element named '" + attribute_name + "'('"
+                                                + str(ce) + "')")
+                        else:
+                            result[data_name] = elem
 
         return result
 
+    @classmethod
+    def data_element_names(cls):
+        """
+        Names of all the data elements of the Concept (including the canonical elements and inherited data elements)
+
+        :return: a set of strings
+        """
+        names = set()
+        for _, ce_name, data_elements in _concept_hierarchy(cls):
+            names.add(ce_name)
+            names.update(data_name for data_name, _ in data_elements)
+        return names
+
     @classmethod
     def description(cls):
         """
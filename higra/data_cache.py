@@ -11,7 +11,14 @@
 import weakref
 import functools
 import sys
+import os
 import inspect
+import collections
+import hashlib
+import pickle
+import shutil
+import tempfile
+import numpy as np
 import higra as hg
 
 
@@ -41,10 +48,24 @@ class WeakKeyDictionary:
     Useful weak key dictionary (compared to the one provided by python...)
 
     Uses solely object id as key.
+
+    If given, :attr:`on_delete` is called with the id of each key that gets garbage collected.
     """
 
-    def __init__(self):
+    def __init__(self, on_delete=None):
         self._data = {}
+        self._on_delete = on_delete
+
+    def __make_ref(self, obj, key):
+        def on_destroy(_):
+            try:
+                del self._data[key]
+            except:
+                pass
+            if self._on_delete is not None:
+                self._on_delete(key)
+
+        return weakref.ref(obj, on_destroy)
 
     def __get__(self, obj, owner):
         _, val = self._data[id(obj)]
@@ -55,13 +76,7 @@ class WeakKeyDictionary:
         try:
             ref, _ = self._data[key]
         except KeyError:
-            def on_destroy(_):
-                try:
-                    del self._data[key]
-                except:
-                    pass
-
-            ref = weakref.ref(obj, on_destroy)
+            ref = self.__make_ref(obj, key)
         self._data[key] = ref, value
 
     def __delete__(self, obj):
@@ -80,16 +95,23 @@ class WeakKeyDictionary:
             _, val = self._data[key]
             return val
         except KeyError:
-            def on_destroy(_):
-                try:
-                    del self._data[key]
-                except:
-                    pass
-
-            ref = weakref.ref(obj, on_destroy)
+            ref = self.__make_ref(obj, key)
             self._data[key] = ref, default
             return default
 
+    def get_by_id(self, key, default=None):
+        """
+        Value associated to the object of the given id, or :attr:`default` if there is no such object.
+
+        :param key: object id
+        :param default:
+        :return:
+        """
+        try:
+            return self._data[key][1]
+        except KeyError:
+            return default
+
     def clear(self):
         self._data.clear()
 
@@ -101,10 +123,47 @@ def _data_cache__init():
     hg.__higra_global_cache = DataCache()
 
 
+def _nbytes(o):
+    """
+    Estimates the memory used by the given object: uses the attribute ``nbytes`` if available (numpy arrays,
+    :class:`~higra.LCAFast`...) and processes the elements of tuples, lists and dictionaries.
+
+    :param o:
+    :return: a number of bytes
+    """
+    n = getattr(o, "nbytes", None)
+    if n is not None and not callable(n):
+        return int(n)
+    if isinstance(o, (tuple, list)):
+        return sys.getsizeof(o) + sum(_nbytes(e) for e in o)
+    if isinstance(o, dict):
+        return sys.getsizeof(o) + sum(_nbytes(e) for e in o.values())
+    return sys.getsizeof(o)
+
+
 class DataCache:
+    """
+    Data associated to objects, cleared when the objects are garbage collected.
+
+    The results of :func:`~higra.auto_cache` decorated functions stored in the cache are tracked in a least recently
+    used order together with their size. If memory limits are set (see :func:`~higra.set_cache_limits`), the least
+    recently used results are evicted whenever a limit is exceeded. Other data (attributes set with
+    :func:`~higra.set_attribute`, concept links, tags) are pinned: they are never evicted.
+    """
 
     def __init__(self):
-        self.__data = WeakKeyDictionary()
+        self.__data = WeakKeyDictionary(on_delete=self.__on_delete)
+        # (object id, function name, hash) -> size in bytes of cached results, in least recently used order
+        self.__lru = collections.OrderedDict()
+        self.__object_bytes = collections.Counter()
+        self.__function_bytes = collections.Counter()
+        self.__total_bytes = 0
+        self.max_bytes = None
+        self.max_bytes_per_object = None
+        self.max_bytes_per_function = None
+        # persistent storage of auto cached results (see set_auto_cache_backend)
+        self.disk_cache = None
+        self.reset_stats()
 
     def get_data(self, key):
         return self.__data.setdefault(key, {})
@@ -112,13 +171,333 @@ class DataCache:
     def clear_data(self, key):
         if key in self.__data:
             del self.__data[key]
+        self.__forget(lambda e: e[0] == id(key))
 
     def clear_all_data(self):
         self.__data.clear()
+        self.__forget(lambda e: True)
 
     def __iter__(self):
         return iter(self.__data)
 
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+    def stats(self):
+        """
+        Usage statistics of the cache.
+
+        :return: a dictionary with the number of ``hits``, ``misses`` and ``evictions`` of auto cached results, the
+            number of misses that were loaded from the disk cache (``disk_hits``), and the number of auto cached results
+            (``entries``) currently stored together with their size (``bytes``)
+        """
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "entries": len(self.__lru),
+                "bytes": self.__total_bytes}
+
+    def cache_hit(self, obj, function_name, h):
+        """
+        Marks the given auto cached result as recently used.
+        """
+        self.hits += 1
+        entry = (id(obj), function_name, h)
+        if entry in self.__lru:
+            self.__lru.move_to_end(entry)
+
+    def cache_result(self, obj, function_name, h, result, from_disk=False):
+        """
+        Registers a new auto cached result (already stored in the data of :attr:`obj`) and evicts least recently used
+        results if a memory limit is exceeded.
+        """
+        self.misses += 1
+        if from_disk:
+            self.disk_hits += 1
+        entry = (id(obj), function_name, h)
+        self.__remove_entry(entry)
+        size = _nbytes(result)
+        self.__lru[entry] = size
+        self.__object_bytes[entry[0]] += size
+        self.__function_bytes[function_name] += size
+        self.__total_bytes += size
+        self.evict()
+
+    def evict(self):
+        """
+        Evicts least recently used auto cached results until all the memory limits are satisfied.
+        """
+        if self.max_bytes is not None:
+            self.__evict_while(lambda e: self.__total_bytes > self.max_bytes)
+        if self.max_bytes_per_object is not None:
+            self.__evict_while(lambda e: self.__object_bytes[e[0]] > self.max_bytes_per_object)
+        if self.max_bytes_per_function is not None:
+            self.__evict_while(lambda e: self.__function_bytes[e[1]] > self.__function_limit(e[1]))
+
+    def __function_limit(self, function_name):
+        if isinstance(self.max_bytes_per_function, dict):
+            return self.max_bytes_per_function.get(function_name, float("inf"))
+        return self.max_bytes_per_function
+
+    def __evict_while(self, condition):
+        for entry in [e for e in self.__lru if condition(e)]:
+            if condition(entry):
+                cache = self.__data.get_by_id(entry[0], {}).get(_auto_cache_keyword, {}).get(entry[1], {})
+                cache.pop(entry[2], None)
+                self.__remove_entry(entry)
+                self.evictions += 1
+
+    def __remove_entry(self, entry):
+        size = self.__lru.pop(entry, None)
+        if size is not None:
+            self.__object_bytes[entry[0]] -= size
+            self.__function_bytes[entry[1]] -= size
+            self.__total_bytes -= size
+            if self.__object_bytes[entry[0]] == 0:
+                del self.__object_bytes[entry[0]]
+            if self.__function_bytes[entry[1]] == 0:
+                del self.__function_bytes[entry[1]]
+
+    def __forget(self, predicate):
+        """
+        Stops tracking the auto cached results whose entry satisfies the predicate (results must have been removed
+        from the data by the caller).
+        """
+        for entry in [e for e in self.__lru if predicate(e)]:
+            self.__remove_entry(entry)
+
+    def forget_auto_cache(self, obj=None, function_name=None):
+        self.__forget(lambda e: (obj is None or e[0] == id(obj)) and (function_name is None or e[1] == function_name))
+
+    def __on_delete(self, key):
+        self.__forget(lambda e: e[0] == key)
+
+
+class _DiskCachePickler(pickle.Pickler):
+    """
+    Pickler that stores numpy arrays in separate ``.npy`` files of the given directory.
+    """
+
+    def __init__(self, file, directory):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory = directory
+        self.num_arrays = 0
+
+    def persistent_id(self, obj):
+        if type(obj) in (np.ndarray, np.memmap) and not obj.dtype.hasobject and obj.size > 0:
+            name = str(self.num_arrays) + ".npy"
+            self.num_arrays += 1
+            np.save(os.path.join(self.directory, name), obj, allow_pickle=False)
+            return name
+        return None
+
+
+class _DiskCacheUnpickler(pickle.Unpickler):
+    """
+    Unpickler that memory maps the numpy arrays stored by :class:`_DiskCachePickler`.
+    """
+
+    def __init__(self, file, directory):
+        super().__init__(file)
+        self.directory = directory
+
+    def persistent_load(self, pid):
+        return np.load(os.path.join(self.directory, pid), mmap_mode="r", allow_pickle=False)
+
+
+class DiskCache:
+    """
+    Directory storing the results of :func:`~higra.auto_cache` decorated functions across processes
+    (see :func:`~higra.set_auto_cache_backend`).
+
+    A result is stored in the sub-directory ``function_name/key`` where ``key`` is a hash of the content of the
+    arguments. Numpy arrays contained in the result are stored as ``.npy`` files that are memory mapped when the
+    result is loaded, the rest of the result is pickled. When the total size of the stored results exceeds
+    :attr:`max_bytes`, the least recently used results are removed.
+    """
+
+    def __init__(self, path, max_bytes=None):
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        os.makedirs(self.path, exist_ok=True)
+        try:
+            import xxhash
+            self.hash_name = "xxh3"
+            self.new_hasher = xxhash.xxh3_128
+        except ImportError:
+            self.hash_name = "b2"
+            self.new_hasher = functools.partial(hashlib.blake2b, digest_size=16)
+
+    def __entry(self, function_name, key):
+        return os.path.join(self.path, function_name, key)
+
+    def load(self, function_name, key, default=None):
+        """
+        Loads the result stored for the given function and key.
+
+        :return: the stored result or :attr:`default` if there is no such result
+        """
+        entry = self.__entry(function_name, key)
+        try:
+            with open(os.path.join(entry, "result.pkl"), "rb") as f:
+                result = _DiskCacheUnpickler(f, entry).load()
+        except Exception:
+            # missing, partially evicted, or corrupted entry
+            return default
+        try:
+            # mark as recently used
+            os.utime(entry)
+        except OSError:
+            pass
+        return result
+
+    def store(self, function_name, key, result):
+        """
+        Stores the given result for the given function and key, results that cannot be pickled are ignored.
+
+        :return: ``True`` if the result has been stored, ``False`` otherwise
+        """
+        entry = self.__entry(function_name, key)
+        function_dir = os.path.dirname(entry)
+        os.makedirs(function_dir, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=function_dir)
+        try:
+            with open(os.path.join(tmp, "result.pkl"), "wb") as f:
+                _DiskCachePickler(f, tmp).dump(result)
+            if os.path.exists(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            # the entry appears atomically for concurrent processes
+            os.rename(tmp, entry)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        self.evict()
+        return True
+
+    def entries(self):
+        """
+        Stored results.
+
+        :return: a list of tuples (function name, key, size in bytes, last use time)
+        """
+        res = []
+        for function_name in os.listdir(self.path):
+            function_dir = os.path.join(self.path, function_name)
+            if function_name.startswith(".") or not os.path.isdir(function_dir):
+                continue
+            for key in os.listdir(function_dir):
+                if key.startswith("."):
+                    continue
+                entry = os.path.join(function_dir, key)
+                try:
+                    size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+                    res.append((function_name, key, size, os.path.getmtime(entry)))
+                except OSError:
+                    # removed by another process
+                    pass
+        return res
+
+    def nbytes(self):
+        """
+        Total size of the stored results in bytes.
+        """
+        return sum(e[2] for e in self.entries())
+
+    def evict(self):
+        """
+        Removes least recently used results until the total size of the stored results is below :attr:`max_bytes`.
+        """
+        if self.max_bytes is None:
+            return
+        entries = sorted(self.entries(), key=lambda e: e[3])
+        total = sum(e[2] for e in entries)
+        for function_name, key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self.__entry(function_name, key), ignore_errors=True)
+            total -= size
+
+    def clear(self, function_name=None):
+        """
+        Removes the stored results of the given function (all functions if ``None``).
+        """
+        if function_name is None:
+            function_names = [f for f in os.listdir(self.path) if os.path.isdir(os.path.join(self.path, f))]
+        else:
+            function_names = [function_name]
+        for f in function_names:
+            shutil.rmtree(os.path.join(self.path, f), ignore_errors=True)
+
+
+def set_cache_limits(max_bytes=None, max_bytes_per_object=None, max_bytes_per_function=None, data_cache=None):
+    """
+    Sets memory limits on the results stored by :func:`~higra.auto_cache` decorated functions.
+
+    The size of a result is given by the attribute ``nbytes`` of the result (numpy arrays, :class:`~higra.LCAFast`...),
+    the elements of tuples, lists and dictionaries are processed recursively. When a limit is exceeded,
+    the least recently used results are evicted from the cache (they will be recomputed if needed).
+
+    Data stored with :func:`~higra.set_attribute` (in particular concept links like the leaf graph of a
+    :class:`~higra.CptHierarchy`) are never evicted and are not counted.
+
+    :Example:
+
+    >>> hg.set_cache_limits(max_bytes=2**30, max_bytes_per_function={"make_lca_fast": 2**28})
+
+    :param max_bytes: maximal size of all the cached results (``None`` for no limit)
+    :param max_bytes_per_object: maximal size of the cached results associated to a given reference object
+        (``None`` for no limit)
+    :param max_bytes_per_function: maximal size of the cached results of a given function, either a number or a
+        dictionary mapping function names to numbers (``None`` for no limit)
+    :param data_cache: data cache to work on (will default to the global Higra cache)
+    :return: nothing
+    """
+    if data_cache is None:
+        data_cache = hg.__higra_global_cache
+    if isinstance(max_bytes_per_function, dict):
+        max_bytes_per_function = {(k if isinstance(k, str) else k.__name__): v
+                                  for k, v in max_bytes_per_function.items()}
+    data_cache.max_bytes = max_bytes
+    data_cache.max_bytes_per_object = max_bytes_per_object
+    data_cache.max_bytes_per_function = max_bytes_per_function
+    data_cache.evict()
+
+
+def get_cache_limits(data_cache=None):
+    """
+    Current memory limits on the results stored by :func:`~higra.auto_cache` decorated functions
+    (see :func:`~higra.set_cache_limits`).
+
+    :param data_cache: data cache to work on (will default to the global Higra cache)
+    :return: a dictionary with the keys ``max_bytes``, ``max_bytes_per_object``, and ``max_bytes_per_function``
+    """
+    if data_cache is None:
+        data_cache = hg.__higra_global_cache
+    return {"max_bytes": data_cache.max_bytes,
+            "max_bytes_per_object": data_cache.max_bytes_per_object,
+            "max_bytes_per_function": data_cache.max_bytes_per_function}
+
+
+def cache_stats(reset=False, data_cache=None):
+    """
+    Usage statistics of the results stored by :func:`~higra.auto_cache` decorated functions.
+
+    :param reset: if ``True``, the counters of hits, misses and evictions are reset to 0 after the call
+    :param data_cache: data cache to work on (will default to the global Higra cache)
+    :return: a dictionary with the number of ``hits``, ``misses`` and ``evictions`` and the number of results
+        currently stored (``entries``) together with their size (``bytes``)
+    """
+    if data_cache is None:
+        data_cache = hg.__higra_global_cache
+    stats = data_cache.stats()
+    if reset:
+        data_cache.reset_stats()
+    return stats
+
 
 def list_attributes(key):
     try:
@@ -188,39 +567,52 @@ def __check_valid_signature(signature):
             raise Exception("Can only handle simple functions, ie with only position and keyword parameters.")
 
 
-def __transfer_to_kw_arguments(signature, args, kwargs):
+def __parameters_name(signature):
     """
-    Transfer positional arguments to keyword arguments.
+    Names of the parameters of a function in declaration order.
 
     ``__check_valid_signature(signature)`` must be True
 
     :param signature:
-    :param args:
-    :param kwargs:
-    :return:
+    :return: a tuple of strings
     """
-    nargs = list(args)
-    for p in signature.parameters.values():
-        if len(nargs) == 0:
-            break
-        if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
-            kwargs[p.name] = nargs[0]
-            del nargs[0]
-    return nargs
+    return tuple(signature.parameters)
 
 
-def __add_default_parameter(signature, args, kwargs):
+def __default_parameters(signature):
     """
-    Add default parameters present in the signature that are not already in :attr:`kwargs`
+    Parameters of a function having a default value.
 
     :param signature:
+    :return: a tuple of pairs (parameter name, default value)
+    """
+    return tuple((p.name, p.default) for p in signature.parameters.values() if p.default is not p.empty)
+
+
+def __transfer_to_kw_arguments(parameters_name, args, kwargs):
+    """
+    Transfer positional arguments to keyword arguments.
+
+    :param parameters_name: names of the parameters of the function (see ``__parameters_name``)
     :param args:
     :param kwargs:
+    :return: the positional arguments that could not be transferred
+    """
+    kwargs.update(zip(parameters_name, args))
+    return args[len(parameters_name):]
+
+
+def __add_default_parameter(default_parameters, kwargs):
+    """
+    Add default parameters that are not already in :attr:`kwargs`
+
+    :param default_parameters: default parameters of the function (see ``__default_parameters``)
+    :param kwargs:
     :return:
     """
-    for p in signature.parameters.values():
-        if p.name not in kwargs and p.default is not p.empty:
-            kwargs[p.name] = p.default
+    for name, default in default_parameters:
+        if name not in kwargs:
+            kwargs[name] = default
 
 
 ###########################################################
@@ -265,11 +657,75 @@ def get_auto_cache_state():
     return hg.__auto_caching
 
 
+def set_auto_cache_backend(backend, path=None, max_bytes=None, data_cache=None):
+    """
+    Selects where the results of :func:`~higra.auto_cache` decorated functions are stored.
+
+        - ``"memory"`` (default): results are stored in the data cache of the reference object, they are lost when the
+          reference object is garbage collected.
+        - ``"disk"``: results are also stored in the directory :attr:`path` and are reused across objects and processes.
+
+    With the disk backend, results are keyed by a hash of the content of the arguments: numpy arrays, trees, graphs,
+    scalars, and tuples, lists, and dictionaries of those. The concepts and attributes associated to trees and graphs
+    (see :func:`~higra.set_attribute`) are part of their content. A call whose arguments cannot be hashed by content
+    (an argument, or an attribute of an argument, is an arbitrary python object) is only cached in memory. Numpy arrays contained in the results are stored
+    as ``.npy`` files which are memory mapped (read only) when they are loaded back. When the total size of the
+    directory exceeds :attr:`max_bytes`, the least recently used results are removed.
+
+    The content hash uses `xxhash <https://pypi.org/project/xxhash/>`_ if it is installed and blake2b otherwise.
+
+    Results are loaded back with :mod:`pickle`: only use a directory whose content you trust.
+
+    :Example:
+
+    >>> hg.set_auto_cache_backend("disk", path="/tmp/higra_cache", max_bytes=2**32)
+    >>> lca = hg.make_lca_fast(tree) # stored on disk and reused by the next run on the same tree
+
+    :param backend: ``"memory"`` or ``"disk"``
+    :param path: directory of the disk cache (required by the ``"disk"`` backend)
+    :param max_bytes: maximal size of the disk cache (``None`` for no limit)
+    :param data_cache: data cache to work on (will default to the global Higra cache)
+    :return: nothing
+    """
+    if data_cache is None:
+        data_cache = hg.__higra_global_cache
+
+    if backend == "memory":
+        data_cache.disk_cache = None
+    elif backend == "disk":
+        if path is None:
+            raise ValueError("A path must be given to the disk backend.")
+        data_cache.disk_cache = DiskCache(path, max_bytes)
+        data_cache.disk_cache.evict()
+    else:
+        raise ValueError("Unknown auto cache backend '" + str(backend) + "', possible values are 'memory' and 'disk'.")
+
+
+def get_auto_cache_backend(data_cache=None):
+    """
+    Current storage of the results of :func:`~higra.auto_cache` decorated functions
+    (see :func:`~higra.set_auto_cache_backend`).
+
+    :param data_cache: data cache to work on (will default to the global Higra cache)
+    :return: a dictionary with the keys ``backend``, ``path``, and ``max_bytes``
+    """
+    if data_cache is None:
+        data_cache = hg.__higra_global_cache
+
+    disk_cache = data_cache.disk_cache
+    if disk_cache is None:
+        return {"backend": "memory", "path": None, "max_bytes": None}
+    return {"backend": "disk", "path": disk_cache.path, "max_bytes": disk_cache.max_bytes}
+
+
 # keyword used to store auto cached results in reference object data cache
 _auto_cache_keyword = "data_auto_cache"
 
+# marker of a result not found in the disk cache
+_missing = object()
+
 
-def clear_auto_cache(*, function=None, reference_object=None, data_cache=None):
+def clear_auto_cache(*, function=None, reference_object=None, data_cache=None, disk=False):
     """
     Cleanup the result cache for the specified elements
 
@@ -278,6 +734,8 @@ def clear_auto_cache(*, function=None, reference_object=None, data_cache=None):
     :param reference_object: reference object whose cached data have to be cleared (if ``None`` cache data
         of all objects are cleared)
     :param data_cache: data cache to work on (will default to the global Higra cache)
+    :param disk: if ``True`` and :attr:`reference_object` is ``None``, the results of the specified function stored by
+        the disk backend are also removed (see :func:`~higra.set_auto_cache_backend`)
     :return: nothing
     """
     if data_cache is None:
@@ -294,6 +752,11 @@ def clear_auto_cache(*, function=None, reference_object=None, data_cache=None):
             else:
                 raise TypeError("Cannot determine name of " + str(function))
 
+    data_cache.forget_auto_cache(reference_object, function_name)
+
+    if disk and reference_object is None and data_cache.disk_cache is not None:
+        data_cache.disk_cache.clear(function_name)
+
     if function_name is None and reference_object is None:
         for obj, cache in data_cache:
             if _auto_cache_keyword in cache:
@@ -330,24 +793,17 @@ def __hash_combine(h1, h2):
     return h1
 
 
-def __has_method(o, m):
-    """
-    Test if a given object has a given method
-    :param o: object
-    :param m: method name
-    :return: True or False
-    """
-    mm = getattr(o, m, None)
-    return callable(mm)
-
-
 def __make_key(o):
     """
     Computes a hash of the given object
     :param o:
     :return:
     """
-    if isinstance(o, int):
+    t = type(o)
+    if t is str or t is float or o is None or t.__hash__ is object.__hash__:
+        # identity or value hash
+        return hash(o)
+    elif isinstance(o, int):
         # because for an int x hash(x) == x which is not very usefull
         return hash(str(o))
     elif isinstance(o, (set, tuple, list)):
@@ -357,10 +813,13 @@ def __make_key(o):
             return 0x9e3775b2
     elif isinstance(o, dict):
         # not ideal but we use sum to be commutative, i.e. robust to arbitrary ordering of dictionary elements
-        keys = sum([__make_key(k) for k in o.keys()])
-        values = sum([__make_key(v) for v in o.values()])
+        keys = 0
+        values = 0
+        for k, v in o.items():
+            keys += hash(k) if type(k) is str else __make_key(k)
+            values += __make_key(v)
         return __hash_combine(keys, values)
-    elif __has_method(o, "__hash__"):
+    elif t.__hash__ is not None:
         try:
             return hash(o)
         except TypeError:
@@ -369,10 +828,97 @@ def __make_key(o):
     return hash(str(id(o)))
 
 
-def __make_hash(*args, **kwargs):
+def __make_hash(args, kwargs):
+    """
+    Computes a hash of the arguments of a function call
+
+    :param args: tuple of positional arguments
+    :param kwargs: dictionary of keyword arguments
+    :return:
+    """
     return __hash_combine(__make_key(args), __make_key(kwargs))
 
 
+# version of the disk cache format, part of the content keys
+_disk_cache_format = "2"
+
+
+def __update_content_hash(hasher, o, data_cache, visited):
+    """
+    Updates the given hasher with the content of the given object
+
+    :param hasher:
+    :param o:
+    :param data_cache: data cache holding the concepts and attributes of higra objects
+    :param visited: dictionary mapping the id of the higra objects already hashed to their order of appearance
+    :return: ``False`` if the content of the object cannot be hashed, ``True`` otherwise
+    """
+    if o is None or isinstance(o, (bool, int, float, complex, str, bytes, np.generic)):
+        hasher.update((type(o).__name__ + ":" + repr(o) + ";").encode())
+    elif isinstance(o, np.ndarray):
+        if o.dtype.hasobject:
+            return False
+        hasher.update(("ndarray:" + o.dtype.str + ":" + repr(o.shape) + ";").encode())
+        hasher.update(np.ascontiguousarray(o).reshape(-1).view(np.uint8))
+    elif isinstance(o, (tuple, list)):
+        hasher.update((type(o).__name__ + ":" + str(len(o)) + ";").encode())
+        for e in o:
+            if not __update_content_hash(hasher, e, data_cache, visited):
+                return False
+    elif isinstance(o, dict):
+        hasher.update(("dict:" + str(len(o)) + ";").encode())
+        for k, v in sorted(o.items(), key=lambda kv: repr(kv[0])):
+            if not __update_content_hash(hasher, k, data_cache, visited) or \
+                    not __update_content_hash(hasher, v, data_cache, visited):
+                return False
+    elif type(o).__module__.split(".")[-1] == "higram" and hasattr(type(o), "__members__"):
+        # enumerations
+        hasher.update((type(o).__name__ + ":" + str(int(o)) + ";").encode())
+    elif type(o).__module__.split(".")[-1] == "higram" and hasattr(type(o), "__setstate__"):
+        # trees, graphs... : hash their pickled state, their concepts and their attributes
+        if id(o) in visited:
+            hasher.update(("ref:" + str(visited[id(o)]) + ";").encode())
+            return True
+        visited[id(o)] = len(visited)
+        hasher.update((type(o).__name__ + ";").encode())
+        if not __update_content_hash(hasher, o.__getstate__(), data_cache, visited):
+            return False
+        # functions may depend on the concepts and attributes of their arguments (a region adjacency graph,
+        # the shape of a grid graph...) which are not part of the pickled state
+        try:
+            data = data_cache.get_data(o)
+        except TypeError:
+            return False
+        tags = sorted(t.__module__ + "." + t.__qualname__ if isinstance(t, type) else repr(t)
+                      for t in data.get("__tags__", ()))
+        hasher.update(("tags:" + ",".join(tags) + ";").encode())
+        attributes = {k: v for k, v in data.items() if k != "__tags__" and k != _auto_cache_keyword}
+        return __update_content_hash(hasher, attributes, data_cache, visited)
+    else:
+        return False
+    return True
+
+
+def __make_content_key(data_cache, fun, args, kwargs):
+    """
+    Computes a key of a function call from the content of its arguments (see :func:`~higra.set_auto_cache_backend`)
+
+    :param data_cache:
+    :param fun:
+    :param args:
+    :param kwargs:
+    :return: a string or ``None`` if the content of an argument cannot be hashed
+    """
+    disk_cache = data_cache.disk_cache
+    hasher = disk_cache.new_hasher()
+    hasher.update((_disk_cache_format + ":" + fun.__module__ + "." + fun.__qualname__ + ";").encode())
+    visited = {}
+    if not __update_content_hash(hasher, args, data_cache, visited) or \
+            not __update_content_hash(hasher, kwargs, data_cache, visited):
+        return None
+    return disk_cache.hash_name + "-" + hasher.hexdigest()
+
+
 def auto_cache(fun):
     """
     Function decorator that provides automatic caching of function results.
@@ -429,6 +975,11 @@ def auto_cache(fun):
     The cache data associated to a particular function or object can be manually cleared with
     :func:`~higra.clear_auto_cache`.
 
+    The memory used by cached results can be bounded with :func:`~higra.set_cache_limits`: the least recently used
+    results are then evicted when a limit is exceeded. Usage statistics are given by :func:`~higra.cache_stats`.
+
+    Results can also be stored on disk and reused across processes, see :func:`~higra.set_auto_cache_backend`.
+
     :Global setting:
 
     Auto caching can be globally disabled, see:
@@ -445,10 +996,14 @@ def auto_cache(fun):
 
     signature = inspect.signature(original_fun)
     __check_valid_signature(signature)
+    parameters_name = __parameters_name(signature)
+    default_parameters = __default_parameters(signature)
+    first_parameter_name = parameters_name[0] if len(parameters_name) > 0 else None
+    function_name = fun.__name__
 
     @functools.wraps(fun)
     def wrapper(*args, **kwargs):
-        data_name = kwargs.pop("attribute_name", fun.__name__)
+        data_name = kwargs.pop("attribute_name", function_name)
         force_recompute = kwargs.pop("force_recompute", False)
         data_cache = kwargs.pop("data_cache", hg.__higra_global_cache)
         no_cache = kwargs.pop("no_cache", False)
@@ -457,13 +1012,10 @@ def auto_cache(fun):
             return fun(*args, **kwargs)
 
         try:
-            obj = None
             if len(args) > 0:
                 obj = args[0]
-            elif len(kwargs) > 0:
-                first_param_name = signature.parameters.values().__iter__().__next__().name
-                if first_param_name in kwargs:
-                    obj = kwargs[first_param_name]
+            else:
+                obj = kwargs.get(first_parameter_name, None)
 
             if obj is None:
                 raise TypeError("cannot find first parameter")
@@ -472,18 +1024,35 @@ def auto_cache(fun):
             cache = cache.setdefault(_auto_cache_keyword, {})
             cache = cache.setdefault(data_name, {})
 
-            args = __transfer_to_kw_arguments(signature, args, kwargs)
-            __add_default_parameter(signature, args, kwargs)
+            args = __transfer_to_kw_arguments(parameters_name, args, kwargs)
+            __add_default_parameter(default_parameters, kwargs)
             if len(args) > 0:
                 import warnings
                 warnings.warn('Auto cache: all positional parameters could not be transformed into '
                               'named parameters.')
 
-            h = __make_hash(*args, **kwargs)
+            h = __make_hash(args, kwargs)
 
             if force_recompute or h not in cache:
-                cache[h] = fun(*args, **kwargs)
-
+                result = _missing
+                disk_cache = data_cache.disk_cache
+                disk_key = None
+                if disk_cache is not None:
+                    disk_key = __make_content_key(data_cache, original_fun, args, kwargs)
+                    if disk_key is not None and not force_recompute:
+                        result = disk_cache.load(original_fun.__name__, disk_key, _missing)
+
+                from_disk = result is not _missing
+                if not from_disk:
+                    result = fun(*args, **kwargs)
+                    if disk_key is not None:
+                        disk_cache.store(original_fun.__name__, disk_key, result)
+
+                cache[h] = result
+                data_cache.cache_result(obj, data_name, h, result, from_disk)
+                return result
+
+            data_cache.cache_hit(obj, data_name, h)
             return cache[h]
         except TypeError as e:
             # cannot cache obj...
@@ -503,33 +1072,61 @@ def auto_cache(fun):
 ###########################################################
 
 
-def __resolve_concept(arg_name, concept, all_parameters_name, all_data_found, kwargs, data_cache):
+def __make_resolution_plan(concepts, parameters_name):
     """
-    Tries to expand the elements contained in the concept ``concept`` for the data associated to the name
+    Precomputes how the concepts given to :func:`~higra.argument_helper` are resolved for a function.
+
+    :param concepts: concepts given to the decorator
+    :param parameters_name: names of the parameters of the function
+    :return: a pair whose first element is a list of tuples (argument name, concept type, concept name to argument
+        name map) and second element is the tuple of the parameters that may be injected by the concepts
+    """
+    plan = []
+    injectable_parameters = set()
+    for concept_elem in concepts:
+        try:
+            arg_name, concept = concept_elem
+        except (ValueError, TypeError):  # failed to unpack, use first parameter name
+            concept = concept_elem
+            arg_name = parameters_name[0]
+
+        if not type(concept) is type:
+            # if concept is a concept object, get the associated type and potential name mapping
+            concept_type = type(concept)
+            concept_name_to_arg_name_map = concept.name_mapping
+        else:
+            concept_type = concept
+            concept_name_to_arg_name_map = {}
+
+        if not issubclass(concept_type, hg.Concept):
+            raise Exception(str(concept_type) + " is not a subclass of the abstract Concept class.")
+
+        plan.append((arg_name, concept_type, concept_name_to_arg_name_map))
+        for data_element_name in concept_type.data_element_names():
+            argument_name = concept_name_to_arg_name_map.get(data_element_name, data_element_name)
+            if argument_name in parameters_name:
+                injectable_parameters.add(argument_name)
+
+    return plan, tuple(injectable_parameters)
+
+
+def __resolve_concept(arg_name, concept_type, concept_name_to_arg_name_map, all_parameters_name, all_data_found,
+                      kwargs):
+    """
+    Tries to expand the elements contained in the concept ``concept_type`` for the data associated to the name
     ``arg_name``.
 
     :param arg_name: name or the data element
-    :param concept: concept type or concept object
+    :param concept_type: concept type
+    :param concept_name_to_arg_name_map: mapping from concept data element names to argument names
     :param all_parameters_name: name of all known parameters of the function
     :param all_data_found: dictionary of all found data in the concept resolutions so far
     :param kwargs: dictionary of all known name arguments so far
-    :param data_cache:
     :return:
     """
-    if not type(concept) is type:
-        # if concept is a concept object, get the associated type and potential name mapping
-        concept_type = type(concept)
-        concept_name_to_arg_name_map = concept.name_mapping
-    else:
-        concept_type = concept
-        concept_name_to_arg_name_map = {}
-
-    if not issubclass(concept_type, hg.Concept):
-        raise Exception(str(concept_type) + " is not a subclass of the abstract Concept class.")
-
     # if arg_name is not associated to any found data, then we can not do anything
-    if arg_name in all_data_found:
-        arg_value = all_data_found[arg_name]
+    arg_value = all_data_found.get(arg_name, None)
+    if arg_value is not None:
         concept_elements = concept_type.construct(arg_value, strict=False)
 
         for data_element_name, data_element in concept_elements.items():
@@ -553,6 +1150,9 @@ def argument_helper(*concepts):
     the function has a parameter called *n* that is either undefined or ``None`` in the current call, then the decorator
     will inject ``n=e`` as a new keyword parameter in the function call.
 
+    The resolution of the concepts is prepared when the function is decorated. If a call already provides a value
+    (different from ``None``) for every parameter that the concepts could inject, the concepts are not resolved at all.
+
     :param concepts:
     :return:
     """
@@ -575,24 +1175,23 @@ def argument_helper(*concepts):
         signature = inspect.signature(original_fun)
         __check_valid_signature(signature)
 
-        all_parameters_name = set()
-        for p in signature.parameters.values():
-            all_parameters_name.add(p.name)
+        parameters_name = __parameters_name(signature)
+        all_parameters_name = set(parameters_name)
+        plan, injectable_parameters = __make_resolution_plan(concepts, parameters_name)
 
         @functools.wraps(fun)
         def wrapper(*args, **kwargs):
-            args = __transfer_to_kw_arguments(signature, args, kwargs)
-            data_cache = kwargs.pop("data_cache", hg.__higra_global_cache)
-            all_data_found = dict(kwargs)
-            for concept_elem in concepts:
-
-                try:
-                    arg_name, concept = concept_elem
-                except (ValueError, TypeError):  # failed to unpack, use first parameter name
-                    concept = concept_elem
-                    arg_name = signature.parameters.values().__iter__().__next__().name
-
-                __resolve_concept(arg_name, concept, all_parameters_name, all_data_found, kwargs, data_cache)
+            args = __transfer_to_kw_arguments(parameters_name, args, kwargs)
+            kwargs.pop("data_cache", None)
+
+            for name in injectable_parameters:
+                if kwargs.get(name, None) is None:
+                    # at least one parameter may be provided by the concepts
+                    all_data_found = dict(kwargs)
+                    for arg_name, concept_type, concept_name_to_arg_name_map in plan:
+                        __resolve_concept(arg_name, concept_type, concept_name_to_arg_name_map, all_parameters_name,
+                                          all_data_found, kwargs)
+                    break
 
             if len(args) > 0:
                 import warnings
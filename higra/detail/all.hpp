@@ -11,3 +11,4 @@
 #pragma once
 
 #include "py_log.hpp"
+#include "py_thread_pool.hpp"
@@ -38,6 +38,8 @@ void py_init_log(pybind11::module &m) {
     m.def("logger_register_print_callback",
           []() {
               hg::logger::callbacks().push_back([](const std::string &msg) {
+                  // messages can be emitted from c++ code running without the GIL
+                  pybind11::gil_scoped_acquire acquire;
                   pybind11::object buildins = pybind11::module::import("builtins");
                   pybind11::object print = buildins.attr("print");
                   print(msg);
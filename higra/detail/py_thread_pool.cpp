@@ -0,0 +1,30 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include "py_thread_pool.hpp"
+#include "../py_common.hpp"
+#include "higra/detail/thread_pool.hpp"
+
+namespace py = pybind11;
+
+void py_init_thread_pool(pybind11::module &m) {
+
+    m.def("set_num_threads", [](int64_t num_threads) { hg::set_num_threads(num_threads); },
+          "Set the number of threads used by the parallel algorithms of Higra (parallel loops and sorts).\n\n"
+          "If :attr:`num_threads` is smaller than or equal to 0, the default number of threads is restored: "
+          "the value of the environment variable ``HG_NUM_THREADS`` if it is defined, and the number of "
+          "hardware threads otherwise.\n\n"
+          "This setting has no effect if Higra was compiled with TBB support (``HG_USE_TBB``).",
+          py::arg("num_threads"),
+          py::call_guard<py::gil_scoped_release>());
+
+    m.def("get_num_threads", []() { return hg::get_num_threads(); },
+          "Get the number of threads used by the parallel algorithms of Higra.");
+}
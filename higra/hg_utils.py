@@ -546,6 +546,17 @@ def cast_to_dtype(array, dtype):
     return array
 
 
+def index_dtype():
+    """
+    Numpy dtype used by Higra to represent indices (vertex, edge and node indices, parents of trees, edge maps...).
+
+    This is ``np.int64`` by default and ``np.int32`` if Higra was compiled with the option ``HG_USE_32BIT_INDEX``.
+
+    :return: a numpy dtype
+    """
+    return hg.cpp._index_dtype
+
+
 def get_include():
     """
     Return the path to higra include files.
@@ -8,6 +8,7 @@
 # The full license is in the file LICENSE, distributed with this software. #
 ############################################################################
 
+from .batch import *
 from .binary_partition_tree import *
 from .component_tree import *
 from .constrained_connectivity_hierarchy import *
@@ -10,6 +10,7 @@
 
 #pragma once
 
+#include "py_batch.hpp"
 #include "py_binary_partition_tree.hpp"
 #include "py_common.hpp"
 #include "py_component_tree.hpp"
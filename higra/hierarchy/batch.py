@@ -0,0 +1,92 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import concurrent.futures
+import os
+
+import higra as hg
+import numpy as np
+
+
+def batch(function, graph, edge_weights, n_jobs=None):
+    """
+    Computes a hierarchy for each set of edge weights of a stack of edge weights defined on the same graph.
+
+    The hierarchies are computed in parallel using :attr:`n_jobs` threads.
+    If :attr:`function` is one of :func:`~higra.bpt_canonical`, :func:`~higra.quasi_flat_zone_hierarchy`,
+    :func:`~higra.watershed_hierarchy_by_area`, :func:`~higra.watershed_hierarchy_by_volume`, or
+    :func:`~higra.watershed_hierarchy_by_dynamics`, the whole batch is processed in C++ and the Python
+    interpreter is only involved once.
+    Otherwise, :attr:`function` is called on each set of edge weights in a thread pool.
+
+    Example:
+
+    .. code-block:: python
+
+        # edge weights of 100 frames of a video on the same 4-adjacency graph
+        edge_weights = np.stack([hg.weight_graph(graph, frame, hg.WeightFunction.L1) for frame in frames])
+        trees, altitudes = hg.batch(hg.watershed_hierarchy_by_area, graph, edge_weights, n_jobs=8)
+
+    :param function: a hierarchy construction function taking a graph and edge weights as arguments and returning a
+            tree and its node altitudes
+    :param graph: input graph
+    :param edge_weights: a 2d array of shape :math:`(n, |E|)` containing :math:`n` sets of edge weights of the input graph
+    :param n_jobs: number of threads used for the computation (default to the number of cpu cores)
+    :return: a list of :math:`n` trees and a list of :math:`n` node altitudes arrays
+    """
+    edge_weights = np.asarray(edge_weights)
+    if edge_weights.ndim != 2 or edge_weights.shape[1] != graph.num_edges():
+        raise ValueError("edge_weights must be a 2d array of shape (n, graph.num_edges()).")
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+
+    if function is hg.bpt_canonical:
+        res = hg.cpp._batch_bpt_canonical(graph, edge_weights, n_jobs)
+
+        if hg.CptMinimumSpanningTree.validate(graph):
+            leaf_graph = hg.CptMinimumSpanningTree.construct(graph)["base_graph"]
+        else:
+            leaf_graph = graph
+
+        trees = []
+        for r in res:
+            tree = r.tree()
+            mst = r.mst()
+            hg.CptMinimumSpanningTree.link(mst, leaf_graph, r.mst_edge_map())
+            hg.CptHierarchy.link(tree, leaf_graph)
+            hg.CptBinaryHierarchy.link(tree, mst)
+            trees.append(tree)
+
+        return trees, [r.altitudes() for r in res]
+
+    if function is hg.quasi_flat_zone_hierarchy:
+        res = hg.cpp._batch_quasi_flat_zone_hierarchy(graph, edge_weights, n_jobs)
+    elif function is hg.watershed_hierarchy_by_area or function is hg.watershed_hierarchy_by_volume:
+        vertex_area = hg.attribute_vertex_area(graph)
+        vertex_area = hg.linearize_vertex_weights(vertex_area, graph).astype(np.float64)
+        if function is hg.watershed_hierarchy_by_area:
+            res = hg.cpp._batch_watershed_hierarchy_by_area(graph, edge_weights, vertex_area, n_jobs)
+        else:
+            res = hg.cpp._batch_watershed_hierarchy_by_volume(graph, edge_weights, vertex_area, n_jobs)
+    elif function is hg.watershed_hierarchy_by_dynamics:
+        res = hg.cpp._batch_watershed_hierarchy_by_dynamics(graph, edge_weights, n_jobs)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+            results = list(executor.map(lambda w: function(graph, w), edge_weights))
+        return [r[0] for r in results], [r[1] for r in results]
+
+    trees = []
+    for r in res:
+        tree = r.tree()
+        hg.CptHierarchy.link(tree, graph)
+        trees.append(tree)
+
+    return trees, [r.altitudes() for r in res]
@@ -12,7 +12,7 @@ import higra as hg
 import numpy as np
 
 
-def binary_partition_tree_complete_linkage(graph, edge_weights):
+def binary_partition_tree_complete_linkage(graph, edge_weights, algorithm="heap"):
     """
     Binary partition tree with complete linkage distance.
 
@@ -25,12 +25,22 @@ def binary_partition_tree_complete_linkage(graph, edge_weights):
 
     Regions are then iteratively merged following the above distance (closest first) until a single region remains
 
+    Two algorithms are available:
+
+        - ``"heap"`` (default): the edges are stored in a global priority queue, the two closest regions are merged
+          at each step;
+        - ``"nn_chain"``: the nearest-neighbour-chain algorithm follows a chain of nearest neighbours until it finds
+          two reciprocal nearest neighbours which are then merged. It does not need a global priority queue and is much
+          faster. As the linkage is reducible, both algorithms produce the same hierarchy (up to the resolution of
+          ties).
+
     :param graph: input graph
     :param edge_weights: edge weights of the input graph
+    :param algorithm: ``"heap"`` (default) or ``"nn_chain"``, see above
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
 
-    res = hg.cpp._binary_partition_tree_complete_linkage(graph, edge_weights)
+    res = hg.cpp._binary_partition_tree_complete_linkage(graph, edge_weights, algorithm)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -39,7 +49,7 @@ def binary_partition_tree_complete_linkage(graph, edge_weights):
     return tree, altitudes
 
 
-def binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights=None):
+def binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights=None, algorithm="heap"):
     """
     Binary partition tree with average linkage distance.
 
@@ -52,9 +62,19 @@ def binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weigh
 
     with :math:`Z = \sum_{x \in X, y \in Y, \{x,y\} \in E} w_2({x,y})`.
 
+    Two algorithms are available:
+
+        - ``"heap"`` (default): the edges are stored in a global priority queue, the two closest regions are merged
+          at each step;
+        - ``"nn_chain"``: the nearest-neighbour-chain algorithm follows a chain of nearest neighbours until it finds
+          two reciprocal nearest neighbours which are then merged. It does not need a global priority queue and is much
+          faster. As the linkage is reducible, both algorithms produce the same hierarchy (up to the resolution of
+          ties).
+
     :param graph: input graph
     :param edge_weights: edge weights of the input graph
     :param edge_weight_weights: weighting of edge weights of the input graph (default to an array of ones)
+    :param algorithm: ``"heap"`` (default) or ``"nn_chain"``, see above
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
 
@@ -63,7 +83,7 @@ def binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weigh
     else:
         edge_weights, edge_weight_weights = hg.cast_to_common_type(edge_weights, edge_weight_weights)
 
-    res = hg.cpp._binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights)
+    res = hg.cpp._binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights, algorithm)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -143,7 +163,8 @@ def binary_partition_tree_single_linkage(graph, edge_weights):
     return hg.bpt_canonical(graph, edge_weights)
 
 
-def binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes=None, altitude_correction="max"):
+def binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes=None, altitude_correction="max",
+                                       algorithm="heap"):
     """
     Binary partition tree with the Ward linkage rule.
 
@@ -166,10 +187,21 @@ def binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes=Non
         - ``"max"``: the altitude of a node :math:`n` is defined as the maximum of the the Ward distance associated
           to each node in the subtree rooted in :math:`n`.
 
+    Two algorithms are available:
+
+        - ``"heap"`` (default): the edges are stored in a global priority queue, the two closest regions are merged
+          at each step;
+        - ``"nn_chain"``: the nearest-neighbour-chain algorithm follows a chain of nearest neighbours until it finds
+          two reciprocal nearest neighbours which are then merged. It does not need a global priority queue and is much
+          faster. The Ward linkage is reducible on complete graphs, where both algorithms produce the same hierarchy
+          (up to the resolution of ties). On other graphs, the ``"nn_chain"`` algorithm still produces an agglomerative
+          clustering with the Ward linkage but it may differ from the one produced by the ``"heap"`` algorithm.
+
     :param graph: input graph
     :param vertex_centroids: Centroids of the graph vertices (must be a 2d array)
     :param vertex_sizes: Size (number of elements) of the graph vertices (default to an array of ones)
     :param altitude_correction: can be ``"none"`` or ``"max"`` (default)
+    :param algorithm: ``"heap"`` (default) or ``"nn_chain"``, see above
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
 
@@ -178,7 +210,8 @@ def binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes=Non
     else:
         vertex_centroids, vertex_sizes = hg.cast_to_common_type(vertex_centroids, vertex_sizes)
 
-    res = hg.cpp._binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, altitude_correction)
+    res = hg.cpp._binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, altitude_correction,
+                                                     algorithm)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -187,7 +220,7 @@ def binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes=Non
     return tree, altitudes
 
 
-def binary_partition_tree(graph, weight_function, edge_weights):
+def binary_partition_tree(graph, weight_function, edge_weights, batch=False):
     """
     Binary partition tree of the graph with a user provided cluster distance.
 
@@ -280,6 +313,44 @@ def binary_partition_tree(graph, weight_function, edge_weights):
                 edge_weights[n.new_edge_index()] = new_weight
                 edge_counts[n.new_edge_index()] = new_count
 
+    :Batch weight function:
+
+    If :attr:`batch` is ``True``, the description of the new neighbours is given to the :attr:`weight_function`
+    as 4 NumPy arrays and the function must return the array of the new edge weights:
+
+    .. code-block:: python
+
+        def weight_function(graph,              # the current state of the graph
+                       fusion_edge_index,       # the edge between the two vertices being merged
+                       new_region,              # the new vertex in the graph
+                       merged_region1,          # the first vertex merged
+                       merged_region2,          # the second vertex merged
+                       neighbour_vertex,        # for each new neighbour: the other vertex
+                       num_edges,               # for each new neighbour: 1 or 2 (see above)
+                       first_edge_index,        # for each new neighbour: index of the first edge, also the index of the new edge
+                       second_edge_index):      # for each new neighbour: index of the second edge (-1 if num_edges == 1)
+           ...
+           return new_edge_weights
+
+    This avoids the creation of one Python object and several Python calls per new neighbour: the
+    weighting function can then be written with vectorized NumPy operations. The previous example becomes:
+
+    .. code-block:: python
+
+        def weighting_function_average_linkage(graph, fusion_edge_index, new_region, merged_region1, merged_region2,
+                                               neighbour_vertex, num_edges, first_edge_index, second_edge_index):
+            new_count = edge_counts[first_edge_index]
+            new_weight = edge_weights[first_edge_index] * new_count
+            two_edges = num_edges > 1
+            second_edges = second_edge_index[two_edges]
+            new_count[two_edges] += edge_counts[second_edges]
+            new_weight[two_edges] += edge_weights[second_edges] * edge_counts[second_edges]
+            new_weight /= new_count
+
+            edge_weights[first_edge_index] = new_weight
+            edge_counts[first_edge_index] = new_count
+            return new_weight
+
     :Complexity:
 
     The worst case time complexity is in :math:`\mathcal{O}(n^2\log(n))` with :math:`n` the number of vertices in the graph.
@@ -288,15 +359,20 @@ def binary_partition_tree(graph, weight_function, edge_weights):
      .. warning::
 
         This function uses a Python callback (the :attr:`weight_function`) that is called frequently by the algorithm:
-        performances will be far from optimal. Please consider a C++ implementation if it is too slow (see this
+        performances will be far from optimal. Consider using a vectorized weighting function (:attr:`batch` set to
+        ``True``) or a C++ implementation if it is too slow (see this
         `helper project <https://github.com/higra/Higra-cppextension-cookiecutter>`_ ).
 
     :param graph: input graph
     :param weight_function: see detailed description above
     :param edge_weights: edge weights of the input graph
+    :param batch: if ``True``, the weight function follows the vectorized protocol described above
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
-    res = hg.cpp._binary_partition_tree(graph, edge_weights, weight_function)
+    if batch:
+        res = hg.cpp._binary_partition_tree_batch(graph, edge_weights, weight_function)
+    else:
+        res = hg.cpp._binary_partition_tree(graph, edge_weights, weight_function)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -10,9 +10,10 @@
 
 import higra as hg
 import numpy as np
+import os
 
 
-def component_tree_min_tree(graph, vertex_weights):
+def component_tree_min_tree(graph, vertex_weights, n_jobs=1):
     """
     Min Tree hierarchy from the input vertex weighted graph.
 
@@ -28,13 +29,27 @@ def component_tree_min_tree(graph, vertex_weights):
     Component Tree Computation with Application to Pattern Recognition in Astronomical Imaging," \
     IEEE ICIP 2007.
 
+    For vertex weights of integral types of at most 16 bits (``uint8``, ``int16``...), the tree is computed by
+    flooding with a hierarchical queue as in [1]_: no sort is needed and the result is the same.
+
+    If :attr:`n_jobs` is greater than 1, the vertices are split into :attr:`n_jobs` ranges of consecutive indices
+    (horizontal slabs for images): the trees of the slabs are computed in parallel and then merged with the algorithm
+    described in [4]_. The result does not depend on :attr:`n_jobs`.
+
+    .. [4] M. H. F. Wilkinson, H. Gao, W. H. Hesselink, J.-E. Jonker, and A. Meijster, "Concurrent computation of \
+    attribute filters on shared memory parallel machines," IEEE Trans. Pattern Anal. Mach. Intell., vol. 30, \
+    no. 10, pp. 1800-1813, 2008.
+
     :param graph: input graph
     :param vertex_weights: vertex weights of the input graph
+    :param n_jobs: number of slabs processed in parallel (default to 1, ``None`` for the number of cpu cores)
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
     vertex_weights = hg.linearize_vertex_weights(vertex_weights, graph)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
 
-    res = hg.cpp._component_tree_min_tree(graph, vertex_weights)
+    res = hg.cpp._component_tree_min_tree(graph, vertex_weights, n_jobs)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -43,7 +58,7 @@ def component_tree_min_tree(graph, vertex_weights):
     return tree, altitudes
 
 
-def component_tree_max_tree(graph, vertex_weights):
+def component_tree_max_tree(graph, vertex_weights, n_jobs=1):
     """
     Max Tree hierarchy from the input vertex weighted graph.
 
@@ -51,13 +66,19 @@ def component_tree_max_tree(graph, vertex_weights):
     The algorithm used in this
     implementation was first described in [3]_.
 
+    If :attr:`n_jobs` is greater than 1, the tree is computed in parallel with the algorithm described in [4]_
+    (see :func:`~higra.component_tree_min_tree`).
+
     :param graph: input graph
     :param vertex_weights: vertex weights of the input graph
+    :param n_jobs: number of slabs processed in parallel (default to 1, ``None`` for the number of cpu cores)
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
     vertex_weights = hg.linearize_vertex_weights(vertex_weights, graph)
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
 
-    res = hg.cpp._component_tree_max_tree(graph, vertex_weights)
+    res = hg.cpp._component_tree_max_tree(graph, vertex_weights, n_jobs)
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -12,16 +12,25 @@ import higra as hg
 import numpy as np
 
 
-def bpt_canonical(graph, edge_weights):
+def bpt_canonical(graph, edge_weights, algorithm="kruskal"):
     """
     Computes the canonical binary partition tree (binary tree by altitude ordering) of the given weighted graph.
     This is also known as single/min linkage clustering.
 
+    Possible values for :attr:`algorithm` are:
+
+      - ``"kruskal"`` (default): all the edges are sorted and processed sequentially;
+      - ``"filter_kruskal"``: the edges are recursively partitioned around a pivot and the edges whose extremities
+        are already connected are removed in parallel before being sorted. This is faster on very large graphs.
+
+    Both algorithms give exactly the same result.
+
     :param graph: input graph
     :param edge_weights: edge weights of the input graph
+    :param algorithm: ``"kruskal"`` or ``"filter_kruskal"`` (default ``"kruskal"``)
     :return: a tree (Concept :class:`~higra.CptBinaryHierarchy`) and its node altitudes
     """
-    res = hg.cpp._bpt_canonical(graph, edge_weights)
+    res = hg.cpp._bpt_canonical(graph, edge_weights, algorithm)
     tree = res.tree()
     altitudes = res.altitudes()
     mst = res.mst()
@@ -0,0 +1,225 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include "py_batch.hpp"
+#include "../py_common.hpp"
+#include "higra/hierarchy/hierarchy_core.hpp"
+#include "higra/hierarchy/watershed_hierarchy.hpp"
+#include "xtensor-python/pyarray.hpp"
+#include <atomic>
+#include <exception>
+#include <mutex>
+#include <thread>
+
+template<typename T>
+using pyarray = xt::pyarray<T>;
+
+namespace py = pybind11;
+
+namespace batch_internal {
+
+    /**
+     * Calls fun(i) for each i in [0, num_items) using at most num_threads threads.
+     * If num_threads is smaller than or equal to 0, the number of hardware threads is used.
+     */
+    template<typename F>
+    void parallel_apply(hg::index_t num_items, hg::index_t num_threads, F &fun) {
+        if (num_threads <= 0) {
+            num_threads = (std::max)((hg::index_t) std::thread::hardware_concurrency(), (hg::index_t) 1);
+        }
+        num_threads = (std::min)(num_threads, num_items);
+
+        if (num_threads <= 1) {
+            for (hg::index_t i = 0; i < num_items; i++) {
+                fun(i);
+            }
+            return;
+        }
+
+        std::atomic<hg::index_t> next_item(0);
+        std::exception_ptr error = nullptr;
+        std::mutex error_mutex;
+
+        auto worker = [&]() {
+            hg::index_t i;
+            while ((i = next_item++) < num_items) {
+                try {
+                    fun(i);
+                } catch (...) {
+                    std::lock_guard<std::mutex> lock(error_mutex);
+                    if (!error) {
+                        error = std::current_exception();
+                    }
+                    next_item = num_items;
+                }
+            }
+        };
+
+        std::vector<std::thread> threads;
+        for (hg::index_t t = 0; t < num_threads - 1; t++) {
+            threads.emplace_back(worker);
+        }
+        worker();
+        for (auto &t: threads) {
+            t.join();
+        }
+
+        if (error) {
+            std::rethrow_exception(error);
+        }
+    }
+
+    /**
+     * Applies the hierarchy construction function fun on each row of the 2d array edge_weights_stack.
+     * The GIL must be released by the caller.
+     */
+    template<typename graph_t, typename value_t, typename F>
+    auto batch_apply(const graph_t &graph, const pyarray<value_t> &edge_weights_stack, hg::index_t n_jobs, F fun) {
+        hg_assert(edge_weights_stack.dimension() == 2, "Edge weights stack must be a 2d array.");
+        hg_assert(edge_weights_stack.shape()[1] == num_edges(graph),
+                  "The second dimension of the edge weights stack must be equal to the number of edges of the graph.");
+        using result_t = decltype(fun(graph, std::declval<hg::array_1d<value_t>>()));
+
+        hg::index_t num_items = edge_weights_stack.shape()[0];
+        std::vector<result_t> results(num_items);
+        auto process_item = [&](hg::index_t i) {
+            hg::array_1d<value_t> edge_weights = xt::view(edge_weights_stack, i, xt::all());
+            results[i] = fun(graph, edge_weights);
+        };
+        parallel_apply(num_items, n_jobs, process_item);
+        return results;
+    }
+}
+
+template<typename graph_t>
+struct def_batch_bpt_canonical {
+    template<typename value_t, typename C>
+    static
+    void def(C &m, const char *doc) {
+        m.def("_batch_bpt_canonical",
+              [](const graph_t &graph, const pyarray<value_t> &edge_weights, hg::index_t n_jobs) {
+                  return batch_internal::batch_apply(
+                          graph, edge_weights, n_jobs,
+                          [](const graph_t &g, const hg::array_1d<value_t> &w) {
+                              return hg::bpt_canonical(g, w);
+                          });
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("n_jobs"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_batch_quasi_flat_zone_hierarchy {
+    template<typename value_t, typename C>
+    static
+    void def(C &m, const char *doc) {
+        m.def("_batch_quasi_flat_zone_hierarchy",
+              [](const graph_t &graph, const pyarray<value_t> &edge_weights, hg::index_t n_jobs) {
+                  return batch_internal::batch_apply(
+                          graph, edge_weights, n_jobs,
+                          [](const graph_t &g, const hg::array_1d<value_t> &w) {
+                              return hg::quasi_flat_zone_hierarchy(g, w);
+                          });
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("n_jobs"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_batch_watershed_hierarchy {
+    template<typename value_t, typename C>
+    static
+    void def(C &m, const char *doc) {
+        m.def("_batch_watershed_hierarchy_by_area",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights,
+                 const pyarray<double> &vertex_area,
+                 hg::index_t n_jobs) {
+                  return batch_internal::batch_apply(
+                          graph, edge_weights, n_jobs,
+                          [&vertex_area](const graph_t &g, const hg::array_1d<value_t> &w) {
+                              return hg::watershed_hierarchy_by_attribute(
+                                      g, w,
+                                      [&vertex_area](const hg::tree &t, const hg::array_1d<value_t> &) {
+                                          return hg::attribute_area(t, vertex_area);
+                                      });
+                          });
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("vertex_area"),
+              py::arg("n_jobs"),
+              py::call_guard<py::gil_scoped_release>());
+
+        m.def("_batch_watershed_hierarchy_by_volume",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights,
+                 const pyarray<double> &vertex_area,
+                 hg::index_t n_jobs) {
+                  return batch_internal::batch_apply(
+                          graph, edge_weights, n_jobs,
+                          [&vertex_area](const graph_t &g, const hg::array_1d<value_t> &w) {
+                              return hg::watershed_hierarchy_by_attribute(
+                                      g, w,
+                                      [&vertex_area](const hg::tree &t, const hg::array_1d<value_t> &altitudes) {
+                                          return hg::attribute_volume(t, altitudes, hg::attribute_area(t, vertex_area));
+                                      });
+                          });
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("vertex_area"),
+              py::arg("n_jobs"),
+              py::call_guard<py::gil_scoped_release>());
+
+        m.def("_batch_watershed_hierarchy_by_dynamics",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights,
+                 hg::index_t n_jobs) {
+                  return batch_internal::batch_apply(
+                          graph, edge_weights, n_jobs,
+                          [](const graph_t &g, const hg::array_1d<value_t> &w) {
+                              return hg::watershed_hierarchy_by_attribute(
+                                      g, w,
+                                      [](const hg::tree &t, const hg::array_1d<value_t> &altitudes) {
+                                          hg::array_1d<double> dynamics = hg::attribute_dynamics(t, altitudes, true);
+                                          return dynamics;
+                                      });
+                          });
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("n_jobs"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+void py_init_batch(pybind11::module &m) {
+    xt::import_numpy();
+    add_type_overloads<def_batch_bpt_canonical<hg::ugraph>, HG_TEMPLATE_SNUMERIC_TYPES>
+            (m, "Compute the canonical binary partition trees of a stack of edge weights on the same graph.");
+
+    add_type_overloads<def_batch_quasi_flat_zone_hierarchy<hg::ugraph>, HG_TEMPLATE_SNUMERIC_TYPES>
+            (m, "Compute the quasi flat zone hierarchies of a stack of edge weights on the same graph.");
+
+    add_type_overloads<def_batch_watershed_hierarchy<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>
+            (m, "Compute the watershed hierarchies of a stack of edge weights on the same graph.");
+}
@@ -47,13 +47,19 @@ struct def_binary_partition_tree_average_linkage {
     static
     void def(pybind11::module &m, const char *doc) {
         m.def("_binary_partition_tree_average_linkage",
-              [](const hg::ugraph &graph, pyarray<T> &edge_weights, pyarray<T> &edge_weight_weights) {
-                  return binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights);
+              [](const hg::ugraph &graph,
+                 pyarray<T> &edge_weights,
+                 pyarray<T> &edge_weight_weights,
+                 const std::string &algorithm) {
+                  return binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights,
+                                                               py_bpt_algorithm(algorithm));
               },
               doc,
               py::arg("graph"),
               py::arg("edge_weights"),
-              py::arg("edge_weight_weights"));
+              py::arg("edge_weight_weights"),
+              py::arg("algorithm") = "heap",
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -69,7 +75,8 @@ struct def_binary_partition_tree_exponential_linkage {
               py::arg("graph"),
               py::arg("edge_weights"),
               py::arg("alpha"),
-              py::arg("edge_weight_weights"));
+              py::arg("edge_weight_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -81,14 +88,18 @@ struct def_binary_partition_tree_ward_linkage {
               [](const hg::ugraph &graph, 
                       const pyarray<T> &vertex_centroids, 
                       const pyarray<T> &vertex_sizes,
-                      const std::string & altitude_correction) {
-                  return binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, altitude_correction);
+                      const std::string & altitude_correction,
+                      const std::string &algorithm) {
+                  return binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, altitude_correction,
+                                                            py_bpt_algorithm(algorithm));
               },
               doc,
               py::arg("graph"),
               py::arg("vertex_centroids"),
               py::arg("vertex_sizes"),
-              py::arg("altitude_correction")=std::string("max"));
+              py::arg("altitude_correction")=std::string("max"),
+              py::arg("algorithm") = "heap",
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -99,7 +110,7 @@ struct def_binary_partition_tree_custom_linkage {
         m.def("_binary_partition_tree",
               [](const hg::ugraph &graph,
                  pyarray<T> &edge_weights,
-                 py::object weighting_function) {
+                 const py::object &weighting_function) {
                   //using new_neighbours_type = const std::vector<binary_partition_tree_internal::new_neighbour<T> >;
                   auto weighter = [&weighting_function](
                           const undirected_graph<hg::undirected_graph_internal::hash_setS> &g,
@@ -108,6 +119,8 @@ struct def_binary_partition_tree_custom_linkage {
                           index_t merged_region1,
                           index_t merged_region2,
                           const std::vector<binary_partition_tree_internal::new_neighbour<T> > &new_neighbours) {
+                      // the tree construction runs without the GIL: re-acquire it to call back python
+                      py::gil_scoped_acquire acquire;
                       weighting_function(g, fusion_edge_index, new_region, merged_region1, merged_region2,
                                          pybind11::make_iterator(new_neighbours.begin(), new_neighbours.end()));
                   };
@@ -118,7 +131,63 @@ struct def_binary_partition_tree_custom_linkage {
               doc,
               py::arg("graph"),
               py::arg("edge_weights"),
-              py::arg("weighting_function"));
+              py::arg("weighting_function"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+struct def_binary_partition_tree_custom_linkage_batch {
+    template<typename T>
+    static
+    void def(pybind11::module &m, const char *doc) {
+        m.def("_binary_partition_tree_batch",
+              [](const hg::ugraph &graph,
+                 pyarray<T> &edge_weights,
+                 const py::object &weighting_function) {
+                  auto weighter = [&weighting_function](
+                          const undirected_graph<hg::undirected_graph_internal::hash_setS> &g,
+                          index_t fusion_edge_index,
+                          index_t new_region,
+                          index_t merged_region1,
+                          index_t merged_region2,
+                          const std::vector<binary_partition_tree_internal::new_neighbour<T> > &new_neighbours) {
+                      // the tree construction runs without the GIL: re-acquire it to call back python
+                      py::gil_scoped_acquire acquire;
+                      size_t num_neighbours = new_neighbours.size();
+                      std::array<size_t, 1> shape{{num_neighbours}};
+                      auto neighbour_vertex = xt::pytensor<index_t, 1>::from_shape(shape);
+                      auto num_edges = xt::pytensor<index_t, 1>::from_shape(shape);
+                      auto first_edge_index = xt::pytensor<index_t, 1>::from_shape(shape);
+                      auto second_edge_index = xt::pytensor<index_t, 1>::from_shape(shape);
+                      for (index_t i = 0; i < (index_t) num_neighbours; i++) {
+                          auto &n = new_neighbours[i];
+                          neighbour_vertex(i) = n.neighbour_vertex();
+                          num_edges(i) = n.num_edges();
+                          first_edge_index(i) = n.first_edge_index();
+                          second_edge_index(i) = n.second_edge_index();
+                      }
+                      py::object result = weighting_function(g, fusion_edge_index, new_region, merged_region1,
+                                                             merged_region2, neighbour_vertex, num_edges,
+                                                             first_edge_index, second_edge_index);
+                      auto new_weights = py::array_t<T, py::array::c_style | py::array::forcecast>::ensure(result);
+                      if (!new_weights || (size_t) new_weights.size() != num_neighbours) {
+                          throw std::runtime_error(
+                                  "The weighting function must return an array with one weight per new neighbour.");
+                      }
+                      auto data = new_weights.data();
+                      for (index_t i = 0; i < (index_t) num_neighbours; i++) {
+                          new_neighbours[i].new_edge_weight() = data[i];
+                      }
+                  };
+                  return hg::binary_partition_tree(graph,
+                                                   edge_weights,
+                                                   weighter);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("weighting_function"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -127,12 +196,14 @@ struct def_binary_partition_tree_complete_linkage {
     static
     void def(pybind11::module &m, const char *doc) {
         m.def("_binary_partition_tree_complete_linkage",
-              [](const hg::ugraph &graph, pyarray<T> &edge_weights) {
-                  return hg::binary_partition_tree_complete_linkage(graph, edge_weights);
+              [](const hg::ugraph &graph, pyarray<T> &edge_weights, const std::string &algorithm) {
+                  return hg::binary_partition_tree_complete_linkage(graph, edge_weights, py_bpt_algorithm(algorithm));
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights"));
+              py::arg("edge_weights"),
+              py::arg("algorithm") = "heap",
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -148,4 +219,6 @@ void py_init_binary_partition_tree(pybind11::module &m) {
     def_new_neighbour<double>(m);
     add_type_overloads<def_binary_partition_tree_custom_linkage, HG_TEMPLATE_FLOAT_TYPES>
             (m, "Compute a binary partition tree with the given linkage distance.");
+    add_type_overloads<def_binary_partition_tree_custom_linkage_batch, HG_TEMPLATE_FLOAT_TYPES>
+            (m, "Compute a binary partition tree with the given vectorized linkage distance.");
 }
@@ -11,7 +11,21 @@
 #pragma once
 
 #include "pybind11/pybind11.h"
+#include "higra/hierarchy/binary_partition_tree.hpp"
+#include <stdexcept>
+#include <string>
 
+/**
+ * Converts the name of a binary partition tree engine ("heap" or "nn_chain") into the corresponding bpt_algorithm value.
+ */
+inline hg::bpt_algorithm py_bpt_algorithm(const std::string &algorithm) {
+    if (algorithm == "heap") {
+        return hg::bpt_algorithm::heap;
+    } else if (algorithm == "nn_chain") {
+        return hg::bpt_algorithm::nn_chain;
+    }
+    throw std::runtime_error("Unknown algorithm '" + algorithm + "', possible values are 'heap' and 'nn_chain'.");
+}
 
 void py_init_binary_partition_tree(pybind11::module &m);
 
@@ -26,12 +26,15 @@ struct def_min_tree {
     void def(C &c, const char *doc) {
         c.def("_component_tree_min_tree",
               [](const graph_t &graph,
-                 const pyarray<value_t> &vertex_weights) {
-                  return hg::component_tree_min_tree(graph, vertex_weights);
+                 const pyarray<value_t> &vertex_weights,
+                 const hg::index_t n_jobs) {
+                  return hg::component_tree_min_tree(graph, vertex_weights, n_jobs);
               },
               doc,
               py::arg("graph"),
-              py::arg("vertex_weights"));
+              py::arg("vertex_weights"),
+              py::arg("n_jobs") = 1,
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -42,12 +45,15 @@ struct def_max_tree {
     void def(C &c, const char *doc) {
         c.def("_component_tree_max_tree",
               [](const graph_t &graph,
-                 const pyarray<value_t> &vertex_weights) {
-                  return hg::component_tree_max_tree(graph, vertex_weights);
+                 const pyarray<value_t> &vertex_weights,
+                 const hg::index_t n_jobs) {
+                  return hg::component_tree_max_tree(graph, vertex_weights, n_jobs);
               },
               doc,
               py::arg("graph"),
-              py::arg("vertex_weights"));
+              py::arg("vertex_weights"),
+              py::arg("n_jobs") = 1,
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -10,6 +10,7 @@
 
 #include "py_hierarchy_core.hpp"
 #include "../py_common.hpp"
+#include "../algo/py_graph_core.hpp"
 #include "higra/hierarchy/hierarchy_core.hpp"
 #include "xtensor-python/pyarray.hpp"
 #include "xtensor-python/pytensor.hpp"
@@ -45,12 +46,16 @@ struct def_bptCanonical {
     template<typename value_t, typename C>
     static
     void def(C &m, const char *doc) {
-        m.def("_bpt_canonical", [](const graph_t &graph, const pyarray<value_t> &edge_weights) {
-                  return hg::bpt_canonical(graph, edge_weights);
+        m.def("_bpt_canonical", [](const graph_t &graph,
+                                   const pyarray<value_t> &edge_weights,
+                                   const std::string &algorithm) {
+                  return hg::bpt_canonical(graph, edge_weights, py_mst_algorithm(algorithm));
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights")
+              py::arg("edge_weights"),
+              py::arg("algorithm") = "kruskal",
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -65,7 +70,8 @@ struct def_quasi_flat_zone_hierarchy {
               },
               doc,
               py::arg("graph"),
-              py::arg("edge_weights")
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -99,7 +105,8 @@ void py_init_hierarchy_core(pybind11::module &m) {
           "",
           py::arg("tree"),
           py::arg("deleted_nodes"),
-          py::arg("process_leaves"));
+          py::arg("process_leaves"),
+          py::call_guard<py::gil_scoped_release>());
 
     add_type_overloads<def_quasi_flat_zone_hierarchy<hg::ugraph>, HG_TEMPLATE_SNUMERIC_TYPES>
             (m,
@@ -111,6 +118,7 @@ void py_init_hierarchy_core(pybind11::module &m) {
               return hg::tree_2_binary_tree(t);
           },
           "",
-          py::arg("tree")
+          py::arg("tree"),
+          py::call_guard<py::gil_scoped_release>()
     );
 }
\ No newline at end of file
@@ -30,12 +30,92 @@ struct def_watershed_hierarchy_by_attribute {
                       // FIXME can we do better for return type ?
                  const std::function<pyarray<double>(const hg::tree &,
                                                      const hg::array_1d<value_t> &)> &attribute_functor) {
-                  return hg::watershed_hierarchy_by_attribute(graph, edge_weights, attribute_functor);
+                  // the python functor is called with the GIL held and its result is copied in a c++ array
+                  // so that no python object outlives the GIL scope
+                  auto functor = [&attribute_functor](const hg::tree &tree, const hg::array_1d<value_t> &altitudes) {
+                      py::gil_scoped_acquire acquire;
+                      hg::array_1d<double> attribute = attribute_functor(tree, altitudes);
+                      return attribute;
+                  };
+                  return hg::watershed_hierarchy_by_attribute(graph, edge_weights, functor);
               },
               doc,
               py::arg("graph"),
               py::arg("edge_weights"),
-              py::arg("attribute_functor"));
+              py::arg("attribute_functor"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_watershed_hierarchy_by_area {
+    template<typename value_t, typename C>
+    static
+    void def(C &c, const char *doc) {
+        c.def("_watershed_hierarchy_by_area",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights,
+                 const pyarray<double> &vertex_area) {
+                  return hg::watershed_hierarchy_by_area(graph, edge_weights, vertex_area);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("vertex_area"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_watershed_hierarchy_by_volume {
+    template<typename value_t, typename C>
+    static
+    void def(C &c, const char *doc) {
+        c.def("_watershed_hierarchy_by_volume",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights,
+                 const pyarray<double> &vertex_area) {
+                  return hg::watershed_hierarchy_by_volume(graph, edge_weights, vertex_area);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::arg("vertex_area"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_watershed_hierarchy_by_dynamics {
+    template<typename value_t, typename C>
+    static
+    void def(C &c, const char *doc) {
+        c.def("_watershed_hierarchy_by_dynamics",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights) {
+                  return hg::watershed_hierarchy_by_dynamics(graph, edge_weights);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
+    }
+};
+
+template<typename graph_t>
+struct def_watershed_hierarchy_by_number_of_parents {
+    template<typename value_t, typename C>
+    static
+    void def(C &c, const char *doc) {
+        c.def("_watershed_hierarchy_by_number_of_parents",
+              [](const graph_t &graph,
+                 const pyarray<value_t> &edge_weights) {
+                  return hg::watershed_hierarchy_by_number_of_parents(graph, edge_weights);
+              },
+              doc,
+              py::arg("graph"),
+              py::arg("edge_weights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -56,7 +136,8 @@ struct def_watershed_hierarchy_by_minima_ordering {
               py::arg("graph"),
               py::arg("edge_weights"),
               py::arg("minima_ranks"),
-              py::arg("minima_ordering"));
+              py::arg("minima_ordering"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -65,6 +146,14 @@ void py_init_watershed_hierarchy(pybind11::module &m) {
 
     add_type_overloads<def_watershed_hierarchy_by_attribute<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
 
+    add_type_overloads<def_watershed_hierarchy_by_area<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
+
+    add_type_overloads<def_watershed_hierarchy_by_volume<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
+
+    add_type_overloads<def_watershed_hierarchy_by_dynamics<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
+
+    add_type_overloads<def_watershed_hierarchy_by_number_of_parents<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
+
     add_type_overloads<def_watershed_hierarchy_by_minima_ordering<hg::ugraph>, HG_TEMPLATE_NUMERIC_TYPES>(m, "");
 }
 
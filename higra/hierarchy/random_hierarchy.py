@@ -41,7 +41,7 @@ def random_binary_partition_tree(num_leaves, asymmetry_probability):
     num_leaves = int(num_leaves)
     assert (num_leaves > 0)
 
-    parents = np.zeros((num_leaves * 2 - 1,), dtype=np.int64)
+    parents = np.zeros((num_leaves * 2 - 1,), dtype=hg.index_dtype())
 
     n = 1
     root = {}
@@ -36,10 +36,10 @@ def watershed_hierarchy_by_area(graph, edge_weights, vertex_area=None):
     if vertex_area is None:
         vertex_area = hg.attribute_vertex_area(graph)
 
-    vertex_area = hg.linearize_vertex_weights(vertex_area, graph)
+    vertex_area = hg.cast_to_dtype(hg.linearize_vertex_weights(vertex_area, graph), np.float64)
 
-    return watershed_hierarchy_by_attribute(graph, edge_weights,
-                                            lambda tree, _: hg.attribute_area(tree, vertex_area, graph))
+    res = hg.cpp._watershed_hierarchy_by_area(graph, edge_weights, vertex_area)
+    return _link_result(res, graph)
 
 
 def watershed_hierarchy_by_volume(graph, edge_weights, vertex_area=None):
@@ -66,13 +66,10 @@ def watershed_hierarchy_by_volume(graph, edge_weights, vertex_area=None):
     if vertex_area is None:
         vertex_area = hg.attribute_vertex_area(graph)
 
-    vertex_area = hg.linearize_vertex_weights(vertex_area, graph)
+    vertex_area = hg.cast_to_dtype(hg.linearize_vertex_weights(vertex_area, graph), np.float64)
 
-    return watershed_hierarchy_by_attribute(graph, edge_weights,
-                                            lambda tree, altitudes:
-                                            hg.attribute_volume(tree,
-                                                                altitudes,
-                                                                hg.attribute_area(tree, vertex_area)))
+    res = hg.cpp._watershed_hierarchy_by_volume(graph, edge_weights, vertex_area)
+    return _link_result(res, graph)
 
 
 def watershed_hierarchy_by_dynamics(graph, edge_weights):
@@ -95,11 +92,8 @@ def watershed_hierarchy_by_dynamics(graph, edge_weights):
     :param edge_weights: input graph edge weights
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
-    return watershed_hierarchy_by_attribute(graph, edge_weights,
-                                            lambda tree, altitudes:
-                                            hg.attribute_dynamics(tree,
-                                                                  altitudes,
-                                                                  "increasing"))
+    res = hg.cpp._watershed_hierarchy_by_dynamics(graph, edge_weights)
+    return _link_result(res, graph)
 
 
 def watershed_hierarchy_by_number_of_parents(graph, edge_weights):
@@ -131,34 +125,8 @@ def watershed_hierarchy_by_number_of_parents(graph, edge_weights):
     :param edge_weights: edge weights of the input graph
     :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
     """
-
-    def num_parents(bpt_tree, altitudes):
-        # construct quasi flat zone hierarchy from input bpt
-        tree, node_map = hg.simplify_tree(bpt_tree, altitudes == altitudes[bpt_tree.parents()])
-
-        # determine inner nodes of the min tree, i.e. nodes of qfz having at least one node that is not a leaf
-        num_children = tree.num_children(np.arange(tree.num_vertices()))
-        num_children_leaf = np.zeros((tree.num_vertices(),), dtype=np.int64)
-        np.add.at(num_children_leaf, tree.parents()[:tree.num_leaves()], 1)
-        inner_nodes = num_children != num_children_leaf
-
-        # go back into bpt space
-        inner_nodes_bpt = np.zeros((bpt_tree.num_vertices(),), dtype=np.int64)
-        inner_nodes_bpt[node_map] = inner_nodes
-        inner_nodes = inner_nodes_bpt
-
-        # count number of min tree inner nodes in the subtree rooted in the given node
-        res = hg.accumulate_and_add_sequential(bpt_tree,
-                                               inner_nodes,
-                                               inner_nodes[:tree.num_leaves()],
-                                               hg.Accumulators.sum)
-
-        # add 1 to avoid having a zero measure in a minima
-        res[bpt_tree.num_leaves():] = res[bpt_tree.num_leaves():] + 1
-
-        return res
-
-    return hg.watershed_hierarchy_by_attribute(graph, edge_weights, num_parents)
+    res = hg.cpp._watershed_hierarchy_by_number_of_parents(graph, edge_weights)
+    return _link_result(res, graph)
 
 
 def watershed_hierarchy_by_attribute(graph, edge_weights, attribute_functor):
@@ -188,6 +156,9 @@ def watershed_hierarchy_by_attribute(graph, edge_weights, attribute_functor):
 
         tree = watershed_hierarchy_by_attribute(graph, edge_weights, lambda tree, _: hg.attribute_area(tree))
 
+    The area, volume, dynamics and number of parents attributes are computed natively by the dedicated functions
+    (:func:`~higra.watershed_hierarchy_by_area`, ...) which should be preferred.
+
     :param graph: input graph
     :param edge_weights: edge weights of the input graph
     :param attribute_functor: function computing the regional attribute
@@ -200,12 +171,7 @@ def watershed_hierarchy_by_attribute(graph, edge_weights, attribute_functor):
         return attribute_functor(tree, altitudes)
 
     res = hg.cpp._watershed_hierarchy_by_attribute(graph, edge_weights, helper_functor)
-    tree = res.tree()
-    altitudes = res.altitudes()
-
-    hg.CptHierarchy.link(tree, graph)
-
-    return tree, altitudes
+    return _link_result(res, graph)
 
 
 def watershed_hierarchy_by_minima_ordering(graph, edge_weights, minima_ranks, minima_altitudes):
@@ -253,6 +219,14 @@ def watershed_hierarchy_by_minima_ordering(graph, edge_weights, minima_ranks, mi
     minima_ranks = hg.cast_to_dtype(minima_ranks, np.uint64)
     minima_altitudes = hg.cast_to_dtype(minima_altitudes, np.float64)
     res = hg.cpp._watershed_hierarchy_by_minima_ordering(graph, edge_weights, minima_ranks, minima_altitudes)
+    return _link_result(res, graph)
+
+
+def _link_result(res, graph):
+    """
+    Extracts the tree and the altitudes of a node weighted tree computed by a watershed hierarchy function and
+    links the tree with the given graph.
+    """
     tree = res.tree()
     altitudes = res.altitudes()
 
@@ -12,4 +12,5 @@ from .contour_2d import *
 from .graph_image import *
 from .image_utils import *
 from .hierarchy_mean_pb import *
+from .tiled_hierarchy import *
 from .tree_of_shapes import *
@@ -76,7 +76,7 @@ def mask_2_neighbours(mask, center=None):
     mask = np.asarray(mask)
 
     if center is None:
-        center = np.floor_divide(np.asarray(mask.shape, dtype=np.int64), 2)
+        center = np.floor_divide(np.asarray(mask.shape, dtype=hg.index_dtype()), 2)
     else:
         center = np.asarray(center)
         if len(center) != mask.ndim:
@@ -133,7 +133,7 @@ def get_4_adjacency_implicit_graph(shape):
     if len(shape) != 2:
         raise ValueError("Shape must be a 1d array of size 2.")
 
-    neighbours = np.array(((-1, 0), (0, -1), (0, 1), (1, 0)), dtype=np.int64)
+    neighbours = np.array(((-1, 0), (0, -1), (0, 1), (1, 0)), dtype=hg.index_dtype())
     graph = hg.RegularGraph2d(shape, neighbours)
 
     hg.CptGridGraph.link(graph, shape)
@@ -153,7 +153,7 @@ def get_8_adjacency_implicit_graph(shape):
     if len(shape) != 2:
         raise ValueError("Shape must be a 1d array of size 2.")
 
-    neighbours = np.array(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)), dtype=np.int64)
+    neighbours = np.array(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)), dtype=hg.index_dtype())
     graph = hg.RegularGraph2d(shape, neighbours)
 
     hg.CptGridGraph.link(graph, shape)
@@ -131,7 +131,8 @@ struct def_fit_contour_2d {
               doc,
               py::arg("graph"),
               py::arg("shape"),
-              py::arg("edgeWeights"));
+              py::arg("edgeWeights"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -34,7 +34,7 @@ struct def_oriented_watershed {
                                                    hg::embedding_grid_2d(shape),
                                                    edge_weights,
                                                    edge_orientations);
-                  return py::make_tuple(std::move(res.first.rag),
+                  return std::make_tuple(std::move(res.first.rag),
                                         std::move(res.first.vertex_map),
                                         std::move(res.first.edge_map),
                                         std::move(res.second));
@@ -43,7 +43,8 @@ struct def_oriented_watershed {
               py::arg("graph"),
               py::arg("shape"),
               py::arg("edge_weights"),
-              py::arg("edge_orientations") = pyarray<value_t>()
+              py::arg("edge_orientations") = pyarray<value_t>(),
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -61,7 +62,7 @@ struct def_hierarchy_mean_pb {
                                                    hg::embedding_grid_2d(shape),
                                                    edge_weights,
                                                    edge_orientations);
-                  return py::make_tuple(std::move(res.first.rag),
+                  return std::make_tuple(std::move(res.first.rag),
                                         std::move(res.first.vertex_map),
                                         std::move(res.first.edge_map),
                                         std::move(res.second.tree),
@@ -72,7 +73,8 @@ struct def_hierarchy_mean_pb {
               py::arg("graph"),
               py::arg("shape"),
               py::arg("edge_weights"),
-              py::arg("edge_orientations") = pyarray<value_t>()
+              py::arg("edge_orientations") = pyarray<value_t>(),
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -21,6 +21,18 @@ using pyarray = xt::pyarray<T>;
 namespace py = pybind11;
 
 
+hg::tos_padding parse_tos_padding(const std::string &padding) {
+    if (padding == "none") {
+        return hg::tos_padding::none;
+    } else if (padding == "zero") {
+        return hg::tos_padding::zero;
+    } else if (padding == "mean") {
+        return hg::tos_padding::mean;
+    } else {
+        throw std::runtime_error("tree_of_shapes_image: Unknown padding option.");
+    }
+}
+
 struct def_tree_of_shapes {
     template<typename value_t, typename C>
     static
@@ -30,26 +42,39 @@ struct def_tree_of_shapes {
                                                            bool original_size,
                                                            bool immersion,
                                                            hg::index_t exterior_vertex) {
-                  hg::tos_padding tpadding;
-                  if (padding == "none") {
-                      tpadding = hg::tos_padding::none;
-                  } else if (padding == "zero") {
-                      tpadding = hg::tos_padding::zero;
-                  } else if (padding == "mean") {
-                      tpadding = hg::tos_padding::mean;
-                  } else {
-                      throw std::runtime_error("tree_of_shapes_image2d: Unknown padding option.");
-                  }
+                  return hg::component_tree_tree_of_shapes_image2d(image, parse_tos_padding(padding), original_size,
+                                                                   immersion, exterior_vertex);
+              },
+              doc,
+              py::arg("image"),
+              py::arg("padding") = "mean",
+              py::arg("original_size") = true,
+              py::arg("immersion") = true,
+              py::arg("exterior_vertex") = 0,
+              py::call_guard<py::gil_scoped_release>()
+        );
+    }
+};
 
-                  return hg::component_tree_tree_of_shapes_image2d(image, tpadding, original_size, immersion,
-                                                                   exterior_vertex);
+struct def_tree_of_shapes_3d {
+    template<typename value_t, typename C>
+    static
+    void def(C &m, const char *doc) {
+        m.def("_component_tree_tree_of_shapes_image3d", [](const pyarray<value_t> &image,
+                                                           const std::string &padding,
+                                                           bool original_size,
+                                                           bool immersion,
+                                                           hg::index_t exterior_vertex) {
+                  return hg::component_tree_tree_of_shapes_image3d(image, parse_tos_padding(padding), original_size,
+                                                                   immersion, exterior_vertex);
               },
               doc,
               py::arg("image"),
               py::arg("padding") = "mean",
               py::arg("original_size") = true,
               py::arg("immersion") = true,
-              py::arg("exterior_vertex") = 0
+              py::arg("exterior_vertex") = 0,
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -61,5 +86,8 @@ void py_init_tree_of_shapes_image(pybind11::module &m) {
     add_type_overloads<def_tree_of_shapes, HG_TEMPLATE_NUMERIC_TYPES>
             (m, "");
 
+    add_type_overloads<def_tree_of_shapes_3d, HG_TEMPLATE_NUMERIC_TYPES>
+            (m, "");
+
 
 }
\ No newline at end of file
@@ -0,0 +1,164 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import higra as hg
+import numpy as np
+
+
+def bpt_canonical_tiled(shape, edge_weights, tile_shape=(1024, 1024)):
+    """
+    Computes the canonical binary partition tree of a 4 adjacency graph without building the graph.
+
+    The result is the same as
+
+    .. code-block:: python
+
+        tree, altitudes = hg.bpt_canonical(hg.get_4_adjacency_graph(shape), edge_weights)
+
+    but the edge weights are read one tile at a time: a minimum spanning tree is computed on each tile
+    and only its edges, plus the edges linking two tiles, are kept in memory.
+    The final tree is then computed on the union of those edges.
+    Peak memory is thus bounded by the size of a tile plus the size of the minimum spanning tree
+    (and the tree itself).
+
+    Edges are indexed as in :func:`~higra.get_4_adjacency_graph`: the edges of a vertex :math:`(y, x)` whose
+    other extremity is either :math:`(y, x + 1)` or :math:`(y + 1, x)` are said to be owned by :math:`(y, x)`.
+    The argument :attr:`edge_weights` can be:
+
+      - a 1d array (for example a ``numpy.memmap``) containing the weights of all the edges of
+        the 4 adjacency graph: only the required slices are read for each tile;
+      - a function ``f(y_begin, y_end, x_begin, x_end)`` that returns a 1d array containing the weights of the edges
+        owned by the vertices :math:`(y, x)` of the tile, with :math:`y\\_begin \\leq y < y\\_end` and
+        :math:`x\\_begin \\leq x < x\\_end`, in increasing edge index order.
+
+    The returned tree leaf graph is the implicit 4 adjacency graph of the given shape, and its minimum spanning tree
+    (see :class:`~higra.CptBinaryHierarchy`) edge map refers to the edge indices of
+    :func:`~higra.get_4_adjacency_graph`.
+
+    :param shape: a pair (height, width)
+    :param edge_weights: a 1d array of edge weights or a function returning the edge weights of a tile
+    :param tile_shape: a pair (tile height, tile width) (default (1024, 1024))
+    :return: a tree (Concept :class:`~higra.CptBinaryHierarchy`) and its node altitudes
+    """
+    shape = hg.normalize_shape(shape)
+    if len(shape) != 2:
+        raise ValueError("Shape must be a 1d array of size 2.")
+    height, width = (int(s) for s in shape)
+    tile_height, tile_width = (int(s) for s in hg.normalize_shape(tile_shape))
+    if tile_height <= 0 or tile_width <= 0:
+        raise ValueError("Tile shape must be positive.")
+
+    if callable(edge_weights):
+        read_tile = edge_weights
+    else:
+        def read_tile(y_begin, y_end, x_begin, x_end):
+            return np.concatenate([__row_slice(edge_weights, y, x_begin, x_end, height, width)
+                                   for y in range(y_begin, y_end)])
+
+    kept_indices = []
+    kept_sources = []
+    kept_targets = []
+    kept_weights = []
+
+    for y_begin in range(0, height, tile_height):
+        y_end = min(y_begin + tile_height, height)
+        for x_begin in range(0, width, tile_width):
+            x_end = min(x_begin + tile_width, width)
+
+            indices, sources, targets, internal = __tile_edges(y_begin, y_end, x_begin, x_end, height, width)
+            weights = np.asarray(read_tile(y_begin, y_end, x_begin, x_end))
+            if weights.shape != indices.shape:
+                raise ValueError("Invalid number of edge weights for tile ({}, {}, {}, {}): expected {}, got {}."
+                                 .format(y_begin, y_end, x_begin, x_end, indices.size, weights.size))
+
+            # edges linking two tiles are kept as is
+            boundary = np.logical_not(internal)
+            kept_indices.append(indices[boundary])
+            kept_sources.append(sources[boundary])
+            kept_targets.append(targets[boundary])
+            kept_weights.append(weights[boundary])
+
+            # only the minimum spanning tree of the edges inside the tile is kept: local edges are in the same
+            # order as the global ones so that ties are resolved as in the global graph
+            if np.any(internal):
+                tile_graph = hg.UndirectedGraph((y_end - y_begin) * (x_end - x_begin))
+                local_sources, local_targets = (__global_2_tile_vertex(v[internal], y_begin, x_begin,
+                                                                       x_end - x_begin, width)
+                                                for v in (sources, targets))
+                tile_graph.add_edges(local_sources, local_targets)
+                _, mst_edge_map = hg.cpp._minimum_spanning_tree(tile_graph, weights[internal])
+                kept_indices.append(indices[internal][mst_edge_map])
+                kept_sources.append(sources[internal][mst_edge_map])
+                kept_targets.append(targets[internal][mst_edge_map])
+                kept_weights.append(weights[internal][mst_edge_map])
+
+    kept_indices = np.concatenate(kept_indices)
+    order = np.argsort(kept_indices, kind="stable")
+    kept_indices = kept_indices[order]
+
+    graph = hg.UndirectedGraph(height * width)
+    graph.add_edges(np.concatenate(kept_sources)[order], np.concatenate(kept_targets)[order])
+    kept_weights = np.concatenate(kept_weights)[order]
+    del kept_sources, kept_targets, order
+
+    res = hg.cpp._bpt_canonical(graph, kept_weights)
+    tree = res.tree()
+    altitudes = res.altitudes()
+    mst = res.mst()
+
+    leaf_graph = hg.get_4_adjacency_implicit_graph(shape)
+    hg.CptMinimumSpanningTree.link(mst, leaf_graph, kept_indices[res.mst_edge_map()])
+    hg.CptHierarchy.link(tree, leaf_graph)
+    hg.CptBinaryHierarchy.link(tree, mst)
+
+    return tree, altitudes
+
+
+def __row_slice(edge_weights, y, x_begin, x_end, height, width):
+    """
+    Weights of the edges owned by the vertices (y, x_begin), ..., (y, x_end - 1): they form a contiguous
+    range of edge indices.
+    """
+    first = y * (2 * width - 1)
+    if y < height - 1:
+        return edge_weights[first + 2 * x_begin: first + min(2 * x_end, 2 * width - 1)]
+    else:
+        return edge_weights[first + x_begin: first + min(x_end, width - 1)]
+
+
+def __tile_edges(y_begin, y_end, x_begin, x_end, height, width):
+    """
+    Indices, sources and targets of the edges owned by the vertices of the given tile in increasing index order,
+    and a boolean array indicating if each edge is inside the tile.
+    """
+    ys, xs = np.meshgrid(np.arange(y_begin, y_end, dtype=hg.index_dtype()),
+                         np.arange(x_begin, x_end, dtype=hg.index_dtype()),
+                         indexing="ij")
+    ys = ys.ravel()
+    xs = xs.ravel()
+    vertices = ys * width + xs
+    first = ys * (2 * width - 1)
+    not_last_row = ys < height - 1
+
+    right_indices = np.where(not_last_row, first + 2 * xs, first + xs)
+    down_indices = first + 2 * xs + (xs < width - 1)
+
+    # each vertex owns its right edge first, then its bottom edge
+    indices = np.stack((right_indices, down_indices), axis=1).ravel()
+    sources = np.repeat(vertices, 2)
+    targets = np.stack((vertices + 1, vertices + width), axis=1).ravel()
+    exists = np.stack((xs < width - 1, not_last_row), axis=1).ravel()
+    internal = np.stack((xs < x_end - 1, ys < y_end - 1), axis=1).ravel()
+
+    return indices[exists], sources[exists], targets[exists], internal[exists]
+
+
+def __global_2_tile_vertex(vertices, y_begin, x_begin, tile_width, width):
+    return (vertices // width - y_begin) * tile_width + vertices % width - x_begin
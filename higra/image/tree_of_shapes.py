@@ -38,7 +38,7 @@ def component_tree_tree_of_shapes_image2d(image, padding='mean', original_size=T
     image of size:
 
       - :math:`(h, w)` if :attr:`original_size` is ``True``;
-      - :math:`(h * 2 - 1, w * 2 - 1)` is :attr:`original_size` is ``False`` and :attr:`padding` is ``"none"``; and
+      - :math:`(h * 2 - 1, w * 2 - 1)` if :attr:`original_size` is ``False`` and :attr:`padding` is ``"none"``; and
       - :math:`((h + 2) * 2 - 1, (w + 2) * 2 - 1)` otherwise.
 
     :Advanced options:
@@ -93,6 +93,57 @@ def component_tree_tree_of_shapes_image2d(image, padding='mean', original_size=T
     return tree, altitudes
 
 
+def component_tree_tree_of_shapes_image3d(image, padding='mean', original_size=True, immersion=True, exterior_vertex=0):
+    """
+    Tree of shapes of a 3d image.
+
+    This is the 3d counterpart of :func:`~higra.component_tree_tree_of_shapes_image2d`: please look at this function
+    documentation for more details. The tree is computed with the 6-adjacency in the interpolated Khalimsky space.
+    The values of the points of the interpolated space (the plain map) are computed on the fly from the input image,
+    but the propagation and the construction of the tree still run on the whole interpolated space, even if
+    :attr:`original_size` is ``True``: the memory usage is proportional to the number of points of the interpolated
+    space, between 70 and 120 bytes per point depending on the value type. For example, a :math:`512^3` volume with
+    padding has more than :math:`10^9` points in the interpolated space and requires about 80 GB with 8 bits values.
+
+    If the size of the input image is :math:`(d, h, w)`, the leaves of the returned tree will correspond to an
+    image of size:
+
+      - :math:`(d, h, w)` if :attr:`original_size` is ``True``;
+      - :math:`(d * 2 - 1, h * 2 - 1, w * 2 - 1)` if :attr:`original_size` is ``False`` and :attr:`padding` is
+        ``"none"``; and
+      - :math:`((d + 2) * 2 - 1, (h + 2) * 2 - 1, (w + 2) * 2 - 1)` otherwise.
+
+    :param image: must be a 3d array
+    :param padding: possible values are `'none'`, `'zero'`, and `'mean'` (default = `'mean'`)
+    :param original_size: remove all nodes corresponding to interpolated/padded pixels (default = `True`)
+    :param immersion: performs a plain map continuous immersion fo the original image (default = `True`)
+    :param exterior_vertex: linear coordinate of the exterior point
+    :return: a tree (Concept :class:`~higra.CptHierarchy`) and its node altitudes
+    """
+
+    assert len(image.shape) == 3, "This tree of shapes implementation only supports 3d images."
+    immersion = bool(immersion)
+
+    res = hg.cpp._component_tree_tree_of_shapes_image3d(image, padding, original_size, immersion, exterior_vertex)
+    tree = res.tree()
+    altitudes = res.altitudes()
+
+    if original_size or ((not immersion) and padding == "none"):
+        size = image.shape
+    else:
+        border = 0 if padding == "none" else 2
+        if immersion:
+            size = tuple((s + border) * 2 - 1 for s in image.shape)
+        else:
+            size = tuple(s + border for s in image.shape)
+
+    neighbours = ((-1, 0, 0), (0, -1, 0), (0, 0, -1), (0, 0, 1), (0, 1, 0), (1, 0, 0))
+    g = hg.get_nd_regular_graph(size, neighbours)
+    hg.CptHierarchy.link(tree, g)
+
+    return tree, altitudes
+
+
 def component_tree_multivariate_tree_of_shapes_image2d(image, padding='mean', original_size=True, immersion=True):
     """
     Multivariate tree of shapes for a 2d multi-band image. This tree is defined as a fusion of the marginal
@@ -42,7 +42,7 @@ def binary_hierarchy_to_scipy_linkage_matrix(tree, altitudes=None, area=None):
     if area is None:
         area = hg.attribute_area(tree)
 
-    area = hg.cast_to_dtype(area, np.int64)
+    area = hg.cast_to_dtype(area, hg.index_dtype())
     return hg.cpp._binary_hierarchy_to_scipy_linkage_matrix(tree, altitudes, area)
 
 
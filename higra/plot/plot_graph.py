@@ -11,14 +11,11 @@
 ############################################################################
 
 import numpy as np
+import importlib.util
 from .utils import COLORS, MARKERS, lighten_color
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.collections import LineCollection
-    __matplotlib_available = True
-except:
-    __matplotlib_available = False
+# matplotlib is only imported when the function is called (slow import)
+__matplotlib_available = importlib.util.find_spec("matplotlib") is not None
 
 
 def plot_graph(graph, *, vertex_positions, vertex_labels=None):
@@ -33,6 +30,8 @@ def plot_graph(graph, *, vertex_positions, vertex_labels=None):
     :return: None
     """
     assert __matplotlib_available, "The plot graph function requires matplotlib"
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
     sources, targets = graph.edge_list()
     segments = np.stack((vertex_positions[sources, :], vertex_positions[targets, :]), axis=1)
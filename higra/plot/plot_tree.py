@@ -11,20 +11,13 @@
 ############################################################################
 
 import numpy as np
+import importlib.util
 import higra as hg
 from .utils import COLORS
 
-try:
-    from scipy.cluster.hierarchy import dendrogram, set_link_color_palette
-    __scipy_available = True
-except:
-    __scipy_available = False
-
-try:
-    import matplotlib.pyplot as plt
-    __matplotlib_available = True
-except:
-    __matplotlib_available = False
+# scipy and matplotlib are only imported when the function is called (slow imports)
+__scipy_available = importlib.util.find_spec("scipy") is not None
+__matplotlib_available = importlib.util.find_spec("matplotlib") is not None
 
 
 def plot_partition_tree(tree, *, altitudes=None, n_clusters=0, lastp=30):
@@ -41,6 +34,8 @@ def plot_partition_tree(tree, *, altitudes=None, n_clusters=0, lastp=30):
     """
     assert __scipy_available, "The plot tree function requires scipy"
     assert __matplotlib_available, "The plot tree function requires matplotlib"
+    from scipy.cluster.hierarchy import dendrogram, set_link_color_palette
+    import matplotlib.pyplot as plt
 
     if np.max(tree.num_children()) > 2:
         tree, nmap = hg.tree_2_binary_tree(tree)
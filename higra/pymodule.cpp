@@ -34,6 +34,7 @@ PYBIND11_MODULE(higram, m) {
     m.attr("__version__") = "dev";
 #endif
     xt::import_numpy();
+    m.attr("_index_dtype") = pybind11::dtype::of<hg::index_t>();
     py_init_accumulators(m);
     py_init_algo_graph_core(m);
     py_init_algo_tree(m);
@@ -41,6 +42,7 @@ PYBIND11_MODULE(higram, m) {
     py_init_assessment_partition(m);
     py_init_at_accumulator(m);
     py_init_attributes(m);
+    py_init_batch(m);
     py_init_binary_partition_tree(m);
     py_init_common_hierarchy(m);
     py_init_component_tree(m);
@@ -59,6 +61,7 @@ PYBIND11_MODULE(higram, m) {
     py_init_rag(m);
     py_init_regular_graph(m);
     py_init_scipy(m);
+    py_init_thread_pool(m);
     py_init_tree_accumulator(m);
     py_init_tree_contour_accumulator(m);
     py_init_tree_energy_optimization(m);
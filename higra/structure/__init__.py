@@ -10,3 +10,4 @@
 
 from .tree_graph import *
 from .lca_fast import *
+from .shared_memory import *
@@ -38,7 +38,8 @@ struct def_lca_vertices {
               },
               doc,
               pybind11::arg("vertices1"),
-              pybind11::arg("vertices2"));
+              pybind11::arg("vertices2"),
+              py::call_guard<py::gil_scoped_release>());
     }
 };
 
@@ -52,7 +53,8 @@ void py_init_lca_fast(pybind11::module &m) {
           "Preprocess the given tree in order for fast lowest common ancestor (LCA) computation.\n\n"
           "Consider using the function :func:`~higra.make_lca_fast` instead of calling this constructor to"
           "avoid preprocessing the same tree several times.",
-          py::arg("tree"));
+          py::arg("tree"),
+          py::call_guard<py::gil_scoped_release>());
 
     c.def("lca",
           [](const lca_fast &l, index_t v1, index_t v2) {
@@ -68,7 +70,32 @@ void py_init_lca_fast(pybind11::module &m) {
     c.def("lca",
           [](const lca_fast &l, const ugraph &g) { return l.lca(edge_iterator(g)); },
           "Compute the LCA of every edge of the given graph.",
-          py::arg("UndirectedGraph"));
+          py::arg("UndirectedGraph"),
+          py::call_guard<py::gil_scoped_release>());
+
+    c.def_property_readonly("nbytes",
+                            &lca_fast::nbytes,
+                            "Memory used by the preprocessing tables in bytes.");
+
+    c.def(py::pickle(
+            [](const lca_fast &l) {
+                auto state = l.get_state();
+                return py::make_tuple(state.num_vertices,
+                                      std::move(state.Euler),
+                                      std::move(state.Depth),
+                                      std::move(state.Represent),
+                                      std::move(state.Number),
+                                      std::move(state.Minim));
+            },
+            [](const py::tuple &t) {
+                hg_assert(t.size() == 6, "Invalid LCAFast state.");
+                return lca_fast::make_from_state({t[0].cast<size_t>(),
+                                                  t[1].cast<pyarray<size_t>>(),
+                                                  t[2].cast<pyarray<size_t>>(),
+                                                  t[3].cast<pyarray<size_t>>(),
+                                                  t[4].cast<pyarray<size_t>>(),
+                                                  t[5].cast<pyarray<size_t>>()});
+            }));
 
     add_type_overloads<def_lca_vertices, int, unsigned int, long long, unsigned long long>
             (c, "Given two 1d array of graph vertex indices v1 and v2, both containing n elements, "
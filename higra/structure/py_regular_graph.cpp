@@ -58,6 +58,28 @@ void py_init_regular_graph_impl(pybind11::module &m) {
           py::arg("shape"),
           py::arg("neighbour_list"));
 
+    c.def(py::pickle(
+            [](const graph_t &graph) {
+                std::vector<hg::index_t> shape(graph.embedding.shape().begin(), graph.embedding.shape().end());
+                std::vector<std::vector<hg::index_t>> neighbours;
+                for (const auto &p: graph.neighbours) {
+                    neighbours.emplace_back(p.begin(), p.end());
+                }
+                return py::make_tuple(shape, neighbours);
+            },
+            [](const py::tuple &state) {
+                hg_assert(state.size() == 2, "Invalid regular graph state.");
+                embedding_t embedding(state[0].cast<std::vector<hg::index_t>>());
+                std::vector<point_t> points;
+                for (const auto &v: state[1].cast<std::vector<std::vector<hg::index_t>>>()) {
+                    point_t p;
+                    for (hg::index_t i = 0; i < dim; ++i)
+                        p(i) = v[i];
+                    points.push_back(p);
+                }
+                return graph_t(embedding, points);
+            }));
+
     c.def("as_explicit_graph",
           [](const graph_t &graph) {
               return hg::copy_graph<hg::ugraph>(graph);
@@ -26,7 +26,8 @@ struct def_tree_ctr {
                 [](const pyarray<type> &parent, hg::tree_category category) { return graph_t(parent, category); }),
               doc,
               py::arg("parent_relation"),
-              py::arg("category") = hg::tree_category::partition_tree
+              py::arg("category") = hg::tree_category::partition_tree,
+              py::call_guard<py::gil_scoped_release>()
         );
     }
 };
@@ -147,6 +148,15 @@ void py_init_tree_graph(pybind11::module &m) {
 
     add_type_overloads<def_tree_ctr<graph_t>, HG_TEMPLATE_INTEGRAL_TYPES>
             (c, "Create a tree from the given parent relation.");
+
+    c.def(py::pickle(
+            [](const graph_t &tree) {
+                return py::make_tuple(tree.parents(), tree.category());
+            },
+            [](const py::tuple &state) {
+                hg_assert(state.size() == 2, "Invalid tree state.");
+                return graph_t(state[0].cast<pyarray<hg::index_t>>(), state[1].cast<hg::tree_category>());
+            }));
     add_edge_accessor_graph_concept<graph_t, decltype(c)>(c);
     add_incidence_graph_concept<graph_t, decltype(c)>(c);
     add_bidirectionnal_graph_concept<graph_t, decltype(c)>(c);
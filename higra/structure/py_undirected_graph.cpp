@@ -32,6 +32,16 @@ struct def_add_edges {
     }
 };
 
+template<typename T>
+void freeze_graph(hg::undirected_graph<T> &) {
+    hg_assert(false, "Only UndirectedGraph can be frozen.");
+}
+
+inline
+void freeze_graph(hg::ugraph &g) {
+    g.freeze();
+}
+
 template<typename graph_t, typename class_t>
 void init_graph(class_t &c) {
 
@@ -64,6 +74,39 @@ void init_graph(class_t &c) {
     add_type_overloads<def_add_edges<graph_t>, int, unsigned int, long long, unsigned long long>
             (c, "Add all edges given as a pair of arrays (sources, targets) to the graph.");
 
+    c.def(py::pickle(
+            [](const graph_t &g) {
+                hg::array_1d<hg::index_t> sources = hg::array_1d<hg::index_t>::from_shape({hg::num_edges(g)});
+                hg::array_1d<hg::index_t> targets = hg::array_1d<hg::index_t>::from_shape({hg::num_edges(g)});
+                auto s = sources.begin();
+                auto t = targets.begin();
+                for (auto e: hg::edge_iterator(g)) {
+                    *s++ = hg::source(e, g);
+                    *t++ = hg::target(e, g);
+                }
+                return py::make_tuple(hg::num_vertices(g), std::move(sources), std::move(targets), g.is_frozen());
+            },
+            [](const py::tuple &state) {
+                hg_assert(state.size() == 3 || state.size() == 4, "Invalid graph state.");
+                graph_t g(state[0].cast<hg::size_t>());
+                auto sources = state[1].cast<pyarray<hg::index_t>>();
+                auto targets = state[2].cast<pyarray<hg::index_t>>();
+                hg_assert_same_shape(sources, targets);
+                for (hg::index_t i = 0; i < (hg::index_t) sources.size(); i++) {
+                    if (sources(i) == hg::invalid_index) {
+                        // removed edge: keep its index
+                        hg::add_edge(0, 0, g);
+                        hg::remove_edge(i, g);
+                    } else {
+                        hg::add_edge(sources(i), targets(i), g);
+                    }
+                }
+                if (state.size() == 4 && state[3].cast<bool>()) {
+                    freeze_graph(g);
+                }
+                return g;
+            }));
+
     c.def("add_vertex", [](graph_t &g) {
               return hg::add_vertex(g);
           },
@@ -99,6 +142,29 @@ void py_init_undirected_graph(py::module &m) {
                                                          "A class to represent sparse undirected graph as adjacency lists.");
     init_graph<hg::ugraph>(c);
 
+    c.def("freeze", &hg::ugraph::freeze,
+          "Converts the adjacency lists of the graph into a single compressed sparse row (CSR) structure. "
+          "Traversals of a frozen graph are more cache friendly but the graph cannot be modified anymore: "
+          "adding or removing vertices or edges raises an exception.",
+          py::call_guard<py::gil_scoped_release>());
+    c.def("is_frozen", &hg::ugraph::is_frozen,
+          "Returns true if the graph has been frozen (see :meth:`freeze`).");
+    c.def("csr_adjacency", [](const py::object &self) {
+              const auto &g = self.cast<const hg::ugraph &>();
+              hg_assert(g.is_frozen(), "The graph must be frozen (see freeze).");
+              const auto &offsets = g.csr_offsets();
+              const auto &edges = g.csr_edges();
+              // read only views on the graph internal arrays, the graph is kept alive by the arrays
+              py::array_t<hg::index_t> indptr(offsets.size(), offsets.data(), self);
+              py::array_t<hg::index_t> indices(edges.size(), edges.data(), self);
+              indptr.attr("setflags")(py::arg("write") = false);
+              indices.attr("setflags")(py::arg("write") = false);
+              return py::make_tuple(indptr, indices);
+          },
+          "Returns the adjacency of a frozen graph as a pair of arrays (indptr, indices) in compressed sparse row format: "
+          "the indices of the out edges of the vertex ``v`` are ``indices[indptr[v]:indptr[v + 1]]``. "
+          "The arrays are read-only views on the graph internal storage (no copy is made).");
+
     auto c2 = py::class_<hg::undirected_graph<hg::hash_setS>>(m, "UndirectedGraphOptimizedDelete");
     init_graph<hg::undirected_graph<hg::hash_setS >>(c2);
 }
@@ -0,0 +1,98 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import higra as hg
+import numpy as np
+
+
+def to_shared_memory(graph):
+    """
+    Copies the given tree or undirected graph into a new shared memory block
+    (see :class:`multiprocessing.shared_memory.SharedMemory`).
+
+    The function returns the shared memory block and a small picklable handle. The handle can be sent to other
+    processes which can then recreate the tree or the graph with :func:`~higra.from_shared_memory`
+    without serializing the underlying arrays.
+
+    The caller is responsible for closing and unlinking the shared memory block when it is not needed anymore
+    (see :meth:`multiprocessing.shared_memory.SharedMemory.unlink`).
+
+    Attributes of the tree or graph (see :func:`~higra.set_attribute`) are not copied.
+
+    :Example:
+
+    >>> shm, handle = hg.to_shared_memory(tree)
+    >>> with concurrent.futures.ProcessPoolExecutor() as executor:
+    >>>     # in each worker: tree = hg.from_shared_memory(handle)
+    >>>     results = list(executor.map(worker_function, [handle] * 4))
+    >>> shm.close()
+    >>> shm.unlink()
+
+    :param graph: a :class:`~higra.Tree` or a :class:`~higra.UndirectedGraph`
+    :return: a shared memory block and a handle
+    """
+    from multiprocessing import shared_memory
+
+    if isinstance(graph, hg.Tree):
+        arrays = (graph.parents(),)
+        meta = ("Tree", int(graph.category()))
+    elif isinstance(graph, hg.UndirectedGraph):
+        arrays = graph.edge_list()
+        meta = ("UndirectedGraph", graph.num_vertices())
+    else:
+        raise TypeError("Unsupported graph type: " + str(type(graph)))
+
+    dtype = hg.index_dtype()
+    size = sum(a.size for a in arrays)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size * np.dtype(dtype).itemsize))
+    offset = 0
+    shapes = []
+    for a in arrays:
+        np.ndarray(a.shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = a
+        offset += a.size * np.dtype(dtype).itemsize
+        shapes.append(a.shape)
+
+    return shm, (shm.name, np.dtype(dtype).str, tuple(shapes)) + meta
+
+
+def from_shared_memory(handle):
+    """
+    Creates a tree or an undirected graph from a handle returned by :func:`~higra.to_shared_memory`.
+
+    The arrays stored in the shared memory block are read in place: the only copy made is the one
+    into the internal structure of the tree or of the graph.
+
+    :param handle: a handle returned by :func:`~higra.to_shared_memory`
+    :return: a :class:`~higra.Tree` or a :class:`~higra.UndirectedGraph`
+    """
+    from multiprocessing import shared_memory
+
+    name, dtype, shapes, graph_type, meta = handle
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = []
+        offset = 0
+        for shape in shapes:
+            arrays.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset))
+            offset += arrays[-1].size * dtype.itemsize
+
+        # same code path as unpickling
+        if graph_type == "Tree":
+            result = hg.Tree.__new__(hg.Tree)
+            result.__setstate__((arrays[0], hg.TreeCategory(meta)))
+        else:
+            result = hg.UndirectedGraph.__new__(hg.UndirectedGraph)
+            result.__setstate__((meta, arrays[0], arrays[1]))
+        del arrays
+    finally:
+        shm.close()
+
+    return result
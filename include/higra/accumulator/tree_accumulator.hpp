@@ -13,11 +13,190 @@
 #include "../graph.hpp"
 #include "accumulator.hpp"
 #include "../structure/details/light_axis_view.hpp"
+#include <atomic>
+#include <memory>
+#include <numeric>
 
 namespace hg {
 
     namespace tree_accumulator_detail {
 
+        /**
+         * Minimal number of nodes of a tree for the tree accumulators to process the tree in parallel, a negative
+         * value disables parallel processing.
+         */
+        inline index_t &parallel_threshold() {
+            static index_t threshold = -1;
+            return threshold;
+        }
+
+        /**
+         * Number of nodes processed by a task of a parallel level.
+         */
+        const index_t parallel_grain_size = 1 << 12;
+
+        template<typename tree_t>
+        bool use_parallel_levels(const tree_t &tree) {
+            if (parallel_threshold() < 0 || (index_t) num_vertices(tree) < parallel_threshold()) {
+                return false;
+            }
+#ifdef HG_USE_TBB
+            return tbb::this_task_arena::max_concurrency() > 1;
+#else
+            return get_num_threads() > 1;
+#endif
+        }
+
+        /**
+         * Nodes of a tree grouped by level: the nodes of level l are
+         * nodes[offsets[l]], ..., nodes[offsets[l + 1] - 1] in no particular order.
+         */
+        struct level_schedule {
+            array_1d<index_t> nodes;
+            std::vector<index_t> offsets;
+        };
+
+        /**
+         * Builds a schedule level by level: the first level contains the nodes first_level_begin, ...,
+         * first_level_end - 1 and the next level contains the nodes given by expand(i, push) for all the nodes i of
+         * the current level (expand calls push(n) for each node n of the next level it discovers).
+         *
+         * Large levels are expanded in parallel.
+         */
+        template<typename expand_t>
+        level_schedule make_level_schedule(index_t num_nodes, index_t first_level_begin, index_t first_level_end,
+                                           expand_t &expand) {
+            level_schedule schedule;
+            // uninitialized: the nodes are written level by level
+            schedule.nodes = array_1d<index_t>::from_shape({(size_t) num_nodes});
+            index_t *nodes = schedule.nodes.data();
+            std::iota(nodes, nodes + (first_level_end - first_level_begin), first_level_begin);
+            schedule.offsets.push_back(0);
+            schedule.offsets.push_back(first_level_end - first_level_begin);
+
+            index_t first = 0;
+            index_t last = schedule.offsets.back();
+            while (first != last) {
+                index_t size = last - first;
+                index_t position = last;
+                if (size < 2 * parallel_grain_size) {
+                    auto push = [nodes, &position](index_t n) {
+                        nodes[position++] = n;
+                    };
+                    for (index_t k = first; k < last; k++) {
+                        expand(nodes[k], push);
+                    }
+                } else {
+                    index_t num_blocks = (size + parallel_grain_size - 1) / parallel_grain_size;
+                    std::vector<std::vector<index_t>> buffers(num_blocks);
+                    parfor(0, num_blocks, [nodes, &buffers, &expand, first, last](index_t b) {
+                        auto &buffer = buffers[b];
+                        buffer.reserve(parallel_grain_size);
+                        auto push = [&buffer](index_t n) {
+                            buffer.push_back(n);
+                        };
+                        auto end = (std::min)(first + (b + 1) * parallel_grain_size, last);
+                        for (index_t k = first + b * parallel_grain_size; k < end; k++) {
+                            expand(nodes[k], push);
+                        }
+                    });
+                    std::vector<index_t> buffer_positions(num_blocks);
+                    for (index_t b = 0; b < num_blocks; b++) {
+                        buffer_positions[b] = position;
+                        position += buffers[b].size();
+                    }
+                    parfor(0, num_blocks, [nodes, &buffers, &buffer_positions](index_t b) {
+                        std::copy(buffers[b].begin(), buffers[b].end(),
+                                  nodes + buffer_positions[b]);
+                    });
+                }
+                first = last;
+                last = position;
+                if (first != last) {
+                    schedule.offsets.push_back(last);
+                }
+            }
+            return schedule;
+        }
+
+        /**
+         * Groups the nodes of the tree by topological height: leaves are at level 0 and a non leaf node is one level
+         * above its highest child. The children of a node of level l are all in levels smaller than l.
+         *
+         * A node is added to the next level when its last child is processed: the schedule is built in parallel.
+         */
+        template<typename tree_t>
+        level_schedule topological_height_schedule(const tree_t &tree) {
+            HG_TRACE();
+            auto &parents = tree.parents();
+            index_t num_nodes = num_vertices(tree);
+            index_t root_node = root(tree);
+            // number of children of each node that are not yet in the schedule
+            std::unique_ptr<std::atomic<index_t>[]> pending(new std::atomic<index_t>[num_nodes]);
+            parfor(0, (num_nodes + parallel_grain_size - 1) / parallel_grain_size,
+                   [&tree, &pending, num_nodes](index_t b) {
+                       auto end = (std::min)((b + 1) * parallel_grain_size, num_nodes);
+                       for (index_t i = b * parallel_grain_size; i < end; i++) {
+                           pending[i].store((index_t) num_children(i, tree), std::memory_order_relaxed);
+                       }
+                   });
+
+            auto expand = [&parents, &pending, root_node](index_t i, auto &push) {
+                if (i != root_node) {
+                    auto p = parents(i);
+                    if (pending[p].fetch_sub(1, std::memory_order_relaxed) == 1) {
+                        push(p);
+                    }
+                }
+            };
+            return make_level_schedule(num_nodes, 0, num_leaves(tree), expand);
+        }
+
+        /**
+         * Groups the nodes of the tree by depth: the root is at level 0 and a non root node is one level below
+         * its parent.
+         */
+        template<typename tree_t>
+        level_schedule depth_schedule(const tree_t &tree) {
+            HG_TRACE();
+            auto expand = [&tree](index_t i, auto &push) {
+                for (auto c: children_iterator(i, tree)) {
+                    push(c);
+                }
+            };
+            index_t root_node = root(tree);
+            return make_level_schedule(num_vertices(tree), root_node, root_node + 1, expand);
+        }
+
+        /**
+         * Calls fun(first, last) on consecutive sub-ranges of [first, last[ in parallel.
+         */
+        template<typename iterator_t, typename fun_t>
+        void parallel_blocks(iterator_t first, iterator_t last, fun_t &fun) {
+            index_t size = last - first;
+            if (size < 2 * parallel_grain_size) {
+                fun(first, last);
+                return;
+            }
+            index_t num_blocks = (size + parallel_grain_size - 1) / parallel_grain_size;
+            parfor(0, num_blocks, [&fun, first, size](index_t b) {
+                auto begin = b * parallel_grain_size;
+                auto end = (std::min)(begin + parallel_grain_size, size);
+                fun(first + begin, first + end);
+            });
+        }
+
+        /**
+         * Processes the levels of the schedule one after the other starting from first_level: the nodes of a level
+         * are processed in parallel by calling fun(first, last) on sub-ranges of the level.
+         */
+        template<typename fun_t>
+        void parallel_levels(const level_schedule &schedule, index_t first_level, fun_t &fun) {
+            auto nodes = schedule.nodes.data();
+            for (index_t l = first_level; l < (index_t) schedule.offsets.size() - 1; l++) {
+                parallel_blocks(nodes + schedule.offsets[l], nodes + schedule.offsets[l + 1], fun);
+            }
+        }
 
         template<bool vectorial,
                 typename tree_t,
@@ -37,26 +216,30 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(output_shape);
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto output_view = make_light_axis_view<vectorial>(output);
-            auto acc = accumulator.template make_accumulator<vectorial>(output_view);
-
-            for (auto i: leaves_iterator(tree)) {
-                output_view.set_position(i);
-                acc.set_storage(output_view);
-                acc.initialize();
-                acc.finalize();
-            }
-
-            for (auto i : leaves_to_root_iterator(tree, leaves_it::exclude)) {
-                output_view.set_position(i);
-                acc.set_storage(output_view);
-                acc.initialize();
-                for (auto c : children_iterator(i, tree)) {
-                    input_view.set_position(c);
-                    acc.accumulate(input_view.begin());
+            auto accumulate_nodes = [&tree, &input, &output, &accumulator](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto acc = accumulator.template make_accumulator<vectorial>(output_view);
+
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    acc.set_storage(output_view);
+                    acc.initialize();
+                    for (auto c : children_iterator(i, tree)) {
+                        input_view.set_position(c);
+                        acc.accumulate(input_view.begin());
+                    }
+                    acc.finalize();
                 }
-                acc.finalize();
+            };
+
+            // leaves have no children: the accumulation is empty
+            auto nodes = leaves_to_root_iterator(tree);
+            if (use_parallel_levels(tree)) {
+                parallel_blocks(nodes.begin(), nodes.end(), accumulate_nodes);
+            } else {
+                accumulate_nodes(nodes.begin(), nodes.end());
             }
 
             return output;
@@ -80,26 +263,43 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(output_shape);
 
-            auto vertex_data_view = make_light_axis_view<vectorial>(vertex_data);
-            auto input_view = make_light_axis_view<vectorial>(output);
-            auto output_view = make_light_axis_view<vectorial>(output);
-            auto acc = accumulator.template make_accumulator<vectorial>(output_view);
-
-            for (auto i: leaves_iterator(tree)) {
-                output_view.set_position(i);
-                vertex_data_view.set_position(i);
-                output_view = vertex_data_view;
-            }
-
-            for (auto i : leaves_to_root_iterator(tree, leaves_it::exclude)) {
-                output_view.set_position(i);
-                acc.set_storage(output_view);
-                acc.initialize();
-                for (auto c : children_iterator(i, tree)) {
-                    input_view.set_position(c);
-                    acc.accumulate(input_view.begin());
+            auto copy_leaves = [&vertex_data, &output](auto first, auto last) {
+                auto vertex_data_view = make_light_axis_view<vectorial>(vertex_data);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    vertex_data_view.set_position(i);
+                    output_view = vertex_data_view;
                 }
-                acc.finalize();
+            };
+
+            auto accumulate_nodes = [&tree, &output, &accumulator](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(output);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto acc = accumulator.template make_accumulator<vectorial>(output_view);
+
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    acc.set_storage(output_view);
+                    acc.initialize();
+                    for (auto c : children_iterator(i, tree)) {
+                        input_view.set_position(c);
+                        acc.accumulate(input_view.begin());
+                    }
+                    acc.finalize();
+                }
+            };
+
+            auto leaves = leaves_iterator(tree);
+            if (use_parallel_levels(tree)) {
+                parallel_blocks(leaves.begin(), leaves.end(), copy_leaves);
+                parallel_levels(topological_height_schedule(tree), 1, accumulate_nodes);
+            } else {
+                copy_leaves(leaves.begin(), leaves.end());
+                auto nodes = leaves_to_root_iterator(tree, leaves_it::exclude);
+                accumulate_nodes(nodes.begin(), nodes.end());
             }
             return output;
         };
@@ -137,31 +337,47 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(output_shape);
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto inout_view = make_light_axis_view<vectorial>(output);
-            auto output_view = make_light_axis_view<vectorial>(output);
-            auto acc = accumulator.template make_accumulator<vectorial>(output_view);
-
-            auto vertex_data_view = make_light_axis_view<vectorial>(vertex_data);
-
-            for (auto i: leaves_iterator(tree)) {
-                output_view.set_position(i);
-                vertex_data_view.set_position(i);
-                output_view = vertex_data_view;
-            }
-
-            for (auto i : leaves_to_root_iterator(tree, leaves_it::exclude)) {
-                output_view.set_position(i);
-                acc.set_storage(output_view);
-                acc.initialize();
-                for (auto c : children_iterator(i, tree)) {
-
-                    inout_view.set_position(c);
-                    acc.accumulate(inout_view.begin());
+            auto copy_leaves = [&vertex_data, &output](auto first, auto last) {
+                auto vertex_data_view = make_light_axis_view<vectorial>(vertex_data);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    vertex_data_view.set_position(i);
+                    output_view = vertex_data_view;
                 }
-                acc.finalize();
-                input_view.set_position(i);
-                output_view.combine(input_view, combine);
+            };
+
+            auto accumulate_nodes = [&tree, &input, &output, &accumulator, &combine](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto inout_view = make_light_axis_view<vectorial>(output);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto acc = accumulator.template make_accumulator<vectorial>(output_view);
+
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    acc.set_storage(output_view);
+                    acc.initialize();
+                    for (auto c : children_iterator(i, tree)) {
+
+                        inout_view.set_position(c);
+                        acc.accumulate(inout_view.begin());
+                    }
+                    acc.finalize();
+                    input_view.set_position(i);
+                    output_view.combine(input_view, combine);
+                }
+            };
+
+            auto leaves = leaves_iterator(tree);
+            if (use_parallel_levels(tree)) {
+                parallel_blocks(leaves.begin(), leaves.end(), copy_leaves);
+                parallel_levels(topological_height_schedule(tree), 1, accumulate_nodes);
+            } else {
+                copy_leaves(leaves.begin(), leaves.end());
+                auto nodes = leaves_to_root_iterator(tree, leaves_it::exclude);
+                accumulate_nodes(nodes.begin(), nodes.end());
             }
 
             return output;
@@ -179,15 +395,24 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(input.shape());
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto output_view = make_light_axis_view<vectorial>(output);
-
             auto aparents = parents(tree).storage_begin();
 
-            for (auto i: root_to_leaves_iterator(tree)) {
-                input_view.set_position(aparents[i]);
-                output_view.set_position(i);
-                output_view = input_view;
+            auto propagate_nodes = [&input, &output, &aparents](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    input_view.set_position(aparents[i]);
+                    output_view.set_position(i);
+                    output_view = input_view;
+                }
+            };
+
+            auto nodes = root_to_leaves_iterator(tree);
+            if (use_parallel_levels(tree)) {
+                parallel_blocks(nodes.begin(), nodes.end(), propagate_nodes);
+            } else {
+                propagate_nodes(nodes.begin(), nodes.end());
             }
             return output;
         };
@@ -208,19 +433,28 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(input.shape());
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto output_view = make_light_axis_view<vectorial>(output);
-
             auto aparents = parents(tree).storage_begin();
 
-            for (auto i: root_to_leaves_iterator(tree)) {
-                if (condition(i)) {
-                    input_view.set_position(aparents[i]);
-                } else {
-                    input_view.set_position(i);
+            auto propagate_nodes = [&input, &condition, &output, &aparents](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    if (condition(i)) {
+                        input_view.set_position(aparents[i]);
+                    } else {
+                        input_view.set_position(i);
+                    }
+                    output_view.set_position(i);
+                    output_view = input_view;
                 }
-                output_view.set_position(i);
-                output_view = input_view;
+            };
+
+            auto nodes = root_to_leaves_iterator(tree);
+            if (use_parallel_levels(tree)) {
+                parallel_blocks(nodes.begin(), nodes.end(), propagate_nodes);
+            } else {
+                propagate_nodes(nodes.begin(), nodes.end());
             }
             return output;
         };
@@ -241,27 +475,39 @@ namespace hg {
 
             array_nd <output_t> output = array_nd<output_t>::from_shape(input.shape());
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto output_view = make_light_axis_view<vectorial>(output);
-            auto inout_view = make_light_axis_view<vectorial>(output);
-
             auto aparents = parents(tree).storage_begin();
 
-            // root cannot be deleted
-            output_view.set_position(root(tree));
-            input_view.set_position(root(tree));
-            output_view = input_view;
+            {
+                // root cannot be deleted
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                output_view.set_position(root(tree));
+                input_view.set_position(root(tree));
+                output_view = input_view;
+            }
 
-            for (auto i: root_to_leaves_iterator(tree, leaves_it::include, root_it::exclude)) {
-                output_view.set_position(i);
-                if (condition(i)) {
-                    inout_view.set_position(aparents[i]);
-                    output_view = inout_view;
-                } else {
-                    input_view.set_position(i);
-                    output_view = input_view;
+            auto propagate_nodes = [&input, &condition, &output, &aparents](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto inout_view = make_light_axis_view<vectorial>(output);
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    if (condition(i)) {
+                        inout_view.set_position(aparents[i]);
+                        output_view = inout_view;
+                    } else {
+                        input_view.set_position(i);
+                        output_view = input_view;
+                    }
                 }
+            };
 
+            if (use_parallel_levels(tree)) {
+                parallel_levels(depth_schedule(tree), 1, propagate_nodes);
+            } else {
+                auto nodes = root_to_leaves_iterator(tree, leaves_it::include, root_it::exclude);
+                propagate_nodes(nodes.begin(), nodes.end());
             }
             return output;
         };
@@ -288,32 +534,48 @@ namespace hg {
             output_shape.insert(output_shape.begin(), num_vertices(tree));
             array_nd <output_t> output = array_nd<output_t>::from_shape(output_shape);
 
-            auto input_view = make_light_axis_view<vectorial>(input);
-            auto output_view = make_light_axis_view<vectorial>(output);
-            auto parent_view = make_light_axis_view<vectorial>(output);
-
             auto aparents = parents(tree).storage_begin();
-            auto acc = accumulator.template make_accumulator<vectorial>(output_view);
-            // root cannot be deleted
-            output_view.set_position(root(tree));
-            input_view.set_position(root(tree));
-            acc.set_storage(output_view);
-            acc.initialize();
-            acc.accumulate(input_view.begin());
-            acc.finalize();
-
-            for (auto i: root_to_leaves_iterator(tree, leaves_it::include, root_it::exclude)) {
-                output_view.set_position(i);
+
+            {
+                // root cannot be deleted
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto acc = accumulator.template make_accumulator<vectorial>(output_view);
+                output_view.set_position(root(tree));
+                input_view.set_position(root(tree));
                 acc.set_storage(output_view);
                 acc.initialize();
+                acc.accumulate(input_view.begin());
+                acc.finalize();
+            }
 
-                parent_view.set_position(aparents[i]);
-                acc.accumulate(parent_view.begin());
+            auto propagate_nodes = [&input, &output, &aparents, &accumulator](auto first, auto last) {
+                auto input_view = make_light_axis_view<vectorial>(input);
+                auto output_view = make_light_axis_view<vectorial>(output);
+                auto parent_view = make_light_axis_view<vectorial>(output);
+                auto acc = accumulator.template make_accumulator<vectorial>(output_view);
 
-                input_view.set_position(i);
-                acc.accumulate(input_view.begin());
+                for (; first != last; ++first) {
+                    auto i = *first;
+                    output_view.set_position(i);
+                    acc.set_storage(output_view);
+                    acc.initialize();
 
-                acc.finalize();
+                    parent_view.set_position(aparents[i]);
+                    acc.accumulate(parent_view.begin());
+
+                    input_view.set_position(i);
+                    acc.accumulate(input_view.begin());
+
+                    acc.finalize();
+                }
+            };
+
+            if (use_parallel_levels(tree)) {
+                parallel_levels(depth_schedule(tree), 1, propagate_nodes);
+            } else {
+                auto nodes = root_to_leaves_iterator(tree, leaves_it::include, root_it::exclude);
+                propagate_nodes(nodes.begin(), nodes.end());
             }
 
             return output;
@@ -321,6 +583,30 @@ namespace hg {
 
     }
 
+    /**
+     * Minimal number of nodes of a tree for the tree accumulators (accumulate_*, propagate_*) to process the tree in
+     * parallel. A negative value (default) disables parallel processing.
+     *
+     * In parallel mode, the nodes are grouped by level (topological height for the leaves to root accumulations,
+     * depth for the root to leaves propagations) and the nodes of a level are processed concurrently. Each node
+     * still reads its children (or its parent) in the same order: the results are identical to the sequential ones.
+     *
+     * @return
+     */
+    inline index_t get_tree_accumulator_parallel_threshold() {
+        return tree_accumulator_detail::parallel_threshold();
+    }
+
+    /**
+     * Set the minimal number of nodes of a tree for the tree accumulators to process the tree in parallel
+     * (see get_tree_accumulator_parallel_threshold).
+     *
+     * @param threshold
+     */
+    inline void set_tree_accumulator_parallel_threshold(index_t threshold) {
+        tree_accumulator_detail::parallel_threshold() = threshold;
+    }
+
     template<typename tree_t, typename T, typename accumulator_t, typename output_t = typename T::value_type>
     auto accumulate_parallel(const tree_t &tree,
                              const xt::xexpression<T> &xinput,
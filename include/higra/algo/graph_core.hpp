@@ -12,9 +12,13 @@
 
 #include "../graph.hpp"
 #include "../algo/graph_weights.hpp"
+#include "../algo/kruskal.hpp"
 #include "higra/structure/unionfind.hpp"
 #include "xtensor/xview.hpp"
 #include "higra/sorting.hpp"
+#include <algorithm>
+#include <cmath>
+#include <limits>
 
 namespace hg {
 
@@ -123,45 +127,36 @@ namespace hg {
      * @tparam T Input edge weights type
      * @param graph Input graph
      * @param xedge_weights  Input edge weights
+     * @param algorithm Kruskal engine (see mst_algorithm)
      * @return a mst structure
      */
     template<typename graph_t,
             typename T>
     auto minimum_spanning_tree(const graph_t &graph,
-                               const xt::xexpression<T> &xedge_weights) {
+                               const xt::xexpression<T> &xedge_weights,
+                               mst_algorithm algorithm = mst_algorithm::kruskal) {
         HG_TRACE();
         auto &edge_weights = xedge_weights.derived_cast();
         hg_assert_edge_weights(graph, edge_weights);
         hg_assert_1d_array(edge_weights);
 
-        array_1d<index_t> sorted_edges_indices = xt::arange(num_edges(graph));
-        stable_sort(sorted_edges_indices.begin(), sorted_edges_indices.end(),
-                         [&edge_weights](index_t i, index_t j) { return edge_weights[i] < edge_weights[j]; });
-
         auto num_points = num_vertices(graph);
 
-        auto num_edge_mst_max = num_points - 1;
+        index_t num_edge_mst_max = (index_t) num_points - 1;
         ugraph mst(num_points);
-        array_1d<index_t> mst_edge_map = xt::empty<index_t>({num_edge_mst_max});
+        array_1d<index_t> mst_edge_map = xt::empty<index_t>({(size_t) num_edge_mst_max});
 
         union_find uf(num_points);
 
-        size_t num_edge_found = 0;
-        index_t i = 0;
-
-        while (num_edge_found < num_edge_mst_max && i < (index_t) sorted_edges_indices.size()) {
-            auto ei = sorted_edges_indices[i];
-            auto e = edge_from_index(ei, graph);
-            auto c1 = uf.find(source(e, graph));
-            auto c2 = uf.find(target(e, graph));
-            if (c1 != c2) {
-                uf.link(c1, c2);
-                mst.add_edge(e);
-                mst_edge_map(num_edge_found) = ei;
-                num_edge_found++;
-            }
-            i++;
-        }
+        index_t num_edge_found = 0;
+
+        kruskal(graph, edge_weights, uf, num_edge_mst_max,
+                [&](index_t ei, index_t, index_t, index_t) {
+                    mst.add_edge(edge_from_index(ei, graph));
+                    mst_edge_map(num_edge_found) = ei;
+                    num_edge_found++;
+                },
+                algorithm);
 
         if (num_edge_found != num_edge_mst_max) {
             return minimum_spanning_tree_result<ugraph>{
@@ -175,4 +170,296 @@ namespace hg {
 
     };
 
+    namespace graph_core_internal {
+
+        /**
+         * Minimal kd-tree over a set of points stored in a row major n x d array, used by
+         * euclidean_minimum_spanning_tree.
+         *
+         * Nodes are stored in preorder: the children of a node always have larger indices than the node itself.
+         */
+        struct kd_tree {
+
+            kd_tree(const double *points, index_t num_points, index_t dim, index_t leaf_size = 16) :
+                    points(points), dim(dim), leaf_size(leaf_size), index(num_points) {
+                for (index_t i = 0; i < num_points; i++) {
+                    index[i] = i;
+                }
+                if (num_points > 0) {
+                    build(0, num_points);
+                }
+            }
+
+            index_t num_nodes() const {
+                return (index_t) begin.size();
+            }
+
+            bool is_leaf(index_t node) const {
+                return left[node] == invalid_index;
+            }
+
+            double box_squared_distance(index_t node, const double *x) const {
+                double d = 0;
+                const double *bmin = &box_min[node * dim];
+                const double *bmax = &box_max[node * dim];
+                for (index_t k = 0; k < dim; k++) {
+                    double t = 0;
+                    if (x[k] < bmin[k]) {
+                        t = bmin[k] - x[k];
+                    } else if (x[k] > bmax[k]) {
+                        t = x[k] - bmax[k];
+                    }
+                    d += t * t;
+                }
+                return d;
+            }
+
+            double squared_distance(index_t i, index_t j) const {
+                double d = 0;
+                const double *x = &points[i * dim];
+                const double *y = &points[j * dim];
+                for (index_t k = 0; k < dim; k++) {
+                    double t = x[k] - y[k];
+                    d += t * t;
+                }
+                return d;
+            }
+
+            const double *points;
+            index_t dim;
+            index_t leaf_size;
+            std::vector<index_t> index;
+            std::vector<index_t> begin;
+            std::vector<index_t> end;
+            std::vector<index_t> left;
+            std::vector<index_t> right;
+            std::vector<double> box_min;
+            std::vector<double> box_max;
+
+        private:
+
+            index_t build(index_t first, index_t last) {
+                index_t node = (index_t) begin.size();
+                begin.push_back(first);
+                end.push_back(last);
+                left.push_back(invalid_index);
+                right.push_back(invalid_index);
+                box_min.insert(box_min.end(), &points[index[first] * dim], &points[index[first] * dim] + dim);
+                box_max.insert(box_max.end(), &points[index[first] * dim], &points[index[first] * dim] + dim);
+
+                index_t split_dim = 0;
+                double split_extent = 0;
+                for (index_t k = 0; k < dim; k++) {
+                    double &bmin = box_min[node * dim + k];
+                    double &bmax = box_max[node * dim + k];
+                    for (index_t i = first + 1; i < last; i++) {
+                        double v = points[index[i] * dim + k];
+                        bmin = (std::min)(bmin, v);
+                        bmax = (std::max)(bmax, v);
+                    }
+                    if (bmax - bmin > split_extent) {
+                        split_extent = bmax - bmin;
+                        split_dim = k;
+                    }
+                }
+
+                if (last - first <= leaf_size || split_extent == 0) {
+                    return node;
+                }
+
+                index_t middle = first + (last - first) / 2;
+                std::nth_element(index.begin() + first, index.begin() + middle, index.begin() + last,
+                                 [this, split_dim](index_t i, index_t j) {
+                                     return points[i * dim + split_dim] < points[j * dim + split_dim];
+                                 });
+                index_t l = build(first, middle);
+                index_t r = build(middle, last);
+                left[node] = l;
+                right[node] = r;
+                return node;
+            }
+        };
+    }
+
+    /**
+     * Computes a minimum spanning tree of the complete graph on the given points where the weight of an edge {x, y}
+     * is the Euclidean distance between x and y.
+     *
+     * The algorithm is Boruvka's algorithm where, at each round, the nearest point outside of the component of every
+     * point is found with a kd-tree. Sub-trees of the kd-tree containing only points of the component of the query
+     * point, or too far from the query point, are pruned. The queries of a round are done in parallel. There are at
+     * most log2(n) rounds and, contrarily to the approach based on the complete graph, the memory footprint is
+     * linear in the number of points.
+     *
+     * Ties are broken by the indices of the extremities of the edges, the result is thus deterministic.
+     *
+     * @tparam T
+     * @param xpoints a 2d array of n points (one point per row)
+     * @return a pair of types (ugraph, array_1d) representing the minimum spanning tree (n vertices and n - 1 edges
+     * sorted in lexicographic order) and its edge weights
+     */
+    template<typename T>
+    auto euclidean_minimum_spanning_tree(const xt::xexpression<T> &xpoints) {
+        HG_TRACE();
+        auto &input_points = xpoints.derived_cast();
+        hg_assert(input_points.dimension() == 2, "Points must be a 2d array.");
+
+        array_2d<double> points = input_points;
+        index_t num_points = points.shape()[0];
+        index_t dim = points.shape()[1];
+        index_t num_edges = (std::max)(num_points - 1, (index_t) 0);
+
+        array_1d<index_t> sources = xt::empty<index_t>({(size_t) num_edges});
+        array_1d<index_t> targets = xt::empty<index_t>({(size_t) num_edges});
+        array_1d<double> weights = xt::empty<double>({(size_t) num_edges});
+
+        graph_core_internal::kd_tree tree(points.data(), num_points, dim);
+        index_t num_nodes = tree.num_nodes();
+
+        union_find uf(num_points);
+        std::vector<index_t> component(num_points);
+        std::vector<index_t> node_component(num_nodes);
+        std::vector<double> nearest_distance(num_points);
+        std::vector<index_t> nearest_point(num_points);
+        std::vector<index_t> component_best(num_points);
+        std::vector<double> component_bound(num_points);
+        // components only grow: the distance from a point to the nearest point outside of its component never
+        // decreases along the rounds
+        std::vector<double> lower_bound(num_points, 0);
+
+        // strict total order on edges: (squared length, smallest extremity, largest extremity)
+        auto edge_less = [](double d1, index_t p1, index_t q1, double d2, index_t p2, index_t q2) {
+            if (d1 != d2) {
+                return d1 < d2;
+            }
+            auto e1 = std::minmax(p1, q1);
+            auto e2 = std::minmax(p2, q2);
+            return e1 < e2;
+        };
+
+        index_t num_edge_found = 0;
+        while (num_edge_found < num_edges) {
+            for (index_t i = 0; i < num_points; i++) {
+                component[i] = uf.find(i);
+            }
+
+            // the nearest neighbours of the previous round that are still outside of the component of a point
+            // give an upper bound on the length of the shortest edge leaving this component
+            std::fill(component_bound.begin(), component_bound.end(), std::numeric_limits<double>::infinity());
+            if (num_edge_found > 0) {
+                for (index_t p = 0; p < num_points; p++) {
+                    index_t q = nearest_point[p];
+                    if (q != invalid_index && component[q] != component[p]) {
+                        component_bound[component[p]] = (std::min)(component_bound[component[p]],
+                                                                   nearest_distance[p]);
+                    }
+                }
+            }
+
+            for (index_t n = num_nodes - 1; n >= 0; n--) {
+                if (tree.is_leaf(n)) {
+                    index_t c = component[tree.index[tree.begin[n]]];
+                    for (index_t i = tree.begin[n] + 1; i < tree.end[n] && c != invalid_index; i++) {
+                        if (component[tree.index[i]] != c) {
+                            c = invalid_index;
+                        }
+                    }
+                    node_component[n] = c;
+                } else {
+                    index_t cl = node_component[tree.left[n]];
+                    node_component[n] = (cl == node_component[tree.right[n]]) ? cl : invalid_index;
+                }
+            }
+
+            parfor(0, num_points, [&](index_t p) {
+                const double *x = &points.data()[p * dim];
+                index_t cp = component[p];
+                if (lower_bound[p] > component_bound[cp]) {
+                    nearest_distance[p] = std::numeric_limits<double>::infinity();
+                    nearest_point[p] = invalid_index;
+                    return;
+                }
+                double best_distance = component_bound[cp];
+                index_t best_point = invalid_index;
+                stackv<std::pair<index_t, double>> stack;
+                stack.push({0, 0});
+                while (!stack.empty()) {
+                    auto top = stack.top();
+                    stack.pop();
+                    index_t n = top.first;
+                    if (top.second > best_distance || node_component[n] == cp) {
+                        continue;
+                    }
+                    if (tree.is_leaf(n)) {
+                        for (index_t i = tree.begin[n]; i < tree.end[n]; i++) {
+                            index_t q = tree.index[i];
+                            if (component[q] != cp) {
+                                double d = tree.squared_distance(p, q);
+                                if ((best_point == invalid_index && d <= best_distance) ||
+                                    (best_point != invalid_index && edge_less(d, p, q, best_distance, p, best_point))) {
+                                    best_distance = d;
+                                    best_point = q;
+                                }
+                            }
+                        }
+                    } else {
+                        index_t l = tree.left[n];
+                        index_t r = tree.right[n];
+                        double dl = tree.box_squared_distance(l, x);
+                        double dr = tree.box_squared_distance(r, x);
+                        // closest child is explored first
+                        if (dl <= dr) {
+                            stack.push({r, dr});
+                            stack.push({l, dl});
+                        } else {
+                            stack.push({l, dl});
+                            stack.push({r, dr});
+                        }
+                    }
+                }
+                lower_bound[p] = best_distance;
+                nearest_distance[p] = (best_point == invalid_index) ? std::numeric_limits<double>::infinity() : best_distance;
+                nearest_point[p] = best_point;
+            });
+
+            for (index_t i = 0; i < num_points; i++) {
+                if (component[i] == i) {
+                    component_best[i] = invalid_index;
+                }
+            }
+            for (index_t p = 0; p < num_points; p++) {
+                index_t c = component[p];
+                index_t b = component_best[c];
+                if (nearest_point[p] == invalid_index) {
+                    continue;
+                }
+                if (b == invalid_index ||
+                    edge_less(nearest_distance[p], p, nearest_point[p],
+                              nearest_distance[b], b, nearest_point[b])) {
+                    component_best[c] = p;
+                }
+            }
+
+            index_t num_edge_found_before = num_edge_found;
+            for (index_t i = 0; i < num_points; i++) {
+                if (component[i] == i) {
+                    index_t p = component_best[i];
+                    index_t q = nearest_point[p];
+                    index_t cp = uf.find(p);
+                    index_t cq = uf.find(q);
+                    if (cp != cq) {
+                        uf.link(cp, cq);
+                        sources(num_edge_found) = p;
+                        targets(num_edge_found) = q;
+                        weights(num_edge_found) = std::sqrt(nearest_distance[p]);
+                        num_edge_found++;
+                    }
+                }
+            }
+            hg_assert(num_edge_found > num_edge_found_before, "Boruvka round without new edge.");
+        }
+
+        return arcs_2_undirected_graph(num_points, sources, targets, weights, arc_symmetrization::max);
+    };
+
 }
@@ -0,0 +1,195 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#pragma once
+
+#include "../graph.hpp"
+#include "../sorting.hpp"
+#include "../structure/unionfind.hpp"
+#include <vector>
+
+namespace hg {
+
+    /**
+     * Algorithms available to process the edges of a graph in Kruskal order.
+     *
+     *  - kruskal: all the edges are sorted, then processed sequentially;
+     *  - filter_kruskal: the edges are recursively partitioned around a pivot, the edges lighter than the pivot are
+     *    processed first, then the heavier edges whose extremities are already in the same component are removed
+     *    in parallel before being sorted and processed.
+     *
+     * Both algorithms process the edges in the same order (increasing weight, ties broken by increasing edge index)
+     * and thus give exactly the same results.
+     */
+    enum class mst_algorithm {
+        kruskal,
+        filter_kruskal
+    };
+
+    namespace kruskal_internal {
+
+        /**
+         * Under this number of edges, filter Kruskal sorts and processes the edges directly.
+         */
+        const index_t filter_kruskal_min_size = 1024;
+
+        template<typename graph_t, typename T, typename callback_t>
+        struct filter_kruskal_engine {
+
+            const graph_t &graph;
+            const T &edge_weights;
+            union_find &uf;
+            callback_t &on_mst_edge;
+            index_t max_edges;
+            index_t num_edge_found = 0;
+            std::vector<index_t> edges;
+
+            filter_kruskal_engine(const graph_t &graph,
+                                  const T &edge_weights,
+                                  union_find &uf,
+                                  callback_t &on_mst_edge,
+                                  index_t max_edges) :
+                    graph(graph), edge_weights(edge_weights), uf(uf), on_mst_edge(on_mst_edge),
+                    max_edges(max_edges), edges(num_edges(graph)) {
+                for (index_t i = 0; i < (index_t) edges.size(); i++) {
+                    edges[i] = i;
+                }
+            }
+
+            // total order on edges: by weight, then by index
+            bool less(index_t i, index_t j) const {
+                return edge_weights(i) < edge_weights(j) || (!(edge_weights(j) < edge_weights(i)) && i < j);
+            }
+
+            void process_edge(index_t ei) {
+                auto e = edge_from_index(ei, graph);
+                auto c1 = uf.find(source(e, graph));
+                auto c2 = uf.find(target(e, graph));
+                if (c1 != c2) {
+                    auto new_root = uf.link(c1, c2);
+                    on_mst_edge(ei, c1, c2, new_root);
+                    num_edge_found++;
+                }
+            }
+
+            /**
+             * Removes the edges of [first, last) whose extremities are in the same component.
+             * @return the new end of the range
+             */
+            index_t filter(index_t first, index_t last) {
+                std::vector<char> keep(last - first);
+                parfor(first, last, [this, first, &keep](index_t i) {
+                    auto e = edge_from_index(edges[i], graph);
+                    keep[i - first] = uf.find_root(source(e, graph)) != uf.find_root(target(e, graph));
+                });
+                index_t new_last = first;
+                for (index_t i = first; i < last; i++) {
+                    if (keep[i - first]) {
+                        edges[new_last++] = edges[i];
+                    }
+                }
+                return new_last;
+            }
+
+            /**
+             * Processes the edges of [first, last) in Kruskal order: all these edges must be heavier
+             * than the already processed edges.
+             */
+            void run(index_t first, index_t last) {
+                if (num_edge_found >= max_edges || first >= last) {
+                    return;
+                }
+                auto comp = [this](index_t i, index_t j) { return less(i, j); };
+                if (last - first <= (std::max)(filter_kruskal_min_size, (index_t) num_vertices(graph))) {
+                    hg::sort(edges.begin() + first, edges.begin() + last, comp);
+                    for (index_t i = first; i < last && num_edge_found < max_edges; i++) {
+                        process_edge(edges[i]);
+                    }
+                    return;
+                }
+
+                // median of a regular sample: as the order is total, at least the largest element of the sample
+                // is strictly greater than the pivot and both sides of the partition are non empty
+                const index_t sample_size = 31;
+                std::vector<index_t> sample(sample_size);
+                for (index_t i = 0; i < sample_size; i++) {
+                    sample[i] = edges[first + (last - first - 1) * i / (sample_size - 1)];
+                }
+                std::nth_element(sample.begin(), sample.begin() + sample_size / 2, sample.end(), comp);
+                index_t pivot = sample[sample_size / 2];
+
+                auto middle = std::partition(edges.begin() + first, edges.begin() + last,
+                                             [this, pivot](index_t i) { return !less(pivot, i); });
+                index_t mid = middle - edges.begin();
+
+                run(first, mid);
+                if (num_edge_found >= max_edges) {
+                    return;
+                }
+                run(mid, filter(mid, last));
+            }
+        };
+    }
+
+    /**
+     * Processes the edges of the given edge weighted graph in Kruskal order (increasing weight, ties broken by
+     * increasing edge index) and calls on_mst_edge for each edge whose extremities are in different components.
+     *
+     * The callback on_mst_edge is called with 4 arguments: the index of the edge, the canonical elements c1 and c2
+     * of the components of its extremities in the union find structure uf, and the canonical element of the union of
+     * c1 and c2.
+     *
+     * The processing stops as soon as max_edges edges have been found.
+     *
+     * @tparam graph_t input graph type
+     * @tparam T xexpression derived type of xedge_weights
+     * @tparam callback_t callback type
+     * @param graph input graph
+     * @param xedge_weights input graph edge weights
+     * @param uf union find structure on the vertices of the graph
+     * @param max_edges maximum number of edges to find
+     * @param on_mst_edge callback
+     * @param algorithm engine used to order the edges (see mst_algorithm)
+     * @return the number of edges found
+     */
+    template<typename graph_t, typename T, typename callback_t>
+    index_t kruskal(const graph_t &graph,
+                    const xt::xexpression<T> &xedge_weights,
+                    union_find &uf,
+                    index_t max_edges,
+                    callback_t &&on_mst_edge,
+                    mst_algorithm algorithm = mst_algorithm::kruskal) {
+        auto &edge_weights = xedge_weights.derived_cast();
+
+        if (algorithm == mst_algorithm::filter_kruskal) {
+            kruskal_internal::filter_kruskal_engine<graph_t, T, callback_t> engine(graph, edge_weights, uf,
+                                                                                   on_mst_edge, max_edges);
+            engine.run(0, num_edges(graph));
+            return engine.num_edge_found;
+        }
+
+        array_1d<index_t> sorted_edges_indices = stable_arg_sort(edge_weights);
+        index_t num_edge_found = 0;
+        index_t i = 0;
+        while (num_edge_found < max_edges && i < (index_t) sorted_edges_indices.size()) {
+            auto ei = sorted_edges_indices[i];
+            auto e = edge_from_index(ei, graph);
+            auto c1 = uf.find(source(e, graph));
+            auto c2 = uf.find(target(e, graph));
+            if (c1 != c2) {
+                auto new_root = uf.link(c1, c2);
+                on_mst_edge(ei, c1, c2, new_root);
+                num_edge_found++;
+            }
+            i++;
+        }
+        return num_edge_found;
+    }
+}
@@ -78,7 +78,7 @@ namespace hg {
         xt::view(volume, xt::range(0, num_leaves(tree))) = 0;
         for (auto i: leaves_to_root_iterator(tree, leaves_it::exclude)) {
             volume(i) = std::fabs(node_altitude(i) - node_altitude(parent(i))) * node_area(i);
-            for (auto c: tree.children(i)) {
+            for (auto c: children_iterator(i, tree)) {
                 volume(i) += volume(c);
             }
         }
@@ -130,7 +130,7 @@ namespace hg {
         using value_type = typename T::value_type;
 
         if (increasing_altitudes) {
-            auto min_depth = xt::empty_like(altitudes);
+            array_1d<value_type> min_depth = array_1d<value_type>::from_shape({num_vertices(tree)});
             xt::noalias(xt::view(min_depth, xt::range(0, num_leaves(tree)))) =
                     xt::view(xt::index_view(altitudes, tree.parents()), xt::range(0, num_leaves(tree)));
             for (auto n: leaves_to_root_iterator(tree, leaves_it::exclude)) {
@@ -150,7 +150,7 @@ namespace hg {
             }
             return xt::eval(xt::index_view(altitudes, tree.parents()) - min_depth);
         } else {
-            auto max_depth = xt::empty_like(altitudes);
+            array_1d<value_type> max_depth = array_1d<value_type>::from_shape({num_vertices(tree)});
             xt::noalias(xt::view(max_depth, xt::range(0, num_leaves(tree)))) =
                     xt::view(xt::index_view(altitudes, tree.parents()), xt::range(0, num_leaves(tree)));
             for (auto n: leaves_to_root_iterator(tree, leaves_it::exclude)) {
@@ -260,7 +260,7 @@ namespace hg {
         // identify path to the deepest extrema
         array_1d<index_t> ref_son({num_vertices(tree)}, invalid_index);
         if (increasing_altitudes) {
-            auto min_depth = xt::empty_like(altitudes);
+            array_1d<value_type> min_depth = array_1d<value_type>::from_shape({num_vertices(tree)});
             for (auto n: leaves_to_root_iterator(tree, leaves_it::exclude)) {
                 min_depth(n) = (std::numeric_limits<value_type>::max)();
                 bool flag = true;
@@ -278,7 +278,7 @@ namespace hg {
                 }
             }
         } else {
-            auto max_depth = xt::empty_like(altitudes);
+            array_1d<value_type> max_depth = array_1d<value_type>::from_shape({num_vertices(tree)});
             for (auto n: leaves_to_root_iterator(tree, leaves_it::exclude)) {
                 max_depth(n) = std::numeric_limits<value_type>::lowest();
                 bool flag = true;
@@ -556,4 +556,236 @@ namespace hg {
         return res;
     }
 
+    /**
+     * Attributes that can be computed by attribute_fused.
+     */
+    enum class fused_attribute {
+        area,
+        volume,
+        height,
+        depth,
+        contour_length,
+        mean_vertex_weights
+    };
+
+    /**
+     * Result of attribute_fused: arrays corresponding to attributes that were not computed are empty.
+     *
+     * @tparam value_type value type of the node altitudes
+     */
+    template<typename value_type>
+    struct fused_attributes {
+        array_1d<double> area;
+        array_1d<double> volume;
+        array_1d<value_type> height;
+        array_1d<index_t> depth;
+        array_1d<double> contour_length;
+        array_2d<double> mean_vertex_weights;
+    };
+
+    /**
+     * Computes several attributes of the nodes of the given tree in a single leaves to root traversal (plus a root to
+     * leaves traversal if the depth is requested): the children of each node are visited once and all the requested
+     * accumulations are updated together.
+     *
+     * Each attribute is computed as its single attribute counterpart:
+     *
+     *  - area: see attribute_area with the leaf area :attr:`xleaf_area`;
+     *  - volume: see attribute_volume with the node altitudes :attr:`xaltitudes` (implies area);
+     *  - height: see attribute_height with the node altitudes :attr:`xaltitudes`;
+     *  - depth: see attribute_depth;
+     *  - contour_length: the contour length of a leaf is given by :attr:`xvertex_perimeter` and the contour length of
+     *    a non leaf node is the sum of the contour lengths of its children minus twice its frontier length given
+     *    by :attr:`xfrontier_length`;
+     *  - mean_vertex_weights: mean of the leaf weights :attr:`xvertex_weights` (2d array of shape
+     *    (num_leaves, num_features)) inside each node (implies area).
+     *
+     * Inputs that are not used by any requested attribute are ignored and can be empty arrays.
+     *
+     * @tparam tree_t tree type
+     * @tparam T1 xexpression derived type of xleaf_area
+     * @tparam T2 xexpression derived type of xaltitudes
+     * @tparam T3 xexpression derived type of xvertex_weights
+     * @tparam T4 xexpression derived type of xvertex_perimeter
+     * @tparam T5 xexpression derived type of xfrontier_length
+     * @param tree input tree
+     * @param attributes requested attributes
+     * @param xleaf_area area of the leaves of the input tree
+     * @param xaltitudes altitudes of the nodes of the input tree
+     * @param increasing_altitudes must be true if altitude is increasing, false if it is decreasing (used by height)
+     * @param xvertex_weights 2d array of leaf weights
+     * @param xvertex_perimeter perimeter of the leaves of the input tree
+     * @param xfrontier_length frontier length of the nodes of the input tree
+     * @return a fused_attributes structure
+     */
+    template<typename tree_t, typename T1, typename T2, typename T3, typename T4, typename T5,
+            typename value_type=typename T2::value_type>
+    auto attribute_fused(const tree_t &tree,
+                         const std::vector<fused_attribute> &attributes,
+                         const xt::xexpression<T1> &xleaf_area,
+                         const xt::xexpression<T2> &xaltitudes,
+                         bool increasing_altitudes,
+                         const xt::xexpression<T3> &xvertex_weights,
+                         const xt::xexpression<T4> &xvertex_perimeter,
+                         const xt::xexpression<T5> &xfrontier_length) {
+        auto &leaf_area = xleaf_area.derived_cast();
+        auto &altitudes = xaltitudes.derived_cast();
+        auto &vertex_weights = xvertex_weights.derived_cast();
+        auto &vertex_perimeter = xvertex_perimeter.derived_cast();
+        auto &frontier_length = xfrontier_length.derived_cast();
+
+        bool c_area = false;
+        bool c_volume = false;
+        bool c_height = false;
+        bool c_depth = false;
+        bool c_contour_length = false;
+        bool c_mean = false;
+        for (auto a: attributes) {
+            switch (a) {
+                case fused_attribute::area:
+                    c_area = true;
+                    break;
+                case fused_attribute::volume:
+                    c_volume = true;
+                    break;
+                case fused_attribute::height:
+                    c_height = true;
+                    break;
+                case fused_attribute::depth:
+                    c_depth = true;
+                    break;
+                case fused_attribute::contour_length:
+                    c_contour_length = true;
+                    break;
+                case fused_attribute::mean_vertex_weights:
+                    c_mean = true;
+                    break;
+            }
+        }
+        c_area = c_area || c_volume || c_mean;
+
+        const auto num_v = num_vertices(tree);
+        const auto num_l = num_leaves(tree);
+        auto &parent = tree.parents();
+        fused_attributes<value_type> res;
+
+        if (c_area) {
+            hg_assert_leaf_weights(tree, leaf_area);
+            hg_assert_1d_array(leaf_area);
+            res.area = array_1d<double>::from_shape({num_v});
+            xt::noalias(xt::view(res.area, xt::range(0, num_l))) = leaf_area;
+        }
+        if (c_volume || c_height) {
+            hg_assert_node_weights(tree, altitudes);
+            hg_assert_1d_array(altitudes);
+        }
+        if (c_volume) {
+            res.volume = array_1d<double>::from_shape({num_v});
+            xt::view(res.volume, xt::range(0, num_l)) = 0;
+        }
+        if (c_height) {
+            // holds the altitude of the deepest non leaf node of each subtree until the end of the traversal
+            res.height = array_1d<value_type>::from_shape({num_v});
+            for (index_t i = 0; i < (index_t) num_l; i++) {
+                res.height(i) = altitudes(parent(i));
+            }
+        }
+        if (c_contour_length) {
+            hg_assert_leaf_weights(tree, vertex_perimeter);
+            hg_assert_1d_array(vertex_perimeter);
+            hg_assert_node_weights(tree, frontier_length);
+            hg_assert_1d_array(frontier_length);
+            res.contour_length = array_1d<double>::from_shape({num_v});
+            xt::noalias(xt::view(res.contour_length, xt::range(0, num_l))) = vertex_perimeter;
+        }
+        size_t num_d = 0;
+        double *mean = nullptr;
+        if (c_mean) {
+            hg_assert(vertex_weights.dimension() == 2, "vertex_weights must be a 2d array.");
+            hg_assert_leaf_weights(tree, vertex_weights);
+            num_d = vertex_weights.shape()[1];
+            res.mean_vertex_weights = xt::zeros<double>({num_v, num_d});
+            xt::noalias(xt::view(res.mean_vertex_weights, xt::range(0, num_l), xt::all())) = vertex_weights;
+            mean = res.mean_vertex_weights.data();
+        }
+
+        const value_type extremum = (increasing_altitudes) ?
+                                    (std::numeric_limits<value_type>::max)() :
+                                    std::numeric_limits<value_type>::lowest();
+
+        for (auto i: leaves_to_root_iterator(tree, leaves_it::exclude)) {
+            double area = 0;
+            double volume = 0;
+            double contour_length = 0;
+            value_type deepest = extremum;
+            bool has_non_leaf_child = false;
+
+            for (auto c: children_iterator(i, tree)) {
+                if (c_area) {
+                    area += res.area(c);
+                }
+                if (c_volume) {
+                    volume += res.volume(c);
+                }
+                if (c_contour_length) {
+                    contour_length += res.contour_length(c);
+                }
+                if (c_height && !is_leaf(c, tree)) {
+                    has_non_leaf_child = true;
+                    if ((increasing_altitudes) ? res.height(c) < deepest : res.height(c) > deepest) {
+                        deepest = res.height(c);
+                    }
+                }
+                if (c_mean) {
+                    double *mean_i = mean + i * num_d;
+                    const double *mean_c = mean + c * num_d;
+                    for (size_t k = 0; k < num_d; k++) {
+                        mean_i[k] += mean_c[k];
+                    }
+                }
+            }
+
+            if (c_area) {
+                res.area(i) = area;
+            }
+            if (c_volume) {
+                res.volume(i) = volume + std::fabs((double) altitudes(i) - (double) altitudes(parent(i))) * area;
+            }
+            if (c_height) {
+                res.height(i) = (has_non_leaf_child) ? deepest : altitudes(i);
+            }
+            if (c_contour_length) {
+                res.contour_length(i) = contour_length - 2 * frontier_length(i);
+            }
+        }
+
+        if (c_height) {
+            if (increasing_altitudes) {
+                for (index_t i = 0; i < (index_t) num_v; i++) {
+                    res.height(i) = altitudes(parent(i)) - res.height(i);
+                }
+            } else {
+                for (index_t i = 0; i < (index_t) num_v; i++) {
+                    res.height(i) = res.height(i) - altitudes(parent(i));
+                }
+            }
+        }
+
+        if (c_mean) {
+            for (index_t i = 0; i < (index_t) num_v; i++) {
+                double *mean_i = mean + i * num_d;
+                const double area = res.area(i);
+                for (size_t k = 0; k < num_d; k++) {
+                    mean_i[k] /= area;
+                }
+            }
+        }
+
+        if (c_depth) {
+            res.depth = attribute_depth(tree);
+        }
+
+        return res;
+    }
+
 }
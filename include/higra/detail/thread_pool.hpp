@@ -0,0 +1,357 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstdint>
+#include <cstdlib>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#ifndef _WIN32
+
+#include <unistd.h>
+
+#endif
+
+namespace hg {
+
+    /**
+     * A pool of worker threads executing parallel loops with work stealing.
+     *
+     * The pool is a process wide singleton accessed with thread_pool::instance().
+     * Its number of threads (including the calling thread) is, by order of priority:
+     *
+     *  - the value given to set_num_threads,
+     *  - the value of the environment variable HG_NUM_THREADS,
+     *  - the number of hardware threads.
+     *
+     * Worker threads are lazily started on the first parallel loop.
+     * Parallel loops called from a worker thread (nested parallelism) or while another parallel loop is
+     * running are executed sequentially by the calling thread.
+     */
+    class thread_pool {
+    public:
+
+        using index_type = std::int64_t;
+
+        static thread_pool &instance() {
+            static thread_pool pool;
+            return pool;
+        }
+
+        /**
+         * Number of threads used for parallel loops (including the calling thread).
+         */
+        index_type num_threads() const {
+            return m_num_threads;
+        }
+
+        /**
+         * Set the number of threads used for parallel loops (including the calling thread).
+         * If num_threads is smaller than or equal to 0, the default number of threads is used.
+         *
+         * Waits for the completion of any running parallel loop.
+         */
+        void set_num_threads(index_type num_threads) {
+            std::lock_guard<std::mutex> submit_lock(m_submit_mutex);
+            stop_workers();
+            m_num_threads = (num_threads > 0) ? num_threads : default_num_threads();
+        }
+
+        /**
+         * Calls fun(i) for i in [start_index, end_index) with a step size of step_size.
+         *
+         * The iteration range is split among the threads of the pool, idle threads steal
+         * iterations from the busy ones. Exceptions thrown by fun are propagated to the caller
+         * (only the first one if several iterations failed).
+         */
+        template<typename lambda_t>
+        void parallel_for(index_type start_index, index_type end_index, lambda_t &&fun, index_type step_size = 1) {
+            if (end_index <= start_index) {
+                return;
+            }
+            index_type num_iterations = (end_index - start_index + step_size - 1) / step_size;
+
+            std::unique_lock<std::mutex> submit_lock(m_submit_mutex, std::defer_lock);
+            if (num_iterations <= 1 || m_num_threads <= 1 || is_worker_thread() || !submit_lock.try_lock()) {
+                for (index_type i = start_index; i < end_index; i += step_size) {
+                    fun(i);
+                }
+                return;
+            }
+
+            start_workers();
+
+            index_type num_participants = (std::min)((index_type) m_workers->size() + 1, num_iterations);
+            range_job<lambda_t> job(fun, start_index, step_size, num_iterations, num_participants);
+            run(job);
+            job.rethrow();
+        }
+
+        ~thread_pool() {
+            stop_workers();
+        }
+
+        thread_pool(const thread_pool &) = delete;
+
+        thread_pool &operator=(const thread_pool &) = delete;
+
+    private:
+
+        struct job_base {
+            virtual void execute(index_type participant) = 0;
+
+            virtual ~job_base() = default;
+        };
+
+        /**
+         * Each participant owns a contiguous range of iterations [begin, end).
+         * A participant consumes small chunks at the front of its own range; once it is empty,
+         * it steals the second half of the remaining range of another participant.
+         */
+        template<typename lambda_t>
+        struct range_job : public job_base {
+
+            struct range {
+                std::mutex mutex;
+                index_type begin = 0;
+                index_type end = 0;
+            };
+
+            lambda_t &fun;
+            index_type start_index;
+            index_type step_size;
+            index_type grain_size;
+            std::vector<range> ranges;
+            std::atomic<bool> cancelled{false};
+            std::mutex error_mutex;
+            std::exception_ptr error = nullptr;
+
+            range_job(lambda_t &fun,
+                      index_type start_index,
+                      index_type step_size,
+                      index_type num_iterations,
+                      index_type num_participants) :
+                    fun(fun),
+                    start_index(start_index),
+                    step_size(step_size),
+                    ranges(num_participants) {
+                grain_size = (std::max)(num_iterations / (num_participants * 16), (index_type) 1);
+                for (index_type p = 0; p < num_participants; p++) {
+                    ranges[p].begin = num_iterations * p / num_participants;
+                    ranges[p].end = num_iterations * (p + 1) / num_participants;
+                }
+            }
+
+            bool pop_chunk(index_type participant, index_type &begin, index_type &end) {
+                auto &r = ranges[participant];
+                std::lock_guard<std::mutex> lock(r.mutex);
+                if (r.begin >= r.end) {
+                    return false;
+                }
+                begin = r.begin;
+                end = (std::min)(r.begin + grain_size, r.end);
+                r.begin = end;
+                return true;
+            }
+
+            bool steal(index_type participant) {
+                index_type num_participants = ranges.size();
+                for (index_type k = 1; k < num_participants; k++) {
+                    auto &victim = ranges[(participant + k) % num_participants];
+                    index_type begin, end;
+                    {
+                        std::lock_guard<std::mutex> lock(victim.mutex);
+                        if (victim.begin >= victim.end) {
+                            continue;
+                        }
+                        begin = victim.begin + (victim.end - victim.begin) / 2;
+                        end = victim.end;
+                        victim.end = begin;
+                    }
+                    auto &r = ranges[participant];
+                    std::lock_guard<std::mutex> lock(r.mutex);
+                    r.begin = begin;
+                    r.end = end;
+                    return true;
+                }
+                return false;
+            }
+
+            void execute(index_type participant) override {
+                if (participant >= (index_type) ranges.size()) {
+                    return;
+                }
+                index_type begin, end;
+                do {
+                    while (!cancelled && pop_chunk(participant, begin, end)) {
+                        try {
+                            for (index_type i = begin; i < end; i++) {
+                                fun(start_index + i * step_size);
+                            }
+                        } catch (...) {
+                            std::lock_guard<std::mutex> lock(error_mutex);
+                            if (!error) {
+                                error = std::current_exception();
+                            }
+                            cancelled = true;
+                        }
+                    }
+                } while (!cancelled && steal(participant));
+            }
+
+            void rethrow() {
+                if (error) {
+                    std::rethrow_exception(error);
+                }
+            }
+        };
+
+        thread_pool() : m_num_threads(default_num_threads()) {
+        }
+
+        static index_type default_num_threads() {
+            const char *env = std::getenv("HG_NUM_THREADS");
+            if (env != nullptr) {
+                index_type value = std::atoll(env);
+                if (value > 0) {
+                    return value;
+                }
+            }
+            return (std::max)((index_type) std::thread::hardware_concurrency(), (index_type) 1);
+        }
+
+        static bool &is_worker_thread() {
+            static thread_local bool value = false;
+            return value;
+        }
+
+        static index_type current_process_id() {
+#ifdef _WIN32
+            return 0;
+#else
+            return getpid();
+#endif
+        }
+
+        void start_workers() {
+            if (m_workers && m_process_id != current_process_id()) {
+                // the process has been forked: the worker threads do not exist in the child process,
+                // the old thread handles are leaked as they cannot be joined
+                m_workers.release();
+                m_job = nullptr;
+                m_stop = false;
+            }
+            if (m_workers) {
+                return;
+            }
+            m_process_id = current_process_id();
+            m_workers.reset(new std::vector<std::thread>());
+            std::size_t generation = m_generation;
+            for (index_type i = 1; i < m_num_threads; i++) {
+                m_workers->emplace_back([this, i, generation]() { worker_loop(i, generation); });
+            }
+        }
+
+        void stop_workers() {
+            if (!m_workers || m_process_id != current_process_id()) {
+                return;
+            }
+            {
+                std::lock_guard<std::mutex> lock(m_mutex);
+                m_stop = true;
+            }
+            m_start_condition.notify_all();
+            for (auto &t: *m_workers) {
+                t.join();
+            }
+            m_workers.reset();
+            m_stop = false;
+        }
+
+        void worker_loop(index_type participant, std::size_t seen_generation) {
+            is_worker_thread() = true;
+            while (true) {
+                job_base *job;
+                {
+                    std::unique_lock<std::mutex> lock(m_mutex);
+                    m_start_condition.wait(lock, [this, seen_generation]() {
+                        return m_stop || m_generation != seen_generation;
+                    });
+                    if (m_stop) {
+                        return;
+                    }
+                    seen_generation = m_generation;
+                    job = m_job;
+                }
+                job->execute(participant);
+                {
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    if (--m_pending_workers == 0) {
+                        m_done_condition.notify_all();
+                    }
+                }
+            }
+        }
+
+        void run(job_base &job) {
+            {
+                std::lock_guard<std::mutex> lock(m_mutex);
+                m_job = &job;
+                m_pending_workers = m_workers->size();
+                m_generation++;
+            }
+            m_start_condition.notify_all();
+
+            is_worker_thread() = true;
+            job.execute(0);
+            is_worker_thread() = false;
+
+            std::unique_lock<std::mutex> lock(m_mutex);
+            m_done_condition.wait(lock, [this]() { return m_pending_workers == 0; });
+            m_job = nullptr;
+        }
+
+        index_type m_num_threads;
+        index_type m_process_id = 0;
+        std::unique_ptr<std::vector<std::thread>> m_workers;
+        std::mutex m_submit_mutex;
+        std::mutex m_mutex;
+        std::condition_variable m_start_condition;
+        std::condition_variable m_done_condition;
+        job_base *m_job = nullptr;
+        std::size_t m_generation = 0;
+        std::size_t m_pending_workers = 0;
+        bool m_stop = false;
+    };
+
+    /**
+     * Number of threads used by Higra parallel algorithms.
+     */
+    inline std::int64_t get_num_threads() {
+        return thread_pool::instance().num_threads();
+    }
+
+    /**
+     * Set the number of threads used by Higra parallel algorithms.
+     * If num_threads is smaller than or equal to 0, the default number of threads is used
+     * (environment variable HG_NUM_THREADS if defined, number of hardware threads otherwise).
+     */
+    inline void set_num_threads(std::int64_t num_threads) {
+        thread_pool::instance().set_num_threads(num_threads);
+    }
+}
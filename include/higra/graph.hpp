@@ -253,6 +253,67 @@ namespace hg {
             g.add_edge(sources(i), targets(i));
     }
 
+    /**
+     * Add the edges (sources(i), targets(i)) to the given undirected graph.
+     *
+     * The edge storage and the adjacency lists of the extremities of the new edges are preallocated before inserting
+     * the edges (the capacities grow geometrically).
+     *
+     * @tparam T type of the input arrays
+     * @tparam storage_t edge storage of the graph
+     * @param xsources A 1d array of integer (source vertices)
+     * @param xtargets A 1d array of integer (target vertices)
+     * @param g A mutable undirected graph
+     */
+    template<typename T, typename storage_t>
+    void add_edges(const xt::xexpression<T> &xsources,
+                   const xt::xexpression<T> &xtargets,
+                   undirected_graph<storage_t> &g) {
+        auto &sources = xsources.derived_cast();
+        auto &targets = xtargets.derived_cast();
+        hg_assert_1d_array(sources);
+        hg_assert_integral_value_type(sources);
+        hg_assert_same_shape(sources, targets);
+
+        index_t num_new_edges = sources.size();
+        index_t num_v = num_vertices(g);
+        g.reserve_edges(num_edges(g) + num_new_edges);
+        if (2 * num_new_edges >= num_v) {
+            // large batch: count the new degrees in a dense array
+            std::vector<size_t> new_degrees(num_v, 0);
+            for (index_t i = 0; i < num_new_edges; i++) {
+                new_degrees[sources(i)]++;
+                if (sources(i) != targets(i)) {
+                    new_degrees[targets(i)]++;
+                }
+            }
+            for (index_t v = 0; v < num_v; v++) {
+                if (new_degrees[v] != 0) {
+                    g.reserve_out_edges(v, degree(v, g) + new_degrees[v]);
+                }
+            }
+        } else {
+            // small batch: only consider the extremities of the new edges
+            std::vector<index_t> extremities;
+            extremities.reserve(2 * num_new_edges);
+            for (index_t i = 0; i < num_new_edges; i++) {
+                extremities.push_back(sources(i));
+                if (sources(i) != targets(i)) {
+                    extremities.push_back(targets(i));
+                }
+            }
+            std::sort(extremities.begin(), extremities.end());
+            for (auto first = extremities.begin(); first != extremities.end();) {
+                auto last = std::upper_bound(first, extremities.end(), *first);
+                g.reserve_out_edges(*first, degree(*first, g) + (last - first));
+                first = last;
+            }
+        }
+
+        for (index_t i = 0; i < num_new_edges; i++)
+            g.add_edge(sources(i), targets(i));
+    }
+
     /**
      * Create a new graph as a copy of the given graph
      * @tparam T input graph type
@@ -351,6 +412,248 @@ namespace hg {
         return a;
     }
 
+    /**
+     * Sparse adjacency matrix of an undirected edge-weighted graph in compressed sparse row (CSR) format
+     * (the matrix is thus symmetric).
+     *
+     * The column indices of each row are sorted in increasing order. The entry (v, v) of a self loop on a vertex v
+     * appears only once. Parallel edges lead to repeated entries.
+     *
+     * @tparam graph_t
+     * @tparam T
+     * @param graph Input undirected graph
+     * @param xedge_weights Input edge-weights
+     * @return a tuple of 1d arrays (indptr, indices, data)
+     */
+    template<typename graph_t, typename T>
+    auto undirected_graph_2_csr(const graph_t &graph,
+                                const xt::xexpression<T> &xedge_weights) {
+        HG_TRACE();
+        using value_type = typename T::value_type;
+        auto &edge_weights = xedge_weights.derived_cast();
+        hg_assert_edge_weights(graph, edge_weights);
+        hg_assert_1d_array(edge_weights);
+
+        index_t n_vertices = num_vertices(graph);
+        array_1d<index_t> indptr = array_1d<index_t>::from_shape({(size_t) n_vertices + 1});
+        indptr(0) = 0;
+        for (index_t v = 0; v < n_vertices; v++) {
+            indptr(v + 1) = indptr(v) + out_degree(v, graph);
+        }
+
+        index_t nnz = indptr(n_vertices);
+        array_1d<index_t> indices = array_1d<index_t>::from_shape({(size_t) nnz});
+        array_1d<value_type> data = array_1d<value_type>::from_shape({(size_t) nnz});
+
+        parfor(0, n_vertices, [&graph, &edge_weights, &indptr, &indices, &data](index_t v) {
+            std::vector<std::pair<index_t, index_t>> row;
+            for (auto e: out_edge_iterator(v, graph)) {
+                row.emplace_back(target(e, graph), index(e, graph));
+            }
+            std::sort(row.begin(), row.end());
+            index_t pos = indptr(v);
+            for (const auto &entry: row) {
+                indices(pos) = entry.first;
+                data(pos) = edge_weights(entry.second);
+                pos++;
+            }
+        });
+
+        return std::make_tuple(std::move(indptr), std::move(indices), std::move(data));
+    }
+
+    /**
+     * Strategies to build undirected edges from a set of arcs (directed edges)
+     */
+    enum class arc_symmetrization {
+        max, // an edge {x, y} exists if any arc (x, y) or (y, x) exists, its weight is the maximal weight of those arcs
+        min // an edge {x, y} exists if both arcs (x, y) and (y, x) exist, its weight is the minimal weight of those arcs
+    };
+
+    /**
+     * Creates an undirected edge-weighted graph from a list of weighted arcs (directed edges).
+     *
+     * Arcs between the same pair of vertices (in any direction), including repeated arcs, are merged into a single edge
+     * according to the given symmetrization strategy (see arc_symmetrization). A self loop (x, x) is considered to exist
+     * in both directions.
+     *
+     * Edges of the resulting graph are sorted in lexicographic order: the edge {x, y} with x <= y comes before the
+     * edge {x', y'} with x' <= y' if x < x' or if x = x' and y < y'.
+     *
+     * The arc weights are optional: if the weight array is empty, the returned edge weights are empty.
+     *
+     * Time complexity is linear in the number of vertices plus the number of arcs.
+     *
+     * @tparam T1
+     * @tparam T2
+     * @param num_vertices number of vertices of the graph
+     * @param xsources A 1d array of integer (source vertices of arcs)
+     * @param xtargets A 1d array of integer (target vertices of arcs)
+     * @param xarc_weights A 1d array of arc weights or an empty array
+     * @param symmetrization arc symmetrization strategy
+     * @return a pair of types (ugraph, array_1d) representing the graph and its edge-weights
+     */
+    template<typename T1, typename T2>
+    auto arcs_2_undirected_graph(size_t num_vertices,
+                                 const xt::xexpression<T1> &xsources,
+                                 const xt::xexpression<T1> &xtargets,
+                                 const xt::xexpression<T2> &xarc_weights,
+                                 arc_symmetrization symmetrization = arc_symmetrization::max) {
+        HG_TRACE();
+        using value_type = typename T2::value_type;
+        auto &sources = xsources.derived_cast();
+        auto &targets = xtargets.derived_cast();
+        auto &arc_weights = xarc_weights.derived_cast();
+        hg_assert_1d_array(sources);
+        hg_assert_integral_value_type(sources);
+        hg_assert_same_shape(sources, targets);
+        bool weighted = arc_weights.size() != 0;
+        hg_assert(!weighted || arc_weights.size() == sources.size(),
+                  "Arc weights must be empty or have the same size as sources and targets.");
+
+        index_t num_arcs = sources.size();
+        index_t n_vertices = num_vertices;
+
+        auto smaller = [&sources, &targets](index_t i) {
+            return (std::min)((index_t) sources(i), (index_t) targets(i));
+        };
+        auto larger = [&sources, &targets](index_t i) {
+            return (std::max)((index_t) sources(i), (index_t) targets(i));
+        };
+
+        // sort arcs by (smaller extremity, larger extremity) with two stable counting sorts
+        std::vector<index_t> counts(n_vertices + 1);
+        std::vector<index_t> order_larger(num_arcs);
+        std::vector<index_t> order(num_arcs);
+
+        for (index_t i = 0; i < num_arcs; i++) {
+            hg_assert(sources(i) >= 0 && (index_t) sources(i) < n_vertices &&
+                      targets(i) >= 0 && (index_t) targets(i) < n_vertices,
+                      "Vertex indices must be positive and smaller than the number of vertices.");
+            counts[larger(i) + 1]++;
+        }
+        for (index_t v = 0; v < n_vertices; v++) {
+            counts[v + 1] += counts[v];
+        }
+        for (index_t i = 0; i < num_arcs; i++) {
+            order_larger[counts[larger(i)]++] = i;
+        }
+
+        std::fill(counts.begin(), counts.end(), 0);
+        for (index_t i = 0; i < num_arcs; i++) {
+            counts[smaller(i) + 1]++;
+        }
+        for (index_t v = 0; v < n_vertices; v++) {
+            counts[v + 1] += counts[v];
+        }
+        for (index_t i = 0; i < num_arcs; i++) {
+            auto a = order_larger[i];
+            order[counts[smaller(a)]++] = a;
+        }
+        std::vector<index_t>().swap(order_larger);
+
+        // merge runs of arcs with the same extremities
+        std::vector<index_t> edge_sources;
+        std::vector<index_t> edge_targets;
+        std::vector<value_type> weights;
+        std::vector<size_t> degrees(n_vertices, 0);
+
+        index_t i = 0;
+        while (i < num_arcs) {
+            index_t s = smaller(order[i]);
+            index_t t = larger(order[i]);
+            bool forward = false;
+            bool backward = false;
+            value_type w{};
+            index_t j = i;
+            for (; j < num_arcs && smaller(order[j]) == s && larger(order[j]) == t; j++) {
+                auto a = order[j];
+                if ((index_t) sources(a) == s) {
+                    forward = true;
+                }
+                if ((index_t) targets(a) == s) {
+                    backward = true;
+                }
+                if (weighted) {
+                    if (j == i) {
+                        w = arc_weights(a);
+                    } else if (symmetrization == arc_symmetrization::max) {
+                        w = (std::max)(w, (value_type) arc_weights(a));
+                    } else {
+                        w = (std::min)(w, (value_type) arc_weights(a));
+                    }
+                }
+            }
+            if (symmetrization == arc_symmetrization::max || (forward && backward)) {
+                edge_sources.push_back(s);
+                edge_targets.push_back(t);
+                if (weighted) {
+                    weights.push_back(w);
+                }
+                degrees[s]++;
+                if (s != t) {
+                    degrees[t]++;
+                }
+            }
+            i = j;
+        }
+        std::vector<index_t>().swap(order);
+
+        ugraph g(n_vertices);
+        g.reserve_edges(edge_sources.size());
+        for (index_t v = 0; v < n_vertices; v++) {
+            g.reserve_out_edges(v, degrees[v]);
+        }
+        for (index_t e = 0; e < (index_t) edge_sources.size(); e++) {
+            g.add_edge(edge_sources[e], edge_targets[e]);
+        }
+
+        array_1d<value_type> edge_weights = array_1d<value_type>::from_shape({weights.size()});
+        std::copy(weights.begin(), weights.end(), edge_weights.begin());
+
+        return std::make_pair(std::move(g), std::move(edge_weights));
+    }
+
+    /**
+     * Creates an undirected edge-weighted graph from a square sparse matrix in compressed sparse row (CSR) format.
+     *
+     * Each non zero entry (i, j) of the matrix is an arc from i to j, see arcs_2_undirected_graph for the
+     * symmetrization of arcs.
+     *
+     * @tparam T1
+     * @tparam T2
+     * @tparam T3
+     * @param xindptr A 1d array of integers of size n + 1 (n is the number of vertices of the graph)
+     * @param xindices A 1d array of integers (column indices)
+     * @param xdata A 1d array of values (matrix entries) or an empty array
+     * @param symmetrization arc symmetrization strategy
+     * @return a pair of types (ugraph, array_1d) representing the graph and its edge-weights
+     */
+    template<typename T1, typename T2, typename T3>
+    auto csr_2_undirected_graph(const xt::xexpression<T1> &xindptr,
+                                const xt::xexpression<T2> &xindices,
+                                const xt::xexpression<T3> &xdata,
+                                arc_symmetrization symmetrization = arc_symmetrization::max) {
+        HG_TRACE();
+        auto &indptr = xindptr.derived_cast();
+        auto &indices = xindices.derived_cast();
+        hg_assert_1d_array(indptr);
+        hg_assert_1d_array(indices);
+        hg_assert(indptr.size() >= 1, "indptr cannot be empty.");
+        index_t n_vertices = indptr.size() - 1;
+        hg_assert((index_t) indptr(n_vertices) == (index_t) indices.size(), "Invalid indptr array.");
+
+        array_1d<index_t> sources = array_1d<index_t>::from_shape({indices.size()});
+        array_1d<index_t> targets = array_1d<index_t>::from_shape({indices.size()});
+        for (index_t i = 0; i < n_vertices; i++) {
+            for (index_t j = indptr(i); j < (index_t) indptr(i + 1); j++) {
+                sources(j) = i;
+                targets(j) = indices(j);
+            }
+        }
+        return arcs_2_undirected_graph(n_vertices, sources, targets, xdata, symmetrization);
+    }
+
     /**
      * Creates an undirected edge-weighted graph from an adjacency matrix.
      *
@@ -14,12 +14,39 @@
 #include "../graph.hpp"
 #include "hierarchy_core.hpp"
 #include "../structure/fibonacci_heap.hpp"
+#include "../structure/indexed_heap.hpp"
 #include "xtensor/xview.hpp"
 #include "xtensor/xnoalias.hpp"
+#include <algorithm>
+#include <numeric>
 #include <string>
+#include <vector>
 
 namespace hg {
 
+    /**
+     * Engines available to compute binary partition trees with a reducible linkage (see binary_partition_tree and
+     * binary_partition_tree_nn_chain).
+     */
+    enum class bpt_algorithm {
+        heap,
+        nn_chain
+    };
+
+    /**
+     * Priority queues available for the generic binary partition tree engine (see binary_partition_tree).
+     *
+     * All the heaps give the same result if there are no ties in the edge weights: the indexed heaps (pairing and
+     * dary) process equal edges in increasing index order while the order of the Fibonacci heap is implementation
+     * defined. Running times are within a few percents of each other: the Fibonacci heap is the default as it
+     * preserves the results of previous versions.
+     */
+    enum class bpt_heap {
+        fibonacci,
+        pairing,
+        dary
+    };
+
     namespace binary_partition_tree_internal {
 
         template<typename T>
@@ -42,6 +69,82 @@ namespace hg {
 
         };
 
+        /**
+         * Edge priority queue of the binary partition tree algorithm based on a pooled Fibonacci heap.
+         */
+        template<typename T>
+        struct fibonacci_edge_queue {
+            using heap_t = fibonacci_heap<heap_element<T> >;
+
+            fibonacci_edge_queue(size_t num_edges) : m_handles(num_edges, nullptr) {}
+
+            void push(index_t edge_index, const T &value) {
+                m_handles[edge_index] = m_heap.push({value, edge_index});
+            }
+
+            bool empty() const {
+                return m_heap.empty();
+            }
+
+            index_t top_index() {
+                return m_heap.top()->get_value().index;
+            }
+
+            T top_value() {
+                return m_heap.top()->get_value().value;
+            }
+
+            void pop() {
+                m_handles[top_index()] = nullptr;
+                m_heap.pop();
+            }
+
+            void update(index_t edge_index, const T &value) {
+                m_heap.update(m_handles[edge_index], {value, edge_index});
+            }
+
+        private:
+            heap_t m_heap;
+            std::vector<typename heap_t::value_handle> m_handles;
+        };
+
+        /**
+         * Edge priority queue of the binary partition tree algorithm based on an indexed heap
+         * (indexed_pairing_heap or indexed_dary_heap).
+         */
+        template<typename heap_t, typename T>
+        struct indexed_edge_queue {
+
+            indexed_edge_queue(size_t num_edges) : m_heap(num_edges) {}
+
+            void push(index_t edge_index, const T &value) {
+                m_heap.push(edge_index, value);
+            }
+
+            bool empty() const {
+                return m_heap.empty();
+            }
+
+            index_t top_index() const {
+                return m_heap.top();
+            }
+
+            T top_value() const {
+                return m_heap.top_value();
+            }
+
+            void pop() {
+                m_heap.pop();
+            }
+
+            void update(index_t edge_index, const T &value) {
+                m_heap.update(edge_index, value);
+            }
+
+        private:
+            heap_t m_heap;
+        };
+
         /**
          * This structure is provided by the binary partition algorithm when two nodes are merged in order to
          * compute the edge weight between the newly created node and one of its neighbouring node.
@@ -431,7 +534,115 @@ namespace hg {
             }
         };
 
+        template<typename edge_queue_t, typename graph_t, typename weighter, typename T>
+        auto binary_partition_tree_impl(const graph_t &graph, const T &edge_weights, weighter &weight_function) {
+            using weight_t = typename T::value_type;
+
+            auto g = copy_graph<undirected_graph<hash_setS> >(graph); // optimized for removal
+
+            auto num_points = num_vertices(g);
+            auto num_nodes_tree = num_points * 2 - 1;
+
+            array_1d<index_t> parents = xt::arange(num_nodes_tree);
+            array_1d<weight_t> levels = xt::zeros<weight_t>({num_nodes_tree});
+
+            // optimization to detect already visited neighbours during neighbour search
+            array_1d<index_t> new_neighbour_indices({num_nodes_tree}, invalid_index);
+
+            // active edges are in the heap and still present in the graph (removed edges are leazily left in the heap)
+            // TODO: check for performance impact
+            array_1d<bool> active = xt::zeros<bool>({num_edges(g)});
 
+            // special structure to store the list of neighbours adjacent to the fused regions.
+            std::vector<binary_partition_tree_internal::new_neighbour<weight_t> > new_neighbours;
+            const decltype(new_neighbours) &const_new_neighbours = new_neighbours;
+
+            // init heap
+            edge_queue_t heap(num_edges(g));
+
+            for (auto v: vertex_iterator(graph)) {
+                for (auto &e: out_edge_iterator(v, g)) {
+                    if (!active(e)) {
+                        heap.push(e, edge_weights(e));
+                        active(e) = true;
+                    }
+                }
+            }
+
+            // main loop
+            size_t current_num_nodes_tree = num_points;
+            while (!heap.empty() && current_num_nodes_tree < num_nodes_tree) {
+
+                auto fusion_edge_index = heap.top_index();
+                auto fusion_edge_weight = heap.top_value();
+
+                heap.pop();
+
+                if (active[fusion_edge_index]) {
+                    active[fusion_edge_index] = false;
+                    // create new region, update tree
+                    auto new_parent = g.add_vertex();
+                    auto fusion_edge = edge_from_index(fusion_edge_index, g);
+                    auto region1 = source(fusion_edge, g);
+                    auto region2 = target(fusion_edge, g);
+                    parents[region1] = new_parent;
+                    parents[region2] = new_parent;
+                    levels[new_parent] = fusion_edge_weight;
+                    current_num_nodes_tree++;
+
+                    // remove fusion edge
+                    remove_edge(fusion_edge_index, g);
+                    active[fusion_edge_index] = false;
+
+                    // search for neighbours of region1 and region2 and store them in new_neighbours
+                    new_neighbours.clear();
+                    auto explore_region = [&active, &g, &new_neighbours, &new_neighbour_indices](
+                            index_t region, index_t other_region) {
+                        // iterates on raw edge indices: avoids the type erased transform of out_edge_iterator
+                        for (auto it = g.out_edges_cbegin(region), end = g.out_edges_cend(region); it != end; ++it) {
+                            auto ei = *it;
+                            const auto &e = g.edge_from_index(ei);
+                            auto n = (e.source == region) ? e.target : e.source;
+                            if (n != other_region) { // may happen with multiple edges
+                                if (new_neighbour_indices[n] != invalid_index) {
+                                    new_neighbours[new_neighbour_indices[n]].second_edge_index() = ei;
+                                } else {
+                                    new_neighbour_indices[n] = new_neighbours.size();
+                                    new_neighbours.emplace_back(n, ei);
+                                }
+                            } else {
+                                active[ei] = false;
+                            }
+                        }
+                    };
+
+                    explore_region(region1, region2);
+                    explore_region(region2, region1);
+                    for (auto &n: new_neighbours) {
+                        new_neighbour_indices[n.neighbour_vertex()] = invalid_index;
+                    }
+
+                    // update edge weights
+                    if (!new_neighbours.empty()) { // should only happen at last iteration
+                        // external callback : compute new edge weights
+                        weight_function(g, fusion_edge_index, new_parent, region1, region2, const_new_neighbours);
+
+                        // process new weights, update heap and things
+                        for (auto &nn: new_neighbours) {
+                            if (nn.num_edges() > 1) {
+                                active[nn.second_edge_index()] = false;
+                                // not removed from heap: maybe not necessary
+                                remove_edge(nn.second_edge_index(), g);
+                            }
+                            set_edge(nn.first_edge_index(), nn.neighbour_vertex(), new_parent, g);
+                            heap.update(nn.first_edge_index(), nn.new_edge_weight());
+                            active[nn.first_edge_index()] = true;
+                        }
+                    }
+                }
+            }
+            return make_node_weighted_tree(tree(parents), std::move(levels));
+        }
     }
 
     /**
@@ -484,125 +695,293 @@ namespace hg {
      * @param graph
      * @param xedge_weights
      * @param weight_function
+     * @param heap priority queue used to store the edges (see bpt_heap)
      * @return a node weighted tree
      */
     template<typename graph_t, typename weighter, typename T>
     auto
-    binary_partition_tree(const graph_t &graph, const xt::xexpression<T> &xedge_weights, weighter weight_function) {
+    binary_partition_tree(const graph_t &graph,
+                          const xt::xexpression<T> &xedge_weights,
+                          weighter weight_function,
+                          bpt_heap heap = bpt_heap::fibonacci) {
         using weight_t = typename T::value_type;
-        using heap_t = fibonacci_heap<binary_partition_tree_internal::heap_element<weight_t> >;
+        using namespace binary_partition_tree_internal;
 
         auto &edge_weights = xedge_weights.derived_cast();
         hg_assert_edge_weights(graph, edge_weights);
 
-        auto g = copy_graph<undirected_graph<hash_setS> >(graph); // optimized for removal
+        switch (heap) {
+            case bpt_heap::pairing:
+                return binary_partition_tree_impl<indexed_edge_queue<indexed_pairing_heap<weight_t>, weight_t> >(
+                        graph, edge_weights, weight_function);
+            case bpt_heap::dary:
+                return binary_partition_tree_impl<indexed_edge_queue<indexed_dary_heap<weight_t>, weight_t> >(
+                        graph, edge_weights, weight_function);
+            case bpt_heap::fibonacci:
+            default:
+                return binary_partition_tree_impl<fibonacci_edge_queue<weight_t> >(
+                        graph, edge_weights, weight_function);
+        }
+    }
 
-        auto num_points = num_vertices(g);
-        auto num_nodes_tree = num_points * 2 - 1;
 
-        array_1d<index_t> parents = xt::arange(num_nodes_tree);
-        array_1d<weight_t> levels = xt::zeros<weight_t>({num_nodes_tree});
+    /**
+     * Compute the binary partition tree of the graph with the nearest-neighbour-chain algorithm.
+     *
+     * This function computes the same hierarchy as binary_partition_tree if the linkage defined by the initial edge
+     * weights (xedge_weights) and the callback (weight_function) is reducible, i.e. if, for any clusters X, Y, Z such
+     * that d(X, Y) <= min(d(X, Z), d(Y, Z)), it holds d(X u Y, Z) >= min(d(X, Z), d(Y, Z)) (a missing edge being
+     * seen as an infinite distance). This is the case of the complete, average and exponential linkages, and of the
+     * Ward linkage on complete graphs.
+     *
+     * Instead of maintaining a global heap of all the edges, the algorithm follows a chain of nearest neighbours until
+     * it finds two reciprocal nearest neighbours which are then merged: the merge order is thus not the final order
+     * of the nodes which are renumbered at the end by increasing altitude. With a non reducible linkage, the result
+     * is still a valid agglomerative clustering but it may differ from the one computed by binary_partition_tree.
+     *
+     * In case of ties, the hierarchy may differ from the one computed by binary_partition_tree.
+     *
+     * The weight_function callback is the same as the one of binary_partition_tree except that the graph given
+     * as first argument is the input graph.
+     *
+     * @tparam graph_t
+     * @tparam weighter
+     * @tparam T
+     * @param graph
+     * @param xedge_weights
+     * @param weight_function
+     * @return a node weighted tree
+     */
+    template<typename graph_t, typename weighter, typename T>
+    auto binary_partition_tree_nn_chain(const graph_t &graph,
+                                        const xt::xexpression<T> &xedge_weights,
+                                        weighter weight_function) {
+        using weight_t = typename T::value_type;
 
-        // optimization to detect already visited neighbours during neighbour search
-        array_1d<index_t> new_neighbour_indices({num_nodes_tree}, invalid_index);
+        auto &edge_weights = xedge_weights.derived_cast();
+        hg_assert_edge_weights(graph, edge_weights);
 
-        // active edges are in the heap and still present in the graph (removed edges are leazily left in the heap)
-        // TODO: check for performance impact
-        array_1d<bool> active = xt::zeros<bool>({num_edges(g)});
+        index_t num_points = num_vertices(graph);
+        index_t num_nodes_tree = (num_points > 0) ? num_points * 2 - 1 : 0;
+        index_t num_e = num_edges(graph);
+
+        // edges are reused during the merges: an edge linking a merged region with a neighbour is redirected toward
+        // the new region (as in binary_partition_tree)
+        std::vector<index_t> sources(num_e);
+        std::vector<index_t> targets(num_e);
+        std::vector<weight_t> weights(num_e);
+        std::vector<char> alive(num_e, true);
+        std::vector<std::vector<index_t>> adjacency(num_nodes_tree);
+        for (auto e: edge_iterator(graph)) {
+            auto ei = index(e, graph);
+            sources[ei] = source(e, graph);
+            targets[ei] = target(e, graph);
+            weights[ei] = edge_weights(ei);
+            if (sources[ei] == targets[ei]) {
+                alive[ei] = false;
+            } else {
+                adjacency[sources[ei]].push_back(ei);
+                adjacency[targets[ei]].push_back(ei);
+            }
+        }
 
-        // special structure to store the list of neighbours adjacent to the fused regions.
+        std::vector<char> active(num_nodes_tree, false);
+        std::fill(active.begin(), active.begin() + num_points, true);
+        std::vector<char> in_chain(num_nodes_tree, false);
+        // regions without any neighbour, happens only if the graph is not connected
+        std::vector<char> isolated(num_nodes_tree, false);
+
+        std::vector<index_t> merge_region1;
+        std::vector<index_t> merge_region2;
+        std::vector<weight_t> merge_levels;
+        merge_region1.reserve(num_points);
+        merge_region2.reserve(num_points);
+        merge_levels.reserve(num_points);
+
+        array_1d<index_t> new_neighbour_indices({(size_t) num_nodes_tree}, invalid_index);
         std::vector<binary_partition_tree_internal::new_neighbour<weight_t> > new_neighbours;
         const decltype(new_neighbours) &const_new_neighbours = new_neighbours;
 
-        // init heap
-        heap_t heap;
-        array_1d<typename heap_t::value_handle> heap_handles({num_edges(g)}, nullptr);
+        auto other_extremity = [&sources, &targets](index_t e, index_t v) {
+            return (sources[e] == v) ? targets[e] : sources[e];
+        };
 
-        for (auto v: vertex_iterator(graph)) {
-            for (auto &e: out_edge_iterator(v, g)) {
-                if (!active(e)) {
-                    heap_handles(e) = heap.push({edge_weights(e), e});
-                    active(e) = true;
+        // nearest neighbour of the given region, ties are broken in favour of the previous region in the chain
+        auto nearest_neighbour = [&](index_t region, index_t previous, weight_t &best_weight, index_t &best_edge) {
+            auto &adj = adjacency[region];
+            index_t best = invalid_index;
+            index_t k = 0;
+            for (index_t i = 0; i < (index_t) adj.size(); i++) {
+                auto e = adj[i];
+                if (!alive[e]) {
+                    continue;
+                }
+                adj[k++] = e;
+                auto n = other_extremity(e, region);
+                if (best == invalid_index || weights[e] < best_weight ||
+                    (weights[e] == best_weight && n == previous)) {
+                    best = n;
+                    best_weight = weights[e];
+                    best_edge = e;
                 }
             }
-        }
+            adj.resize(k);
+            return best;
+        };
 
-        // main loop
-        size_t current_num_nodes_tree = num_points;
-        while (!heap.empty() && current_num_nodes_tree < num_nodes_tree) {
-
-            auto heap_handle = heap.top();
-            auto min_element = heap_handle->get_value();
-
-            auto fusion_edge_index = min_element.index;
-            auto fusion_edge_weight = min_element.value;
-
-            heap.pop();
-            heap_handles[fusion_edge_index] = nullptr;
-
-            if (active[fusion_edge_index]) {
-                active[fusion_edge_index] = false;
-                // create new region, update tree
-                auto new_parent = g.add_vertex();
-                auto fusion_edge = edge_from_index(fusion_edge_index, g);
-                auto region1 = source(fusion_edge, g);
-                auto region2 = target(fusion_edge, g);
-                parents[region1] = new_parent;
-                parents[region2] = new_parent;
-                levels[new_parent] = fusion_edge_weight;
-                current_num_nodes_tree++;
-
-                // remove fusion edge
-                remove_edge(fusion_edge_index, g);
-                active[fusion_edge_index] = false;
-
-                // search for neighbours of region1 and region2 and store them in new_neighbours
-                new_neighbours.clear();
-                auto explore_region = [&active, &g, &new_neighbours, &new_neighbour_indices](
-                        index_t region, index_t other_region) {
-                    for (auto e: out_edge_iterator(region, g)) {
-                        auto n = other_vertex(e, region, g);
-                        if (n != other_region) { // may happen with multiple edges
-                            if (new_neighbour_indices[n] != invalid_index) {
-                                new_neighbours[new_neighbour_indices[n]].second_edge_index() = e;
+        auto merge = [&](index_t region1, index_t region2, weight_t level, index_t fusion_edge_index) {
+            index_t new_region = num_points + (index_t) merge_levels.size();
+            merge_region1.push_back(region1);
+            merge_region2.push_back(region2);
+            merge_levels.push_back(level);
+            active[region1] = false;
+            active[region2] = false;
+            active[new_region] = true;
+
+            new_neighbours.clear();
+            auto explore_region = [&](index_t region, index_t other_region) {
+                for (auto e: adjacency[region]) {
+                    if (!alive[e]) {
+                        continue;
+                    }
+                    auto n = other_extremity(e, region);
+                    if (n != other_region) {
+                        if (new_neighbour_indices[n] != invalid_index) {
+                            auto &nn = new_neighbours[new_neighbour_indices[n]];
+                            if (nn.num_edges() > 1) {
+                                // more than two parallel edges: the weighting function only sees two of them
+                                alive[e] = false;
                             } else {
-                                new_neighbour_indices[n] = new_neighbours.size();
-                                new_neighbours.emplace_back(n, e);
+                                nn.second_edge_index() = e;
                             }
                         } else {
-                            active[index(e, g)] = false;
+                            new_neighbour_indices[n] = new_neighbours.size();
+                            new_neighbours.emplace_back(n, e);
                         }
+                    } else {
+                        alive[e] = false;
                     }
-                };
-
-                explore_region(region1, region2);
-                explore_region(region2, region1);
-                for (auto &n: new_neighbours) {
-                    new_neighbour_indices[n.neighbour_vertex()] = invalid_index;
                 }
+            };
 
-                // update edge weights
-                if (!new_neighbours.empty()) { // should only happen at last iteration
-                    // external callback : compute new edge weights
-                    weight_function(g, fusion_edge_index, new_parent, region1, region2, const_new_neighbours);
-
-                    // process new weights, update heap and things
-                    for (auto &nn: new_neighbours) {
-                        if (nn.num_edges() > 1) {
-                            active[nn.second_edge_index()] = false;
-                            // not removed from heap: maybe not necessary
-                            remove_edge(nn.second_edge_index(), g);
-                        }
-                        set_edge(nn.first_edge_index(), nn.neighbour_vertex(), new_parent, g);
-                        heap.update(heap_handles[nn.first_edge_index()], {nn.new_edge_weight(), nn.first_edge_index()});
-                        active[nn.first_edge_index()] = true;
+            explore_region(region1, region2);
+            explore_region(region2, region1);
+            for (auto &n: new_neighbours) {
+                new_neighbour_indices[n.neighbour_vertex()] = invalid_index;
+            }
+
+            if (!new_neighbours.empty()) {
+                weight_function(graph, fusion_edge_index, new_region, region1, region2, const_new_neighbours);
+
+                auto &new_adjacency = adjacency[new_region];
+                new_adjacency.reserve(new_neighbours.size());
+                for (auto &nn: new_neighbours) {
+                    if (nn.num_edges() > 1) {
+                        alive[nn.second_edge_index()] = false;
                     }
+                    auto e = nn.first_edge_index();
+                    sources[e] = nn.neighbour_vertex();
+                    targets[e] = new_region;
+                    weights[e] = nn.new_edge_weight();
+                    new_adjacency.push_back(e);
                 }
             }
+            std::vector<index_t>().swap(adjacency[region1]);
+            std::vector<index_t>().swap(adjacency[region2]);
+        };
+
+        std::vector<index_t> chain;
+        index_t next_start = 0;
+        while ((index_t) merge_levels.size() < num_points - 1) {
+            if (chain.empty()) {
+                index_t num_regions = num_points + (index_t) merge_levels.size();
+                while (next_start < num_regions && (!active[next_start] || isolated[next_start])) {
+                    next_start++;
+                }
+                if (next_start == num_regions) {
+                    break;
+                }
+                chain.push_back(next_start);
+                in_chain[next_start] = true;
+            }
+
+            index_t region = chain.back();
+            index_t previous = (chain.size() >= 2) ? chain[chain.size() - 2] : invalid_index;
+            weight_t weight{};
+            index_t edge = invalid_index;
+            index_t nearest = nearest_neighbour(region, previous, weight, edge);
+
+            if (nearest == invalid_index) {
+                isolated[region] = true;
+                in_chain[region] = false;
+                chain.pop_back();
+            } else if (nearest == previous) {
+                in_chain[region] = false;
+                in_chain[previous] = false;
+                chain.pop_back();
+                chain.pop_back();
+                merge(previous, region, weight, edge);
+            } else if (in_chain[nearest]) {
+                // may only happen with a non reducible linkage
+                while (chain.back() != nearest) {
+                    in_chain[chain.back()] = false;
+                    chain.pop_back();
+                }
+            } else {
+                chain.push_back(nearest);
+                in_chain[nearest] = true;
+            }
+        }
+
+        // renumber the new regions by increasing altitude: the merges are sorted according to the maximal altitude
+        // in their sub-tree, which is compatible with the ancestor relation even if the linkage is not monotone
+        index_t num_merges = merge_levels.size();
+        std::vector<weight_t> keys(num_merges);
+        for (index_t i = 0; i < num_merges; i++) {
+            keys[i] = merge_levels[i];
+            for (auto r: {merge_region1[i], merge_region2[i]}) {
+                if (r >= num_points && keys[i] < keys[r - num_points]) {
+                    keys[i] = keys[r - num_points];
+                }
+            }
+        }
+        std::vector<index_t> order(num_merges);
+        std::iota(order.begin(), order.end(), 0);
+        std::stable_sort(order.begin(), order.end(), [&keys](index_t i, index_t j) {
+            return keys[i] < keys[j];
+        });
+        std::vector<index_t> new_index(num_merges);
+        for (index_t i = 0; i < num_merges; i++) {
+            new_index[order[i]] = num_points + i;
+        }
+
+        array_1d<index_t> parents = xt::arange(num_nodes_tree);
+        array_1d<weight_t> levels = xt::zeros<weight_t>({num_nodes_tree});
+        auto relabel = [&new_index, num_points](index_t r) {
+            return (r < num_points) ? r : new_index[r - num_points];
+        };
+        for (index_t i = 0; i < num_merges; i++) {
+            auto n = new_index[i];
+            parents[relabel(merge_region1[i])] = n;
+            parents[relabel(merge_region2[i])] = n;
+            levels[n] = merge_levels[i];
         }
         return make_node_weighted_tree(tree(parents), std::move(levels));
     }
 
+    namespace binary_partition_tree_internal {
+
+        template<typename graph_t, typename weighter, typename T>
+        auto binary_partition_tree_dispatch(const graph_t &graph,
+                                            const xt::xexpression<T> &xedge_weights,
+                                            weighter weight_function,
+                                            bpt_algorithm algorithm) {
+            if (algorithm == bpt_algorithm::nn_chain) {
+                return binary_partition_tree_nn_chain(graph, xedge_weights, weight_function);
+            }
+            return binary_partition_tree(graph, xedge_weights, weight_function);
+        }
+    }
 
     /**
      * Binary partition tree, i.e. the agglomerative clustering, with the  minimum/single linkage rule.
@@ -644,15 +1023,19 @@ namespace hg {
      * @tparam T
      * @param graph
      * @param xedge_weights
+     * @param algorithm engine (see bpt_algorithm)
      * @return a node weighted tree
      */
     template<typename graph_t, typename T>
-    auto binary_partition_tree_complete_linkage(const graph_t &graph, const xt::xexpression<T> &xedge_weights) {
-        return binary_partition_tree(
+    auto binary_partition_tree_complete_linkage(const graph_t &graph,
+                                                const xt::xexpression<T> &xedge_weights,
+                                                bpt_algorithm algorithm = bpt_algorithm::heap) {
+        return binary_partition_tree_internal::binary_partition_tree_dispatch(
                 graph,
                 xedge_weights,
                 binary_partition_tree_internal::binary_partition_tree_complete_linkage_weighting_functor<T>(
-                        xedge_weights));
+                        xedge_weights),
+                algorithm);
     }
 
     /**
@@ -674,18 +1057,21 @@ namespace hg {
      * @param graph
      * @param xedge_weights
      * @param xedge_weight_weights
+     * @param algorithm engine (see bpt_algorithm)
      * @return a node weighted tree
      */
     template<typename graph_t, typename T>
     auto binary_partition_tree_average_linkage(const graph_t &graph,
                                                const xt::xexpression<T> &xedge_weights,
-                                               const xt::xexpression<T> &xedge_weight_weights) {
-        return binary_partition_tree(
+                                               const xt::xexpression<T> &xedge_weight_weights,
+                                               bpt_algorithm algorithm = bpt_algorithm::heap) {
+        return binary_partition_tree_internal::binary_partition_tree_dispatch(
                 graph,
                 xedge_weights,
                 binary_partition_tree_internal::binary_partition_tree_average_linkage_weighting_functor<T>(
                         xedge_weights,
-                        xedge_weight_weights));
+                        xedge_weight_weights),
+                algorithm);
     }
 
     /**
@@ -765,21 +1151,24 @@ namespace hg {
      * @param xvertex_centroids Centroids of the graph vertices (must be a 2d array)
      * @param xvertex_sizes Size (number of elements) of the graph vertices
      * @param altitude_correction can be ``"none"`` or ``"max"`` (default)
+     * @param algorithm engine (see bpt_algorithm), the Ward linkage is reducible only on complete graphs
      * @return a node weighted tree
      */
     template<typename graph_t, typename T1, typename T2>
     auto binary_partition_tree_ward_linkage(const graph_t &graph,
                                             const xt::xexpression<T1> &xvertex_centroids,
                                             const xt::xexpression<T2> &xvertex_sizes,
-                                            const std::string &altitude_correction = "max") {
+                                            const std::string &altitude_correction = "max",
+                                            bpt_algorithm algorithm = bpt_algorithm::heap) {
 
         auto f = binary_partition_tree_internal::binary_partition_tree_ward_linkage_weighting_functor<T1, T2>
                 (xvertex_centroids, xvertex_sizes);
 
-        auto res = binary_partition_tree(
+        auto res = binary_partition_tree_internal::binary_partition_tree_dispatch(
                 graph,
                 f.get_weights(graph),
-                f);
+                f,
+                algorithm);
 
         auto &tree = res.tree;
         auto &altitudes = res.altitudes;
@@ -13,6 +13,7 @@
 #include "common.hpp"
 #include "higra/structure/unionfind.hpp"
 #include "higra/graph.hpp"
+#include "higra/algo/kruskal.hpp"
 #include "higra/sorting.hpp"
 #include "higra/accumulator/tree_accumulator.hpp"
 #include "higra/structure/lca_fast.hpp"
@@ -65,23 +66,25 @@ namespace hg {
      * L. Najman, J. Cousty, B. Perret. Playing with Kruskal: algorithms for morphological trees in edge-weighted graphs.
      * In, 11th International Symposium on Mathematical Morphology, ISMM 2013, Uppsala, Sweden, Mai 2013.
      *
+     * The edges are processed in Kruskal order with the given algorithm (see mst_algorithm), all the algorithms
+     * give the same result.
+     *
      * @tparam graph_t
      * @tparam T
      * @param graph
      * @param xedge_weights
+     * @param algorithm
      * @return
      */
     template<typename graph_t, typename T>
-    auto bpt_canonical(const graph_t &graph, const xt::xexpression<T> &xedge_weights) {
+    auto bpt_canonical(const graph_t &graph,
+                       const xt::xexpression<T> &xedge_weights,
+                       mst_algorithm algorithm = mst_algorithm::kruskal) {
         HG_TRACE();
         auto &edge_weights = xedge_weights.derived_cast();
         hg_assert_edge_weights(graph, edge_weights);
         hg_assert_1d_array(edge_weights);
 
-        array_1d<index_t> sorted_edges_indices = xt::arange(num_edges(graph));
-        stable_sort(sorted_edges_indices.begin(), sorted_edges_indices.end(),
-                    [&edge_weights](index_t i, index_t j) { return edge_weights[i] < edge_weights[j]; });
-
         auto num_points = num_vertices(graph);
 
         auto num_edge_mst = num_points - 1;
@@ -96,28 +99,20 @@ namespace hg {
         array_1d<typename T::value_type> levels = xt::zeros<typename T::value_type>({num_points * 2 - 1});
 
         size_t num_nodes = num_points;
-        size_t num_edge_found = 0;
-        index_t i = 0;
-
-        while (num_edge_found < num_edge_mst && i < (index_t) sorted_edges_indices.size()) {
-            auto ei = sorted_edges_indices[i];
-            auto e = edge_from_index(ei, graph);
-            auto c1 = uf.find(source(e, graph));
-            auto c2 = uf.find(target(e, graph));
-            if (c1 != c2) {
-                levels[num_nodes] = edge_weights[ei];
-                parents[roots[c1]] = num_nodes;
-                parents[roots[c2]] = num_nodes;
-                auto newRoot = uf.link(c1, c2);
-                roots[newRoot] = num_nodes;
-                mst.add_edge(e);
-                mst_edge_map(num_edge_found) = ei;
-                num_nodes++;
-                num_edge_found++;
-            }
-            i++;
-        }
-        hg_assert(num_edge_found == num_edge_mst, "Input graph must be connected.");
+
+        auto num_edge_found = kruskal(
+                graph, edge_weights, uf, num_edge_mst,
+                [&](index_t ei, index_t c1, index_t c2, index_t newRoot) {
+                    levels[num_nodes] = edge_weights[ei];
+                    parents[roots[c1]] = num_nodes;
+                    parents[roots[c2]] = num_nodes;
+                    roots[newRoot] = num_nodes;
+                    mst.add_edge(edge_from_index(ei, graph));
+                    mst_edge_map(num_nodes - num_points) = ei;
+                    num_nodes++;
+                },
+                algorithm);
+        hg_assert(num_edge_found == (index_t) num_edge_mst, "Input graph must be connected.");
 
         return make_node_weighted_tree_and_mst(
                 tree(parents),
@@ -42,6 +42,43 @@ namespace hg {
             result(root(tree)) = attribute(root(tree));
             return result;
         };
+
+        /**
+         * Number of parents attribute of the nodes of a binary partition tree by altitude ordering: for each node n,
+         * 1 + the number of nodes of the quasi-flat zone hierarchy, included in n, having at least one non leaf child
+         * (0 for the leaves).
+         */
+        template<typename tree_t, typename T>
+        auto attribute_number_of_parents_BPT(const tree_t &tree, const T &altitude) {
+            auto num_nodes = num_vertices(tree);
+            auto n_leaves = num_leaves(tree);
+            auto rt = root(tree);
+            auto &parents = tree.parents();
+
+            // a non leaf node of the bpt is a node of the quasi flat zone hierarchy if its altitude is different
+            // from the one of its parent (or if it is the root)
+            auto is_qfz_node = [&altitude, &parents, rt](index_t n) {
+                return n == rt || altitude(n) != altitude(parents(n));
+            };
+
+            // closest strict ancestor of each node that belongs to the quasi flat zone hierarchy
+            array_1d<index_t> qfz_parent = xt::empty<index_t>({num_nodes});
+            qfz_parent(rt) = rt;
+            array_1d<double> result = xt::zeros<double>({num_nodes});
+            for (auto n: root_to_leaves_iterator(tree, leaves_it::include, root_it::exclude)) {
+                auto p = parents(n);
+                qfz_parent(n) = is_qfz_node(p) ? p : qfz_parent(p);
+                if ((index_t) n >= (index_t) n_leaves && is_qfz_node(n)) {
+                    result(qfz_parent(n)) = 1;
+                }
+            }
+
+            for (auto n: leaves_to_root_iterator(tree, leaves_it::exclude, root_it::exclude)) {
+                result(parents(n)) += result(n);
+            }
+            xt::view(result, xt::range(n_leaves, num_nodes)) += 1;
+            return result;
+        }
     }
 
     /**
@@ -225,4 +262,32 @@ namespace hg {
                 });
     };
 
+    /**
+     * Watershed hierarchy by number of parents.
+     *
+     * The definition of number of parents was proposed in:
+     *
+     *   B. Perret, J. Cousty, S. J. F. Guimarães and D. S. Maia,
+     *   Evaluation of Hierarchical Watersheds, IEEE Transactions on Image Processing, vol. 27, no. 4,
+     *   pp. 1676-1688, April 2018.
+     *
+     * @tparam graph_t
+     * @tparam T
+     * @param graph: input graph
+     * @param edge_weights: input graph edge weights
+     * @return a node_weighted_tree
+     */
+    template<typename graph_t, typename T>
+    auto watershed_hierarchy_by_number_of_parents(
+            const graph_t &graph,
+            const xt::xexpression<T> &edge_weights) {
+
+        return watershed_hierarchy_by_attribute(
+                graph,
+                edge_weights,
+                [](const tree &t, const auto &altitude) {
+                    return watershed_hierarchy_internal::attribute_number_of_parents_BPT(t, altitude);
+                });
+    };
+
 }
@@ -19,6 +19,7 @@
 #include "xtensor/xnoalias.hpp"
 #include "xtensor/xindex_view.hpp"
 
+#include <array>
 #include <map>
 #include <deque>
 
@@ -229,22 +230,138 @@ namespace hg {
             return plain_map;
         }
 
+        /**
+         * Plain map stored in a 2d array: the interval of values associated to the vertex i is
+         * [plain_map(i, 0), plain_map(i, 1)].
+         */
+        template<typename T>
+        struct array_plain_map {
+            using value_type = typename T::value_type;
+
+            array_plain_map(const T &plain_map) : m_plain_map(plain_map) {
+            }
+
+            std::pair<value_type, value_type> interval(index_t i) const {
+                return {m_plain_map(i, 0), m_plain_map(i, 1)};
+            }
+
+            value_type min_value() const {
+                return xt::amin(m_plain_map)();
+            }
+
+            value_type max_value() const {
+                return xt::amax(m_plain_map)();
+            }
+
+        private:
+            const T &m_plain_map;
+        };
+
+        /**
+         * Plain map of a nd image immersed in the interpolated Khalimsky grid, computed on the fly.
+         *
+         * If the image shape is (s_0, ..., s_{n-1}), the grid has the shape (2 * s_0 - 1, ..., 2 * s_{n-1} - 1): a grid
+         * point whose k odd coordinates are odd is a face between 2^k pixels of the image and its interval of values
+         * is given by the min and max of these pixels. This is equivalent to interpolate_plain_map_khalimsky_2d in
+         * 2d, without storing the 2 values of each grid point.
+         *
+         * If immersion is false, the grid is the image grid and the interval of each pixel is reduced to its value.
+         *
+         * @tparam value_t
+         * @tparam dim
+         */
+        template<typename value_t, int dim>
+        struct khalimsky_plain_map {
+            using value_type = value_t;
+
+            /**
+             * @param image flat image, must outlive the plain map
+             * @param shape shape of the image
+             * @param immersion
+             */
+            khalimsky_plain_map(const array_1d<value_type> &image,
+                                const std::array<index_t, dim> &shape,
+                                bool immersion) :
+                    m_image(image),
+                    m_immersion(immersion) {
+                index_t stride = 1;
+                for (index_t d = dim - 1; d >= 0; d--) {
+                    m_strides[d] = stride;
+                    stride *= shape[d];
+                    m_grid_shape[d] = immersion ? shape[d] * 2 - 1 : shape[d];
+                }
+            }
+
+            const std::array<index_t, dim> &grid_shape() const {
+                return m_grid_shape;
+            }
+
+            std::pair<value_type, value_type> interval(index_t i) const {
+                index_t base = 0;
+                if (!m_immersion) {
+                    for (index_t d = dim - 1; d >= 0; d--) {
+                        base += (i % m_grid_shape[d]) * m_strides[d];
+                        i /= m_grid_shape[d];
+                    }
+                    return {m_image(base), m_image(base)};
+                }
+
+                std::array<index_t, dim> odd_strides;
+                index_t num_odd = 0;
+                for (index_t d = dim - 1; d >= 0; d--) {
+                    auto c = i % m_grid_shape[d];
+                    i /= m_grid_shape[d];
+                    base += (c / 2) * m_strides[d];
+                    if (c % 2 == 1) {
+                        odd_strides[num_odd++] = m_strides[d];
+                    }
+                }
+                value_type low = m_image(base);
+                value_type high = low;
+                for (index_t mask = 1; mask < ((index_t) 1 << num_odd); mask++) {
+                    index_t offset = 0;
+                    for (index_t k = 0; k < num_odd; k++) {
+                        if (mask & ((index_t) 1 << k)) {
+                            offset += odd_strides[k];
+                        }
+                    }
+                    auto v = m_image(base + offset);
+                    low = (std::min)(low, v);
+                    high = (std::max)(high, v);
+                }
+                return {low, high};
+            }
+
+            value_type min_value() const {
+                return xt::amin(m_image)();
+            }
+
+            value_type max_value() const {
+                return xt::amax(m_image)();
+            }
+
+        private:
+            const array_1d<value_type> &m_image;
+            bool m_immersion;
+            std::array<index_t, dim> m_strides;
+            std::array<index_t, dim> m_grid_shape;
+        };
+
         template<typename graph_t,
-                typename T,
-                typename value_type = typename T::value_type,
+                typename plain_map_t,
+                typename value_type = typename plain_map_t::value_type,
                 typename std::enable_if_t<sizeof(value_type) <= 2 && std::is_integral<value_type>::value, int> = 0>
-        auto sort_vertices_tree_of_shapes(const graph_t &graph,
-                                          const xt::xexpression<T> &xplain_map, index_t exterior_vertex = 0) {
+        auto sort_vertices_tree_of_shapes_impl(const graph_t &graph,
+                                               const plain_map_t &plain_map, index_t exterior_vertex) {
 
-            auto &plain_map = xplain_map.derived_cast();
             auto num_v = num_vertices(graph);
             array_1d<bool> dejavu({num_v}, false);
             array_1d<index_t> sorted_vertex_indices = array_1d<index_t>::from_shape({num_v});
             array_1d<value_type> enqueued_level = array_1d<value_type>::from_shape({num_v});
-            integer_level_multi_queue<value_type, index_t> queue(xt::amin(plain_map)(), xt::amax(plain_map)());
+            integer_level_multi_queue<value_type, index_t> queue(plain_map.min_value(), plain_map.max_value());
 
-            value_type current_level = (value_type) ((plain_map(exterior_vertex, 0) + plain_map(exterior_vertex, 1)) /
-                                                     2.0);
+            auto exterior_interval = plain_map.interval(exterior_vertex);
+            value_type current_level = (value_type) ((exterior_interval.first + exterior_interval.second) / 2.0);
             queue.push(current_level, exterior_vertex);
             dejavu(exterior_vertex) = true;
 
@@ -257,7 +374,8 @@ namespace hg {
                 sorted_vertex_indices(i++) = current_point;
                 for (auto n: adjacent_vertex_iterator(current_point, graph)) {
                     if (!dejavu(n)) {
-                        auto newLevel = (std::min)(plain_map(n, 1), (std::max)(plain_map(n, 0), current_level));
+                        auto interval = plain_map.interval(n);
+                        auto newLevel = (std::min)(interval.second, (std::max)(interval.first, current_level));
                         queue.push(newLevel, n);
                         dejavu(n) = true;
                     }
@@ -268,16 +386,12 @@ namespace hg {
         }
 
         template<typename graph_t,
-                typename T,
-                typename value_type = typename T::value_type,
+                typename plain_map_t,
+                typename value_type = typename plain_map_t::value_type,
                 typename std::enable_if_t<3 <= sizeof(value_type) || !std::is_integral<value_type>::value, int> = 0>
-        auto sort_vertices_tree_of_shapes(const graph_t &graph,
-                                          const xt::xexpression<T> &xplain_map, index_t exterior_vertex = 0) {
+        auto sort_vertices_tree_of_shapes_impl(const graph_t &graph,
+                                               const plain_map_t &plain_map, index_t exterior_vertex) {
 
-            auto &plain_map = xplain_map.derived_cast();
-            hg_assert(plain_map.dimension() == 2, "Invalid plain map");
-            hg_assert(plain_map.shape()[1] == 2, "Invalid plain map");
-            hg_assert_vertex_weights(graph, plain_map);
             auto num_v = num_vertices(graph);
             array_1d<bool> dejavu({num_v}, false);
             array_1d<index_t> sorted_vertex_indices = array_1d<index_t>::from_shape({num_v});
@@ -300,8 +414,8 @@ namespace hg {
                 }
             };
 
-            value_type current_level = (value_type) ((plain_map(exterior_vertex, 0) + plain_map(exterior_vertex, 1)) /
-                                                     2.0);
+            auto exterior_interval = plain_map.interval(exterior_vertex);
+            value_type current_level = (value_type) ((exterior_interval.first + exterior_interval.second) / 2.0);
 
             auto position = queue.insert({current_level, exterior_vertex});
             dejavu(exterior_vertex) = true;
@@ -315,7 +429,8 @@ namespace hg {
                 sorted_vertex_indices(i++) = current_point;
                 for (auto n: adjacent_vertex_iterator(current_point, graph)) {
                     if (!dejavu(n)) {
-                        auto newLevel = (std::min)(plain_map(n, 1), (std::max)(plain_map(n, 0), current_level));
+                        auto interval = plain_map.interval(n);
+                        auto newLevel = (std::min)(interval.second, (std::max)(interval.first, current_level));
                         queue.insert({newLevel, n});
                         dejavu(n) = true;
                     }
@@ -328,6 +443,72 @@ namespace hg {
             return std::make_pair(std::move(sorted_vertex_indices), std::move(enqueued_level));
         }
 
+        /**
+         * Sorts the vertices of the graph in the order of propagation of the tree of shapes algorithm and gives the
+         * level at which each vertex has been enqueued.
+         *
+         * @param graph
+         * @param xplain_map 2d array of size num_vertices * 2: the interval of values of vertex i is
+         * [plain_map(i, 0), plain_map(i, 1)]
+         * @param exterior_vertex
+         * @return a pair (sorted vertex indices, enqueued levels)
+         */
+        template<typename graph_t, typename T>
+        auto sort_vertices_tree_of_shapes(const graph_t &graph,
+                                          const xt::xexpression<T> &xplain_map, index_t exterior_vertex = 0) {
+            auto &plain_map = xplain_map.derived_cast();
+            hg_assert(plain_map.dimension() == 2, "Invalid plain map");
+            hg_assert(plain_map.shape()[1] == 2, "Invalid plain map");
+            hg_assert_vertex_weights(graph, plain_map);
+            return sort_vertices_tree_of_shapes_impl(graph, array_plain_map<T>(plain_map), exterior_vertex);
+        }
+
+        /**
+         * Regular grid graph where each point is linked to its 2 * dim direct neighbours
+         * (4 adjacency in 2d, 6 adjacency in 3d).
+         */
+        template<int dim>
+        auto get_direct_adjacency_implicit_graph(const std::array<index_t, dim> &shape) {
+            using embedding_t = embedding_internal::embedding_grid<dim, index_t>;
+            // neighbours in lexicographic order
+            std::vector<point<index_t, dim>> neighbours;
+            for (index_t d = 0; d < dim; d++) {
+                point<index_t, dim> p;
+                p.fill(0);
+                p(d) = -1;
+                neighbours.push_back(p);
+            }
+            for (index_t d = dim - 1; d >= 0; d--) {
+                point<index_t, dim> p;
+                p.fill(0);
+                p(d) = 1;
+                neighbours.push_back(p);
+            }
+            return regular_graph<embedding_t>(embedding_t(std::vector<index_t>(shape.begin(), shape.end())),
+                                              std::move(neighbours));
+        }
+
+        /**
+         * Calls fun(i, coordinates) for each linear index i of a grid of the given shape, in increasing order.
+         */
+        template<int dim, typename fun_t>
+        void for_each_grid_point(const std::array<index_t, dim> &shape, fun_t fun) {
+            index_t size = 1;
+            for (auto s: shape) {
+                size *= s;
+            }
+            std::array<index_t, dim> coordinates;
+            coordinates.fill(0);
+            for (index_t i = 0; i < size; i++) {
+                fun(i, coordinates);
+                for (index_t d = dim - 1; d >= 0; d--) {
+                    if (++coordinates[d] < shape[d]) {
+                        break;
+                    }
+                    coordinates[d] = 0;
+                }
+            }
+        }
     }
 
     /**
@@ -339,6 +520,130 @@ namespace hg {
         zero
     };
 
+    namespace tree_of_shapes_internal {
+
+        /**
+         * Adds a border of 1 pixel around a flat nd image (see tos_padding).
+         *
+         * @param image flat image
+         * @param shape shape of the image, updated to the shape of the padded image
+         * @param padding
+         * @return padded flat image
+         */
+        template<int dim, typename value_type>
+        auto pad_image(const array_1d<value_type> &image, std::array<index_t, dim> &shape, tos_padding padding) {
+            value_type pad_value;
+            switch (padding) {
+                case tos_padding::zero:
+                    pad_value = 0;
+                    break;
+                case tos_padding::mean: {
+                    double sum = 0;
+                    index_t count = 0;
+                    for_each_grid_point<dim>(shape, [&](index_t i, const std::array<index_t, dim> &coordinates) {
+                        for (index_t d = 0; d < dim; d++) {
+                            if (coordinates[d] == 0 || coordinates[d] == shape[d] - 1) {
+                                sum += image(i);
+                                count++;
+                                break;
+                            }
+                        }
+                    });
+                    pad_value = (value_type) (sum / (std::max)(count, (index_t) 1));
+                    break;
+                }
+                case none:
+                default:
+                    throw std::runtime_error("Incorrect padding value.");
+            }
+
+            std::array<index_t, dim> padded_shape;
+            std::array<index_t, dim> padded_strides;
+            index_t size = 1;
+            for (index_t d = dim - 1; d >= 0; d--) {
+                padded_shape[d] = shape[d] + 2;
+                padded_strides[d] = size;
+                size *= padded_shape[d];
+            }
+            array_1d<value_type> padded_image({(size_t) size}, pad_value);
+            for_each_grid_point<dim>(shape, [&](index_t i, const std::array<index_t, dim> &coordinates) {
+                index_t j = 0;
+                for (index_t d = 0; d < dim; d++) {
+                    j += (coordinates[d] + 1) * padded_strides[d];
+                }
+                padded_image(j) = image(i);
+            });
+            shape = padded_shape;
+            return padded_image;
+        }
+
+        /**
+         * Tree of shapes of a nd image, see component_tree_tree_of_shapes_image2d.
+         *
+         * The plain map of the immersed image is never stored: the interval of each point of the Khalimsky grid
+         * is computed from the image when the point is reached by the propagation. The propagation order, the
+         * levels and the tree are still computed on the whole Khalimsky grid before the simplification to the
+         * original pixels.
+         */
+        template<int dim, typename T>
+        auto tree_of_shapes_image(const T &image,
+                                  tos_padding padding,
+                                  bool original_size,
+                                  bool immersion,
+                                  index_t exterior_vertex) {
+            using value_type = typename T::value_type;
+            std::array<index_t, dim> shape;
+            for (index_t d = 0; d < dim; d++) {
+                shape[d] = image.shape()[d];
+            }
+
+            array_1d<value_type> vertex_values = xt::flatten(image);
+            if (padding != tos_padding::none) {
+                vertex_values = pad_image<dim>(vertex_values, shape, padding);
+            }
+
+            khalimsky_plain_map<value_type, dim> plain_map(vertex_values, shape, immersion);
+            auto grid_shape = plain_map.grid_shape();
+            auto graph = get_direct_adjacency_implicit_graph<dim>(grid_shape);
+            auto res_sort = sort_vertices_tree_of_shapes_impl(graph, plain_map, exterior_vertex);
+            auto &sorted_vertex_indices = res_sort.first;
+            auto &enqueued_levels = res_sort.second;
+            vertex_values = array_1d<value_type>();
+
+            auto res_tree = component_tree_internal::tree_from_sorted_vertices(graph, enqueued_levels,
+                                                                               sorted_vertex_indices);
+            sorted_vertex_indices = array_1d<index_t>();
+            enqueued_levels = array_1d<value_type>();
+
+            if (!original_size || (!immersion && padding == tos_padding::none)) {
+                return res_tree;
+            }
+
+            auto &tree = res_tree.tree;
+            auto &altitudes = res_tree.altitudes;
+
+            // pixels of the original image have even coordinates in the Khalimsky grid and are not in the border
+            index_t step = immersion ? 2 : 1;
+            index_t border = (padding != tos_padding::none) ? step : 0;
+            array_1d<bool> deleted_vertices = array_1d<bool>::from_shape({num_leaves(tree)});
+            for_each_grid_point<dim>(grid_shape, [&](index_t i, const std::array<index_t, dim> &coordinates) {
+                bool deleted = false;
+                for (index_t d = 0; d < dim && !deleted; d++) {
+                    deleted = coordinates[d] % step != 0 ||
+                              coordinates[d] < border ||
+                              coordinates[d] >= grid_shape[d] - border;
+                }
+                deleted_vertices(i) = deleted;
+            });
+
+            auto all_deleted = accumulate_sequential(tree, deleted_vertices, accumulator_min());
+
+            auto stree = simplify_tree(tree, all_deleted, true);
+            array_1d<value_type> saltitudes = xt::index_view(altitudes, stree.node_map);
+            return make_node_weighted_tree(std::move(stree.tree), std::move(saltitudes));
+        }
+    }
+
     /**
      * Computes the tree of shapes of a 2d image.
      * The Tree of Shapes was described in [1].
@@ -352,7 +657,7 @@ namespace hg {
      * anything else. This will ensure the existence of a shape encompassing all the shapes inside the input image
      * (if exterior_vertex is inside the extra border): this shape will be the root of the tree.
      * The padding value can be:
-     *   - 0 is padding == tos_padding::zero
+     *   - 0 if padding == tos_padding::zero
      *   - the mean value of the boundary pixels of the input image if padding == tos_padding::mean
      *
      * If original_size is true, all the nodes corresponding to pixels not belonging to the input image are removed
@@ -360,7 +665,7 @@ namespace hg {
      * If original_size is false, the returned tree is the tree constructed in the interpolated/padded space.
      * In practice if the size of the input image is (h, w), the leaves of the returned tree will correspond to an image of size:
      *   - (h, w) if original_size is true;
-     *   - (h * 2 - 1, w * 2 - 1) is original_size is false and padding is tos_padding::none; and
+     *   - (h * 2 - 1, w * 2 - 1) if original_size is false and padding is tos_padding::none; and
      *   - ((h + 2) * 2 - 1, (w + 2) * 2 - 1) otherwise.
      *
      * :Advanced options:
@@ -382,6 +687,11 @@ namespace hg {
      * [2] Th. Géraud, E. Carlinet, S. Crozet, and L. Najman, "A Quasi-linear Algorithm to Compute the Tree
      *     of Shapes of nD Images", ISMM 2013.
      *
+     * The plain map is not stored: the interval of each point of the interpolated space is computed on the fly from
+     * the input image. However, the propagation and the construction of the tree still run on the whole interpolated
+     * space, even if original_size is true: the memory usage is proportional to the number of points of the
+     * interpolated space (between 70 and 120 bytes per point depending on the value type).
+     *
      * @tparam T
      * @param ximage Must be a 2d array
      * @param padding Defines if an extra boundary of pixels is added to the original image (see enum tos_padding).
@@ -398,137 +708,38 @@ namespace hg {
         HG_TRACE();
         auto &image = ximage.derived_cast();
         hg_assert(image.dimension() == 2, "image must be a 2d array");
-        embedding_grid_2d embedding(image.shape());
-        auto shape = embedding.shape();
-        size_t h = shape[0];
-        size_t w = shape[1];
-        auto vertex_weights = xt::flatten(image);
-        using value_type = typename T::value_type;
-
-        size_t rh;
-        size_t rw;
-
-        array_2d<value_type> cooked_vertex_values;
-
-        auto do_padding = [&padding, &h, &w](const auto &image) {
-            value_type pad_value;
-            switch (padding) {
-                case tos_padding::zero:
-                    pad_value = 0;
-                    break;
-                case tos_padding::mean: {
-                    auto tmp = xt::sum(xt::view(image, 0, xt::all()))() +
-                               xt::sum(xt::view(image, h - 1, xt::all()))();
-                    if (h > 2) {
-                        tmp += xt::sum(xt::view(image, xt::range(1, h - 1), 0))() +
-                               xt::sum(xt::view(image, xt::range(1, h - 1), w - 1))();
-                    }
-                    pad_value = (value_type) (tmp / ((std::max)(2.0 * (w + h) - 4, 1.0)));
-                    break;
-                }
-                case none:
-                default:
-                    throw std::runtime_error("Incorrect padding value.");
-            }
-            array_1d<value_type> padded_vertices = array_1d<value_type>::from_shape({(w + 2) * (h + 2)});
-            auto padded_image = xt::reshape_view(padded_vertices, {h + 2, w + 2});
-
-            xt::noalias(xt::view(padded_image, xt::range(1, h + 1), xt::range(1, w + 1))) = image;
-            xt::view(padded_image, 0, xt::all()) = pad_value;
-            xt::view(padded_image, h + 1, xt::all()) = pad_value;
-            xt::view(padded_image, xt::all(), 0) = pad_value;
-            xt::view(padded_image, xt::all(), w + 1) = pad_value;
-            return padded_vertices;
-        };
-
-        auto process_sorted_pixels = [&original_size, &padding, &rh, &rw, &immersion](auto &graph,
-                                                                                      auto &sorted_vertex_indices,
-                                                                                      auto &enqueued_levels) {
-            auto res_tree = component_tree_internal::tree_from_sorted_vertices(graph, enqueued_levels,
-                                                                               sorted_vertex_indices);
-            auto &tree = res_tree.tree;
-            auto &altitudes = res_tree.altitudes;
-
-            if (!original_size || (!immersion && padding == tos_padding::none)) {
-                return res_tree;
-            }
-
-            array_1d<bool> deleted_vertices({num_leaves(res_tree.tree)}, true);
-            auto deleted = xt::reshape_view(deleted_vertices, {rh, rw});
-            if (immersion) {
-                if (padding != tos_padding::none) {
-                    xt::view(deleted, xt::range(2, rh - 2, 2), xt::range(2, rw - 2, 2)) = false;
-                } else {
-                    xt::view(deleted, xt::range(0, rh, 2), xt::range(0, rw, 2)) = false;
-                }
-            } else {
-                if (padding != tos_padding::none) {
-                    xt::view(deleted, xt::range(1, rh - 1), xt::range(1, rw - 1)) = false;
-                } // else handled by bypass if on top
-            }
-
-            auto all_deleted = accumulate_sequential(tree, deleted_vertices, accumulator_min());
-
-            auto stree = simplify_tree(tree, all_deleted, true);
-            array_1d<value_type> saltitudes = xt::index_view(altitudes, stree.node_map);
-            return make_node_weighted_tree(std::move(stree.tree), std::move(saltitudes));
-        };
-
-        if (immersion) {
-            if (padding != tos_padding::none) {
-
-
-                auto cooked_vertex_values =
-                        tree_of_shapes_internal::interpolate_plain_map_khalimsky_2d(
-                                do_padding(image),
-                                {(index_t) (h + 2), (index_t) (w + 2)});
-                rh = (h + 2) * 2 - 1;
-                rw = (w + 2) * 2 - 1;
-                auto graph = get_4_adjacency_implicit_graph({(index_t) rh, (index_t) rw});
-                auto res_sort = tree_of_shapes_internal::sort_vertices_tree_of_shapes(graph, cooked_vertex_values,
-                                                                                      exterior_vertex);
-                return process_sorted_pixels(graph, res_sort.first, res_sort.second);
-            } else {
-                auto cooked_vertex_values =
-                        tree_of_shapes_internal::interpolate_plain_map_khalimsky_2d(
-                                vertex_weights,
-                                embedding);
-                rh = h * 2 - 1;
-                rw = w * 2 - 1;
-                auto graph = get_4_adjacency_implicit_graph({(index_t) rh, (index_t) rw});
-                auto res_sort = tree_of_shapes_internal::sort_vertices_tree_of_shapes(graph, cooked_vertex_values,
-                                                                                      exterior_vertex);
-                return process_sorted_pixels(graph, res_sort.first, res_sort.second);
-            }
-        } else {
-            if (padding != tos_padding::none) {
-                auto padded_vertices = do_padding(image);
-
-                rh = h + 2;
-                rw = w + 2;
-                auto graph = get_4_adjacency_implicit_graph({(index_t) rh, (index_t) rw});
-
-                // clearly not optimal
-                array_2d<value_type> plain_map = array_2d<value_type>::from_shape({rh * rw, 2});
-                xt::noalias(xt::view(plain_map, xt::all(), 0)) = padded_vertices;
-                xt::noalias(xt::view(plain_map, xt::all(), 1)) = padded_vertices;
-                auto res_sort = tree_of_shapes_internal::sort_vertices_tree_of_shapes(graph, plain_map,
-                                                                                      exterior_vertex);
-                return process_sorted_pixels(graph, res_sort.first, res_sort.second);
-            } else {
-                rh = h;
-                rw = w;
-                auto graph = get_4_adjacency_implicit_graph({(index_t) rh, (index_t) rw});
-                array_2d<value_type> plain_map = array_2d<value_type>::from_shape({rh * rw, 2});
-                xt::noalias(xt::view(plain_map, xt::all(), 0)) = xt::ravel(image);
-                xt::noalias(xt::view(plain_map, xt::all(), 1)) = xt::ravel(image);
-                auto res_sort = tree_of_shapes_internal::sort_vertices_tree_of_shapes(graph, plain_map,
-                                                                                      exterior_vertex);
-                return process_sorted_pixels(graph, res_sort.first, res_sort.second);
-            }
-
-        }
-
+        return tree_of_shapes_internal::tree_of_shapes_image<2>(image, padding, original_size, immersion,
+                                                                exterior_vertex);
+    }
 
+    /**
+     * Computes the tree of shapes of a 3d image.
+     *
+     * This is the 3d counterpart of component_tree_tree_of_shapes_image2d, the tree is computed with the 6 adjacency
+     * in the interpolated Khalimsky space. If the size of the input image is (d, h, w), the leaves of the returned
+     * tree will correspond to an image of size:
+     *   - (d, h, w) if original_size is true;
+     *   - (d * 2 - 1, h * 2 - 1, w * 2 - 1) if original_size is false and padding is tos_padding::none; and
+     *   - ((d + 2) * 2 - 1, (h + 2) * 2 - 1, (w + 2) * 2 - 1) otherwise.
+     *
+     * @tparam T
+     * @param ximage Must be a 3d array
+     * @param padding Defines if an extra boundary of pixels is added to the original image (see enum tos_padding).
+     * @param original_size remove all nodes corresponding to interpolated/padded pixels
+     * @param immersion convert the image into a plain map (see component_tree_tree_of_shapes_image2d)
+     * @param exterior_vertex linear coordinate of the exterior point
+     * @return a node weighted tree
+     */
+    template<typename T>
+    auto component_tree_tree_of_shapes_image3d(const xt::xexpression<T> &ximage,
+                                               tos_padding padding = tos_padding::mean,
+                                               bool original_size = true,
+                                               bool immersion = true,
+                                               index_t exterior_vertex = 0) {
+        HG_TRACE();
+        auto &image = ximage.derived_cast();
+        hg_assert(image.dimension() == 3, "image must be a 3d array");
+        return tree_of_shapes_internal::tree_of_shapes_image<3>(image, padding, original_size, immersion,
+                                                                exterior_vertex);
     }
 };
@@ -10,6 +10,12 @@
 
 #pragma once
 
+#include "structure/array.hpp"
+#include "utils.hpp"
+#include <cstring>
+#include <limits>
+#include <type_traits>
+
 #ifdef HG_USE_TBB
 
 #include "tbb/parallel_sort.h"
@@ -17,18 +23,73 @@
 
 #else
 
+#include "detail/thread_pool.hpp"
 #include <algorithm>
+#include <cstdint>
+#include <vector>
 
 #endif
 
 namespace hg {
-    
+
+#ifndef HG_USE_TBB
+
+    namespace sorting_internal {
+
+        /**
+         * Minimal number of elements per thread for a parallel sort.
+         */
+        const std::int64_t parallel_sort_grain_size = 1 << 15;
+
+        /**
+         * Parallel merge sort on the built-in thread pool: the range is split in one chunk per thread,
+         * chunks are sorted independently with sort_chunk and then merged pairwise with std::inplace_merge.
+         *
+         * If sort_chunk is stable, the whole sort is stable.
+         */
+        template<typename RandomAccessIterator, typename Compare, typename SortFunction>
+        void parallel_merge_sort(RandomAccessIterator xs, RandomAccessIterator xe, Compare comp,
+                                 SortFunction sort_chunk) {
+            auto &pool = thread_pool::instance();
+            std::int64_t size = xe - xs;
+            std::int64_t num_chunks = (std::min)(pool.num_threads(), size / parallel_sort_grain_size);
+            if (num_chunks <= 1) {
+                sort_chunk(xs, xe, comp);
+                return;
+            }
+
+            std::vector<std::int64_t> bounds(num_chunks + 1);
+            for (std::int64_t i = 0; i <= num_chunks; i++) {
+                bounds[i] = size * i / num_chunks;
+            }
+
+            pool.parallel_for(0, num_chunks, [&xs, &bounds, &comp, &sort_chunk](std::int64_t i) {
+                sort_chunk(xs + bounds[i], xs + bounds[i + 1], comp);
+            });
+
+            for (std::int64_t width = 1; width < num_chunks; width *= 2) {
+                pool.parallel_for(0, num_chunks, [&xs, &bounds, &comp, width, num_chunks](std::int64_t i) {
+                    std::int64_t middle = (std::min)(i + width, num_chunks);
+                    std::int64_t end = (std::min)(i + 2 * width, num_chunks);
+                    if (middle < end) {
+                        std::inplace_merge(xs + bounds[i], xs + bounds[middle], xs + bounds[end], comp);
+                    }
+                }, 2 * width);
+            }
+        }
+    }
+
+#endif
+
     template<typename RandomAccessIterator, typename Compare>
     void stable_sort(RandomAccessIterator xs, RandomAccessIterator xe, Compare comp) {
 #ifdef HG_USE_TBB
         pss::parallel_stable_sort(xs,  xe, comp);
 #else
-        std::stable_sort(xs, xe, comp);
+        sorting_internal::parallel_merge_sort(xs, xe, comp,
+                                              [](RandomAccessIterator b, RandomAccessIterator e, Compare &c) {
+                                                  std::stable_sort(b, e, c);
+                                              });
 #endif
     }
 
@@ -38,7 +99,10 @@ namespace hg {
 #ifdef HG_USE_TBB
         tbb::parallel_sort(xs,  xe, comp);
 #else
-        std::sort(xs, xe, comp);
+        sorting_internal::parallel_merge_sort(xs, xe, comp,
+                                              [](RandomAccessIterator b, RandomAccessIterator e, Compare &c) {
+                                                  std::sort(b, e, c);
+                                              });
 #endif
     }
 
@@ -54,4 +118,182 @@ namespace hg {
         typedef typename std::iterator_traits<RandomAccessIterator>::value_type T;
         sort(xs, xe, std::less<T>());
     }
+    namespace sorting_internal {
+
+        template<std::size_t num_bytes>
+        struct unsigned_of_size;
+
+        template<>
+        struct unsigned_of_size<1> {
+            using type = std::uint8_t;
+        };
+
+        template<>
+        struct unsigned_of_size<2> {
+            using type = std::uint16_t;
+        };
+
+        template<>
+        struct unsigned_of_size<4> {
+            using type = std::uint32_t;
+        };
+
+        template<>
+        struct unsigned_of_size<8> {
+            using type = std::uint64_t;
+        };
+
+        /**
+         * Maps a value to an unsigned integer key such that the natural order on keys is the same as the
+         * order induced by the operator < on values (ties included).
+         *
+         * Only defined for integral types and float: other types are sorted with a comparison sort.
+         */
+        template<typename value_t, typename enable = void>
+        struct radix_key {
+            static const bool available = false;
+        };
+
+        template<typename value_t>
+        struct radix_key<value_t, typename std::enable_if<std::is_integral<value_t>::value>::type> {
+            static const bool available = true;
+            using key_type = typename unsigned_of_size<sizeof(value_t)>::type;
+
+            static key_type get(value_t value) {
+                auto key = static_cast<key_type>(value);
+                if (std::is_signed<value_t>::value) {
+                    // flip the sign bit
+                    key ^= (key_type) ((key_type) 1 << (sizeof(key_type) * 8 - 1));
+                }
+                return key;
+            }
+        };
+
+        template<>
+        struct radix_key<float> {
+            static const bool available = true;
+            using key_type = std::uint32_t;
+
+            static key_type get(float value) {
+                // -0 and +0 are equal for operator < and must get the same key
+                if (value == 0) {
+                    value = 0;
+                }
+                key_type key;
+                std::memcpy(&key, &value, sizeof(key));
+                // negative numbers: flip all bits, positive numbers: flip the sign bit
+                return (key & 0x80000000u) ? ~key : (key | 0x80000000u);
+            }
+        };
+
+        /**
+         * Stable LSD radix sort of the given keys: returns the indices of the keys in sorted order.
+         *
+         * Keys of 8 or 16 bits are sorted with a single counting sort pass, larger keys are sorted
+         * with 8 bits digits. Passes where all the keys have the same digit are skipped.
+         */
+        template<typename key_t>
+        array_1d<index_t> radix_arg_sort(std::vector<key_t> &keys, bool decreasing) {
+            const index_t size = keys.size();
+            const int digit_bits = (sizeof(key_t) <= 2) ? sizeof(key_t) * 8 : 8;
+            const int num_passes = (int) (sizeof(key_t) * 8) / digit_bits;
+            const std::size_t num_buckets = (std::size_t) 1 << digit_bits;
+            const key_t digit_mask = (key_t) (num_buckets - 1);
+
+            if (decreasing) {
+                for (auto &k: keys) {
+                    k = (key_t) ~k;
+                }
+            }
+
+            std::vector<index_t> histograms(num_passes * num_buckets, 0);
+            for (const auto k: keys) {
+                for (int p = 0; p < num_passes; p++) {
+                    histograms[p * num_buckets + ((k >> (p * digit_bits)) & digit_mask)]++;
+                }
+            }
+
+            array_1d<index_t> indices = xt::arange<index_t>(size);
+            array_1d<index_t> tmp_indices = array_1d<index_t>::from_shape({(std::size_t) size});
+            std::vector<key_t> tmp_keys(size);
+
+            for (int p = 0; p < num_passes; p++) {
+                index_t *histogram = &histograms[p * num_buckets];
+                int shift = p * digit_bits;
+                if (histogram[(keys[0] >> shift) & digit_mask] == size) {
+                    continue;
+                }
+                index_t offset = 0;
+                for (std::size_t b = 0; b < num_buckets; b++) {
+                    auto count = histogram[b];
+                    histogram[b] = offset;
+                    offset += count;
+                }
+                for (index_t i = 0; i < size; i++) {
+                    auto k = keys[i];
+                    auto pos = histogram[(k >> shift) & digit_mask]++;
+                    tmp_keys[pos] = k;
+                    tmp_indices(pos) = indices(i);
+                }
+                std::swap(keys, tmp_keys);
+                std::swap(indices, tmp_indices);
+            }
+            return indices;
+        }
+
+        template<typename T>
+        auto stable_arg_sort(const T &values, bool decreasing, std::true_type) {
+            using value_type = typename T::value_type;
+            using key_helper = radix_key<value_type>;
+            std::vector<typename key_helper::key_type> keys(values.size());
+            for (index_t i = 0; i < (index_t) keys.size(); i++) {
+                keys[i] = key_helper::get(values(i));
+            }
+            return radix_arg_sort(keys, decreasing);
+        }
+
+        template<typename T>
+        auto stable_arg_sort(const T &values, bool decreasing, std::false_type) {
+            array_1d<index_t> indices = xt::arange<index_t>(values.size());
+            if (decreasing) {
+                hg::stable_sort(indices.begin(), indices.end(),
+                                [&values](index_t i, index_t j) { return values(i) > values(j); });
+            } else {
+                hg::stable_sort(indices.begin(), indices.end(),
+                                [&values](index_t i, index_t j) { return values(i) < values(j); });
+            }
+            return indices;
+        }
+
+        /**
+         * Under this size, a comparison sort is used whatever the value type.
+         */
+        const index_t radix_sort_min_size = 256;
+    }
+
+    /**
+     * Indices that stably sort the given 1d array: the result is the same as a stable sort of
+     * arange(values.size()) with the comparison function values(i) < values(j)
+     * (or values(i) > values(j) if decreasing is true).
+     *
+     * Integral and float values are sorted with a radix sort in linear time, other types are sorted with
+     * a comparison sort.
+     *
+     * @tparam T xexpression derived type of xvalues
+     * @param xvalues a 1d array
+     * @param decreasing sort in decreasing order
+     * @return a 1d array of indices
+     */
+    template<typename T>
+    array_1d<index_t> stable_arg_sort(const xt::xexpression<T> &xvalues, bool decreasing = false) {
+        auto &values = xvalues.derived_cast();
+        hg_assert_1d_array(values);
+        using value_type = typename T::value_type;
+        if ((index_t) values.size() < sorting_internal::radix_sort_min_size) {
+            return sorting_internal::stable_arg_sort(values, decreasing, std::false_type());
+        }
+        return sorting_internal::stable_arg_sort(
+                values, decreasing,
+                std::integral_constant<bool, sorting_internal::radix_key<value_type>::available>());
+    }
 }
\ No newline at end of file
@@ -11,8 +11,10 @@
 #pragma once
 
 #include <vector>
+#include <list>
 #include <stack>
 #include <array>
+#include <algorithm>
 #include "../utils.hpp"
 #include <cstring>
 
@@ -49,32 +51,94 @@ namespace hg {
                 //memset(element, 0, sizeof(T));
                 object *new_first = (object *) element;
                 new_first->next = first_free;
+                if (first_free == nullptr)
+                    last_free = new_first;
                 first_free = new_first;
             }
 
             T *allocate() {
                 if (first_free == nullptr) {
                     pool.emplace_back(m_blocksize);
-                    auto &block = pool[pool.size() - 1];
+                    auto &block = pool.back();
+                    m_capacity += block.size();
+                    m_blocksize = (std::min)(2 * m_blocksize, m_max_blocksize);
                     first_free = &block[0];
                     for (index_t i = 0; i < (index_t) block.size() - 1; i++)
                         block[i].next = first_free + i + 1;
                     block[block.size() - 1].next = nullptr;
+                    last_free = &block[block.size() - 1];
                 }
 
                 object *tmp = first_free;
                 first_free = first_free->next;
+                if (first_free == nullptr)
+                    last_free = nullptr;
                 return (T *) tmp;
             }
 
-            object_pool(size_t blocksize = 4096) : m_blocksize(blocksize) {
+            /**
+             * Creates a pool whose memory blocks all contain blocksize objects.
+             *
+             * @param blocksize
+             */
+            object_pool(size_t blocksize = 4096) : object_pool(blocksize, blocksize) {
+
+            }
+
+            /**
+             * Creates a pool whose first memory block contains first_blocksize objects; the size of the following
+             * blocks doubles until it reaches max_blocksize.
+             *
+             * No memory is allocated before the first call to allocate.
+             *
+             * @param first_blocksize
+             * @param max_blocksize
+             */
+            object_pool(size_t first_blocksize, size_t max_blocksize) :
+                    m_blocksize((std::max)(first_blocksize, (size_t) 1)),
+                    m_max_blocksize((std::max)(first_blocksize, max_blocksize)) {
+
+            }
+
+            /**
+             * Transfers the memory blocks of the given pool into the current pool: objects allocated by the other
+             * pool can then be freed in the current pool. The other pool is empty after the operation.
+             *
+             * Complexity O(1)
+             *
+             * @param other
+             */
+            void absorb(object_pool &other) {
+                if (other.first_free != nullptr) {
+                    other.last_free->next = first_free;
+                    if (first_free == nullptr)
+                        last_free = other.last_free;
+                    first_free = other.first_free;
+                }
+                pool.splice(pool.end(), other.pool);
+                m_capacity += other.m_capacity;
+                m_blocksize = (std::max)(m_blocksize, other.m_blocksize);
+                other.m_capacity = 0;
+                other.first_free = nullptr;
+                other.last_free = nullptr;
+            }
 
+            /**
+             * Number of objects held by the memory blocks of the pool (allocated or free).
+             *
+             * @return
+             */
+            size_t capacity() const {
+                return m_capacity;
             }
 
         private:
-            std::vector<std::vector<object>> pool;
+            std::list<std::vector<object>> pool;
             size_t m_blocksize;
+            size_t m_max_blocksize;
+            size_t m_capacity = 0;
             object *first_free = nullptr;
+            object *last_free = nullptr;
         };
 
 
@@ -118,8 +182,9 @@ namespace hg {
         /**
          * Fibonacci Heap
          *
-         * Warning different heaps will share the same object pool which is NOT thread safe !
-         * The following method are not thread safe: push, pop, erase, clear, destructor
+         * The nodes of the heap are allocated in an object pool owned by the heap: different heaps can be used
+         * concurrently. The pool starts with small blocks whose size grows geometrically, so that many small heaps
+         * remain cheap.
          *
          * @tparam T Value type, must implement operator < (ie. with a and b two values of type T, a < b must be a well formed expression)
          */
@@ -130,11 +195,7 @@ namespace hg {
 
         private:
 
-            static object_pool<node_t> &s_pool() {
-                static object_pool<node_t> pool{};
-                return pool;
-            }
-
+            object_pool<node_t> m_pool{4, 4096};
             node_t *m_heap = nullptr;
             size_t m_size = 0;
 
@@ -159,6 +220,7 @@ namespace hg {
             fibonacci_heap &operator=(const fibonacci_heap &) = delete;
 
             fibonacci_heap(fibonacci_heap &&other) {
+                m_pool.absorb(other.m_pool);
                 m_heap = other.m_heap;
                 m_size = other.m_size;
                 other.m_heap = nullptr;
@@ -166,10 +228,13 @@ namespace hg {
             }
 
             fibonacci_heap &operator=(fibonacci_heap &&other) {
+                clear();
+                m_pool.absorb(other.m_pool);
                 m_heap = other.m_heap;
                 m_size = other.m_size;
                 other.m_heap = nullptr;
                 other.m_size = 0;
+                return *this;
             }
 
             /**
@@ -190,7 +255,7 @@ namespace hg {
              */
             value_handle push(T value) {
                 m_size++;
-                node_t *new_node = s_pool().allocate();
+                node_t *new_node = m_pool.allocate();
                 new_node->init(value);
                 m_heap = m_merge(m_heap, new_node);
                 return new_node;
@@ -205,6 +270,7 @@ namespace hg {
              * @param other
              */
             void merge(fibonacci_heap &other) {
+                m_pool.absorb(other.m_pool);
                 m_heap = m_merge(m_heap, other.m_heap);
                 m_size += other.size();
                 other.m_size = 0;
@@ -228,7 +294,7 @@ namespace hg {
             void pop() {
                 auto old_heap = m_heap;
                 m_extract_min();
-                s_pool().free(old_heap);
+                m_pool.free(old_heap);
             }
 
             /**
@@ -240,7 +306,7 @@ namespace hg {
              */
             void erase(value_handle node) {
                 m_delete_key(node);
-                s_pool().free(node);
+                m_pool.free(node);
             }
 
 
@@ -332,7 +398,7 @@ namespace hg {
                             s.push(tmp);
                         }
                     }
-                    s_pool().free(n);
+                    m_pool.free(n);
                 }
                 m_heap = nullptr;
                 m_size = 0;
@@ -342,6 +408,15 @@ namespace hg {
                 return m_size;
             }
 
+            /**
+             * Number of elements the heap can hold without allocating memory
+             *
+             * @return
+             */
+            auto capacity() const {
+                return m_pool.capacity();
+            }
+
         private:
             auto m_merge(node_t *root1, node_t *root2) {
                 if (root1 == nullptr)
@@ -0,0 +1,446 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#pragma once
+
+#include "../utils.hpp"
+#include <vector>
+
+namespace hg {
+
+    /**
+     * Indexed d-ary min-heap.
+     *
+     * Each element of the heap is identified by a key: an integer in [0, num_keys[ given at construction. A key can be
+     * present at most once in the heap. The position of each key in the heap is tracked in an array which enables
+     * to update or remove any element without handles: no memory is allocated after construction (except if the
+     * number of elements in the heap exceeds the reserved capacity).
+     *
+     * Elements with equal values are ordered by increasing key.
+     *
+     * @tparam T Value type, must implement operator <
+     * @tparam D arity of the heap (4 by default)
+     */
+    template<typename T, index_t D = 4>
+    struct indexed_dary_heap {
+
+        /**
+         * Creates an empty heap for keys in [0, num_keys[
+         * @param num_keys
+         */
+        indexed_dary_heap(size_t num_keys = 0) : m_position(num_keys, invalid_index) {
+            m_keys.reserve(num_keys);
+            m_values.reserve(num_keys);
+        }
+
+        bool empty() const {
+            return m_keys.empty();
+        }
+
+        size_t size() const {
+            return m_keys.size();
+        }
+
+        /**
+         * Test if the given key is in the heap
+         * @param key
+         * @return
+         */
+        bool contains(index_t key) const {
+            return m_position[key] != invalid_index;
+        }
+
+        /**
+         * Insert a new element in the heap.
+         *
+         * Complexity O(log(n))
+         *
+         * @param key must not be already in the heap
+         * @param value
+         */
+        void push(index_t key, const T &value) {
+            index_t i = m_keys.size();
+            m_keys.push_back(key);
+            m_values.push_back(value);
+            m_position[key] = i;
+            sift_up(i);
+        }
+
+        /**
+         * Key of the min element
+         * @return
+         */
+        index_t top() const {
+            return m_keys[0];
+        }
+
+        /**
+         * Value of the min element
+         * @return
+         */
+        const T &top_value() const {
+            return m_values[0];
+        }
+
+        /**
+         * Value associated to the given key
+         * @param key must be in the heap
+         * @return
+         */
+        const T &value(index_t key) const {
+            return m_values[m_position[key]];
+        }
+
+        /**
+         * Removes the min element from the heap.
+         *
+         * Complexity O(D log(n) / log(D))
+         */
+        void pop() {
+            remove_at(0);
+        }
+
+        /**
+         * Removes the given key from the heap.
+         *
+         * Complexity O(D log(n) / log(D))
+         *
+         * @param key must be in the heap
+         */
+        void erase(index_t key) {
+            remove_at(m_position[key]);
+        }
+
+        /**
+         * Changes the value associated to the given key.
+         *
+         * Complexity O(log(n) / log(D)) if the value decreases, O(D log(n) / log(D)) otherwise
+         *
+         * @param key must be in the heap
+         * @param value
+         */
+        void update(index_t key, const T &value) {
+            index_t i = m_position[key];
+            m_values[i] = value;
+            if (!sift_up(i)) {
+                sift_down(i);
+            }
+        }
+
+        /**
+         * Empties the heap
+         */
+        void clear() {
+            for (auto k: m_keys) {
+                m_position[k] = invalid_index;
+            }
+            m_keys.clear();
+            m_values.clear();
+        }
+
+    private:
+
+        bool less(index_t i, index_t j) const {
+            return m_values[i] < m_values[j] || (!(m_values[j] < m_values[i]) && m_keys[i] < m_keys[j]);
+        }
+
+        void swap_elements(index_t i, index_t j) {
+            std::swap(m_keys[i], m_keys[j]);
+            std::swap(m_values[i], m_values[j]);
+            m_position[m_keys[i]] = i;
+            m_position[m_keys[j]] = j;
+        }
+
+        bool sift_up(index_t i) {
+            bool moved = false;
+            while (i > 0) {
+                index_t parent = (i - 1) / D;
+                if (!less(i, parent)) {
+                    break;
+                }
+                swap_elements(i, parent);
+                i = parent;
+                moved = true;
+            }
+            return moved;
+        }
+
+        void sift_down(index_t i) {
+            index_t n = m_keys.size();
+            while (true) {
+                index_t first_child = i * D + 1;
+                if (first_child >= n) {
+                    break;
+                }
+                index_t last_child = (std::min)(first_child + D, n);
+                index_t smallest = first_child;
+                for (index_t c = first_child + 1; c < last_child; c++) {
+                    if (less(c, smallest)) {
+                        smallest = c;
+                    }
+                }
+                if (!less(smallest, i)) {
+                    break;
+                }
+                swap_elements(i, smallest);
+                i = smallest;
+            }
+        }
+
+        void remove_at(index_t i) {
+            index_t last = m_keys.size() - 1;
+            m_position[m_keys[i]] = invalid_index;
+            if (i != last) {
+                m_keys[i] = m_keys[last];
+                m_values[i] = m_values[last];
+                m_position[m_keys[i]] = i;
+            }
+            m_keys.pop_back();
+            m_values.pop_back();
+            if (i != last) {
+                if (!sift_up(i)) {
+                    sift_down(i);
+                }
+            }
+        }
+
+        std::vector<index_t> m_keys;
+        std::vector<T> m_values;
+        std::vector<index_t> m_position;
+    };
+
+    /**
+     * Indexed pairing min-heap.
+     *
+     * Each element of the heap is identified by a key: an integer in [0, num_keys[ given at construction. A key can be
+     * present at most once in the heap. The nodes of the heap are stored in arrays indexed by the keys: no memory is
+     * allocated after construction.
+     *
+     * Elements with equal values are ordered by increasing key.
+     *
+     * @tparam T Value type, must implement operator <
+     */
+    template<typename T>
+    struct indexed_pairing_heap {
+
+        /**
+         * Creates an empty heap for keys in [0, num_keys[
+         * @param num_keys
+         */
+        indexed_pairing_heap(size_t num_keys = 0) :
+                m_values(num_keys),
+                m_child(num_keys, invalid_index),
+                m_next(num_keys, invalid_index),
+                m_previous(num_keys, invalid_index),
+                m_in_heap(num_keys, false) {
+        }
+
+        bool empty() const {
+            return m_root == invalid_index;
+        }
+
+        size_t size() const {
+            return m_size;
+        }
+
+        /**
+         * Test if the given key is in the heap
+         * @param key
+         * @return
+         */
+        bool contains(index_t key) const {
+            return m_in_heap[key];
+        }
+
+        /**
+         * Insert a new element in the heap.
+         *
+         * Complexity O(1)
+         *
+         * @param key must not be already in the heap
+         * @param value
+         */
+        void push(index_t key, const T &value) {
+            m_values[key] = value;
+            m_child[key] = invalid_index;
+            m_next[key] = invalid_index;
+            m_previous[key] = invalid_index;
+            m_in_heap[key] = true;
+            m_size++;
+            m_root = meld(m_root, key);
+        }
+
+        /**
+         * Key of the min element
+         * @return
+         */
+        index_t top() const {
+            return m_root;
+        }
+
+        /**
+         * Value of the min element
+         * @return
+         */
+        const T &top_value() const {
+            return m_values[m_root];
+        }
+
+        /**
+         * Value associated to the given key
+         * @param key must be in the heap
+         * @return
+         */
+        const T &value(index_t key) const {
+            return m_values[key];
+        }
+
+        /**
+         * Removes the min element from the heap.
+         *
+         * Complexity amortized O(log(n))
+         */
+        void pop() {
+            auto old_root = m_root;
+            m_root = merge_children(old_root);
+            m_in_heap[old_root] = false;
+            m_size--;
+        }
+
+        /**
+         * Removes the given key from the heap.
+         *
+         * Complexity amortized O(log(n))
+         *
+         * @param key must be in the heap
+         */
+        void erase(index_t key) {
+            if (key == m_root) {
+                pop();
+                return;
+            }
+            detach(key);
+            m_root = meld(m_root, merge_children(key));
+            m_in_heap[key] = false;
+            m_size--;
+        }
+
+        /**
+         * Changes the value associated to the given key.
+         *
+         * Complexity amortized O(log(n))
+         *
+         * @param key must be in the heap
+         * @param value
+         */
+        void update(index_t key, const T &value) {
+            if (value < m_values[key]) {
+                m_values[key] = value;
+                if (key != m_root) {
+                    detach(key);
+                    m_root = meld(m_root, key);
+                }
+            } else if (m_values[key] < value) {
+                erase(key);
+                push(key, value);
+            }
+        }
+
+        /**
+         * Empties the heap
+         */
+        void clear() {
+            while (!empty()) {
+                pop();
+            }
+        }
+
+    private:
+
+        bool less(index_t i, index_t j) const {
+            return m_values[i] < m_values[j] || (!(m_values[j] < m_values[i]) && i < j);
+        }
+
+        // meld two heap-ordered trees, the roots must not have siblings
+        index_t meld(index_t a, index_t b) {
+            if (a == invalid_index) {
+                return b;
+            }
+            if (b == invalid_index) {
+                return a;
+            }
+            if (less(b, a)) {
+                std::swap(a, b);
+            }
+            // b becomes the leftmost child of a
+            m_next[b] = m_child[a];
+            if (m_child[a] != invalid_index) {
+                m_previous[m_child[a]] = b;
+            }
+            m_previous[b] = a;
+            m_child[a] = b;
+            return a;
+        }
+
+        // cut the sub-tree rooted in key from its parent
+        void detach(index_t key) {
+            auto previous = m_previous[key];
+            if (m_child[previous] == key) {
+                m_child[previous] = m_next[key];
+            } else {
+                m_next[previous] = m_next[key];
+            }
+            if (m_next[key] != invalid_index) {
+                m_previous[m_next[key]] = previous;
+            }
+            m_next[key] = invalid_index;
+            m_previous[key] = invalid_index;
+        }
+
+        // two pass merge of the children of the given node
+        index_t merge_children(index_t key) {
+            m_buffer.clear();
+            for (auto c = m_child[key]; c != invalid_index;) {
+                auto next = m_next[c];
+                m_next[c] = invalid_index;
+                m_previous[c] = invalid_index;
+                m_buffer.push_back(c);
+                c = next;
+            }
+            m_child[key] = invalid_index;
+            if (m_buffer.empty()) {
+                return invalid_index;
+            }
+
+            index_t n = m_buffer.size();
+            index_t k = 0;
+            for (index_t i = 0; i + 1 < n; i += 2) {
+                m_buffer[k++] = meld(m_buffer[i], m_buffer[i + 1]);
+            }
+            if (n % 2 == 1) {
+                m_buffer[k++] = m_buffer[n - 1];
+            }
+            auto result = m_buffer[k - 1];
+            for (index_t i = k - 2; i >= 0; i--) {
+                result = meld(m_buffer[i], result);
+            }
+            return result;
+        }
+
+        std::vector<T> m_values;
+        std::vector<index_t> m_child;
+        std::vector<index_t> m_next;
+        std::vector<index_t> m_previous;
+        std::vector<char> m_in_heap;
+        std::vector<index_t> m_buffer;
+        index_t m_root = invalid_index;
+        size_t m_size = 0;
+    };
+}
@@ -139,7 +139,22 @@ namespace hg {
             }
 
 
+            lca_fast() = default;
+
         public:
+
+            /**
+             * Preprocessing tables of the structure (used for serialization)
+             */
+            struct internal_state {
+                size_t num_vertices;
+                array Euler;
+                array Depth;
+                array Represent;
+                array Number;
+                array2d Minim;
+            };
+
             lca_fast(const tree_t &tree) {
                 HG_TRACE();
                 auto nbNodes = hg::num_vertices(tree);
@@ -234,6 +249,44 @@ namespace hg {
                 return m_num_vertices;
             }
 
+            /**
+             * Memory used by the preprocessing tables in bytes
+             */
+            size_t nbytes() const {
+                return (Euler.size() + Depth.size() + Represent.size() + Number.size() + Minim.size()) *
+                       sizeof(std::size_t);
+            }
+
+            /**
+             * Copy of the preprocessing tables
+             * @return
+             */
+            internal_state get_state() const {
+                return {m_num_vertices, Euler, Depth, Represent, Number, Minim};
+            }
+
+            /**
+             * Rebuild a structure from preprocessing tables obtained with get_state (no tree preprocessing is done)
+             * @param state
+             * @return
+             */
+            static lca_fast make_from_state(internal_state state) {
+                hg_assert(state.Depth.size() == state.num_vertices && state.Number.size() == state.num_vertices,
+                          "Invalid lca_fast state: tables size does not match the number of vertices.");
+                hg_assert(state.Euler.size() == 2 * state.num_vertices - 1 &&
+                          state.Represent.size() == 2 * state.num_vertices - 1 &&
+                          state.Minim.shape()[1] == 2 * state.num_vertices - 1,
+                          "Invalid lca_fast state: tables size does not match the number of vertices.");
+                lca_fast res;
+                res.m_num_vertices = state.num_vertices;
+                res.Euler = std::move(state.Euler);
+                res.Depth = std::move(state.Depth);
+                res.Represent = std::move(state.Represent);
+                res.Number = std::move(state.Number);
+                res.Minim = std::move(state.Minim);
+                return res;
+            }
+
 
         };
     }
@@ -104,7 +104,7 @@ namespace hg {
             //BidirectionalGraph associated types
             using in_edge_iterator = out_edge_iterator;
 
-            tree() : _root(invalid_index), _num_vertices(0), _num_leaves(0) {
+            tree() : _root(invalid_index), _num_vertices(0), _num_leaves(0), _children_offsets(1, 0) {
 
             }
 
@@ -112,7 +112,6 @@ namespace hg {
             tree(const xt::xexpression<T> &parents = xt::xarray<vertex_descriptor>({0}),
                  tree_category category = tree_category::partition_tree) :
                     _parents(parents),
-                    _children(_parents.size()),
                     _category(category) {
                 HG_TRACE();
 
@@ -121,22 +120,33 @@ namespace hg {
                 _root = _num_vertices - 1;
                 hg_assert(_parents(_root) == _root, "nodes are not in a topological order (last node is not a root)");
 
+                // children are stored in compressed sparse row format: the children of v are
+                // _children[_children_offsets[v]], ..., _children[_children_offsets[v + 1] - 1]
+                _children_offsets.resize(_num_vertices + 1, 0);
                 for (vertex_descriptor v = 0; v < _root; ++v) {
                     vertex_descriptor parent_v = _parents(v);
                     hg_assert(parent_v != v, "several root nodes detected");
                     hg_assert(parent_v > v, "nodes are not in a topological order");
-                    _children[parent_v].push_back(v);
+                    _children_offsets[parent_v + 1]++;
                 }
 
                 index_t num_leaves = 0;
 
                 for (vertex_descriptor v = 0; v <= _root; ++v) {
-                    if (_children[v].size() == 0) {
+                    if (_children_offsets[v + 1] == 0) {
                         hg_assert(num_leaves == v, "leaves nodes are not before internal nodes");
                         num_leaves++;
                     }
+                    _children_offsets[v + 1] += _children_offsets[v];
                 }
                 _num_leaves = (size_t) num_leaves;
+
+                // nodes are processed in increasing order: children of a node are sorted in increasing order
+                _children.resize(_children_offsets[_num_vertices]);
+                std::vector<index_t> insert_position(_children_offsets.begin(), _children_offsets.end() - 1);
+                for (vertex_descriptor v = 0; v < _root; ++v) {
+                    _children[insert_position[_parents(v)]++] = v;
+                }
             };
 
             const auto &category() const {
@@ -156,7 +166,7 @@ namespace hg {
             }
 
             size_t num_children(const vertex_descriptor v) const {
-                return _children[v].size();
+                return (size_t) (_children_offsets[v + 1] - _children_offsets[v]);
             }
 
             vertex_descriptor root() const {
@@ -164,23 +174,23 @@ namespace hg {
             }
 
             degree_size_type degree(vertex_descriptor v) const {
-                return _children[v].size() + ((v != _root) ? 1 : 0);
+                return num_children(v) + ((v != _root) ? 1 : 0);
             }
 
-            auto children_cbegin(vertex_descriptor v) const {
-                return _children[v].cbegin();
+            children_iterator children_cbegin(vertex_descriptor v) const {
+                return _children.cbegin() + _children_offsets[v];
             }
 
-            auto children_cend(vertex_descriptor v) const {
-                return _children[v].cend();
+            children_iterator children_cend(vertex_descriptor v) const {
+                return _children.cbegin() + _children_offsets[v + 1];
             }
 
-            auto children(vertex_descriptor v) const {
-                return _children[v];
+            children_list_t children(vertex_descriptor v) const {
+                return children_list_t(children_cbegin(v), children_cend(v));
             }
 
             auto child(index_t i, vertex_descriptor v) const {
-                return _children[v][i];
+                return _children[_children_offsets[v] + i];
             }
 
             template<typename... Args>
@@ -232,7 +242,8 @@ namespace hg {
             size_t _num_vertices;
             size_t _num_leaves;
             array_1d <vertex_descriptor> _parents;
-            std::vector<children_list_t> _children;
+            std::vector<index_t> _children_offsets;
+            children_list_t _children;
             tree_category _category;
         };
 
@@ -14,6 +14,7 @@
 #include "details/graph_concepts.hpp"
 #include "details/indexed_edge.hpp"
 #include "higra/structure/details/iterators.hpp"
+#include "higra/utils.hpp"
 #include <vector>
 #include <list>
 #include <unordered_set>
@@ -67,6 +68,24 @@ namespace hg {
             c.erase(v);
         }
 
+        /**
+         * Ensures that the container can hold size elements without reallocation: the capacity of the container
+         * grows geometrically so that repeated small reservations do not reallocate each time.
+         */
+        template<typename ValueType>
+        void reserve_container(std::vector<ValueType> &c, size_t size) {
+            if (size > c.capacity()) {
+                c.reserve((std::max)(size, 2 * c.capacity()));
+            }
+        }
+
+        template<typename ValueType>
+        void reserve_container(std::unordered_set<ValueType> &c, size_t size) {
+            if (size > c.bucket_count() * c.max_load_factor()) {
+                c.reserve((std::max)(size, 2 * c.size()));
+            }
+        }
+
         template<typename ValueType>
         void add_to_container(std::vector<ValueType> &c, ValueType v) {
             c.push_back(v);
@@ -122,6 +141,62 @@ namespace hg {
             undirected_graph(const size_t num_vertices = 0) : _num_vertices(num_vertices),
                                                               out_edges(num_vertices) {};
 
+            /**
+             * Converts the adjacency lists of the graph into a single compressed sparse row (CSR) structure:
+             * the out edges of the vertex v are csr_edges()[csr_offsets()[v]], ..., csr_edges()[csr_offsets()[v + 1] - 1]
+             * in the same order as before.
+             *
+             * Traversals of a frozen graph are more cache friendly but the graph cannot be modified anymore
+             * (adding or removing vertices or edges throws an exception).
+             *
+             * Only available for graphs using vecS edge storage.
+             */
+            void freeze() {
+                static_assert(std::is_same<edgeS, vecS>::value, "Only graphs with vecS edge storage can be frozen.");
+                if (_frozen) {
+                    return;
+                }
+                _csr_offsets.resize(_num_vertices + 1);
+                _csr_offsets[0] = 0;
+                for (index_t i = 0; i < (index_t) _num_vertices; i++) {
+                    _csr_offsets[i + 1] = _csr_offsets[i] + out_edges[i].size();
+                }
+                _csr_edges.resize(_csr_offsets[_num_vertices]);
+                for (index_t i = 0; i < (index_t) _num_vertices; i++) {
+                    std::copy(out_edges[i].begin(), out_edges[i].end(), _csr_edges.begin() + _csr_offsets[i]);
+                }
+                std::vector<out_edge_container_type>().swap(out_edges);
+                _frozen = true;
+            }
+
+            /**
+             * Preallocates the storage for the given total number of edges (the capacity grows geometrically).
+             */
+            void reserve_edges(size_t num_edges) {
+                assert_not_frozen();
+                reserve_container(edges, num_edges);
+            }
+
+            /**
+             * Preallocates the storage for the given degree of the vertex v (the capacity grows geometrically).
+             */
+            void reserve_out_edges(vertex_descriptor v, size_t degree) {
+                assert_not_frozen();
+                reserve_container(out_edges[v], degree);
+            }
+
+            bool is_frozen() const {
+                return _frozen;
+            }
+
+            const std::vector<index_t> &csr_offsets() const {
+                return _csr_offsets;
+            }
+
+            const std::vector<edge_index_t> &csr_edges() const {
+                return _csr_edges;
+            }
+
             vertices_size_type num_vertices() const {
                 return _num_vertices;
             }
@@ -131,10 +206,14 @@ namespace hg {
             }
 
             degree_size_type degree(vertex_descriptor v) const {
+                if (_frozen) {
+                    return (degree_size_type) (_csr_offsets[v + 1] - _csr_offsets[v]);
+                }
                 return out_edges[v].size();
             }
 
             vertex_descriptor add_vertex() {
+                assert_not_frozen();
                 auto tmp = _num_vertices;
                 _num_vertices++;
                 out_edges.emplace_back();
@@ -142,6 +221,7 @@ namespace hg {
             }
 
             void add_vertices(size_t num) {
+                assert_not_frozen();
                 if(num > 0) {
                     _num_vertices += num;
                     out_edges.resize(_num_vertices);
@@ -149,6 +229,7 @@ namespace hg {
             }
 
             void remove_edge(edge_index_t ei) {
+                assert_not_frozen();
                 auto &source = edges[ei].source;
                 auto &target = edges[ei].target;
                 remove_from_container(out_edges[source], ei);
@@ -159,14 +240,23 @@ namespace hg {
             }
 
             void set_edge(edge_index_t ei, vertex_descriptor v1, vertex_descriptor v2) {
+                assert_not_frozen();
                 if (v1 > v2) {
                     std::swap(v1, v2);
                 }
-                // TODO optimize cases !
-                remove_edge(ei);
+                auto source = edges[ei].source;
+                auto target = edges[ei].target;
+                // only the adjacency lists of the extremities that change are modified
+                if (source != invalid_index) {
+                    if (source != v1 && source != v2)
+                        remove_from_container(out_edges[source], ei);
+                    if (target != source && target != v1 && target != v2)
+                        remove_from_container(out_edges[target], ei);
+                }
 
-                add_to_container(out_edges[v1], ei);
-                if (v1 != v2)
+                if (v1 != source && v1 != target)
+                    add_to_container(out_edges[v1], ei);
+                if (v1 != v2 && v2 != source && v2 != target)
                     add_to_container(out_edges[v2], ei);
                 edges[ei].source = v1;
                 edges[ei].target = v2;
@@ -184,15 +274,16 @@ namespace hg {
                 return edges.cend();
             }
 
-            auto out_edges_cbegin(vertex_descriptor v) const {
-                return out_edges[v].cbegin();
+            out_edge_index_iterator out_edges_cbegin(vertex_descriptor v) const {
+                return _out_edges_cbegin(v, edgeS());
             }
 
-            auto out_edges_cend(vertex_descriptor v) const {
-                return out_edges[v].cend();
+            out_edge_index_iterator out_edges_cend(vertex_descriptor v) const {
+                return _out_edges_cend(v, edgeS());
             }
 
             const edge_descriptor &add_edge(vertex_descriptor v1, vertex_descriptor v2) {
+                assert_not_frozen();
                 if (v1 > v2) {
                     std::swap(v1, v2);
                 }
@@ -214,10 +305,35 @@ namespace hg {
 
         private:
 
+            void assert_not_frozen() const {
+                hg_assert(!_frozen, "A frozen graph cannot be modified.");
+            }
+
+            out_edge_index_iterator _out_edges_cbegin(vertex_descriptor v, vecS) const {
+                return (_frozen) ? _csr_edges.cbegin() + _csr_offsets[v] : out_edges[v].cbegin();
+            }
+
+            out_edge_index_iterator _out_edges_cend(vertex_descriptor v, vecS) const {
+                return (_frozen) ? _csr_edges.cbegin() + _csr_offsets[v + 1] : out_edges[v].cend();
+            }
+
+            out_edge_index_iterator _out_edges_cbegin(vertex_descriptor v, hash_setS) const {
+                return out_edges[v].cbegin();
+            }
+
+            out_edge_index_iterator _out_edges_cend(vertex_descriptor v, hash_setS) const {
+                return out_edges[v].cend();
+            }
+
             size_t _num_vertices;
             std::vector<edge_descriptor> edges;
             std::vector<out_edge_container_type> out_edges; // same as in_edges...
 
+            // compressed sparse row adjacency of frozen graphs (out_edges is empty in this case)
+            bool _frozen = false;
+            std::vector<index_t> _csr_offsets;
+            std::vector<edge_index_t> _csr_edges;
+
         };
 
     }
@@ -50,6 +50,18 @@ namespace hg {
                 return i;
             }
 
+            /**
+             * Same as find but without path compression: the structure is not modified and concurrent calls are safe
+             * as long as no other method is called at the same time.
+             * @param element
+             * @return index of the canonical node of element
+             */
+            idx_t find_root(idx_t element) const {
+                while (parent[element] != element)
+                    element = parent[element];
+                return element;
+            }
+
             /**
              * Union by rank
              * @param i index of canonical node
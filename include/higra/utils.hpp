@@ -18,6 +18,7 @@
 #include "xtensor/xstrided_view.hpp"
 #include "xtensor/xio.hpp"
 #include "detail/log.hpp"
+#include "detail/thread_pool.hpp"
 
 #ifdef  HG_USE_TBB
 
@@ -28,9 +29,17 @@
 namespace hg {
 
     /**
-     * Preferred type to represent an index
+     * Preferred type to represent an index.
+     *
+     * Indices are 64 bits integers by default. If HG_USE_32BIT_INDEX is defined, indices are 32 bits integers: this
+     * halves the memory used by index arrays (parents, edge maps, sources/targets...) but limits the number of
+     * vertices and edges of graphs and trees to 2^31 - 1.
      */
+#ifdef HG_USE_32BIT_INDEX
+    using index_t = int32_t;
+#else
     using index_t = int64_t;
+#endif
 
     /**
      * Constant used to represent an invalid index (eg. not initialized)
@@ -228,9 +237,7 @@ namespace hg {
 #ifdef HG_USE_TBB
         tbb::parallel_for(start_index, end_index, step_size, fun);
 #else
-        for (index_t i = start_index; i < end_index; i += step_size) {
-            fun(i);
-        }
+        thread_pool::instance().parallel_for(start_index, end_index, fun, step_size);
 #endif
     }
 
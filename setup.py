@@ -22,6 +22,7 @@ def get_option(argname, envname):
 
 force_debug = get_option("--force_debug", "HG_DEBUG")
 use_tbb = get_option("--use_tbb", "HG_USE_TBB")
+use_32bit_index = get_option("--use_32bit_index", "HG_USE_32BIT_INDEX")
 
 
 def get_tbb_dirs():
@@ -107,6 +108,9 @@ class CMakeBuild(build_ext):
                 '-DTBB_INCLUDE_DIR=' + tbb_include,
                 '-DTBB_LIBRARY=' + tbb_link]
 
+        if use_32bit_index:
+            cmake_args += ['-DHG_USE_32BIT_INDEX=On']
+
         cfg = 'Debug' if force_debug or self.debug else 'Release'
         build_args = ['--config', cfg]
 
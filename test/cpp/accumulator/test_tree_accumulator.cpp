@@ -10,7 +10,11 @@
 
 #include "../test_utils.hpp"
 #include "higra/accumulator/tree_accumulator.hpp"
+#include "xtensor/xadapt.hpp"
+#include "xtensor/xrandom.hpp"
 #include <functional>
+#include <numeric>
+#include <random>
 
 
 using namespace hg;
@@ -47,6 +51,11 @@ namespace tree_accumulator {
         array_1d<index_t> ref3{1, 1, 1, 1, 1, 2, 2, 3};
         REQUIRE(xt::allclose(ref3, res3));
 
+        array_1d<double> vertex_data2{1, 2, 3, 4, 5};
+        auto res4 = accumulate_sequential(tree, vertex_data2, hg::accumulator_mean());
+        array_1d<double> ref4{1, 2, 3, 4, 5, 1.5, 4, 2.75};
+        REQUIRE(xt::allclose(ref4, res4));
+
     }
 
     TEST_CASE("accumulator tree vectorial", "[tree_accumulator]") {
@@ -183,4 +192,107 @@ namespace tree_accumulator {
                            {8,  1}};
         REQUIRE(xt::allclose(ref4, output4));
     }
+
+    TEST_CASE("tree accumulator level schedules", "[tree_accumulator]") {
+        auto tree = data.t;
+
+        auto s1 = tree_accumulator_detail::topological_height_schedule(tree);
+        REQUIRE((s1.nodes == array_1d<index_t>{0, 1, 2, 3, 4, 5, 6, 7}));
+        REQUIRE((s1.offsets == std::vector<index_t>{0, 5, 7, 8}));
+
+        auto s2 = tree_accumulator_detail::depth_schedule(tree);
+        REQUIRE((s2.nodes == array_1d<index_t>{7, 5, 6, 0, 1, 2, 3, 4}));
+        REQUIRE((s2.offsets == std::vector<index_t>{0, 1, 3, 8}));
+    }
+
+    TEST_CASE("tree accumulator parallel levels", "[tree_accumulator]") {
+        // random tree: nodes with 2 or 3 children are created by merging random roots
+        index_t num_leaves = 50000;
+        std::mt19937 gen(42);
+        std::vector<index_t> parents(num_leaves);
+        std::vector<index_t> roots(num_leaves);
+        std::iota(roots.begin(), roots.end(), 0);
+        while (roots.size() > 1) {
+            index_t num_children = (std::min)((index_t) roots.size(), (index_t) (gen() % 2 + 2));
+            index_t node = parents.size();
+            parents.push_back(node);
+            for (index_t c = 0; c < num_children; c++) {
+                std::swap(roots[gen() % roots.size()], roots.back());
+                parents[roots.back()] = node;
+                roots.pop_back();
+            }
+            roots.push_back(node);
+        }
+        tree t(xt::adapt(parents));
+        auto num_nodes = num_vertices(t);
+
+        array_1d<double> input = xt::random::rand<double>({num_nodes}, 0, 1, gen);
+        array_2d<double> input2 = xt::random::rand<double>({num_nodes, (size_t) 3}, 0, 1, gen);
+        array_1d<double> vertex_data = xt::random::rand<double>({(size_t) num_leaves}, 0, 1, gen);
+        array_2d<double> vertex_data2 = xt::random::rand<double>({(size_t) num_leaves, (size_t) 3}, 0, 1, gen);
+        array_1d<bool> condition = xt::random::rand<double>({num_nodes}, 0, 1, gen) > 0.5;
+
+        auto compute = [&]() {
+            return std::make_tuple(accumulate_parallel(t, input, accumulator_sum()),
+                                   accumulate_sequential(t, vertex_data, accumulator_mean()),
+                                   accumulate_sequential(t, vertex_data2, accumulator_sum()),
+                                   accumulate_and_combine_sequential(t, input, vertex_data, accumulator_max(),
+                                                                     std::plus<double>()),
+                                   propagate_parallel(t, input, condition),
+                                   propagate_sequential(t, input2, condition),
+                                   propagate_sequential_and_accumulate(t, input, accumulator_sum()));
+        };
+
+        auto save_threshold = get_tree_accumulator_parallel_threshold();
+        auto save_num_threads = get_num_threads();
+
+        REQUIRE(save_threshold < 0);
+        set_tree_accumulator_parallel_threshold(-1);
+        auto ref = compute();
+
+        set_num_threads(4);
+        set_tree_accumulator_parallel_threshold(0);
+        REQUIRE(get_tree_accumulator_parallel_threshold() == 0);
+        auto res = compute();
+
+        // schedules built in parallel
+        auto node_levels = [num_nodes](const tree_accumulator_detail::level_schedule &schedule) {
+            std::vector<index_t> levels(num_nodes, -1);
+            REQUIRE((index_t) schedule.nodes.size() == (index_t) num_nodes);
+            REQUIRE(schedule.offsets.back() == (index_t) num_nodes);
+            for (index_t l = 0; l < (index_t) schedule.offsets.size() - 1; l++) {
+                for (index_t k = schedule.offsets[l]; k < schedule.offsets[l + 1]; k++) {
+                    levels[schedule.nodes[k]] = l;
+                }
+            }
+            return levels;
+        };
+        auto height = node_levels(tree_accumulator_detail::topological_height_schedule(t));
+        auto depth = node_levels(tree_accumulator_detail::depth_schedule(t));
+        bool height_ok = true;
+        bool depth_ok = depth[root(t)] == 0;
+        for (auto i: leaves_to_root_iterator(t)) {
+            index_t h = 0;
+            for (auto c: children_iterator(i, t)) {
+                h = (std::max)(h, height[c] + 1);
+            }
+            height_ok = height_ok && height[i] == h;
+            if (i != root(t)) {
+                depth_ok = depth_ok && depth[i] == depth[parent(i, t)] + 1;
+            }
+        }
+        REQUIRE(height_ok);
+        REQUIRE(depth_ok);
+
+        set_tree_accumulator_parallel_threshold(save_threshold);
+        set_num_threads(save_num_threads);
+
+        REQUIRE((std::get<0>(ref) == std::get<0>(res)));
+        REQUIRE((std::get<1>(ref) == std::get<1>(res)));
+        REQUIRE((std::get<2>(ref) == std::get<2>(res)));
+        REQUIRE((std::get<3>(ref) == std::get<3>(res)));
+        REQUIRE((std::get<4>(ref) == std::get<4>(res)));
+        REQUIRE((std::get<5>(ref) == std::get<5>(res)));
+        REQUIRE((std::get<6>(ref) == std::get<6>(res)));
+    }
 }
\ No newline at end of file
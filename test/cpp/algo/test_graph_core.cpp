@@ -12,6 +12,9 @@
 #include "higra/algo/graph_core.hpp"
 #include "higra/utils.hpp"
 #include "higra/image/graph_image.hpp"
+#include "xtensor/xrandom.hpp"
+#include "xtensor/xadapt.hpp"
+#include "xtensor/xindex_view.hpp"
 
 using namespace hg;
 
@@ -61,6 +64,23 @@ namespace test_graph_core {
         REQUIRE(xt::equal(mst_edge_map, array_1d<int>({1, 0, 3, 4, 2}))());
     }
 
+    TEST_CASE("minimum spanning tree filter kruskal", "[graph_algorithm]") {
+        // two disconnected grids
+        auto grid = get_4_adjacency_graph({60, 60});
+        ugraph graph(2 * num_vertices(grid));
+        for (index_t k = 0; k < 2; k++) {
+            for (auto e: edge_iterator(grid)) {
+                add_edge(source(e, grid) + k * num_vertices(grid), target(e, grid) + k * num_vertices(grid), graph);
+            }
+        }
+        array_1d<index_t> edge_weights = xt::arange<index_t>(num_edges(graph)) * 7919 % 31;
+
+        auto ref = minimum_spanning_tree(graph, edge_weights);
+        auto res = minimum_spanning_tree(graph, edge_weights, mst_algorithm::filter_kruskal);
+        REQUIRE(num_edges(res.mst) == 2 * (num_vertices(grid) - 1));
+        REQUIRE((res.mst_edge_map == ref.mst_edge_map));
+    }
+
     TEST_CASE("minimum spanning forest", "[graph_algorithm]") {
         ugraph graph(6);
         add_edge(0, 1, graph);
@@ -91,4 +111,53 @@ namespace test_graph_core {
         REQUIRE((mst_edge_map == array_1d<int>({0, 1, 3, 4})));
     }
 
+    TEST_CASE("euclidean minimum spanning tree", "[graph_algorithm]") {
+        xt::xarray<double> points{{0, 0},
+                                  {0, 1},
+                                  {3, 0},
+                                  {3, 2},
+                                  {10, 10}};
+
+        auto res = euclidean_minimum_spanning_tree(points);
+        auto &mst = res.first;
+        auto &weights = res.second;
+
+        REQUIRE(num_vertices(mst) == 5);
+        REQUIRE(num_edges(mst) == 4);
+        std::vector<ugraph::edge_descriptor> ref = {{0, 1, 0},
+                                                    {0, 2, 1},
+                                                    {2, 3, 2},
+                                                    {3, 4, 3}};
+        for (index_t i = 0; i < (index_t) ref.size(); i++) {
+            REQUIRE(edge_from_index(i, mst) == ref[i]);
+        }
+        REQUIRE(xt::allclose(weights, array_1d<double>{1, 3, 2, std::sqrt(49 + 64)}));
+    }
+
+    TEST_CASE("euclidean minimum spanning tree random", "[graph_algorithm]") {
+        xt::random::seed(1);
+        for (index_t dim: {1, 2, 3, 5}) {
+            array_2d<double> points = xt::random::rand<double>({300, (int) dim});
+            // duplicated points
+            xt::view(points, xt::range(0, 10), xt::all()) = xt::view(points, xt::range(10, 20), xt::all());
+
+            auto res = euclidean_minimum_spanning_tree(points);
+            REQUIRE(num_edges(res.first) == 299);
+
+            ugraph complete(300);
+            std::vector<double> complete_weights;
+            for (index_t i = 0; i < 300; i++) {
+                for (index_t j = i + 1; j < 300; j++) {
+                    add_edge(i, j, complete);
+                    complete_weights.push_back(std::sqrt(xt::sum(xt::square(xt::view(points, i) - xt::view(points, j)))()));
+                }
+            }
+            array_1d<double> complete_weights_a = xt::adapt(complete_weights);
+            auto mst_ref = minimum_spanning_tree(complete, complete_weights_a);
+            double ref = xt::sum(xt::index_view(complete_weights_a, mst_ref.mst_edge_map))();
+
+            REQUIRE(std::abs(xt::sum(res.second)() - ref) < 1e-8);
+        }
+    }
+
 }
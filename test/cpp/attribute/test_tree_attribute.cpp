@@ -246,4 +246,42 @@ namespace tree_attributes {
         REQUIRE(xt::allclose(ref, res));
     }
 
+    TEST_CASE("tree attribute fused", "[tree_attributes]") {
+        auto t = data.t; //{5, 5, 6, 6, 6, 7, 7, 7}
+
+        array_1d<double> leaf_area{2, 1, 1, 3, 2};
+        array_1d<double> altitudes{0, 0, 0, 0, 0, 2, 1, 4};
+        array_2d<double> vertex_weights{{1, 2}, {3, 4}, {5, 6}, {7, 8}, {9, 10}};
+        array_1d<double> vertex_perimeter{4, 4, 4, 4, 4};
+        array_1d<double> frontier_length{0, 0, 0, 0, 0, 1, 2, 1};
+
+        std::vector<fused_attribute> attributes{fused_attribute::volume,
+                                                fused_attribute::height,
+                                                fused_attribute::depth,
+                                                fused_attribute::contour_length,
+                                                fused_attribute::mean_vertex_weights};
+        auto res = attribute_fused(t, attributes, leaf_area, altitudes, true, vertex_weights, vertex_perimeter,
+                                   frontier_length);
+
+        auto area = attribute_area(t, leaf_area);
+        REQUIRE(xt::allclose(res.area, area));
+        REQUIRE(xt::allclose(res.volume, attribute_volume(t, altitudes, area)));
+        REQUIRE((res.height == attribute_height(t, altitudes, true)));
+        REQUIRE((res.depth == attribute_depth(t)));
+
+        array_1d<double> ref_contour_length{4, 4, 4, 4, 4, 6, 8, 12};
+        REQUIRE(xt::allclose(res.contour_length, ref_contour_length));
+
+        array_2d<double> ref_mean{{0.5, 1}, {3, 4}, {5, 6}, {7.0 / 3, 8.0 / 3}, {4.5, 5},
+                                  {4.0 / 3, 2}, {3.5, 4}, {25.0 / 9, 30.0 / 9}};
+        REQUIRE(xt::allclose(res.mean_vertex_weights, ref_mean));
+
+        array_1d<double> altitudes2{0, 0, 0, 0, 0, 2, 3, 1};
+        auto res2 = attribute_fused(t, {fused_attribute::height}, array_1d<double>{}, altitudes2, false,
+                                    array_2d<double>{}, array_1d<double>{}, array_1d<double>{});
+        REQUIRE((res2.height == attribute_height(t, altitudes2, false)));
+        REQUIRE(res2.area.size() == 0);
+        REQUIRE(res2.mean_vertex_weights.size() == 0);
+    }
+
 }
\ No newline at end of file
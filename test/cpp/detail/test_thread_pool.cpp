@@ -0,0 +1,97 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include "../test_utils.hpp"
+#include "higra/detail/thread_pool.hpp"
+#include "higra/sorting.hpp"
+#include <atomic>
+#include <random>
+#include <stdexcept>
+
+namespace test_thread_pool {
+
+    using namespace hg;
+    using namespace std;
+
+    TEST_CASE("thread pool num threads", "[thread_pool]") {
+        auto save = get_num_threads();
+        set_num_threads(3);
+        REQUIRE(get_num_threads() == 3);
+        set_num_threads(0);
+        REQUIRE(get_num_threads() >= 1);
+        set_num_threads(save);
+    }
+
+    TEST_CASE("thread pool parallel for", "[thread_pool]") {
+        auto save = get_num_threads();
+        set_num_threads(4);
+        index_t n = 100003;
+        vector<index_t> res(n, 0);
+        parfor(0, n, [&res](index_t i) { res[i] += i; });
+        for (index_t i = 0; i < n; i++) {
+            REQUIRE(res[i] == i);
+        }
+
+        std::atomic<index_t> count(0);
+        parfor(5, 105, [&count](index_t) { count++; }, 10);
+        REQUIRE(count == 10);
+
+        // nested loops are executed sequentially
+        std::atomic<index_t> count2(0);
+        parfor(0, 100, [&count2](index_t) {
+            parfor(0, 100, [&count2](index_t) { count2++; });
+        });
+        REQUIRE(count2 == 10000);
+        set_num_threads(save);
+    }
+
+    TEST_CASE("thread pool exception", "[thread_pool]") {
+        auto save = get_num_threads();
+        set_num_threads(4);
+        REQUIRE_THROWS_AS(parfor(0, 1000, [](index_t i) {
+            if (i == 500) {
+                throw std::runtime_error("error");
+            }
+        }), std::runtime_error);
+        std::atomic<index_t> count(0);
+        parfor(0, 1000, [&count](index_t) { count++; });
+        REQUIRE(count == 1000);
+        set_num_threads(save);
+    }
+
+    TEST_CASE("parallel stable sort", "[thread_pool]") {
+        auto save = get_num_threads();
+        set_num_threads(4);
+        std::mt19937 gen(42);
+        std::uniform_int_distribution<int> dis(0, 100);
+        vector<pair<int, index_t>> v;
+        for (index_t i = 0; i < 300007; i++) {
+            v.emplace_back(dis(gen), i);
+        }
+        auto ref = v;
+        std::stable_sort(ref.begin(), ref.end(), [](const pair<int, index_t> &a, const pair<int, index_t> &b) {
+            return a.first < b.first;
+        });
+        hg::stable_sort(v.begin(), v.end(), [](const pair<int, index_t> &a, const pair<int, index_t> &b) {
+            return a.first < b.first;
+        });
+        REQUIRE(v == ref);
+
+        vector<int> w;
+        for (index_t i = 0; i < 300007; i++) {
+            w.push_back(dis(gen));
+        }
+        auto refw = w;
+        std::sort(refw.begin(), refw.end());
+        hg::sort(w.begin(), w.end(), std::less<int>());
+        REQUIRE(w == refw);
+        set_num_threads(save);
+    }
+}
@@ -14,6 +14,7 @@
 #include "xtensor/xrandom.hpp"
 #include "higra/hierarchy/hierarchy_core.hpp"
 #include "higra/algo/tree.hpp"
+#include <set>
 
 
 using namespace hg;
@@ -234,4 +235,120 @@ namespace binary_partition_tree {
         REQUIRE(r3.tree.parents() == r3_ref.tree.parents());
     }
 
+    TEST_CASE("nn chain linkage clustering simple", "[binary_partition_tree]") {
+        auto graph = get_4_adjacency_graph({3, 3});
+        array_1d<double> edge_weights({1, 8, 2, 10, 15, 3, 11, 4, 12, 13, 5, 6});
+        auto res = binary_partition_tree_complete_linkage(graph, edge_weights, bpt_algorithm::nn_chain);
+
+        array_1d<index_t> expected_parents({9, 9, 10, 11, 11, 12, 13, 13, 14, 10, 16, 12, 15, 14, 15, 16, 16});
+        array_1d<double> expected_levels({0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 13, 15});
+        REQUIRE((expected_parents == res.tree.parents()));
+        REQUIRE((expected_levels == res.altitudes));
+
+        array_1d<double> edge_weights2({1, 7, 2, 10, 16, 3, 11, 4, 12, 14, 5, 6});
+        array_1d<double> edge_weight_weights2({7, 1, 7, 3, 2, 8, 2, 2, 2, 1, 5, 9});
+        auto res2 = binary_partition_tree_average_linkage(graph, edge_weights2, edge_weight_weights2,
+                                                          bpt_algorithm::nn_chain);
+
+        array_1d<index_t> expected_parents2({9, 9, 10, 11, 11, 12, 13, 13, 14, 10, 15, 12, 15, 14, 16, 16, 16});
+        array_1d<double> expected_levels2({0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 11.5, 12});
+        REQUIRE((expected_parents2 == res2.tree.parents()));
+        REQUIRE((expected_levels2 == res2.altitudes));
+    }
+
+    TEST_CASE("nn chain linkage clustering equiv", "[binary_partition_tree]") {
+        xt::random::seed(42);
+        auto g = get_4_adjacency_graph({30, 30});
+        // random connected graph without multiple edges, similar to a knn graph
+        ugraph g2(200);
+        std::set<std::pair<index_t, index_t>> edges;
+        for (index_t i = 0; i < 200; i++) {
+            edges.insert(std::minmax(i, (i + 1) % 200));
+            array_1d<index_t> candidates = xt::random::randint<index_t>({5}, 0, 200);
+            for (auto j: candidates) {
+                if (j != i) {
+                    edges.insert(std::minmax(i, j));
+                }
+            }
+        }
+        for (auto &e: edges) {
+            add_edge(e.first, e.second, g2);
+        }
+
+        auto check = [](const auto &graph) {
+            array_1d<double> edge_weights = xt::random::rand<double>({num_edges(graph)});
+            array_1d<double> edge_weight_weights = xt::random::randint<int>({num_edges(graph)}, 1, 10);
+
+            auto r1 = binary_partition_tree_complete_linkage(graph, edge_weights, bpt_algorithm::nn_chain);
+            auto r1_ref = binary_partition_tree_complete_linkage(graph, edge_weights);
+            REQUIRE(r1.tree.parents() == r1_ref.tree.parents());
+            REQUIRE((r1.altitudes == r1_ref.altitudes));
+
+            auto r2 = binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights,
+                                                            bpt_algorithm::nn_chain);
+            auto r2_ref = binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights);
+            REQUIRE(r2.tree.parents() == r2_ref.tree.parents());
+            REQUIRE(xt::allclose(r2.altitudes, r2_ref.altitudes));
+        };
+        check(g);
+        check(g2);
+    }
+
+    TEST_CASE("nn chain ward linkage clustering", "[binary_partition_tree]") {
+        xt::random::seed(42);
+        index_t n = 60;
+        ugraph graph(n);
+        for (index_t i = 0; i < n; i++) {
+            for (index_t j = i + 1; j < n; j++) {
+                add_edge(i, j, graph);
+            }
+        }
+        array_2d<double> vertex_centroids = xt::random::rand<double>({(size_t) n, (size_t) 3});
+        array_1d<double> vertex_sizes = xt::random::randint<int>({n}, 1, 5);
+
+        auto res = binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, "none",
+                                                      bpt_algorithm::nn_chain);
+        auto res_ref = binary_partition_tree_ward_linkage(graph, vertex_centroids, vertex_sizes, "none");
+        REQUIRE(res.tree.parents() == res_ref.tree.parents());
+        REQUIRE(xt::allclose(res.altitudes, res_ref.altitudes));
+
+        // non complete graph: still a valid hierarchy
+        auto g4 = get_4_adjacency_graph({6, 10});
+        auto res2 = binary_partition_tree_ward_linkage(g4, vertex_centroids, vertex_sizes, "max",
+                                                       bpt_algorithm::nn_chain);
+        REQUIRE(num_leaves(res2.tree) == (size_t) n);
+        REQUIRE(num_vertices(res2.tree) == (size_t) (2 * n - 1));
+        for (auto i: leaves_to_root_iterator(res2.tree, leaves_it::include, root_it::exclude)) {
+            REQUIRE((res2.altitudes(i) <= res2.altitudes(parent(i, res2.tree))));
+        }
+    }
+
+    TEST_CASE("binary partition tree heaps", "[binary_partition_tree]") {
+        xt::random::seed(42);
+        auto g = get_4_adjacency_graph({20, 20});
+        array_1d<double> edge_weights = xt::random::rand<double>({num_edges(g)});
+        array_1d<double> edge_weight_weights = xt::random::randint<int>({num_edges(g)}, 1, 10);
+
+        auto compute = [&](bpt_heap heap) {
+            return hg::binary_partition_tree(
+                    g,
+                    edge_weights,
+                    binary_partition_tree_internal::binary_partition_tree_average_linkage_weighting_functor<array_1d<double>>(
+                            edge_weights,
+                            edge_weight_weights),
+                    heap);
+        };
+
+        auto ref = compute(bpt_heap::fibonacci);
+        for (auto heap: {bpt_heap::pairing, bpt_heap::dary}) {
+            auto res = compute(heap);
+            REQUIRE((res.tree.parents() == ref.tree.parents()));
+            REQUIRE((res.altitudes == ref.altitudes));
+        }
+
+        auto ref2 = binary_partition_tree_average_linkage(g, edge_weights, edge_weight_weights,
+                                                          bpt_algorithm::nn_chain);
+        REQUIRE((ref.tree.parents() == ref2.tree.parents()));
+        REQUIRE(xt::allclose(ref.altitudes, ref2.altitudes));
+    }
 }
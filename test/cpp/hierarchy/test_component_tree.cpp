@@ -14,6 +14,7 @@
 #include "higra/image/graph_image.hpp"
 #include "higra/algo/tree.hpp"
 #include "xtensor/xadapt.hpp"
+#include "xtensor/xrandom.hpp"
 
 using namespace hg;
 using namespace std;
@@ -160,6 +161,88 @@ namespace binary_partition_tree {
         REQUIRE((expected_altitudes == altitudes));
     }
 
+    TEST_CASE("test parallel max tree and min tree", "[component_tree]") {
+        xt::random::seed(42);
+        auto graph = get_4_adjacency_implicit_graph({23, 17});
+        // many plateaus
+        array_1d<int> vertex_weights = xt::random::randint<int>({23 * 17}, 0, 5);
+
+        auto ref_max = component_tree_max_tree(graph, vertex_weights);
+        auto ref_min = component_tree_min_tree(graph, vertex_weights);
+        for (index_t num_slabs = 2; num_slabs < 8; num_slabs++) {
+            auto res_max = component_tree_max_tree(graph, vertex_weights, num_slabs);
+            REQUIRE(category(res_max.tree) == tree_category::component_tree);
+            REQUIRE((ref_max.tree.parents() == res_max.tree.parents()));
+            REQUIRE((ref_max.altitudes == res_max.altitudes));
+
+            auto res_min = component_tree_min_tree(graph, vertex_weights, num_slabs);
+            REQUIRE((ref_min.tree.parents() == res_min.tree.parents()));
+            REQUIRE((ref_min.altitudes == res_min.altitudes));
+        }
+
+        // edges between non consecutive slabs
+        ugraph g(100);
+        for (index_t i = 0; i < 99; i++) {
+            g.add_edge(i, i + 1);
+        }
+        array_1d<index_t> sources = xt::random::randint<index_t>({150}, 0, 100);
+        array_1d<index_t> targets = xt::random::randint<index_t>({150}, 0, 100);
+        for (index_t i = 0; i < 150; i++) {
+            if (sources(i) != targets(i)) {
+                g.add_edge(sources(i), targets(i));
+            }
+        }
+        array_1d<double> weights = xt::random::randint<int>({100}, 0, 10);
+        auto ref = component_tree_max_tree(g, weights);
+        for (index_t num_slabs: {2, 3, 5, 8, 100, 1000}) {
+            auto res = component_tree_max_tree(g, weights, num_slabs);
+            REQUIRE((ref.tree.parents() == res.tree.parents()));
+            REQUIRE((ref.altitudes == res.altitudes));
+        }
+    }
+
+    TEMPLATE_TEST_CASE("test max tree and min tree hierarchical queue", "[component_tree]",
+                       unsigned char, char, unsigned short, short) {
+        xt::random::seed(7);
+        auto graph = get_8_adjacency_implicit_graph({19, 27});
+        for (int max_value: {3, 100}) {
+            array_1d<TestType> vertex_weights = xt::random::randint<int>({19 * 27}, -max_value / 2, max_value);
+            if (std::is_unsigned<TestType>::value) {
+                vertex_weights = xt::random::randint<int>({19 * 27}, 0, max_value);
+            }
+            // generic algorithm
+            array_1d<double> vertex_weights_d = vertex_weights;
+
+            auto res_max = component_tree_max_tree(graph, vertex_weights);
+            auto ref_max = component_tree_max_tree(graph, vertex_weights_d);
+            REQUIRE(category(res_max.tree) == tree_category::component_tree);
+            REQUIRE((ref_max.tree.parents() == res_max.tree.parents()));
+            REQUIRE((ref_max.altitudes == res_max.altitudes));
+
+            auto res_min = component_tree_min_tree(graph, vertex_weights);
+            auto ref_min = component_tree_min_tree(graph, vertex_weights_d);
+            REQUIRE((ref_min.tree.parents() == res_min.tree.parents()));
+            REQUIRE((ref_min.altitudes == res_min.altitudes));
+        }
+    }
+
+    TEST_CASE("test max tree and min tree hierarchical queue disconnected graph", "[component_tree]") {
+        ugraph graph(5);
+        add_edge(0, 1, graph);
+        add_edge(1, 2, graph);
+        add_edge(3, 4, graph);
+        array_1d<unsigned char> vertex_weights{1, 2, 1, 3, 0};
+        REQUIRE_THROWS_AS(component_tree_max_tree(graph, vertex_weights), std::runtime_error);
+        REQUIRE_THROWS_AS(component_tree_min_tree(graph, vertex_weights), std::runtime_error);
+
+        add_edge(2, 3, graph);
+        auto res = component_tree_max_tree(graph, vertex_weights);
+        array_1d<double> vertex_weights_d = vertex_weights;
+        auto ref = component_tree_max_tree(graph, vertex_weights_d);
+        REQUIRE((ref.tree.parents() == res.tree.parents()));
+        REQUIRE((ref.altitudes == res.altitudes));
+    }
+
     TEST_CASE("test max tree area filter", "[component_tree]") {
         auto graph = get_4_adjacency_implicit_graph({5, 5});
         array_1d<double> vertex_weights({-5, 2, 2, 5, 5,
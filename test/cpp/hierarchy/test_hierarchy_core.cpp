@@ -83,6 +83,24 @@ namespace hierarchy_core {
     }
 
 
+    TEST_CASE("canonical binary partition tree filter kruskal", "[hierarchy_core]") {
+        auto graph = get_4_adjacency_graph({100, 120});
+
+        xt::random::seed(42);
+        array_1d<int> edge_weights_int = xt::random::randint<int>({num_edges(graph)}, 0, 20);
+        array_1d<double> edge_weights_double = xt::random::rand<double>({num_edges(graph)});
+
+        auto check = [&graph](const auto &edge_weights) {
+            auto ref = bpt_canonical(graph, edge_weights);
+            auto res = bpt_canonical(graph, edge_weights, mst_algorithm::filter_kruskal);
+            REQUIRE((res.tree.parents() == ref.tree.parents()));
+            REQUIRE((res.altitudes == ref.altitudes));
+            REQUIRE((res.mst_edge_map == ref.mst_edge_map));
+        };
+        check(edge_weights_int);
+        check(edge_weights_double);
+    }
+
     TEST_CASE("simplify tree", "[hierarchy_core]") {
 
         auto t = data.t;
@@ -104,6 +104,23 @@ namespace watershed_hierarchy {
         REQUIRE((altitudes == ref_altitudes));
     }
 
+    TEST_CASE("watershed hierarchy by number of parents", "[watershed_hierarchy]") {
+
+        auto g = hg::get_4_adjacency_graph({3, 3});
+        array_1d<int> edge_weights{0, 0, 1, 3, 0, 4, 2, 4, 1, 3, 4, 0};
+
+        auto res = watershed_hierarchy_by_number_of_parents(g, edge_weights);
+        auto &t = res.tree;
+        auto &altitudes = res.altitudes;
+
+        array_1d<index_t> ref_parents{11, 11, 9, 11, 10, 9, 11, 10, 10, 12, 13, 12, 13, 13};
+        tree ref_tree(ref_parents);
+        array_1d<double> ref_altitudes{0., 0., 0., 0., 0., 0., 0., 0., 0., 0., 0., 0., 1., 2.};
+
+        REQUIRE(test_tree_isomorphism(t, ref_tree));
+        REQUIRE(xt::allclose(altitudes, ref_altitudes));
+    }
+
     TEST_CASE("watershed hierarchy by minima ordering", "[watershed_hierarchy]") {
 
         auto g = hg::get_4_adjacency_graph({1, 7});
@@ -399,4 +399,50 @@ TEST_CASE("test tree of shapes self duality", "[tree_of_shapes]") {
     REQUIRE(test_tree_isomorphism(res1.tree, res2.tree));
 }
 
+TEST_CASE("test khalimsky_plain_map", "[tree_of_shapes]") {
+    array_1d<int> image{0, 1, 2,
+                        3, 4, 5};
+    tree_of_shapes_internal::khalimsky_plain_map<int, 2> plain_map(image, {{2, 3}}, true);
+    auto ref = tree_of_shapes_internal::interpolate_plain_map_khalimsky_2d(image, {2, 3});
+    REQUIRE(plain_map.grid_shape()[0] == 3);
+    REQUIRE(plain_map.grid_shape()[1] == 5);
+    for (index_t i = 0; i < 15; i++) {
+        auto interval = plain_map.interval(i);
+        REQUIRE(interval.first == ref(i, 0));
+        REQUIRE(interval.second == ref(i, 1));
+    }
+
+    array_1d<int> image3d = xt::arange<int>(8);
+    tree_of_shapes_internal::khalimsky_plain_map<int, 3> plain_map3d(image3d, {{2, 2, 2}}, true);
+    // center of the cube
+    REQUIRE((plain_map3d.interval(13) == std::make_pair(0, 7)));
+    // face between pixels 1, 3, 5, 7
+    REQUIRE((plain_map3d.interval(14) == std::make_pair(1, 7)));
+    // edge between pixels 4 and 5
+    REQUIRE((plain_map3d.interval(19) == std::make_pair(4, 5)));
+    REQUIRE((plain_map3d.interval(26) == std::make_pair(7, 7)));
+}
+
+TEST_CASE("test tree of shapes 3d", "[tree_of_shapes]") {
+    xt::random::seed(1);
+    array_2d<int> image = xt::random::randint<int>({7, 9}, 0, 5);
+    array_3d<int> image3d = xt::reshape_view(image, {1, 7, 9});
+
+    // a 3d image with a single plane is processed as a 2d image when there is no padding
+    for (bool original_size: {true, false}) {
+        auto res2d = component_tree_tree_of_shapes_image2d(image, tos_padding::none, original_size);
+        auto res3d = component_tree_tree_of_shapes_image3d(image3d, tos_padding::none, original_size);
+        REQUIRE((res2d.tree.parents() == res3d.tree.parents()));
+        REQUIRE((res2d.altitudes == res3d.altitudes));
+    }
+
+    array_3d<double> volume = xt::random::rand<double>({5, 6, 7});
+    auto res = component_tree_tree_of_shapes_image3d(volume);
+    REQUIRE(num_leaves(res.tree) == 5 * 6 * 7);
+    REQUIRE(test_tree_isomorphism(res.tree, component_tree_tree_of_shapes_image3d(-volume).tree));
+
+    auto res_interpolated = component_tree_tree_of_shapes_image3d(volume, tos_padding::zero, false);
+    REQUIRE(num_leaves(res_interpolated.tree) == 13 * 15 * 17);
+}
+
 }
@@ -132,73 +132,135 @@ namespace test_fibonacci_heap {
     };
 
     TEST_CASE("memory pool 1 block", "[fibonacci_heap]") {
-        fibonacci_heap_internal::object_pool<hg::index_t> pool;
-        hg::index_t *i1 = pool.allocate();
+        fibonacci_heap_internal::object_pool<std::int64_t> pool;
+        std::int64_t *i1 = pool.allocate();
 
-        hg::index_t *i2 = pool.allocate();
+        std::int64_t *i2 = pool.allocate();
         REQUIRE((i2 - i1) == 1);
-        hg::index_t *i3 = pool.allocate();
+        std::int64_t *i3 = pool.allocate();
         REQUIRE((i3 - i1) == 2);
-        hg::index_t *i4 = pool.allocate();
+        std::int64_t *i4 = pool.allocate();
         REQUIRE((i4 - i1) == 3);
 
         pool.free(i3);
 
-        hg::index_t *i5 = pool.allocate();
+        std::int64_t *i5 = pool.allocate();
         REQUIRE((i5 - i1) == 2);
-        hg::index_t *i6 = pool.allocate();
+        std::int64_t *i6 = pool.allocate();
         REQUIRE((i6 - i1) == 4);
 
         pool.free(i5);
         pool.free(i4);
 
-        hg::index_t *i7 = pool.allocate();
+        std::int64_t *i7 = pool.allocate();
         REQUIRE((i7 - i1) == 3);
-        hg::index_t *i8 = pool.allocate();
+        std::int64_t *i8 = pool.allocate();
         REQUIRE((i8 - i1) == 2);
-        hg::index_t *i9 = pool.allocate();
+        std::int64_t *i9 = pool.allocate();
         REQUIRE(i9 - i1 == 5);
-        hg::index_t *i10 = pool.allocate();
+        std::int64_t *i10 = pool.allocate();
         REQUIRE((i10 - i1) == 6);
     }
 
     TEST_CASE("memory pool several blocks", "[fibonacci_heap]") {
-        fibonacci_heap_internal::object_pool<hg::index_t> pool(3);
-        hg::index_t *i1 = pool.allocate();
-        hg::index_t *i2 = pool.allocate();
+        fibonacci_heap_internal::object_pool<std::int64_t> pool(3);
+        std::int64_t *i1 = pool.allocate();
+        std::int64_t *i2 = pool.allocate();
         REQUIRE(i2 - i1 == 1);
-        hg::index_t *i3 = pool.allocate();
+        std::int64_t *i3 = pool.allocate();
         REQUIRE(i3 - i1 == 2);
 
-        hg::index_t *i4 = pool.allocate();
-        hg::index_t *i5 = pool.allocate();
+        std::int64_t *i4 = pool.allocate();
+        std::int64_t *i5 = pool.allocate();
         REQUIRE(i5 - i4 == 1);
-        hg::index_t *i6 = pool.allocate();
+        std::int64_t *i6 = pool.allocate();
         REQUIRE(i6 - i4 == 2);
 
-        hg::index_t *i7 = pool.allocate();
-        hg::index_t *i8 = pool.allocate();
+        std::int64_t *i7 = pool.allocate();
+        std::int64_t *i8 = pool.allocate();
         REQUIRE(i8 - i7 == 1);
 
         pool.free(i6);
         pool.free(i2);
         pool.free(i4);
 
-        hg::index_t *i9 = pool.allocate();
+        std::int64_t *i9 = pool.allocate();
         REQUIRE(i9 - i4 == 0);
-        hg::index_t *i10 = pool.allocate();
+        std::int64_t *i10 = pool.allocate();
         REQUIRE(i10 - i1 == 1);
-        hg::index_t *i11 = pool.allocate();
+        std::int64_t *i11 = pool.allocate();
         REQUIRE(i11 - i4 == 2);
 
-        hg::index_t *i12 = pool.allocate();
+        std::int64_t *i12 = pool.allocate();
         REQUIRE(i12 - i7 == 2);
 
-        hg::index_t *i13 = pool.allocate();
-        hg::index_t *i14 = pool.allocate();
+        std::int64_t *i13 = pool.allocate();
+        std::int64_t *i14 = pool.allocate();
         REQUIRE(i14 - i13 == 1);
     }
 
+    TEST_CASE("memory pool growing blocks", "[fibonacci_heap]") {
+        fibonacci_heap_internal::object_pool<std::int64_t> pool(2, 8);
+        REQUIRE(pool.capacity() == 0);
+        std::vector<std::int64_t *> elements;
+        for (index_t i = 0; i < 2; i++)
+            elements.push_back(pool.allocate());
+        REQUIRE(pool.capacity() == 2);
+        elements.push_back(pool.allocate());
+        REQUIRE(pool.capacity() == 6);
+        for (index_t i = 0; i < 3; i++)
+            elements.push_back(pool.allocate());
+        REQUIRE(pool.capacity() == 6);
+        elements.push_back(pool.allocate());
+        REQUIRE(pool.capacity() == 14);
+        for (index_t i = 0; i < 7; i++)
+            elements.push_back(pool.allocate());
+        elements.push_back(pool.allocate());
+        REQUIRE(pool.capacity() == 22);
+
+        fibonacci_heap_internal::object_pool<std::int64_t> pool2(2, 8);
+        std::int64_t *j1 = pool2.allocate();
+        pool.absorb(pool2);
+        REQUIRE(pool.capacity() == 24);
+        REQUIRE(pool2.capacity() == 0);
+        pool.free(j1);
+        for (auto e: elements)
+            pool.free(e);
+        for (index_t i = 0; i < 24; i++)
+            pool.allocate();
+        REQUIRE(pool.capacity() == 24);
+    }
+
+    TEST_CASE("fibonacci heap many small heaps memory", "[fibonacci_heap]") {
+        index_t num_heaps = 100000;
+        std::vector<fibonacci_heap<index_t>> heaps(num_heaps);
+        size_t capacity = 0;
+        for (index_t i = 0; i < num_heaps; i++) {
+            heaps[i].push(2 * i);
+            heaps[i].push(2 * i + 1);
+            capacity += heaps[i].capacity();
+        }
+        REQUIRE(capacity <= (size_t) 4 * num_heaps);
+
+        fibonacci_heap<index_t> heap;
+        for (index_t i = num_heaps - 1; i >= 0; i--) {
+            heap.merge(heaps[i]);
+            REQUIRE(heaps[i].capacity() == 0);
+        }
+        REQUIRE(heap.capacity() == capacity);
+        REQUIRE(heap.size() == (size_t) 2 * num_heaps);
+        for (index_t i = 0; i < 2 * num_heaps; i++) {
+            REQUIRE(heap.top()->get_value() == i);
+            heap.pop();
+        }
+        REQUIRE(heap.empty());
+
+        fibonacci_heap<index_t> heap2;
+        for (index_t i = 0; i < num_heaps; i++)
+            heap2.push(i);
+        REQUIRE(heap2.capacity() < (size_t) 2 * num_heaps);
+    }
+
     TEST_CASE("fibonacci heap push-top-size-empty", "[fibonacci_heap]") {
         fibonacci_heap<hg::index_t> heap;
         heap.push(10);
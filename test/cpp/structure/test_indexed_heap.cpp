@@ -0,0 +1,152 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include "higra/structure/indexed_heap.hpp"
+#include "../test_utils.hpp"
+#include <random>
+#include <map>
+
+namespace test_indexed_heap {
+
+    using namespace hg;
+    using namespace std;
+
+    TEMPLATE_TEST_CASE("indexed heap push-top-size-empty", "[indexed_heap]",
+                       indexed_dary_heap<int>, indexed_pairing_heap<int>) {
+        TestType heap(10);
+        REQUIRE(heap.empty());
+        heap.push(3, 10);
+        REQUIRE(heap.size() == 1);
+        REQUIRE(!heap.empty());
+        REQUIRE(heap.contains(3));
+        REQUIRE(!heap.contains(4));
+        REQUIRE(heap.top() == 3);
+        REQUIRE(heap.top_value() == 10);
+        heap.push(5, 15);
+        REQUIRE(heap.size() == 2);
+        REQUIRE(heap.top() == 3);
+        heap.push(7, 8);
+        REQUIRE(heap.size() == 3);
+        REQUIRE(heap.top() == 7);
+        REQUIRE(heap.value(5) == 15);
+
+        heap.clear();
+        REQUIRE(heap.size() == 0);
+        REQUIRE(heap.empty());
+        REQUIRE(!heap.contains(3));
+    }
+
+    TEMPLATE_TEST_CASE("indexed heap pop ties", "[indexed_heap]",
+                       indexed_dary_heap<int>, indexed_pairing_heap<int>) {
+        TestType heap(8);
+        heap.push(4, 2);
+        heap.push(6, 1);
+        heap.push(1, 2);
+        heap.push(0, 3);
+        heap.push(7, 1);
+        heap.push(2, 2);
+
+        vector<index_t> keys;
+        vector<int> values;
+        while (!heap.empty()) {
+            keys.push_back(heap.top());
+            values.push_back(heap.top_value());
+            heap.pop();
+        }
+        vector<index_t> keys_ref{6, 7, 1, 2, 4, 0};
+        vector<int> values_ref{1, 1, 2, 2, 2, 3};
+        REQUIRE(keys == keys_ref);
+        REQUIRE(values == values_ref);
+    }
+
+    TEMPLATE_TEST_CASE("indexed heap update erase", "[indexed_heap]",
+                       indexed_dary_heap<int>, indexed_pairing_heap<int>) {
+        TestType heap(6);
+        for (index_t i = 0; i < 6; i++) {
+            heap.push(i, 10 + (int) i);
+        }
+        heap.update(4, 1);
+        REQUIRE(heap.top() == 4);
+        heap.update(4, 20);
+        REQUIRE(heap.top() == 0);
+        heap.update(0, 30);
+        REQUIRE(heap.top() == 1);
+        heap.erase(1);
+        REQUIRE(!heap.contains(1));
+        REQUIRE(heap.size() == 5);
+        REQUIRE(heap.top() == 2);
+        heap.erase(3);
+
+        vector<index_t> keys;
+        while (!heap.empty()) {
+            keys.push_back(heap.top());
+            heap.pop();
+        }
+        vector<index_t> keys_ref{2, 5, 4, 0};
+        REQUIRE(keys == keys_ref);
+    }
+
+    TEMPLATE_TEST_CASE("indexed heap random operations", "[indexed_heap]",
+                       indexed_dary_heap<double>, indexed_pairing_heap<double>) {
+        index_t num_keys = 200;
+        TestType heap(num_keys);
+        // reference: ordered set of (value, key)
+        map<pair<double, index_t>, bool> ref;
+        vector<double> values(num_keys);
+        vector<bool> in_heap(num_keys, false);
+
+        std::mt19937 gen(42);
+        std::uniform_int_distribution<index_t> dkey(0, num_keys - 1);
+        std::uniform_int_distribution<int> dop(0, 3);
+        std::uniform_int_distribution<int> dvalue(0, 50); // many ties
+
+        for (index_t i = 0; i < 5000; i++) {
+            auto key = dkey(gen);
+            double value = dvalue(gen);
+            switch (dop(gen)) {
+                case 0:
+                case 1:
+                    if (!in_heap[key]) {
+                        heap.push(key, value);
+                        ref[{value, key}] = true;
+                        in_heap[key] = true;
+                        values[key] = value;
+                    } else {
+                        heap.update(key, value);
+                        ref.erase({values[key], key});
+                        ref[{value, key}] = true;
+                        values[key] = value;
+                    }
+                    break;
+                case 2:
+                    if (!heap.empty()) {
+                        auto top = heap.top();
+                        heap.pop();
+                        ref.erase(ref.begin());
+                        in_heap[top] = false;
+                    }
+                    break;
+                case 3:
+                    if (in_heap[key]) {
+                        heap.erase(key);
+                        ref.erase({values[key], key});
+                        in_heap[key] = false;
+                    }
+                    break;
+            }
+            REQUIRE(heap.size() == ref.size());
+            REQUIRE(heap.contains(key) == in_heap[key]);
+            if (!ref.empty()) {
+                REQUIRE(heap.top() == ref.begin()->first.second);
+                REQUIRE(heap.top_value() == ref.begin()->first.first);
+            }
+        }
+    }
+}
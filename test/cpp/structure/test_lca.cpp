@@ -45,6 +45,8 @@ namespace lca {
         REQUIRE(lca.lca(0, 2) == 7);
         REQUIRE(lca.lca(1, 4) == 7);
         REQUIRE(lca.lca(2, 6) == 6);
+        // at least the Euler tour and the depth of each node
+        REQUIRE(lca.nbytes() >= (15 + 8) * sizeof(std::size_t));
     }
 
     TEST_CASE("lca iterators", "[lca]") {
@@ -65,4 +67,17 @@ namespace lca {
         array_1d<index_t> ref{0, 6, 4, 6};
         REQUIRE((l == ref));
     }
+
+    TEST_CASE("lca from state", "[lca]") {
+        auto t = data.t;
+        lca_fast lca(t);
+        auto lca2 = lca_fast::make_from_state(lca.get_state());
+        REQUIRE(lca2.num_vertices() == lca.num_vertices());
+        REQUIRE(lca2.nbytes() == lca.nbytes());
+        for (index_t i = 0; i < (index_t) num_vertices(t); i++) {
+            for (index_t j = 0; j < (index_t) num_vertices(t); j++) {
+                REQUIRE(lca2.lca(i, j) == lca.lca(i, j));
+            }
+        }
+    }
 }
\ No newline at end of file
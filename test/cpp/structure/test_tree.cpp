@@ -299,6 +299,39 @@ namespace tree {
         REQUIRE((child(1, vertices, g) == ref_child1));
     }
 
+    TEST_CASE("tree children interleaved parents", "[tree]") {
+        hg::tree t(xt::xarray<long>{7, 6, 7, 5, 6, 8, 8, 8, 8});
+
+        vector<vector<index_t>> ref{
+                {},
+                {},
+                {},
+                {},
+                {},
+                {3},
+                {1, 4},
+                {0, 2},
+                {5, 6, 7}
+        };
+
+        for (auto v: hg::vertex_iterator(t)) {
+            REQUIRE(hg::num_children(v, t) == ref[v].size());
+            REQUIRE(vectorEqual(ref[v], t.children(v)));
+            vector<index_t> test;
+            for (auto c: hg::children_iterator(v, t)) {
+                test.push_back(c);
+            }
+            REQUIRE(vectorEqual(ref[v], test));
+        }
+        REQUIRE(t.num_leaves() == 5);
+
+        auto t2 = t;
+        REQUIRE(hg::child(2, 8, t2) == 7);
+
+        hg::tree t3;
+        REQUIRE(t3.num_vertices() == 0);
+    }
+
     TEST_CASE("tree tree topological order iterator", "[tree]") {
         auto tree = data.t;
 
@@ -350,6 +350,34 @@ namespace test_undirected_graph {
             }
         }
 
+        SECTION("set edge keep one extremity") {
+            auto g = data<TestType>::g();
+
+            set_edge(1, 3, 2, g);
+
+            vector<pair<index_t, index_t>> eref{{0, 1},
+                                                {2, 3}, // was {1,2}
+                                                {0, 2}};
+            vector<pair<index_t, index_t>> etest;
+            for (auto e: hg::edge_iterator(g)) {
+                etest.push_back(e);
+            }
+
+            REQUIRE(vectorSame(eref, etest));
+
+            REQUIRE(degree(0, g) == 2);
+            REQUIRE(degree(1, g) == 1);
+            REQUIRE(degree(2, g) == 2);
+            REQUIRE(degree(3, g) == 1);
+
+            set_edge(1, 2, 2, g);
+            REQUIRE(degree(2, g) == 2);
+            REQUIRE(degree(3, g) == 0);
+            set_edge(1, 1, 2, g);
+            REQUIRE(degree(1, g) == 2);
+            REQUIRE(degree(2, g) == 2);
+        }
+
         SECTION("adjacency matrix") {
             TestType g(5);
             add_edge(0, 1, g);
@@ -386,4 +414,140 @@ namespace test_undirected_graph {
             }
         }
     }
-}
\ No newline at end of file
+    TEST_CASE("frozen undirected graph", "[undirected_graph]") {
+        auto g = data<hg::ugraph>::g();
+        add_edge(3, 1, g);
+        auto g_ref = g;
+        REQUIRE(!g.is_frozen());
+        g.freeze();
+        REQUIRE(g.is_frozen());
+
+        vector<index_t> ref_offsets{0, 2, 5, 7, 8};
+        vector<index_t> ref_edges{0, 2, 0, 1, 3, 1, 2, 3};
+        REQUIRE(vectorEqual(g.csr_offsets(), ref_offsets));
+        REQUIRE(vectorEqual(g.csr_edges(), ref_edges));
+
+        REQUIRE(num_vertices(g) == num_vertices(g_ref));
+        REQUIRE(num_edges(g) == num_edges(g_ref));
+        for (auto v: vertex_iterator(g)) {
+            REQUIRE(degree(v, g) == degree(v, g_ref));
+            vector<index_t> adj;
+            vector<index_t> adj_ref;
+            for (auto av: adjacent_vertex_iterator(v, g)) {
+                adj.push_back(av);
+            }
+            for (auto av: adjacent_vertex_iterator(v, g_ref)) {
+                adj_ref.push_back(av);
+            }
+            REQUIRE(vectorEqual(adj, adj_ref));
+            vector<index_t> oe;
+            vector<index_t> oe_ref;
+            for (auto e: out_edge_iterator(v, g)) {
+                REQUIRE(source(e, g) == v);
+                oe.push_back(index(e, g));
+            }
+            for (auto e: out_edge_iterator(v, g_ref)) {
+                oe_ref.push_back(index(e, g_ref));
+            }
+            REQUIRE(vectorEqual(oe, oe_ref));
+        }
+
+        REQUIRE_THROWS(add_edge(0, 3, g));
+        REQUIRE_THROWS(add_vertex(g));
+        REQUIRE_THROWS(remove_edge(0, g));
+
+        auto g2 = g;
+        REQUIRE(g2.is_frozen());
+        REQUIRE(degree(1, g2) == 3);
+    }
+    TEST_CASE("undirected graph add_edges preallocated", "[undirected_graph]") {
+        hg::undirected_graph<hg::hash_setS> g1(4);
+        hg::ugraph g2(4);
+        add_edge(0, 1, g2);
+        array_1d<index_t> sources{0, 1, 3, 2};
+        array_1d<index_t> targets{2, 2, 1, 2};
+        add_edges(sources, targets, g1);
+        add_edges(sources, targets, g2);
+        REQUIRE(num_edges(g1) == 4);
+        REQUIRE(num_edges(g2) == 5);
+        REQUIRE(degree(2, g1) == 3);
+        REQUIRE(degree(2, g2) == 3);
+        REQUIRE(degree(1, g2) == 3);
+        REQUIRE((edge_from_index(4, g2) == ugraph::edge_descriptor(2, 2, 4)));
+    }
+
+    TEST_CASE("undirected graph add_edges small batches", "[undirected_graph]") {
+        index_t num_v = 1000;
+        hg::undirected_graph<hg::hash_setS> g1(num_v);
+        hg::ugraph g2(num_v);
+        hg::ugraph ref(num_v);
+        for (index_t i = 0; i < 2 * num_v; i++) {
+            // batches of 3 edges with a self loop and a repeated extremity
+            array_1d<index_t> sources{i % num_v, (7 * i) % num_v, (3 * i + 1) % num_v};
+            array_1d<index_t> targets{(i + 1) % num_v, (7 * i) % num_v, (i + 1) % num_v};
+            add_edges(sources, targets, g1);
+            add_edges(sources, targets, g2);
+            for (index_t j = 0; j < 3; j++) {
+                add_edge(sources(j), targets(j), ref);
+            }
+        }
+        REQUIRE(num_edges(g1) == num_edges(ref));
+        REQUIRE(num_edges(g2) == num_edges(ref));
+        for (index_t i = 0; i < (index_t) num_edges(ref); i++) {
+            REQUIRE((edge_from_index(i, g1) == edge_from_index(i, ref)));
+            REQUIRE((edge_from_index(i, g2) == edge_from_index(i, ref)));
+        }
+        for (index_t v = 0; v < num_v; v++) {
+            REQUIRE(degree(v, g1) == degree(v, ref));
+            REQUIRE(degree(v, g2) == degree(v, ref));
+        }
+    }
+
+    TEST_CASE("undirected graph csr conversions", "[undirected_graph]") {
+        // arcs: (0, 1) twice, (1, 0), (2, 1), (3, 3), (3, 0)
+        array_1d<index_t> sources{0, 2, 1, 3, 0, 3};
+        array_1d<index_t> targets{1, 1, 0, 3, 1, 0};
+        array_1d<double> weights{1, 5, 3, 7, 2, 4};
+
+        auto res_max = arcs_2_undirected_graph(5, sources, targets, weights, arc_symmetrization::max);
+        auto &g_max = res_max.first;
+        REQUIRE(num_vertices(g_max) == 5);
+        REQUIRE(num_edges(g_max) == 4);
+        vector<index_t> ref_sources_max{0, 0, 1, 3};
+        vector<index_t> ref_targets_max{1, 3, 2, 3};
+        array_1d<double> ref_weights_max{3, 4, 5, 7};
+        for (index_t i = 0; i < 4; i++) {
+            REQUIRE(source(edge_from_index(i, g_max), g_max) == ref_sources_max[i]);
+            REQUIRE(target(edge_from_index(i, g_max), g_max) == ref_targets_max[i]);
+        }
+        REQUIRE((res_max.second == ref_weights_max));
+
+        auto res_min = arcs_2_undirected_graph(5, sources, targets, weights, arc_symmetrization::min);
+        auto &g_min = res_min.first;
+        REQUIRE(num_edges(g_min) == 2);
+        REQUIRE((edge_from_index(0, g_min) == ugraph::edge_descriptor(0, 1, 0)));
+        REQUIRE((edge_from_index(1, g_min) == ugraph::edge_descriptor(3, 3, 1)));
+        array_1d<double> ref_weights_min{1, 7};
+        REQUIRE((res_min.second == ref_weights_min));
+
+        auto res_unweighted = arcs_2_undirected_graph(5, sources, targets, array_1d<double>::from_shape({0}));
+        REQUIRE(num_edges(res_unweighted.first) == 4);
+        REQUIRE(res_unweighted.second.size() == 0);
+
+        auto csr = undirected_graph_2_csr(g_max, res_max.second);
+        array_1d<index_t> ref_indptr{0, 2, 4, 5, 7, 7};
+        array_1d<index_t> ref_indices{1, 3, 0, 2, 1, 0, 3};
+        array_1d<double> ref_data{3, 4, 3, 5, 5, 4, 7};
+        REQUIRE((std::get<0>(csr) == ref_indptr));
+        REQUIRE((std::get<1>(csr) == ref_indices));
+        REQUIRE((std::get<2>(csr) == ref_data));
+
+        auto res_csr = csr_2_undirected_graph(std::get<0>(csr), std::get<1>(csr), std::get<2>(csr));
+        auto &g_csr = res_csr.first;
+        REQUIRE(num_edges(g_csr) == num_edges(g_max));
+        for (index_t i = 0; i < 4; i++) {
+            REQUIRE((edge_from_index(i, g_csr) == edge_from_index(i, g_max)));
+        }
+        REQUIRE((res_csr.second == res_max.second));
+    }
+}
@@ -0,0 +1,78 @@
+/***************************************************************************
+* Copyright ESIEE Paris (2018)                                             *
+*                                                                          *
+* Contributor(s) : Benjamin Perret                                         *
+*                                                                          *
+* Distributed under the terms of the CECILL-B License.                     *
+*                                                                          *
+* The full license is in the file LICENSE, distributed with this software. *
+****************************************************************************/
+
+#include "test_utils.hpp"
+#include "higra/sorting.hpp"
+#include <random>
+
+namespace test_sorting {
+
+    using namespace hg;
+    using namespace std;
+
+    template<typename T>
+    void check_stable_arg_sort(const array_1d<T> &values) {
+        array_1d<index_t> ref_increasing = xt::arange<index_t>(values.size());
+        std::stable_sort(ref_increasing.begin(), ref_increasing.end(),
+                         [&values](index_t i, index_t j) { return values(i) < values(j); });
+        REQUIRE((stable_arg_sort(values) == ref_increasing));
+
+        array_1d<index_t> ref_decreasing = xt::arange<index_t>(values.size());
+        std::stable_sort(ref_decreasing.begin(), ref_decreasing.end(),
+                         [&values](index_t i, index_t j) { return values(i) > values(j); });
+        REQUIRE((stable_arg_sort(values, true) == ref_decreasing));
+    }
+
+    template<typename T>
+    void check_stable_arg_sort_random(T min_value, T max_value) {
+        std::mt19937 gen(42);
+        std::uniform_int_distribution<int64_t> dis((int64_t) min_value, (int64_t) max_value);
+        for (auto size: {10, 1000, 100000}) {
+            array_1d<T> values = array_1d<T>::from_shape({(size_t) size});
+            for (auto &v: values) {
+                v = (T) dis(gen);
+            }
+            check_stable_arg_sort(values);
+        }
+    }
+
+    TEST_CASE("stable arg sort integral types", "[sorting]") {
+        check_stable_arg_sort_random<uint8_t>(0, 255);
+        check_stable_arg_sort_random<int8_t>(-128, 127);
+        check_stable_arg_sort_random<uint16_t>(0, 65535);
+        check_stable_arg_sort_random<int16_t>(-32768, 32767);
+        check_stable_arg_sort_random<int32_t>(-1000000, 1000000);
+        check_stable_arg_sort_random<uint32_t>(0, 4000000000u);
+        check_stable_arg_sort_random<int64_t>(-10000000000ll, 10000000000ll);
+        check_stable_arg_sort_random<uint64_t>(0, 10);
+    }
+
+    TEST_CASE("stable arg sort floating point types", "[sorting]") {
+        std::mt19937 gen(42);
+        std::uniform_int_distribution<int> dis(-50, 50);
+        array_1d<float> values_f = array_1d<float>::from_shape({10000});
+        array_1d<double> values_d = array_1d<double>::from_shape({10000});
+        for (index_t i = 0; i < (index_t) values_f.size(); i++) {
+            auto v = dis(gen);
+            // mix +0 and -0 and use both tiny and large magnitudes
+            values_f(i) = (v == 0) ? ((i % 2) ? -0.0f : 0.0f) : v * ((v % 3) ? 1e-30f : 1e30f) / 7;
+            values_d(i) = values_f(i);
+        }
+        check_stable_arg_sort(values_f);
+        check_stable_arg_sort(values_d);
+    }
+
+    TEST_CASE("stable arg sort on views", "[sorting]") {
+        array_1d<int> values{5, 1, 4, 1, 5, 9, 2, 6, 5, 3};
+        auto view = xt::view(values, xt::range(2, 10));
+        array_1d<index_t> ref{1, 4, 7, 0, 2, 6, 5, 3};
+        REQUIRE((stable_arg_sort(view) == ref));
+    }
+}
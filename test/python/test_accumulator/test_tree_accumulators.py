@@ -132,5 +132,40 @@ class TestTreeAccumulators(unittest.TestCase):
         self.assertTrue(np.allclose(ref2, output2))
 
 
+    def test_tree_accumulator_parallel_levels(self):
+        g = hg.get_4_adjacency_graph((200, 200))
+        tree, altitudes = hg.bpt_canonical(g, np.random.rand(g.num_edges()))
+        leaf_data = np.random.rand(tree.num_leaves(), 3)
+        node_data = np.random.rand(tree.num_vertices())
+        condition = np.random.rand(tree.num_vertices()) > 0.5
+
+        def compute():
+            return (hg.accumulate_parallel(tree, node_data, hg.Accumulators.sum),
+                    hg.accumulate_sequential(tree, leaf_data, hg.Accumulators.sum),
+                    hg.accumulate_sequential(tree, leaf_data[:, 0], hg.Accumulators.mean),
+                    hg.accumulate_and_max_sequential(tree, node_data, leaf_data[:, 1], hg.Accumulators.sum),
+                    hg.propagate_parallel(tree, node_data, condition),
+                    hg.propagate_sequential(tree, node_data, condition),
+                    hg.propagate_sequential_and_accumulate(tree, node_data, hg.Accumulators.max))
+
+        save_threshold = hg.get_tree_accumulator_parallel_threshold()
+        save_num_threads = hg.get_num_threads()
+
+        self.assertTrue(save_threshold < 0)
+        hg.set_tree_accumulator_parallel_threshold(-1)
+        ref = compute()
+
+        hg.set_num_threads(4)
+        hg.set_tree_accumulator_parallel_threshold(0)
+        self.assertTrue(hg.get_tree_accumulator_parallel_threshold() == 0)
+        res = compute()
+
+        hg.set_tree_accumulator_parallel_threshold(save_threshold)
+        hg.set_num_threads(save_num_threads)
+
+        for r1, r2 in zip(ref, res):
+            self.assertTrue(np.all(r1 == r2))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -171,6 +171,54 @@ class TestAlgorithmGraphCore(unittest.TestCase):
         with self.assertRaises(ValueError):
             hg.adjacency_matrix_2_undirected_graph(ref_adj_mat, non_edge_value=-1)
 
+    def test_arcs_2_undirected_graph(self):
+        sources = np.asarray((0, 2, 1, 3, 0, 3))
+        targets = np.asarray((1, 1, 0, 3, 1, 0))
+        weights = np.asarray((1, 5, 3, 7, 2, 4), dtype=np.float64)
+
+        graph, edge_weights = hg.arcs_2_undirected_graph(5, sources, targets, weights)
+        self.assertTrue(graph.num_vertices() == 5)
+        s, t = graph.edge_list()
+        self.assertTrue(np.all(s == (0, 0, 1, 3)))
+        self.assertTrue(np.all(t == (1, 3, 2, 3)))
+        self.assertTrue(np.all(edge_weights == (3, 4, 5, 7)))
+
+        graph, edge_weights = hg.arcs_2_undirected_graph(5, sources, targets, weights, symmetrization="min")
+        s, t = graph.edge_list()
+        self.assertTrue(np.all(s == (0, 3)))
+        self.assertTrue(np.all(t == (1, 3)))
+        self.assertTrue(np.all(edge_weights == (1, 7)))
+
+        graph, edge_weights = hg.arcs_2_undirected_graph(5, sources, targets)
+        self.assertTrue(graph.num_edges() == 4)
+        self.assertTrue(edge_weights is None)
+
+        with self.assertRaises(RuntimeError):
+            hg.arcs_2_undirected_graph(5, sources, targets, weights, symmetrization="sum")
+
+    def test_csr_2_undirected_graph(self):
+        A = sp.csr_matrix(np.asarray(((0, 1, 0, 2),
+                                      (1, 0, 3, 0),
+                                      (0, 4, 0, 0),
+                                      (0, 0, 0, 0)), dtype=np.float32))
+        graph, edge_weights = hg.csr_2_undirected_graph(A.indptr, A.indices, A.data)
+        s, t = graph.edge_list()
+        self.assertTrue(np.all(s == (0, 0, 1)))
+        self.assertTrue(np.all(t == (1, 3, 2)))
+        self.assertTrue(edge_weights.dtype == np.float32)
+        self.assertTrue(np.all(edge_weights == (1, 2, 4)))
+
+        graph, edge_weights = hg.csr_2_undirected_graph(A.indptr, A.indices, A.data, symmetrization="min")
+        s, t = graph.edge_list()
+        self.assertTrue(np.all(s == (0, 1)))
+        self.assertTrue(np.all(t == (1, 2)))
+        self.assertTrue(np.all(edge_weights == (1, 3)))
+
+        adj_mat = hg.undirected_graph_2_adjacency_matrix(graph, edge_weights)
+        self.assertTrue(np.all(adj_mat.indptr == (0, 1, 3, 4, 4)))
+        self.assertTrue(np.all(adj_mat.indices == (1, 0, 2, 1)))
+        self.assertTrue(np.all(adj_mat.data == (1, 1, 3, 3)))
+
     def ultrametric_open(self):
         graph = hg.get_4_adjacency_graph((3, 3))
         edge_weights = np.asarray((2, 3, 9, 5, 10, 1, 5, 8, 2, 2, 4, 3), dtype=np.int32)
@@ -201,6 +249,16 @@ class TestAlgorithmGraphCore(unittest.TestCase):
 
         self.assertTrue(np.all(mst_edge_map == (1, 0, 3, 4, 2)))
 
+    def test_minimum_spanning_tree_filter_kruskal(self):
+        graph = hg.get_4_adjacency_graph((60, 70))
+        edge_weights = np.random.randint(0, 10, graph.num_edges())
+
+        ref_mst = hg.minimum_spanning_tree(graph, edge_weights)
+        mst = hg.minimum_spanning_tree(graph, edge_weights, algorithm="filter_kruskal")
+
+        self.assertTrue(np.all(hg.CptMinimumSpanningTree.get_edge_map(mst) ==
+                               hg.CptMinimumSpanningTree.get_edge_map(ref_mst)))
+
     def test_minimum_spanning_forest(self):
         graph = hg.UndirectedGraph(6)
         graph.add_edges((0, 0, 1, 3, 3, 4), (1, 2, 2, 4, 5, 5))
@@ -282,6 +340,30 @@ class TestAlgorithmGraphCore(unittest.TestCase):
 
         self.assertTrue(TestAlgorithmGraphCore.graph_equal(g, ew, g_ref, w_ref))
 
+    def test_make_graph_from_points_mst(self):
+        X = np.asarray(((0, 0), (0, 1), (1, 0), (0, 3), (0, 4), (1, 3), (2, 3)))
+        g, ew = hg.make_graph_from_points(X, graph_type="mst")
+
+        g_ref = hg.UndirectedGraph(7)
+        g_ref.add_edges((0, 0, 1, 3, 3, 5), (1, 2, 3, 4, 5, 6))
+        w_ref = (1, 1, 2, 1, 1, 1)
+
+        self.assertTrue(TestAlgorithmGraphCore.graph_equal(g, ew, g_ref, w_ref))
+
+    def test_make_graph_from_points_mst_random(self):
+        from scipy.spatial.distance import pdist, squareform
+        from scipy.sparse.csgraph import minimum_spanning_tree
+
+        np.random.seed(42)
+        for dim in (1, 2, 3, 6):
+            X = np.random.rand(200, dim)
+            g, ew = hg.make_graph_from_points(X, graph_type="mst")
+            self.assertTrue(g.num_vertices() == 200)
+            self.assertTrue(g.num_edges() == 199)
+
+            ref = minimum_spanning_tree(squareform(pdist(X))).sum()
+            self.assertTrue(np.isclose(np.sum(ew), ref))
+
 
 if __name__ == '__main__':
     unittest.main()
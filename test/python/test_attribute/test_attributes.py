@@ -668,5 +668,58 @@ class TestAttributes(unittest.TestCase):
                0.1481, 0.2222, 0.16, 0.2222, 0.2756)
         self.assertTrue(np.allclose(res,ref,atol=0.0001))
 
+    def test_compute_attributes(self):
+        tree, altitudes = TestAttributes.get_test_tree()
+        vertex_weights = np.asarray(((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8)),
+                                    dtype=np.float64)
+        names = ["area", "volume", "height", "depth", "contour_length", "compactness", "mean_vertex_weights"]
+
+        res = hg.compute_attributes(tree, names, altitudes=altitudes, vertex_weights=vertex_weights)
+
+        self.assertTrue(list(res.keys()) == names)
+        self.assertTrue(np.allclose(res["area"], hg.attribute_area(tree)))
+        self.assertTrue(np.allclose(res["volume"], hg.attribute_volume(tree, altitudes)))
+        self.assertTrue(np.allclose(res["height"], hg.attribute_height(tree, altitudes)))
+        self.assertTrue(np.all(res["depth"] == hg.attribute_depth(tree)))
+        self.assertTrue(np.allclose(res["contour_length"], hg.attribute_contour_length(tree)))
+        self.assertTrue(np.allclose(res["compactness"], hg.attribute_compactness(tree)))
+        self.assertTrue(np.allclose(res["mean_vertex_weights"],
+                                    hg.attribute_mean_vertex_weights(tree, vertex_weights=vertex_weights)))
+
+    def test_compute_attributes_image(self):
+        graph = hg.get_4_adjacency_graph((4, 4))
+        image = np.asarray(((0, 1, 4, 4),
+                            (7, 5, 6, 8),
+                            (2, 3, 4, 1),
+                            (9, 8, 6, 7)), dtype=np.float64)
+        tree, altitudes = hg.component_tree_max_tree(graph, image)
+
+        res = hg.compute_attributes(tree, ("mean_vertex_weights", "height"), altitudes=altitudes,
+                                    vertex_weights=image)
+        self.assertTrue(len(res) == 2)
+        self.assertTrue(res["mean_vertex_weights"].shape == (tree.num_vertices(),))
+        self.assertTrue(np.allclose(res["mean_vertex_weights"],
+                                    hg.attribute_mean_vertex_weights(tree, vertex_weights=image)))
+        self.assertTrue(np.all(res["height"] == hg.attribute_height(tree, altitudes)))
+
+        res = hg.compute_attributes(tree, "area")
+        self.assertTrue(np.allclose(res["area"], hg.attribute_area(tree)))
+
+    def test_compute_attributes_errors(self):
+        tree, altitudes = TestAttributes.get_test_tree()
+
+        with self.assertRaises(ValueError):
+            hg.compute_attributes(tree, ["area", "perimeter"])
+
+        with self.assertRaises(ValueError):
+            hg.compute_attributes(tree, ["volume"])
+
+        with self.assertRaises(ValueError):
+            hg.compute_attributes(tree, ["mean_vertex_weights"])
+
+        with self.assertRaises(ValueError):
+            hg.compute_attributes(hg.Tree((5, 5, 6, 6, 6, 7, 7, 7)), ["contour_length"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -96,6 +96,27 @@ def concept_consumer4(obj, ec1):
     return ec1
 
 
+
+class CptCounting(CptA):
+    _name = "CCounting"
+    _description = "Concept A counting its constructions."
+    _data_elements = {"caA": ("canonical element", None),
+                      "ea1": ("element ca 1", "ea1")}
+    _canonical_data_element = "caA"
+    num_constructs = 0
+
+    @classmethod
+    def construct(cls, canonical_element, strict=True, data_cache=None):
+        CptCounting.num_constructs += 1
+        return super(CptCounting, cls).construct(canonical_element, strict, data_cache)
+
+
+# concept resolution skipped when all arguments are given
+@hg.argument_helper(CptCounting)
+def concept_consumer5(obj, ea1=None):
+    return ea1
+
+
 class TestConcept(unittest.TestCase):
 
     def test_construct(self):
@@ -248,6 +269,33 @@ class TestConcept(unittest.TestCase):
         # call from free variable
         self.assertTrue(concept_consumer4(obj=o4, ec1=o5) == o5)
 
+    def test_concept_consumer_explicit_arguments(self):
+        o1 = Dummy(1)
+        o2 = Dummy(2)
+        o3 = Dummy(3)
+
+        CptA.link(o1, o2)
+        num_constructs = CptCounting.num_constructs
+
+        self.assertTrue(concept_consumer5(o1) == o2)
+        self.assertTrue(CptCounting.num_constructs == num_constructs + 1)
+
+        # no concept resolution when every argument is given
+        self.assertTrue(concept_consumer5(o1, o3) == o3)
+        self.assertTrue(concept_consumer5(o1, ea1=o3) == o3)
+        self.assertTrue(CptCounting.num_constructs == num_constructs + 1)
+
+        # None arguments are resolved
+        self.assertTrue(concept_consumer5(o1, None) == o2)
+        self.assertTrue(CptCounting.num_constructs == num_constructs + 2)
+
+        hg.clear_all_attributes()
+
+    def test_data_element_names(self):
+        self.assertTrue(CptA.data_element_names() == {"caA", "ea1"})
+        self.assertTrue(CptB.data_element_names() == {"caB", "caA", "eb2", "ea1"})
+        self.assertTrue(hg.CptBinaryHierarchy.data_element_names() == {"tree", "leaf_graph", "mst"})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,10 @@
 ############################################################################
 
 import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
 import higra as hg
 
 
@@ -84,6 +88,29 @@ def default_attr(o, v=1):
     return 4
 
 
+class Sized:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+
+computed_sized = []
+
+
+@hg.auto_cache
+def sized_result(obj, nbytes):
+    computed_sized.append(nbytes)
+    return Sized(nbytes)
+
+
+computed_disk = []
+
+
+@hg.auto_cache
+def disk_cached_area(tree, scale=1):
+    computed_disk.append(scale)
+    return hg.attribute_area(tree, no_cache=True) * scale
+
+
 class TestDataCache(unittest.TestCase):
 
     def test_auto_cache_and_force_recompute(self):
@@ -246,5 +273,141 @@ class TestDataCache(unittest.TestCase):
         self.assertRaises(Exception, default_attr, obj1, 1, force_recompute=True)
 
 
+    def test_auto_cache_limits(self):
+        obj1 = Dummy(1)
+        obj2 = Dummy(2)
+        hg.cache_stats(reset=True)
+        try:
+            hg.set_cache_limits(max_bytes=250)
+            sized_result(obj1, 100)
+            sized_result(obj1, 100)
+            sized_result(obj1, 101)
+            sized_result(obj2, 102)
+            stats = hg.cache_stats()
+            self.assertTrue(stats["hits"] == 1)
+            self.assertTrue(stats["misses"] == 3)
+            self.assertTrue(stats["evictions"] == 1)
+            self.assertTrue(stats["entries"] == 2)
+            self.assertTrue(stats["bytes"] == 203)
+
+            # least recently used result has been evicted and is recomputed
+            del computed_sized[:]
+            sized_result(obj1, 101)
+            sized_result(obj1, 100)
+            self.assertTrue(computed_sized == [100])
+
+            hg.set_cache_limits(max_bytes_per_object=150)
+            self.assertTrue(hg.cache_stats()["bytes"] == 100)
+            sized_result(obj2, 50)
+            hg.set_cache_limits(max_bytes_per_function={sized_result: 110})
+            self.assertTrue(hg.cache_stats()["bytes"] == 50)
+            self.assertTrue(hg.get_cache_limits()["max_bytes_per_function"] == {"sized_result": 110})
+
+            # attributes are never evicted
+            hg.set_attribute(obj1, "big", Sized(10 ** 9))
+            hg.set_cache_limits(max_bytes=0)
+            self.assertTrue(hg.get_attribute(obj1, "big").nbytes == 10 ** 9)
+            self.assertTrue(hg.cache_stats()["entries"] == 0)
+            self.assertTrue(hg.cache_stats(reset=True)["evictions"] > 0)
+            self.assertTrue(hg.cache_stats()["evictions"] == 0)
+        finally:
+            hg.set_cache_limits()
+            hg.clear_all_attributes()
+
+    def test_auto_cache_stats_cleared_with_object(self):
+        hg.clear_all_attributes()
+        obj1 = Dummy(1)
+        sized_result(obj1, 10)
+        self.assertTrue(hg.cache_stats()["bytes"] == 10)
+        hg.clear_auto_cache(function=sized_result)
+        self.assertTrue(hg.cache_stats()["bytes"] == 0)
+        sized_result(obj1, 10)
+        del obj1
+        self.assertTrue(hg.cache_stats()["entries"] == 0)
+
+    def test_auto_cache_disk_backend(self):
+        path = tempfile.mkdtemp()
+        try:
+            hg.set_auto_cache_backend("disk", path=path)
+            self.assertTrue(hg.get_auto_cache_backend()["backend"] == "disk")
+            tree1 = hg.Tree((5, 5, 6, 6, 6, 7, 7, 7))
+            tree2 = hg.Tree(np.asarray((5, 5, 6, 6, 6, 7, 7, 7)))
+            ref = np.asarray((1, 1, 1, 1, 1, 2, 3, 5))
+
+            del computed_disk[:]
+            hg.cache_stats(reset=True)
+            area1 = disk_cached_area(tree1)
+            area2 = disk_cached_area(tree2)
+            self.assertTrue(computed_disk == [1])
+            self.assertTrue(hg.cache_stats()["disk_hits"] == 1)
+            self.assertTrue(np.all(area1 == ref))
+            self.assertTrue(np.all(area2 == ref))
+            # loaded arrays are read only memory maps
+            self.assertFalse(area2.flags.writeable)
+
+            self.assertTrue(np.all(disk_cached_area(tree2, 2) == ref * 2))
+            self.assertTrue(computed_disk == [1, 2])
+
+            hg.make_lca_fast(tree1)
+            hg.clear_all_attributes()
+            lca = hg.make_lca_fast(tree2)
+            self.assertTrue(hg.cache_stats()["disk_hits"] == 2)
+            self.assertTrue(lca.lca(0, 1) == 5)
+            self.assertTrue(lca.lca(2, 6) == 6)
+
+            # arguments that cannot be hashed by content are only cached in memory
+            obj = Dummy(1)
+            sized_result(obj, 10)
+            self.assertFalse(os.path.exists(os.path.join(path, "sized_result")))
+
+            hg.clear_auto_cache(function=disk_cached_area, disk=True)
+            self.assertFalse(os.path.exists(os.path.join(path, "disk_cached_area")))
+            self.assertTrue(len(os.listdir(os.path.join(path, "make_lca_fast"))) == 1)
+
+            hg.set_auto_cache_backend("disk", path=path, max_bytes=0)
+            self.assertTrue(len(os.listdir(os.path.join(path, "make_lca_fast"))) == 0)
+
+            self.assertRaises(ValueError, hg.set_auto_cache_backend, "disk")
+            self.assertRaises(ValueError, hg.set_auto_cache_backend, "cloud", path=path)
+        finally:
+            hg.set_auto_cache_backend("memory")
+            hg.clear_all_attributes()
+            shutil.rmtree(path, ignore_errors=True)
+
+    def test_auto_cache_disk_backend_attributes(self):
+        path = tempfile.mkdtemp()
+        try:
+            hg.set_auto_cache_backend("disk", path=path)
+            graph = hg.get_4_adjacency_graph((2, 3))
+            labels = np.asarray(((0, 0, 1),
+                                 (0, 2, 2)))
+            rag = hg.make_region_adjacency_graph_from_labelisation(graph, labels)
+            sources, targets = rag.edge_list()
+            plain_rag = hg.UndirectedGraph(rag.num_vertices())
+            plain_rag.add_edges(sources, targets)
+
+            hg.cache_stats(reset=True)
+            self.assertTrue(np.all(hg.attribute_vertex_area(rag) == (3, 1, 2)))
+            self.assertTrue(np.all(hg.attribute_vertex_area(plain_rag) == (1, 1, 1)))
+
+            # a grid graph and the same edges without shape
+            sources, targets = graph.edge_list()
+            plain_graph = hg.UndirectedGraph(graph.num_vertices())
+            plain_graph.add_edges(sources, targets)
+            self.assertTrue(hg.attribute_vertex_area(plain_graph).shape == (6,))
+            self.assertTrue(hg.attribute_vertex_area(graph).shape == (2, 3))
+            self.assertTrue(hg.cache_stats()["disk_hits"] == 0)
+
+            # same content and same attributes
+            hg.clear_all_attributes()
+            rag = hg.make_region_adjacency_graph_from_labelisation(hg.get_4_adjacency_graph((2, 3)), labels)
+            self.assertTrue(np.all(hg.attribute_vertex_area(rag) == (3, 1, 2)))
+            self.assertTrue(hg.cache_stats()["disk_hits"] > 0)
+        finally:
+            hg.set_auto_cache_backend("memory")
+            hg.clear_all_attributes()
+            shutil.rmtree(path, ignore_errors=True)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -176,3 +176,37 @@ class TestHGUtils(unittest.TestCase):
             res = hg.reconstruct_leaf_data(tree, a)
             self.assertTrue(a.dtype == res.dtype)
 
+
+    def test_index_dtype(self):
+        self.assertTrue(hg.index_dtype() in (np.int32, np.int64))
+
+        tree = hg.Tree((5, 5, 6, 6, 6, 7, 7, 7))
+        self.assertTrue(tree.parents().dtype == hg.index_dtype())
+
+        g = hg.get_4_adjacency_graph((3, 3))
+        sources, targets = g.edge_list()
+        self.assertTrue(sources.dtype == hg.index_dtype())
+        self.assertTrue(targets.dtype == hg.index_dtype())
+
+        tree, altitudes = hg.bpt_canonical(g, np.arange(g.num_edges()))
+        mst = hg.CptBinaryHierarchy.get_mst(tree)
+        self.assertTrue(hg.CptMinimumSpanningTree.get_edge_map(mst).dtype == hg.index_dtype())
+
+    def test_num_threads(self):
+        save = hg.get_num_threads()
+
+        hg.set_num_threads(3)
+        self.assertTrue(hg.get_num_threads() == 3)
+
+        g = hg.get_4_adjacency_graph((100, 100))
+        edge_weights = np.random.rand(g.num_edges())
+        tree3, altitudes3 = hg.bpt_canonical(g, edge_weights)
+        hg.set_num_threads(1)
+        tree1, altitudes1 = hg.bpt_canonical(g, edge_weights)
+        self.assertTrue(np.all(tree3.parents() == tree1.parents()))
+        self.assertTrue(np.all(altitudes3 == altitudes1))
+
+        hg.set_num_threads(0)
+        self.assertTrue(hg.get_num_threads() >= 1)
+
+        hg.set_num_threads(save)
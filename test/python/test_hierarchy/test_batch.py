@@ -0,0 +1,68 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import unittest
+import numpy as np
+import higra as hg
+
+
+class TestBatch(unittest.TestCase):
+
+    def check_batch(self, function, graph, edge_weights, n_jobs):
+        trees, altitudes = hg.batch(function, graph, edge_weights, n_jobs=n_jobs)
+
+        self.assertTrue(len(trees) == edge_weights.shape[0])
+        self.assertTrue(len(altitudes) == edge_weights.shape[0])
+        for w, tree, alt in zip(edge_weights, trees, altitudes):
+            ref_tree, ref_altitudes = function(graph, w)
+            self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+            self.assertTrue(np.all(alt == ref_altitudes))
+            self.assertTrue(hg.CptHierarchy.get_leaf_graph(tree) is graph)
+
+    def test_batch_bpt_canonical(self):
+        graph = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.randint(0, 10, (7, graph.num_edges()))
+
+        self.check_batch(hg.bpt_canonical, graph, edge_weights, 3)
+
+        trees, _ = hg.batch(hg.bpt_canonical, graph, edge_weights)
+        mst = hg.CptBinaryHierarchy.get_mst(trees[0])
+        self.assertTrue(mst.num_edges() == graph.num_vertices() - 1)
+
+    def test_batch_quasi_flat_zone_hierarchy(self):
+        graph = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.randint(0, 5, (5, graph.num_edges())).astype(np.float32)
+
+        self.check_batch(hg.quasi_flat_zone_hierarchy, graph, edge_weights, 2)
+
+    def test_batch_watershed_hierarchies(self):
+        graph = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.randint(0, 20, (6, graph.num_edges())).astype(np.float64)
+
+        self.check_batch(hg.watershed_hierarchy_by_area, graph, edge_weights, 4)
+        self.check_batch(hg.watershed_hierarchy_by_volume, graph, edge_weights, 4)
+        self.check_batch(hg.watershed_hierarchy_by_dynamics, graph, edge_weights, 4)
+
+    def test_batch_generic_function(self):
+        graph = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.rand(4, graph.num_edges())
+
+        self.check_batch(hg.binary_partition_tree_average_linkage, graph, edge_weights, 2)
+
+    def test_batch_wrong_shape(self):
+        graph = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.rand(4, graph.num_edges() + 1)
+
+        with self.assertRaises(ValueError):
+            hg.batch(hg.bpt_canonical, graph, edge_weights)
+
+
+if __name__ == '__main__':
+    unittest.main()
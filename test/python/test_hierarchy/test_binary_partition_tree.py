@@ -67,6 +67,42 @@ class TestBinaryPartitionTree(unittest.TestCase):
         self.assertTrue(np.all(expected_parents == tree.parents()))
         self.assertTrue(np.all(expected_altitudes == altitudes))
 
+    def test_binary_partition_tree_custom_linkage_batch(self):
+        graph = hg.get_4_adjacency_graph((3, 3))
+        edge_values = np.asarray((1, 7, 2, 10, 16, 3, 11, 4, 12, 14, 5, 6), np.float32)
+        edge_weights = np.asarray((7, 1, 7, 3, 2, 8, 2, 2, 2, 1, 5, 9), np.float32)
+
+        def weighting_function_average_linkage(graph, fusion_edge_index, new_region, merged_region1, merged_region2,
+                                               neighbour_vertex, num_edges, first_edge_index, second_edge_index):
+            self.assertTrue(neighbour_vertex.size == first_edge_index.size)
+            self.assertTrue(np.all(second_edge_index[num_edges == 1] == -1))
+            new_weight = edge_weights[first_edge_index]
+            new_value = edge_values[first_edge_index] * new_weight
+            two_edges = num_edges > 1
+            second_edges = second_edge_index[two_edges]
+            new_weight[two_edges] += edge_weights[second_edges]
+            new_value[two_edges] += edge_values[second_edges] * edge_weights[second_edges]
+            new_value /= new_weight
+
+            edge_values[first_edge_index] = new_value
+            edge_weights[first_edge_index] = new_weight
+            return new_value
+
+        tree, altitudes = hg.binary_partition_tree(graph, weighting_function_average_linkage, edge_values,
+                                                   batch=True)
+
+        expected_parents = np.asarray((9, 9, 10, 11, 11, 12, 13, 13, 14, 10, 15, 12, 15, 14, 16, 16, 16), np.uint32)
+        expected_altitudes = np.asarray((0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 11.5, 12), np.float32)
+
+        self.assertTrue(np.all(expected_parents == tree.parents()))
+        self.assertTrue(np.all(expected_altitudes == altitudes))
+
+        def bad_weighting_function(*args):
+            return np.zeros((1000,))
+
+        with self.assertRaises(Exception):
+            hg.binary_partition_tree(graph, bad_weighting_function, edge_values, batch=True)
+
     def test_binary_partition_tree_average_linkage2(self):
         graph = hg.UndirectedGraph(10)
         graph.add_edges((0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4, 5, 5, 7, 7),
@@ -169,5 +205,34 @@ class TestBinaryPartitionTree(unittest.TestCase):
         self.assertTrue(np.allclose(altitudes, alt_ref))
 
 
+    def test_binary_partition_tree_nn_chain(self):
+        np.random.seed(1)
+        graph = hg.get_4_adjacency_graph((20, 20))
+        edge_weights = np.random.rand(graph.num_edges())
+        edge_weight_weights = np.random.randint(1, 10, graph.num_edges()).astype(np.float64)
+
+        tree1, altitudes1 = hg.binary_partition_tree_complete_linkage(graph, edge_weights)
+        tree2, altitudes2 = hg.binary_partition_tree_complete_linkage(graph, edge_weights, algorithm="nn_chain")
+        self.assertTrue(np.all(tree1.parents() == tree2.parents()))
+        self.assertTrue(np.all(altitudes1 == altitudes2))
+
+        tree1, altitudes1 = hg.binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights)
+        tree2, altitudes2 = hg.binary_partition_tree_average_linkage(graph, edge_weights, edge_weight_weights,
+                                                                     algorithm="nn_chain")
+        self.assertTrue(np.all(tree1.parents() == tree2.parents()))
+        self.assertTrue(np.allclose(altitudes1, altitudes2))
+
+        complete_graph = hg.UndirectedGraph(30)
+        complete_graph.add_edges(*np.triu_indices(30, 1))
+        vertex_centroids = np.random.rand(30, 2)
+        tree1, altitudes1 = hg.binary_partition_tree_ward_linkage(complete_graph, vertex_centroids)
+        tree2, altitudes2 = hg.binary_partition_tree_ward_linkage(complete_graph, vertex_centroids,
+                                                                  algorithm="nn_chain")
+        self.assertTrue(np.all(tree1.parents() == tree2.parents()))
+        self.assertTrue(np.allclose(altitudes1, altitudes2))
+
+        with self.assertRaises(RuntimeError):
+            hg.binary_partition_tree_complete_linkage(graph, edge_weights, algorithm="foo")
+
 if __name__ == '__main__':
     unittest.main()
@@ -84,6 +84,39 @@ class TestConstrainedConnectivityHierarchy(unittest.TestCase):
 
         self.assertTrue(np.all(filtered_weights == expected_filtered_weights))
 
+    def test_component_tree_parallel(self):
+        np.random.seed(1)
+        graph = hg.get_4_adjacency_implicit_graph((31, 19))
+        vertex_weights = np.random.randint(0, 6, (31, 19))
+
+        ref_tree, ref_altitudes = hg.component_tree_max_tree(graph, vertex_weights)
+        ref_tree2, ref_altitudes2 = hg.component_tree_min_tree(graph, vertex_weights)
+        for n_jobs in (2, 3, 4, None):
+            tree, altitudes = hg.component_tree_max_tree(graph, vertex_weights, n_jobs=n_jobs)
+            self.assertTrue(np.all(ref_tree.parents() == tree.parents()))
+            self.assertTrue(np.all(ref_altitudes == altitudes))
+
+            tree2, altitudes2 = hg.component_tree_min_tree(graph, vertex_weights, n_jobs=n_jobs)
+            self.assertTrue(np.all(ref_tree2.parents() == tree2.parents()))
+            self.assertTrue(np.all(ref_altitudes2 == altitudes2))
+
+    def test_component_tree_integer_weights(self):
+        np.random.seed(2)
+        graph = hg.get_4_adjacency_implicit_graph((23, 29))
+        for dtype in (np.uint8, np.int8, np.uint16, np.int16):
+            vertex_weights = np.random.randint(0, 10, (23, 29)).astype(dtype)
+
+            ref_tree, ref_altitudes = hg.component_tree_max_tree(graph, vertex_weights.astype(np.float64))
+            tree, altitudes = hg.component_tree_max_tree(graph, vertex_weights)
+            self.assertTrue(altitudes.dtype == dtype)
+            self.assertTrue(np.all(ref_tree.parents() == tree.parents()))
+            self.assertTrue(np.all(ref_altitudes == altitudes))
+
+            ref_tree, ref_altitudes = hg.component_tree_min_tree(graph, vertex_weights.astype(np.float64))
+            tree, altitudes = hg.component_tree_min_tree(graph, vertex_weights)
+            self.assertTrue(np.all(ref_tree.parents() == tree.parents()))
+            self.assertTrue(np.all(ref_altitudes == altitudes))
+
 
 if __name__ == '__main__':
     unittest.main()
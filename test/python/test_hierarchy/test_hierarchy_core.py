@@ -8,6 +8,11 @@
 # The full license is in the file LICENSE, distributed with this software. #
 ############################################################################
 
+import concurrent.futures
+import os
+import sys
+import threading
+import time
 import unittest
 import numpy as np
 import higra as hg
@@ -186,6 +191,82 @@ class TestHierarchyCore(unittest.TestCase):
         self.assertTrue(np.all(new_tree.parents() == exp_parents))
         self.assertTrue(np.all(node_map == exp_node_map))
 
+    def test_bpt_canonical_filter_kruskal(self):
+        graph = hg.get_4_adjacency_graph((100, 120))
+
+        for edge_weights in (np.random.randint(0, 20, graph.num_edges()), np.random.rand(graph.num_edges())):
+            ref_tree, ref_altitudes = hg.bpt_canonical(graph, edge_weights)
+            tree, altitudes = hg.bpt_canonical(graph, edge_weights, algorithm="filter_kruskal")
+
+            self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+            self.assertTrue(np.all(altitudes == ref_altitudes))
+            self.assertTrue(np.all(hg.CptMinimumSpanningTree.get_edge_map(hg.CptBinaryHierarchy.get_mst(tree)) ==
+                                   hg.CptMinimumSpanningTree.get_edge_map(hg.CptBinaryHierarchy.get_mst(ref_tree))))
+
+        with self.assertRaises(RuntimeError):
+            hg.bpt_canonical(graph, edge_weights, algorithm="prim")
+
+    def test_bpt_canonical_releases_gil(self):
+        graph = hg.get_4_adjacency_graph((500, 500))
+        edge_weights = np.random.rand(graph.num_edges())
+
+        started = threading.Event()
+        finished = threading.Event()
+
+        def worker():
+            started.set()
+            hg.cpp._bpt_canonical(graph, edge_weights)
+            finished.set()
+
+        # with a huge switch interval, the worker thread keeps the GIL until it explicitly releases it: the main
+        # thread can only run again before the end of the worker if the c++ call releases the GIL
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1000)
+        try:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            started.wait()
+            worker_finished = finished.is_set()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        thread.join()
+
+        self.assertFalse(worker_finished)
+        self.assertTrue(finished.is_set())
+
+    def test_bpt_canonical_thread_pool(self):
+        graph = hg.get_4_adjacency_graph((50, 50))
+        weights = [np.random.rand(graph.num_edges()) for _ in range(8)]
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda w: hg.bpt_canonical(graph, w), weights))
+
+        for w, (tree, altitudes) in zip(weights, results):
+            ref_tree, ref_altitudes = hg.bpt_canonical(graph, w)
+            self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+            self.assertTrue(np.all(altitudes == ref_altitudes))
+
+    @unittest.skipIf(os.cpu_count() is None or os.cpu_count() < 4, "requires at least 4 cores")
+    def test_bpt_canonical_thread_scaling(self):
+        num_threads = 4
+        graph = hg.get_4_adjacency_graph((256, 256))
+        weights = [np.random.rand(graph.num_edges()) for _ in range(4 * num_threads)]
+
+        def run(w):
+            hg.cpp._bpt_canonical(graph, w)
+
+        start = time.perf_counter()
+        for w in weights:
+            run(w)
+        serial_time = time.perf_counter() - start
+
+        with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+            start = time.perf_counter()
+            list(executor.map(run, weights))
+            parallel_time = time.perf_counter() - start
+
+        self.assertTrue(serial_time / parallel_time > 0.5 * num_threads)
+
 
 if __name__ == '__main__':
     unittest.main()
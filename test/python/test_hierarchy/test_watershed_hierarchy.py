@@ -8,6 +8,7 @@
 # The full license is in the file LICENSE, distributed with this software. #
 ############################################################################
 
+import concurrent.futures
 import unittest
 import numpy as np
 import higra as hg
@@ -99,6 +100,43 @@ class TestWatershedHierarchy(unittest.TestCase):
         self.assertTrue(hg.test_tree_isomorphism(tree, ref_tree))
         self.assertTrue(np.allclose(altitudes, ref_altitudes))
 
+    def test_watershed_hierarchy_by_area_thread_pool(self):
+        # the attribute functor is a python callback called from c++ without the GIL
+        g = hg.get_4_adjacency_graph((20, 20))
+        weights = [np.random.randint(0, 10, g.num_edges()) for _ in range(8)]
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(
+                lambda w: hg.watershed_hierarchy_by_attribute(g, w, lambda t, _: hg.attribute_area(t)), weights))
+
+        for w, (tree, altitudes) in zip(weights, results):
+            ref_tree, ref_altitudes = hg.watershed_hierarchy_by_area(g, w)
+            self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+            self.assertTrue(np.allclose(altitudes, ref_altitudes))
+
+    def test_watershed_hierarchy_native_attributes(self):
+        g = hg.get_4_adjacency_graph((10, 12))
+        edge_weights = np.random.randint(0, 10, g.num_edges())
+        vertex_area = np.random.randint(1, 4, g.num_vertices())
+
+        tree, altitudes = hg.watershed_hierarchy_by_area(g, edge_weights, vertex_area)
+        ref_tree, ref_altitudes = hg.watershed_hierarchy_by_attribute(
+            g, edge_weights, lambda t, _: hg.attribute_area(t, vertex_area))
+        self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+        self.assertTrue(np.allclose(altitudes, ref_altitudes))
+
+        tree, altitudes = hg.watershed_hierarchy_by_volume(g, edge_weights, vertex_area)
+        ref_tree, ref_altitudes = hg.watershed_hierarchy_by_attribute(
+            g, edge_weights, lambda t, a: hg.attribute_volume(t, a, hg.attribute_area(t, vertex_area)))
+        self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+        self.assertTrue(np.allclose(altitudes, ref_altitudes))
+
+        tree, altitudes = hg.watershed_hierarchy_by_dynamics(g, edge_weights)
+        ref_tree, ref_altitudes = hg.watershed_hierarchy_by_attribute(
+            g, edge_weights, lambda t, a: hg.attribute_dynamics(t, a, "increasing"))
+        self.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+        self.assertTrue(np.allclose(altitudes, ref_altitudes))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import unittest
+import higra as hg
+import numpy as np
+
+
+class TestTiledHierarchy(unittest.TestCase):
+
+    @staticmethod
+    def check_same_bpt(tc, shape, edge_weights, tree, altitudes):
+        graph = hg.get_4_adjacency_graph(shape)
+        ref_tree, ref_altitudes = hg.bpt_canonical(graph, edge_weights)
+
+        tc.assertTrue(np.all(tree.parents() == ref_tree.parents()))
+        tc.assertTrue(np.all(altitudes == ref_altitudes))
+
+        mst = hg.CptBinaryHierarchy.get_mst(tree)
+        ref_mst = hg.CptBinaryHierarchy.get_mst(ref_tree)
+        tc.assertTrue(np.all(hg.CptMinimumSpanningTree.get_edge_map(mst) ==
+                             hg.CptMinimumSpanningTree.get_edge_map(ref_mst)))
+
+        leaf_graph = hg.CptHierarchy.get_leaf_graph(tree)
+        tc.assertTrue(np.all(hg.CptGridGraph.get_shape(leaf_graph) == shape))
+
+    def test_bpt_canonical_tiled_array(self):
+        np.random.seed(1)
+        shape = (13, 17)
+        graph = hg.get_4_adjacency_graph(shape)
+        edge_weights = np.random.randint(0, 5, graph.num_edges())
+
+        for tile_shape in ((1, 1), (4, 5), (13, 17), (20, 20)):
+            tree, altitudes = hg.bpt_canonical_tiled(shape, edge_weights, tile_shape)
+            TestTiledHierarchy.check_same_bpt(self, shape, edge_weights, tree, altitudes)
+
+    def test_bpt_canonical_tiled_function(self):
+        np.random.seed(2)
+        shape = (11, 9)
+        image = np.random.rand(*shape)
+        graph = hg.get_4_adjacency_graph(shape)
+        edge_weights = hg.weight_graph(graph, image, hg.WeightFunction.L1)
+        sources, targets = graph.edge_list()
+
+        def read_tile(y_begin, y_end, x_begin, x_end):
+            ys, xs = np.unravel_index(sources, shape)
+            in_tile = (ys >= y_begin) & (ys < y_end) & (xs >= x_begin) & (xs < x_end)
+            return edge_weights[in_tile]
+
+        tree, altitudes = hg.bpt_canonical_tiled(shape, read_tile, (3, 4))
+        TestTiledHierarchy.check_same_bpt(self, shape, edge_weights, tree, altitudes)
+
+    def test_bpt_canonical_tiled_invalid_weights(self):
+        shape = (4, 4)
+        with self.assertRaises(ValueError):
+            hg.bpt_canonical_tiled(shape, lambda y0, y1, x0, x1: np.zeros((1,)), (2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
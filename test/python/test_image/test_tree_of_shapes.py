@@ -385,3 +385,23 @@ class TestTreeOfShapesImage(unittest.TestCase):
                             44, 43, 43, 43, 43, 43, 44,
                             44, 43, 43, 43, 43, 43, 44, 43, 44, 44))
         self.assertTrue(hg.test_tree_isomorphism(tree, ref_tree))
+
+    def test_tree_of_shapes_3d(self):
+        np.random.seed(5)
+        image = np.random.randint(0, 5, (6, 7))
+
+        # a single plane without padding is processed as a 2d image
+        tree2d, altitudes2d = hg.component_tree_tree_of_shapes_image2d(image, 'none')
+        tree3d, altitudes3d = hg.component_tree_tree_of_shapes_image3d(image[None, :, :], 'none')
+        self.assertTrue(np.all(tree2d.parents() == tree3d.parents()))
+        self.assertTrue(np.all(altitudes2d == altitudes3d))
+
+        volume = np.random.rand(4, 5, 6)
+        tree, altitudes = hg.component_tree_tree_of_shapes_image3d(volume)
+        self.assertTrue(tree.num_leaves() == volume.size)
+        self.assertTrue(tuple(hg.CptGridGraph.get_shape(hg.CptHierarchy.get_leaf_graph(tree))) == (4, 5, 6))
+        tree2, altitudes2 = hg.component_tree_tree_of_shapes_image3d(-volume)
+        self.assertTrue(hg.test_tree_isomorphism(tree, tree2))
+
+        tree, altitudes = hg.component_tree_tree_of_shapes_image3d(volume, 'zero', original_size=False)
+        self.assertTrue(tuple(hg.CptGridGraph.get_shape(hg.CptHierarchy.get_leaf_graph(tree))) == (11, 13, 15))
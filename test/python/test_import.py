@@ -0,0 +1,89 @@
+############################################################################
+# Copyright ESIEE Paris (2018)                                             #
+#                                                                          #
+# Contributor(s) : Benjamin Perret                                         #
+#                                                                          #
+# Distributed under the terms of the CECILL-B License.                     #
+#                                                                          #
+# The full license is in the file LICENSE, distributed with this software. #
+############################################################################
+
+import unittest
+import importlib
+import inspect
+import os
+import subprocess
+import sys
+import higra as hg
+
+
+def run_python(code):
+    """
+    Runs the given code in a new python interpreter and returns its standard output
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(hg.__file__))) + os.pathsep + \
+                        env.get("PYTHONPATH", "")
+    return subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, env=env, check=True,
+                          universal_newlines=True).stdout
+
+
+def import_time(load_all, repeat=3):
+    """
+    Best time (in seconds) of ``import higra`` in a new python interpreter over :attr:`repeat` runs
+    """
+    code = "import time\n" \
+           "t = time.perf_counter()\n" \
+           "import higra\n" \
+           "if " + str(load_all) + ":\n" \
+           "    for name in higra._lazy_submodules:\n" \
+           "        getattr(higra, name)\n" \
+           "print(time.perf_counter() - t)\n"
+    return min(float(run_python(code)) for _ in range(repeat))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "lazy loading requires python 3.7")
+class TestImport(unittest.TestCase):
+
+    def test_lazy_submodules_not_imported(self):
+        modules = run_python("import sys\n"
+                             "import higra\n"
+                             "print(' '.join(sys.modules))\n").split()
+        for submodule in hg._lazy_submodules:
+            self.assertFalse("higra." + submodule in modules, submodule)
+        self.assertFalse("matplotlib" in modules)
+        self.assertFalse("scipy" in modules)
+
+        modules = run_python("import sys\n"
+                             "import higra\n"
+                             "higra.attribute_area\n"
+                             "print(' '.join(sys.modules))\n").split()
+        self.assertTrue("higra.attribute" in modules)
+        self.assertFalse("higra.plot" in modules)
+
+    def test_lazy_names(self):
+        for submodule, names in hg._lazy_submodules.items():
+            module = importlib.import_module("higra." + submodule)
+            for name in names:
+                self.assertTrue(getattr(hg, name) is getattr(module, name), name)
+                self.assertTrue(name in dir(hg))
+                self.assertTrue(name in hg.__all__)
+
+            # every function and class defined in the submodule is registered
+            for name, value in vars(module).items():
+                if not name.startswith("_") and (inspect.isfunction(value) or inspect.isclass(value)) \
+                        and value.__module__.startswith("higra." + submodule + "."):
+                    self.assertTrue(name in names, name)
+
+        self.assertTrue(hg.attribute is importlib.import_module("higra.attribute"))
+        self.assertTrue(hasattr(hg.HorizontalCutNodes, "graph_cut"))
+        self.assertRaises(AttributeError, getattr, hg, "not_a_higra_function")
+
+    def test_import_time(self):
+        lazy = import_time(False)
+        full = import_time(True)
+        self.assertTrue(lazy <= full * 1.25, "import higra: " + str(lazy) + "s, with all submodules: " + str(full) + "s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -108,5 +108,15 @@ class TestRegularGraph(unittest.TestCase):
         self.assertTrue(TestRegularGraph.graph_implicit_explicit_equal(g_imp, g_exp))
 
 
+    def test_pickle(self):
+        import pickle
+        shape = (2, 3)
+        g = hg.get_8_adjacency_implicit_graph(shape)
+
+        g2 = pickle.loads(pickle.dumps(g))
+        self.assertTrue(g2.num_vertices() == g.num_vertices())
+        self.assertTrue(TestRegularGraph.graph_implicit_explicit_equal(g2, g.as_explicit_graph()))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -272,6 +272,39 @@ class TestTree(unittest.TestCase):
         ref = np.asarray((0, 7, 5, 7), dtype=np.int64)
         self.assertTrue(np.all(res == ref))
 
+    def test_pickle(self):
+        import pickle
+        t = hg.Tree((5, 5, 6, 6, 6, 7, 7, 7), hg.TreeCategory.ComponentTree)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            t2 = pickle.loads(pickle.dumps(t, protocol))
+            self.assertTrue(np.all(t.parents() == t2.parents()))
+            self.assertTrue(t2.category() == hg.TreeCategory.ComponentTree)
+            self.assertTrue(t2.num_leaves() == 5)
+
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            buffers = []
+            data = pickle.dumps(t, protocol=5, buffer_callback=buffers.append)
+            self.assertTrue(len(buffers) > 0)
+            t2 = pickle.loads(data, buffers=buffers)
+            self.assertTrue(np.all(t.parents() == t2.parents()))
+
+    def test_shared_memory(self):
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            return
+        t = hg.Tree((5, 5, 6, 6, 6, 7, 7, 7))
+
+        shm, handle = hg.to_shared_memory(t)
+        try:
+            t2 = hg.from_shared_memory(handle)
+            self.assertTrue(np.all(t.parents() == t2.parents()))
+            self.assertTrue(t2.category() == t.category())
+        finally:
+            shm.close()
+            shm.unlink()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -207,5 +207,68 @@ class TestUndirectedGraph(unittest.TestCase):
         self.assertTrue(test == ref)
 
 
+    def test_pickle(self):
+        import pickle
+        g = TestUndirectedGraph.test_graph()
+        g.add_edge(0, 3)
+        g.remove_edge(3)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            g2 = pickle.loads(pickle.dumps(g, protocol))
+            self.assertTrue(g2.num_vertices() == g.num_vertices())
+            self.assertTrue(g2.num_edges() == g.num_edges())
+            s1, t1 = g.edge_list()
+            s2, t2 = g2.edge_list()
+            self.assertTrue(np.all(s1 == s2))
+            self.assertTrue(np.all(t1 == t2))
+            self.assertTrue(g2.degree(3) == 0)
+
+    def test_shared_memory(self):
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            return
+        g = TestUndirectedGraph.test_graph()
+
+        shm, handle = hg.to_shared_memory(g)
+        try:
+            g2 = hg.from_shared_memory(handle)
+            self.assertTrue(g2.num_vertices() == g.num_vertices())
+            s1, t1 = g.edge_list()
+            s2, t2 = g2.edge_list()
+            self.assertTrue(np.all(s1 == s2))
+            self.assertTrue(np.all(t1 == t2))
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+    def test_freeze(self):
+        g = TestUndirectedGraph.test_graph()
+        g.add_edge(3, 1)
+        self.assertFalse(g.is_frozen())
+        ref_adjacency = [list(g.adjacent_vertices(v)) for v in g.vertices()]
+
+        g.freeze()
+        self.assertTrue(g.is_frozen())
+        self.assertTrue(g.num_edges() == 4)
+        self.assertTrue([list(g.adjacent_vertices(v)) for v in g.vertices()] == ref_adjacency)
+
+        indptr, indices = g.csr_adjacency()
+        self.assertTrue(np.all(indptr == (0, 2, 5, 7, 8)))
+        self.assertTrue(np.all(indices == (0, 2, 0, 1, 3, 1, 2, 3)))
+        self.assertFalse(indices.flags.writeable)
+
+        with self.assertRaises(RuntimeError):
+            g.add_edge(0, 3)
+
+        tree, altitudes = hg.bpt_canonical(g, np.asarray((1, 2, 3, 4)))
+        self.assertTrue(np.all(tree.parents() == (4, 4, 5, 6, 5, 6, 6)))
+
+        import pickle
+        g2 = pickle.loads(pickle.dumps(g))
+        self.assertTrue(g2.is_frozen())
+
+
 if __name__ == '__main__':
     unittest.main()